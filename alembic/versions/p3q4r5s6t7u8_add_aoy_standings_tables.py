@@ -0,0 +1,86 @@
+"""Add precomputed Angler-of-the-Year tables
+
+Creates the two tables behind core/services/aoy_standings.py:
+
+* ``aoy_tournament_points`` — AoY place/points per (tournament, angler),
+  rebuilt for one tournament whenever its results change.
+* ``aoy_standings`` — per-year totals per angler, re-aggregated from the
+  points table for the affected years.
+
+No backfill here: the scoring rules live in Python
+(core/helpers/tournament_points.py), and every year without standings is
+built by the build_missing_aoy_years scheduler job on its first tick.
+
+Both cascade-delete with their tournament / angler; the rows are derived
+data and are recomputed from results.
+
+Revision ID: p3q4r5s6t7u8
+Revises: o2p3q4r5s6t7
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "p3q4r5s6t7u8"
+down_revision: Union[str, None] = "o2p3q4r5s6t7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "aoy_tournament_points",
+        sa.Column("tournament_id", sa.Integer(), nullable=False),
+        sa.Column("angler_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("place", sa.Integer(), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False),
+        sa.Column("num_fish", sa.Integer(), nullable=False),
+        sa.Column("total_weight", sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint("tournament_id", "angler_id"),
+        sa.ForeignKeyConstraint(
+            ["tournament_id"],
+            ["tournaments.id"],
+            ondelete="CASCADE",
+            name="fk_aoy_tournament_points_tournament_id",
+        ),
+        sa.ForeignKeyConstraint(
+            ["angler_id"],
+            ["anglers.id"],
+            ondelete="CASCADE",
+            name="fk_aoy_tournament_points_angler_id",
+        ),
+    )
+    op.create_index("ix_aoy_tournament_points_angler_id", "aoy_tournament_points", ["angler_id"])
+    op.create_index("ix_aoy_tournament_points_year", "aoy_tournament_points", ["year"])
+
+    op.create_table(
+        "aoy_standings",
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("angler_id", sa.Integer(), nullable=False),
+        sa.Column("total_points", sa.Integer(), nullable=False),
+        sa.Column("total_fish", sa.Integer(), nullable=False),
+        sa.Column("total_weight", sa.Numeric(), nullable=False),
+        sa.Column("tournaments_fished", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("year", "angler_id"),
+        sa.ForeignKeyConstraint(
+            ["angler_id"],
+            ["anglers.id"],
+            ondelete="CASCADE",
+            name="fk_aoy_standings_angler_id",
+        ),
+    )
+    op.create_index("ix_aoy_standings_angler_id", "aoy_standings", ["angler_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_aoy_standings_angler_id", table_name="aoy_standings")
+    op.drop_table("aoy_standings")
+    op.drop_index("ix_aoy_tournament_points_year", table_name="aoy_tournament_points")
+    op.drop_index("ix_aoy_tournament_points_angler_id", table_name="aoy_tournament_points")
+    op.drop_table("aoy_tournament_points")
@@ -0,0 +1,37 @@
+"""Add scheduler_leases table
+
+Backs the leader lease of the in-process background scheduler
+(core/scheduler.py): one row per lease name, held by one process until
+``expires_at``. Lets more than one app process run without two of them
+sweeping polls, tournaments and reset tokens at once.
+
+Revision ID: q4r5s6t7u8v9
+Revises: p3q4r5s6t7u8
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "q4r5s6t7u8v9"
+down_revision: Union[str, None] = "p3q4r5s6t7u8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_leases",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("holder", sa.String(length=200), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_leases")
@@ -0,0 +1,53 @@
+"""Add big_bass_ledger table
+
+Backs core/services/big_bass_ledger.py: one row per tournament with results
+holding its pot contribution, whether a member won the big bass pot, and the
+running carryover left after it. The results page reads the carryover from
+the latest row before the tournament's date instead of rescanning history.
+
+No backfill here: the ledger is filled from the earliest tournament without
+a row by the build_missing_big_bass_ledger scheduler job on its first tick.
+
+Cascade-deletes with its tournament; the rows are derived data.
+
+Revision ID: r5s6t7u8v9w0
+Revises: q4r5s6t7u8v9
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "r5s6t7u8v9w0"
+down_revision: Union[str, None] = "q4r5s6t7u8v9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "big_bass_ledger",
+        sa.Column("tournament_id", sa.Integer(), nullable=False),
+        sa.Column("event_date", sa.Date(), nullable=False),
+        sa.Column("entries", sa.Integer(), nullable=False),
+        sa.Column("pot_contribution", sa.Numeric(), nullable=False),
+        sa.Column("member_won", sa.Boolean(), nullable=False),
+        sa.Column("carryover", sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint("tournament_id"),
+        sa.ForeignKeyConstraint(
+            ["tournament_id"],
+            ["tournaments.id"],
+            ondelete="CASCADE",
+            name="fk_big_bass_ledger_tournament_id",
+        ),
+    )
+    op.create_index("ix_big_bass_ledger_event_date", "big_bass_ledger", ["event_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_big_bass_ledger_event_date", table_name="big_bass_ledger")
+    op.drop_table("big_bass_ledger")
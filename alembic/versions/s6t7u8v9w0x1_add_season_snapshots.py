@@ -0,0 +1,43 @@
+"""Add season_snapshots table
+
+Backs core/services/season_snapshots.py: a completed season frozen into
+versioned parts (the awards page, each tournament's results page and the
+year's /data rows) so those read paths stop recomputing from raw results.
+Rows are written by scripts/freeze_season.py and dropped again when a
+result write touches the season.
+
+Revision ID: s6t7u8v9w0x1
+Revises: r5s6t7u8v9w0
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "s6t7u8v9w0x1"
+down_revision: Union[str, None] = "r5s6t7u8v9w0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "season_snapshots",
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=20), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("format_version", sa.Integer(), nullable=False),
+        sa.Column("built_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("year", "kind", "item_id"),
+    )
+    op.create_index("ix_season_snapshots_kind_item_id", "season_snapshots", ["kind", "item_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_season_snapshots_kind_item_id", table_name="season_snapshots")
+    op.drop_table("season_snapshots")
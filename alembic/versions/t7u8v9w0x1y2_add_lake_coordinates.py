@@ -0,0 +1,33 @@
+"""Add latitude/longitude to lakes
+
+Lets the forecast prefetcher (core/forecast_prefetcher.py) fetch each lake's
+own NWS forecast and compute its sunrise instead of using Austin's for every
+tournament. Both nullable: lakes without coordinates keep the Austin
+forecast. Set them from the admin lake edit page.
+
+Revision ID: t7u8v9w0x1y2
+Revises: s6t7u8v9w0x1
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "t7u8v9w0x1y2"
+down_revision: Union[str, None] = "s6t7u8v9w0x1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("lakes", sa.Column("latitude", sa.Float(), nullable=True))
+    op.add_column("lakes", sa.Column("longitude", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("lakes", "longitude")
+    op.drop_column("lakes", "latitude")
@@ -0,0 +1,37 @@
+"""Add content_hash/width/height to photos
+
+The gallery's responsive variants (/photos/variants/{content_hash}/...) are
+named by the sha256 of the original, and srcset needs the original's width.
+New uploads set all three; scripts/backfill_photo_variants.py fills them in
+for existing photos, which fall back to the thumbnail and original until then.
+
+Revision ID: u8v9w0x1y2z3
+Revises: t7u8v9w0x1y2
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "u8v9w0x1y2z3"
+down_revision: Union[str, None] = "t7u8v9w0x1y2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("photos", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.add_column("photos", sa.Column("width", sa.Integer(), nullable=True))
+    op.add_column("photos", sa.Column("height", sa.Integer(), nullable=True))
+    op.create_index("ix_photos_content_hash", "photos", ["content_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_photos_content_hash", table_name="photos")
+    op.drop_column("photos", "height")
+    op.drop_column("photos", "width")
+    op.drop_column("photos", "content_hash")
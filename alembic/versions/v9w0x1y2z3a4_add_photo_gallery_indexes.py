@@ -0,0 +1,45 @@
+"""Add (uploaded_at, id) indexes for the photo gallery's keyset pagination
+
+The gallery's infinite scroll seeks to a (uploaded_at, id) cursor instead of
+using OFFSET. One index per filter — none, tournament, angler, big bass (a
+partial index) — keeps every page a short index range scan.
+
+Revision ID: v9w0x1y2z3a4
+Revises: u8v9w0x1y2z3
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "v9w0x1y2z3a4"
+down_revision: Union[str, None] = "u8v9w0x1y2z3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_photos_uploaded_at_id", "photos", ["uploaded_at", "id"])
+    op.create_index(
+        "ix_photos_tournament_id_uploaded_at_id", "photos", ["tournament_id", "uploaded_at", "id"]
+    )
+    op.create_index(
+        "ix_photos_angler_id_uploaded_at_id", "photos", ["angler_id", "uploaded_at", "id"]
+    )
+    op.create_index(
+        "ix_photos_big_bass_uploaded_at_id",
+        "photos",
+        ["uploaded_at", "id"],
+        postgresql_where=sa.text("is_big_bass IS TRUE"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_photos_big_bass_uploaded_at_id", table_name="photos")
+    op.drop_index("ix_photos_angler_id_uploaded_at_id", table_name="photos")
+    op.drop_index("ix_photos_tournament_id_uploaded_at_id", table_name="photos")
+    op.drop_index("ix_photos_uploaded_at_id", table_name="photos")
@@ -0,0 +1,38 @@
+"""Add state_counters table
+
+Backs the database state store (core/state_store.py): expiring counters for
+the login lockout and slowapi's rate limits, shared by every worker instead
+of held in each process's memory.
+
+Revision ID: w0x1y2z3a4b5
+Revises: v9w0x1y2z3a4
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "w0x1y2z3a4b5"
+down_revision: Union[str, None] = "v9w0x1y2z3a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "state_counters",
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index("ix_state_counters_expires_at", "state_counters", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_state_counters_expires_at", table_name="state_counters")
+    op.drop_table("state_counters")
@@ -1,23 +1,27 @@
+import asyncio
 import html as _html
 import json
 import os
-import sys
-from typing import Any, Dict, List, Sequence, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Sequence, Union
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from markupsafe import Markup as _Markup
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.responses import Response
 
+from core.assets import PrecompressedStaticFiles, asset_url
 from core.correlation_middleware import CorrelationIDMiddleware, get_correlation_id
 from core.csrf_middleware import CSRFMiddleware
+from core.db_schema import engine
+from core.db_schema.async_engine import dispose_async_engine
+from core.db_schema.engine import requested_workers
 from core.deps import (
     CustomJSONEncoder,
     date_format_filter,
@@ -31,12 +35,22 @@ from core.deps import (
     to_local_datetime_filter,
     tojson_attr_filter,
 )
+from core.email import cleanup_expired_tokens
+from core.forecast_prefetcher import ForecastPrefetcher
+from core.helpers import user_cache
 from core.helpers.logging import configure_logging, get_logger
 from core.helpers.sanitize import sanitize_iframe as _sanitize_iframe
 from core.helpers.timezone import now_local
 from core.monitoring import init_sentry
 from core.monitoring.middleware import MetricsMiddleware
+from core.page_cache_middleware import PageCacheMiddleware, mark_uncacheable
+from core.photo_processing import shutdown_photo_pool
+from core.rate_limit import limiter
+from core.scheduler import Job, Scheduler
 from core.security_middleware import SecurityHeadersMiddleware
+from core.services.aoy_standings import build_missing_years
+from core.services.big_bass_ledger import build_missing_ledger
+from core.state_store import STATE_STORE, get_state_store
 from routes import api, auth, monitoring, pages, password_reset, photos, static, tournaments, voting
 from routes.admin import core as admin_core
 from routes.admin import events as admin_events
@@ -44,10 +58,8 @@ from routes.admin import lakes as admin_lakes
 from routes.admin import polls as admin_polls
 from routes.admin import tournaments as admin_tournaments
 from routes.admin import users as admin_users
-
-# Asset version string for cache-busting static assets in templates.
-# Bump this whenever bundled CSS/JS changes so browsers fetch the new files.
-ASSET_VERSION = "42"
+from routes.tournaments.helpers import auto_complete_past_tournaments
+from routes.voting.helpers import process_closed_polls
 
 
 def get_csrf_token(request: Request) -> str:
@@ -59,6 +71,8 @@ def get_csrf_token(request: Request) -> str:
     core/csrf_middleware.py) — that same token is set as the cookie on the
     response, so the rendered form and the cookie stay in agreement.
     """
+    # The token is per visitor, so a page embedding it can't be shared.
+    mark_uncacheable(request)
     return request.cookies.get("csrf_token", "") or request.scope.get("sabc_csrf_token", "")
 
 
@@ -66,15 +80,23 @@ _DEV_SECRET_FALLBACK_ENVS = {"development", "test"}
 
 
 def _assert_single_worker() -> None:
-    """Refuse to start if launched with more than one worker.
-
-    The login lockout counters, slowapi rate-limit state, and the SQLAlchemy
-    connection-pool budget all assume a single worker per container (see
-    routes/auth/login.py and core/db_schema/engine.py). With N workers the
-    effective lockout becomes N x _MAX_FAILED_ATTEMPTS, rate limits multiply,
-    and the DB pool over-provisions. Detect the two common multi-worker
-    spawners (uvicorn --workers, gunicorn WEB_CONCURRENCY) and fail fast so a
-    misconfiguration never silently weakens those defenses.
+    """Refuse to start more than one worker unless their state is shared.
+
+    The login lockout counters and slowapi's rate limits live in the state
+    store (core/state_store.py). With the default memory store each worker
+    keeps its own, so with N workers the effective lockout becomes
+    N x _MAX_FAILED_ATTEMPTS and rate limits multiply. Detect the two common
+    multi-worker spawners (uvicorn --workers, gunicorn WEB_CONCURRENCY) and
+    fail fast unless the operator opted in with SABC_ALLOW_MULTIPLE_WORKERS=1
+    AND STATE_STORE names a shared backend, so a misconfiguration never
+    silently weakens those defenses. The DB pool budget is split between the
+    workers (see core/db_schema/engine.py).
+
+    The /data and anonymous page caches keep their generations in the same
+    store, so a write in one worker invalidates them everywhere. The session
+    user cache (core/helpers/user_cache.py) is invalidated per angler in the
+    writing process only, so it must be off (USER_CACHE_TTL_SECONDS=0):
+    another worker would keep serving a user whose password was just reset.
 
     The dev/test envs short-circuit because uvicorn --reload spawns a child
     worker that wouldn't see the original argv, and pytest never touches the
@@ -82,34 +104,25 @@ def _assert_single_worker() -> None:
     """
     if os.environ.get("ENVIRONMENT", "development") in _DEV_SECRET_FALLBACK_ENVS:
         return
-    if os.environ.get("SABC_ALLOW_MULTIPLE_WORKERS") == "1":
-        return  # Operator escape hatch — assumes they've moved state to Redis.
-
-    web_concurrency = os.environ.get("WEB_CONCURRENCY")
-    if web_concurrency and web_concurrency.isdigit() and int(web_concurrency) > 1:
+    workers = requested_workers()
+    if workers <= 1:
+        return
+    if os.environ.get("SABC_ALLOW_MULTIPLE_WORKERS") != "1":
         raise RuntimeError(
-            f"WEB_CONCURRENCY={web_concurrency} is incompatible with the "
-            f"in-process state (login lockout, slowapi limits, DB pool). "
-            f"Set SABC_ALLOW_MULTIPLE_WORKERS=1 only after migrating these "
-            f"to a shared store."
+            f"{workers} workers requested (uvicorn --workers / WEB_CONCURRENCY). Set "
+            f"STATE_STORE to a shared backend and SABC_ALLOW_MULTIPLE_WORKERS=1 to run them."
+        )
+    if not get_state_store().shared:
+        raise RuntimeError(
+            f"SABC_ALLOW_MULTIPLE_WORKERS=1 with {workers} workers needs a shared "
+            f"STATE_STORE (database or a sqlite:/// file), not {STATE_STORE!r}: the login "
+            f"lockout and rate limits would be counted per worker."
+        )
+    if user_cache.USER_CACHE_TTL > 0:
+        raise RuntimeError(
+            f"USER_CACHE_TTL_SECONDS must be 0 with {workers} workers: a user invalidated "
+            f"in one worker would stay cached in the others."
         )
-
-    argv = sys.argv
-    for i, token in enumerate(argv):
-        if token == "--workers" and i + 1 < len(argv):
-            value = argv[i + 1]
-            if value.isdigit() and int(value) > 1:
-                raise RuntimeError(
-                    f"uvicorn --workers {value} is incompatible with the "
-                    f"in-process state. See SABC_ALLOW_MULTIPLE_WORKERS."
-                )
-        elif token.startswith("--workers="):
-            value = token.split("=", 1)[1]
-            if value.isdigit() and int(value) > 1:
-                raise RuntimeError(
-                    f"uvicorn --workers={value} is incompatible with the "
-                    f"in-process state. See SABC_ALLOW_MULTIPLE_WORKERS."
-                )
 
 
 def _get_secret_key() -> str:
@@ -132,6 +145,61 @@ def _get_secret_key() -> str:
     return "dev-key-change-in-production"
 
 
+def _build_missing_aoy_years() -> None:
+    with engine.begin() as conn:
+        build_missing_years(conn)
+
+
+def _build_missing_big_bass_ledger() -> None:
+    with engine.begin() as conn:
+        build_missing_ledger(conn)
+
+
+def _scheduled_jobs() -> List[Job]:
+    """Periodic sweeps that used to run as side effects of GET requests."""
+    return [
+        Job("process_closed_polls", process_closed_polls, interval=60),
+        Job("auto_complete_past_tournaments", auto_complete_past_tournaments, interval=600),
+        Job("build_missing_aoy_years", _build_missing_aoy_years, interval=300),
+        Job("build_missing_big_bass_ledger", _build_missing_big_bass_ledger, interval=300),
+        Job("cleanup_expired_tokens", cleanup_expired_tokens, interval=3600),
+    ]
+
+
+def _enabled(name: str) -> bool:
+    """Background tasks are off in the test environment unless ``name`` turns them on."""
+    default = "false" if os.environ.get("ENVIRONMENT") == "test" else "true"
+    return os.environ.get(name, default).lower() == "true"
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the background scheduler and forecast prefetcher for the life of the app.
+
+    Off in the test environment (tests call the jobs directly) unless
+    SCHEDULER_ENABLED / NWS_PREFETCH_ENABLED say otherwise. The photo worker
+    pool starts on the first upload and the async engine (ASYNC_DATABASE) on
+    its first use; both are shut down here.
+    """
+    scheduler = None
+    if _enabled("SCHEDULER_ENABLED"):
+        scheduler = Scheduler(_scheduled_jobs())
+        scheduler.start()
+    prefetcher = None
+    if _enabled("NWS_PREFETCH_ENABLED"):
+        prefetcher = ForecastPrefetcher()
+        prefetcher.start()
+    try:
+        yield
+    finally:
+        if prefetcher is not None:
+            await prefetcher.stop()
+        if scheduler is not None:
+            await scheduler.stop()
+        await asyncio.to_thread(shutdown_photo_pool)
+        await dispose_async_engine()
+
+
 def create_app() -> FastAPI:
     # Refuse multi-worker launches that would break the in-process state
     # backing login lockout, slowapi limits, and the DB connection pool.
@@ -144,6 +212,7 @@ def create_app() -> FastAPI:
     app = FastAPI(
         redirect_slashes=False,
         default_response_class=JSONResponse,
+        lifespan=_lifespan,
     )
 
     class CustomJSONResponse(JSONResponse):
@@ -152,18 +221,29 @@ def create_app() -> FastAPI:
 
     app.default_response_class = CustomJSONResponse  # type: ignore[attr-defined]
 
-    # Rate limiting (disabled in test environment to avoid rate limit errors in test suites)
-    is_test_env = os.environ.get("ENVIRONMENT") == "test"
-    limiter = Limiter(key_func=get_remote_address, enabled=not is_test_env)
+    # Rate limiting: the one limiter every route module decorates with
+    # (disabled in the test environment; see core/rate_limit.py)
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
 
+    # Anonymous page cache. Added first so it runs innermost: inside the
+    # session middleware (it only serves visitors without a session user) and
+    # inside everything that decorates responses, so cache hits still get
+    # security headers, a correlation ID and metrics.
+    app.add_middleware(PageCacheMiddleware)
+
+    # Metrics middleware (should be early in the chain). Added before the
+    # correlation ID middleware so it runs inside it and its slow-request log
+    # carries the correlation ID. Server-Timing exposes DB time, so it is
+    # left off in production.
+    app.add_middleware(
+        MetricsMiddleware,
+        server_timing=os.environ.get("ENVIRONMENT", "development") != "production",
+    )
+
     # Correlation ID middleware (must be first to capture all requests)
     app.add_middleware(CorrelationIDMiddleware)
 
-    # Metrics middleware (should be early in the chain)
-    app.add_middleware(MetricsMiddleware)
-
     app.add_middleware(SecurityHeadersMiddleware)
 
     # Session middleware with secure configuration.
@@ -202,7 +282,8 @@ def create_app() -> FastAPI:
             header_name="x-csrf-token",
         )
 
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+    # Serves the .br/.gz siblings scripts/build_static_assets.py writes (core/assets.py)
+    app.mount("/static", PrecompressedStaticFiles(directory="static"), name="static")
 
     # Create uploads directory if it doesn't exist (for photo gallery)
     os.makedirs("uploads/photos", exist_ok=True)
@@ -239,8 +320,8 @@ def create_app() -> FastAPI:
     # Expose now_local() to templates for current-time rendering.
     templates.env.globals["now_local"] = now_local
 
-    # Expose the asset cache-bust version to every template render as {{ asset_v }}.
-    templates.env.globals["asset_v"] = ASSET_VERSION
+    # {{ asset_url('sabc.css') }}: the content-hashed URL of a static asset.
+    templates.env.globals["asset_url"] = asset_url
 
     # Logger for exception handlers
     error_logger = get_logger("exception_handler")
@@ -0,0 +1,269 @@
+"""Content-hashed static assets, served precompressed.
+
+``build_assets`` (scripts/build_static_assets.py) copies every file under
+static/ into static/dist/, named by a hash of its content (sabc.css becomes
+sabc.3f2a9c1b.css). Compressible files also get .gz and .br siblings. The
+mapping is recorded in static/dist/manifest.json. Stylesheets are copied
+after the files they reference, with their url()s rewritten to the hashed
+names, so a new font version gives the stylesheet a new URL too.
+
+Templates link assets with ``asset_url("sabc.css")``, which resolves to
+/static/dist/sabc.3f2a9c1b.css through the manifest. A file's URL changes
+exactly when its content does, so each URL is served as immutable and an
+unchanged file stays cached across deploys. Without a manifest
+(development, tests), ``asset_url`` falls back to
+/static/sabc.css?v=<hash of the file>, so an edited file is still fetched
+fresh.
+
+``PrecompressedStaticFiles`` is the app's /static mount. When the request's
+Accept-Encoding allows it, it answers with a file's .br or .gz sibling
+rather than compressing on the fly. In production nginx serves /static/
+itself (see nginx-https.conf).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+from functools import lru_cache
+from mimetypes import guess_type
+from typing import Dict, List, Set, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from core.helpers.logging import get_logger
+
+try:
+    import brotli  # Only the build needs it, to write .br files
+except ImportError:
+    brotli = None
+
+logger = get_logger(__name__)
+
+STATIC_DIR = "static"
+STATIC_URL = "/static"
+DIST_DIRNAME = "dist"
+MANIFEST_FILENAME = "manifest.json"
+HASH_LENGTH = 8
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Already-compressed formats (images, woff/woff2, PDF) gain nothing from gzip.
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".svg", ".json", ".md", ".txt", ".ttf", ".eot"}
+# Served in this order of preference when the client accepts both.
+ENCODINGS: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+_CSS_URL = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+
+def fingerprint(name: str, data: bytes) -> str:
+    """``name`` with a hash of ``data`` before its extension: dir/sabc.css -> dir/sabc.<hash>.css."""
+    stem, ext = posixpath.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def _source_files(static_dir: str) -> List[str]:
+    """Every asset under ``static_dir`` (outside dist/), as a sorted relative posix path."""
+    names: List[str] = []
+    for root, dirs, files in os.walk(static_dir):
+        if root == static_dir:
+            dirs[:] = [d for d in dirs if d != DIST_DIRNAME]
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        relative = os.path.relpath(root, static_dir)
+        for filename in files:
+            if not filename.startswith("."):
+                names.append(
+                    posixpath.normpath(posixpath.join(relative.replace(os.sep, "/"), filename))
+                )
+    return sorted(names)
+
+
+def _rewrite_css_urls(name: str, css: bytes, manifest: Dict[str, str]) -> bytes:
+    """Point a stylesheet's relative url()s at the hashed names in ``manifest``."""
+    directory = posixpath.dirname(name)
+
+    def replace(match: "re.Match[str]") -> str:
+        quote, reference = match.group(1), match.group(2).strip()
+        if reference.startswith(("data:", "http:", "https:", "//", "/", "#")):
+            return match.group(0)
+        path, _, _ = reference.partition("?")
+        path, _, fragment = path.partition("#")
+        hashed = manifest.get(posixpath.normpath(posixpath.join(directory, path)))
+        if hashed is None:
+            return match.group(0)
+        # The hashed name already versions the file; drop any ?v= query.
+        target = posixpath.relpath(hashed, directory or ".")
+        suffix = f"#{fragment}" if fragment else ""
+        return f"url({quote}{target}{suffix}{quote})"
+
+    return _CSS_URL.sub(replace, css.decode("utf-8")).encode("utf-8")
+
+
+def _compressed(data: bytes) -> Dict[str, bytes]:
+    """The .gz and .br encodings of ``data`` that are actually smaller."""
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(data, quality=11)
+    return {suffix: encoded for suffix, encoded in variants.items() if len(encoded) < len(data)}
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def build_assets(static_dir: str = STATIC_DIR, prune: bool = False) -> Dict[str, int]:
+    """Fingerprint every asset under ``static_dir`` into its dist/ and write the manifest.
+
+    Hashed files already in dist/ are left alone, so rebuilding unchanged
+    assets writes nothing and keeps their URLs. Files from earlier builds
+    stay too, for pages still rendered with the old manifest during a
+    deploy, unless ``prune`` removes those the new manifest doesn't list.
+    Returns counts of assets, files written and files pruned.
+    """
+    if brotli is None:
+        logger.warning("brotli is not installed; building .gz assets only")
+    dist_dir = os.path.join(static_dir, DIST_DIRNAME)
+    names = _source_files(static_dir)
+    # Stylesheets last, once everything they can reference has its hashed name.
+    names.sort(key=lambda name: name.endswith(".css"))
+
+    manifest: Dict[str, str] = {}
+    counts = {"assets": len(names), "written": 0, "pruned": 0}
+    for name in names:
+        with open(os.path.join(static_dir, name), "rb") as f:
+            data = f.read()
+        if name.endswith(".css"):
+            data = _rewrite_css_urls(name, data, manifest)
+        hashed = manifest[name] = fingerprint(name, data)
+        path = os.path.join(dist_dir, hashed)
+        if os.path.exists(path):
+            continue
+        outputs = {path: data}
+        if posixpath.splitext(name)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+            outputs.update(
+                {path + suffix: encoded for suffix, encoded in _compressed(data).items()}
+            )
+        for output, content in outputs.items():
+            _write_atomically(output, content)
+        counts["written"] += len(outputs)
+
+    _write_atomically(
+        os.path.join(dist_dir, MANIFEST_FILENAME),
+        json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"),
+    )
+    if prune:
+        keep = {MANIFEST_FILENAME} | {
+            hashed + suffix for hashed in manifest.values() for suffix in ("", ".gz", ".br")
+        }
+        for existing in _source_files(dist_dir):
+            if existing not in keep:
+                os.remove(os.path.join(dist_dir, existing))
+                counts["pruned"] += 1
+    return counts
+
+
+@lru_cache(maxsize=4)
+def _read_manifest(path: str, mtime_ns: int) -> Dict[str, str]:
+    with open(path) as f:
+        manifest: Dict[str, str] = json.load(f)
+    return manifest
+
+
+@lru_cache(maxsize=256)
+def _file_version(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()[:HASH_LENGTH]
+
+
+def load_manifest(static_dir: str = STATIC_DIR) -> Dict[str, str]:
+    """The current build's manifest, re-read only when the file changes; {} if there is none."""
+    path = os.path.join(static_dir, DIST_DIRNAME, MANIFEST_FILENAME)
+    try:
+        return _read_manifest(path, os.stat(path).st_mtime_ns)
+    except (OSError, ValueError):
+        return {}
+
+
+def asset_url(path: str) -> str:
+    """The URL of the static asset at ``path`` (relative to static/), versioned by its content."""
+    name = path.lstrip("/")
+    hashed = load_manifest(STATIC_DIR).get(name)
+    if hashed is not None:
+        return f"{STATIC_URL}/{DIST_DIRNAME}/{hashed}"
+    source = os.path.join(STATIC_DIR, name)
+    try:
+        stat_result = os.stat(source)
+    except OSError:
+        logger.warning(f"asset_url: no such asset {name!r}")
+        return f"{STATIC_URL}/{name}"
+    return f"{STATIC_URL}/{name}?v={_file_version(source, stat_result.st_mtime_ns, stat_result.st_size)}"
+
+
+def _accepted_encodings(header: str) -> Set[str]:
+    """Content codings an Accept-Encoding header allows (those without q=0)."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves a file's prebuilt .br/.gz sibling when the client accepts it.
+
+    Fingerprinted files (under dist/) are also marked immutable.
+    """
+
+    def file_response(
+        self,
+        full_path: "os.PathLike[str] | str",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = str(full_path)
+        headers: Dict[str, str] = {}
+        if f"/{DIST_DIRNAME}/" in scope["path"]:
+            headers["Cache-Control"] = IMMUTABLE
+
+        accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+        response = None
+        for encoding, suffix in ENCODINGS:
+            try:
+                sibling_stat = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            # The response now depends on Accept-Encoding, whichever is served.
+            headers["Vary"] = "Accept-Encoding"
+            if encoding in accepted:
+                response = FileResponse(
+                    full_path + suffix,
+                    status_code=status_code,
+                    headers={**headers, "Content-Encoding": encoding},
+                    media_type=guess_type(full_path)[0] or "text/plain",
+                    stat_result=sibling_stat,
+                )
+                break
+        if response is None:
+            response = FileResponse(
+                full_path, status_code=status_code, headers=headers, stat_result=stat_result
+            )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
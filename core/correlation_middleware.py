@@ -7,10 +7,10 @@ tracing requests across logs and services.
 import re
 import uuid
 from contextvars import ContextVar
-from typing import Any, Callable, Optional
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Context variable to store correlation ID for the current request
 correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
@@ -42,7 +42,7 @@ def generate_correlation_id() -> str:
     return str(uuid.uuid4())
 
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
+class CorrelationIDMiddleware:
     """Middleware that assigns a unique correlation ID to each request.
 
     The correlation ID is:
@@ -50,13 +50,24 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
     - Generated as a new UUID if not present
     - Stored in a context variable for access throughout the request lifecycle
     - Added to the response headers for client correlation
+
+    Plain ASGI rather than BaseHTTPMiddleware: the app runs in this
+    middleware's own context, so the context variable is set for everything
+    downstream, including the body of a streaming response.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Any]) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract existing correlation ID from header or generate new one.
         # Only honor a client-provided ID if it matches the safe pattern,
         # otherwise generate a fresh one (defends against header/log injection).
-        correlation_id = request.headers.get(CORRELATION_ID_HEADER)
+        correlation_id = Headers(scope=scope).get(CORRELATION_ID_HEADER)
         if not correlation_id or not _CORRELATION_ID_PATTERN.match(correlation_id):
             correlation_id = generate_correlation_id()
 
@@ -64,13 +75,16 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
         token = correlation_id_var.set(correlation_id)
 
         # Store in request state for easy access in route handlers
-        request.state.correlation_id = correlation_id
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add correlation ID to response headers
+                MutableHeaders(scope=message)[CORRELATION_ID_HEADER] = correlation_id
+            await send(message)
 
         try:
-            response = await call_next(request)
-            # Add correlation ID to response headers
-            response.headers[CORRELATION_ID_HEADER] = correlation_id
-            return response
+            await self.app(scope, receive, send_with_id)
         finally:
             # Reset context variable
             correlation_id_var.reset(token)
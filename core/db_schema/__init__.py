@@ -1,7 +1,11 @@
+from core.db_schema.async_engine import get_async_engine, get_async_session
 from core.db_schema.engine import engine
 from core.db_schema.models import (
     Angler,
+    AoyStanding,
+    AoyTournamentPoints,
     Base,
+    BigBassLedgerEntry,
     Event,
     Lake,
     News,
@@ -15,6 +19,9 @@ from core.db_schema.models import (
     PollVote,
     Ramp,
     Result,
+    SchedulerLease,
+    SeasonSnapshotPart,
+    StateCounter,
     TeamResult,
     Tournament,
     utc_now,
@@ -38,10 +45,18 @@ __all__ = [
     "Tournament",
     "Result",
     "TeamResult",
+    "AoyTournamentPoints",
+    "AoyStanding",
+    "BigBassLedgerEntry",
     "OfficerPosition",
     "Photo",
+    "SchedulerLease",
+    "SeasonSnapshotPart",
+    "StateCounter",
     "SessionLocal",
     "get_session",
     "get_db_session",
+    "get_async_engine",
+    "get_async_session",
     "utc_now",
 ]
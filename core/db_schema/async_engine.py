@@ -0,0 +1,114 @@
+"""Optional async engine and session path, alongside the sync engine.
+
+Enabled with ASYNC_DB_ENABLED=true. The async engine is built lazily from the
+sync engine's URL with the driver swapped for its asyncio counterpart (asyncpg
+for PostgreSQL, aiosqlite for the SQLite test database), so nothing imports
+an async driver unless a converted route actually uses it.
+
+Routes converted to ``async def`` read through :func:`get_async_session` (ORM)
+or ``AsyncQueryServiceBase`` (raw SQL) without a threadpool hop. When the flag
+is off they fall back to the sync path via ``run_in_threadpool``.
+
+The async pool is sized from the same DB_POOL_SIZE / DB_MAX_OVERFLOW budget as
+the sync one and is separate from it: enabling the flag can double the
+connections a worker holds open.
+"""
+
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from core.db_schema.engine import _MAX_OVERFLOW, _POOL_SIZE, engine
+
+ASYNC_DB_ENABLED = os.environ.get("ASYNC_DB_ENABLED", "false").lower() == "true"
+
+# Backend name -> asyncio driver.
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def async_database_url(url: str) -> str:
+    """Rewrite a sync database URL for its asyncio driver.
+
+    asyncpg spells psycopg2's ``sslmode`` query parameter ``ssl``.
+
+    Raises:
+        ValueError: If the backend has no configured async driver.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r} databases")
+    parsed = parsed.set(drivername=_ASYNC_DRIVERS[backend])
+    if backend == "postgresql" and "sslmode" in parsed.query:
+        query = dict(parsed.query)
+        query["ssl"] = query.pop("sslmode")
+        parsed = parsed.set(query=query)
+    return parsed.render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the process-wide async engine, creating it on first use."""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        url = async_database_url(engine.url.render_as_string(hide_password=False))
+        if make_url(url).get_backend_name() == "sqlite":
+            # aiosqlite connections are bound to the event loop that opened
+            # them; don't pool them across loops (each TestClient has its own).
+            _async_engine = create_async_engine(url, poolclass=NullPool)
+        else:
+            _async_engine = create_async_engine(
+                url,
+                pool_pre_ping=True,
+                pool_size=_POOL_SIZE,
+                max_overflow=_MAX_OVERFLOW,
+                pool_recycle=3600,
+            )
+        _async_session_factory = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """Async counterpart of ``get_session``: commit on success, roll back on error.
+
+    Usage:
+        async with get_async_session() as session:
+            lakes = (await session.execute(select(Lake))).scalars().all()
+    """
+    get_async_engine()
+    assert _async_session_factory is not None
+    session = _async_session_factory()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections and forget the engine."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
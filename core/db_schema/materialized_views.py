@@ -0,0 +1,97 @@
+"""Opt-in materialized backend for the tournament result views.
+
+``v_angler_tournament_results`` and ``v_team_tournament_results`` re-derive
+the results/team_results dedup (UNION ALL + NOT EXISTS) on every read. Once
+materialized, each name is a plain summary table with the same columns,
+holding the rows the view would return, so every reader — ORM ``table()``
+constructs and raw SQL alike — keeps working without changes.
+
+The summary tables are refreshed per tournament: result-writing routes call
+:func:`refresh_result_views` (via ``core.services.result_changes``) inside
+their transaction with the tournament_ids they touched, and only those rows
+are re-derived from the view SELECTs in ``core/db_schema/views.py``.
+
+Why summary tables and not PostgreSQL ``MATERIALIZED VIEW``: ``REFRESH
+MATERIALIZED VIEW`` always rebuilds the whole view, while a table can be
+refreshed for one tournament with DELETE + INSERT. The same statements run
+unchanged on SQLite, so the test suite exercises the real code path.
+
+Switching backends is an explicit, one-off DDL operation (see
+``scripts/materialize_result_views.py``); with the live views in place every
+function here except the switch itself is a no-op.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import Connection, inspect, text
+
+from core.db_schema.views import ALL_VIEW_DROP_SQL, ALL_VIEWS_SQL, RESULT_VIEW_SELECTS
+from core.query_service.dialect_helpers import safe_in_clause
+
+# Secondary indexes on the summary tables, matching the lookups readers do
+# against the views (per tournament, per angler, per boat member).
+_SUMMARY_INDEX_COLUMNS = {
+    "v_angler_tournament_results": ("tournament_id", "angler_id"),
+    "v_team_tournament_results": ("tournament_id", "angler1_id", "angler2_id"),
+}
+
+
+def result_views_materialized(conn: Connection) -> bool:
+    """Return True when the result views are backed by summary tables."""
+    table_names = set(inspect(conn).get_table_names())
+    return all(name in table_names for name in RESULT_VIEW_SELECTS)
+
+
+def materialize_result_views(conn: Connection) -> None:
+    """Replace the live views with fully populated summary tables.
+
+    Runs in the caller's transaction; commit to make the switch visible.
+    """
+    if result_views_materialized(conn):
+        return
+    for drop_sql in ALL_VIEW_DROP_SQL:
+        conn.execute(text(drop_sql))
+    for name, select_sql in RESULT_VIEW_SELECTS.items():
+        conn.execute(text(f"CREATE TABLE {name} AS SELECT * FROM ({select_sql}) live"))
+        for column_name in _SUMMARY_INDEX_COLUMNS[name]:
+            conn.execute(text(f"CREATE INDEX ix_{name}_{column_name} ON {name} ({column_name})"))
+
+
+def dematerialize_result_views(conn: Connection) -> None:
+    """Drop the summary tables and restore the live views."""
+    if not result_views_materialized(conn):
+        return
+    for name in RESULT_VIEW_SELECTS:
+        conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    for create_sql in ALL_VIEWS_SQL:
+        conn.execute(text(create_sql))
+
+
+def refresh_result_views(conn: Connection, tournament_ids: Optional[Iterable[int]] = None) -> None:
+    """Re-derive summary-table rows for the given tournaments.
+
+    Args:
+        conn: Connection inside the transaction that wrote results, so the
+            refresh commits (or rolls back) together with the write.
+        tournament_ids: Tournaments whose results changed. ``None`` rebuilds
+            every row; an empty iterable is a no-op.
+    """
+    if not result_views_materialized(conn):
+        return
+
+    params: Dict[str, Any] = {}
+    if tournament_ids is None:
+        where_sql = ""
+    else:
+        ids = sorted(set(tournament_ids))
+        if not ids:
+            return
+        in_sql, params = safe_in_clause(ids, "tids", conn.dialect.name)  # type: ignore[arg-type]
+        where_sql = f"WHERE tournament_id {in_sql}"
+
+    for name, select_sql in RESULT_VIEW_SELECTS.items():
+        conn.execute(text(f"DELETE FROM {name} {where_sql}"), params)  # nosec B608
+        conn.execute(
+            text(f"INSERT INTO {name} SELECT * FROM ({select_sql}) live {where_sql}"),  # nosec B608
+            params,
+        )
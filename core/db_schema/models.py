@@ -9,13 +9,16 @@ from sqlalchemy import (
     CheckConstraint,
     Date,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     Time,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -256,6 +259,9 @@ class Lake(Base):
     yaml_key: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
     display_name: Mapped[str] = mapped_column(Text, nullable=False)
     google_maps_iframe: Mapped[Optional[str]] = mapped_column(Text)
+    # Where the lake's forecast and sunrise are computed (core/helpers/poll_day_info.py).
+    latitude: Mapped[Optional[float]] = mapped_column(Float)
+    longitude: Mapped[Optional[float]] = mapped_column(Float)
     created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -369,6 +375,123 @@ class TeamResult(Base):
     place_finish: Mapped[Optional[int]] = mapped_column(Integer)
 
 
+class AoyTournamentPoints(Base):
+    """Angler-of-the-Year points for one angler in one tournament.
+
+    Derived from v_angler_tournament_results by calculate_tournament_points and
+    rebuilt per tournament by core.services.aoy_standings whenever that
+    tournament's results change. ``year`` is copied from the event so the
+    yearly standings can be re-aggregated without joining back to events.
+    """
+
+    __tablename__ = "aoy_tournament_points"
+
+    tournament_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), primary_key=True
+    )
+    angler_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("anglers.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    year: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    place: Mapped[int] = mapped_column(Integer, nullable=False)
+    points: Mapped[int] = mapped_column(Integer, nullable=False)
+    num_fish: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_weight: Mapped[Decimal] = mapped_column(Numeric, nullable=False, default=0.0)
+
+
+class AoyStanding(Base):
+    """Per-year Angler-of-the-Year totals, aggregated from aoy_tournament_points.
+
+    Holds every angler with points in the year; the member-only filter is
+    applied at read time because membership changes without a result write.
+    """
+
+    __tablename__ = "aoy_standings"
+
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    angler_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("anglers.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    total_points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_fish: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_weight: Mapped[Decimal] = mapped_column(Numeric, nullable=False, default=0.0)
+    tournaments_fished: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class BigBassLedgerEntry(Base):
+    """Big bass pot bookkeeping for one tournament with results.
+
+    Recomputed forward from the earliest changed tournament by
+    core.services.big_bass_ledger. ``carryover`` is the unclaimed pot left
+    after this tournament (zero when a member won it); the next tournament
+    by date inherits it. ``event_date`` is copied from the event so the
+    running total can be read without joining back to events.
+    """
+
+    __tablename__ = "big_bass_ledger"
+
+    tournament_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), primary_key=True
+    )
+    event_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    entries: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pot_contribution: Mapped[Decimal] = mapped_column(Numeric, nullable=False, default=0.0)
+    member_won: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    carryover: Mapped[Decimal] = mapped_column(Numeric, nullable=False, default=0.0)
+
+
+class SeasonSnapshotPart(Base):
+    """One piece of a frozen season (core/services/season_snapshots.py).
+
+    A season is frozen as a set of parts sharing ``year``: the awards page
+    (``kind="awards"``), one results page per tournament (``kind="tournament"``,
+    ``item_id`` = tournament id) and the year's /data rows
+    (``kind="dashboard"``). Year-wide parts use ``item_id`` 0. ``payload`` is
+    tagged JSON written in ``format_version``; readers ignore other versions.
+    """
+
+    __tablename__ = "season_snapshots"
+    __table_args__ = (Index("ix_season_snapshots_kind_item_id", "kind", "item_id"),)
+
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    item_id: Mapped[int] = mapped_column(Integer, primary_key=True, default=0)
+    format_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=utc_now
+    )
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+
+
+class SchedulerLease(Base):
+    """Leader lease for the in-process background scheduler (core/scheduler.py).
+
+    The process named in ``holder`` runs the periodic jobs until
+    ``expires_at``, renewing the lease on every tick.
+    """
+
+    __tablename__ = "scheduler_leases"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    holder: Mapped[str] = mapped_column(String(200), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class StateCounter(Base):
+    """An expiring counter of the shared state store (core/state_store.py).
+
+    Holds the login lockout counts and slowapi's rate-limit windows when
+    STATE_STORE=database, so every worker sees the same numbers.
+    ``expires_at`` is a Unix timestamp, as the rate limiter reports it.
+    """
+
+    __tablename__ = "state_counters"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    expires_at: Mapped[float] = mapped_column(Float, nullable=False, index=True)
+
+
 class OfficerPosition(Base):
     """Officer position model."""
 
@@ -390,6 +513,21 @@ class Photo(Base):
     """Photo gallery model."""
 
     __tablename__ = "photos"
+    # The gallery pages through photos newest first by (uploaded_at, id),
+    # under each of its filters; one index per filter lets every page seek
+    # straight to its cursor. Combined filters lead with the most selective.
+    __table_args__ = (
+        Index("ix_photos_uploaded_at_id", "uploaded_at", "id"),
+        Index("ix_photos_tournament_id_uploaded_at_id", "tournament_id", "uploaded_at", "id"),
+        Index("ix_photos_angler_id_uploaded_at_id", "angler_id", "uploaded_at", "id"),
+        Index(
+            "ix_photos_big_bass_uploaded_at_id",
+            "uploaded_at",
+            "id",
+            postgresql_where=text("is_big_bass IS TRUE"),
+            sqlite_where=text("is_big_bass IS TRUE"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     angler_id: Mapped[int] = mapped_column(
@@ -401,6 +539,11 @@ class Photo(Base):
     filename: Mapped[str] = mapped_column(Text, nullable=False)
     thumbnail_filename: Mapped[Optional[str]] = mapped_column(Text)
     placeholder_filename: Mapped[Optional[str]] = mapped_column(Text)
+    # sha256 of the original; names its responsive variants. NULL (with
+    # width/height) for photos scripts/backfill_photo_variants.py hasn't reached.
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True)
+    width: Mapped[Optional[int]] = mapped_column(Integer)
+    height: Mapped[Optional[int]] = mapped_column(Integer)
     caption: Mapped[Optional[str]] = mapped_column(String(200))
     is_big_bass: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     uploaded_at: Mapped[Optional[datetime]] = mapped_column(
@@ -18,8 +18,7 @@ from sqlalchemy import Boolean, Integer, Numeric, String, column, table
 # Cross-dialect DDL: ``CAST(0 AS NUMERIC)`` works in both Postgres and SQLite,
 # unlike the PG-only ``0::numeric`` shortcut.
 
-ANGLER_TOURNAMENT_RESULTS_VIEW_SQL = """
-CREATE VIEW v_angler_tournament_results AS
+ANGLER_TOURNAMENT_RESULTS_SELECT_SQL = """
 -- (1) Individual results row — source of truth whenever it exists.
 SELECT
     r.tournament_id,
@@ -84,8 +83,7 @@ WHERE tr.angler2_id IS NOT NULL
   AND a2.name != 'Admin User'
 """
 
-TEAM_TOURNAMENT_RESULTS_VIEW_SQL = """
-CREATE VIEW v_team_tournament_results AS
+TEAM_TOURNAMENT_RESULTS_SELECT_SQL = """
 -- (1) team_results is the canonical boat row when present.
 SELECT
     tr.tournament_id,
@@ -127,6 +125,14 @@ WHERE a.name != 'Admin User'
   )
 """
 
+ANGLER_TOURNAMENT_RESULTS_VIEW_SQL = (
+    "CREATE VIEW v_angler_tournament_results AS" + ANGLER_TOURNAMENT_RESULTS_SELECT_SQL
+)
+
+TEAM_TOURNAMENT_RESULTS_VIEW_SQL = (
+    "CREATE VIEW v_team_tournament_results AS" + TEAM_TOURNAMENT_RESULTS_SELECT_SQL
+)
+
 ALL_VIEWS_SQL = (
     ANGLER_TOURNAMENT_RESULTS_VIEW_SQL,
     TEAM_TOURNAMENT_RESULTS_VIEW_SQL,
@@ -137,10 +143,21 @@ ALL_VIEW_DROP_SQL = (
     "DROP VIEW IF EXISTS v_angler_tournament_results",
 )
 
+# View name -> defining SELECT. The materialized backend
+# (core/db_schema/materialized_views.py) re-runs these bodies, filtered to the
+# tournaments that changed, to refresh its summary tables.
+RESULT_VIEW_SELECTS = {
+    "v_angler_tournament_results": ANGLER_TOURNAMENT_RESULTS_SELECT_SQL,
+    "v_team_tournament_results": TEAM_TOURNAMENT_RESULTS_SELECT_SQL,
+}
+
 
 # ORM-table constructs for SELECT-side use. These are NOT registered with
 # Base.metadata (no CREATE/DROP from them); they exist so existing ORM-style
 # queries can join/filter the views without resorting to raw text() strings.
+# The relation behind each name is either the live view above or, once
+# materialized, a summary table of the same name and columns — callers (ORM
+# or raw SQL) never need to know which.
 v_angler_tournament_results = table(
     "v_angler_tournament_results",
     column("tournament_id", Integer),
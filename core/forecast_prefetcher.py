@@ -0,0 +1,240 @@
+"""Background refresh of the NWS forecasts shown on poll and homepage cards.
+
+Pages used to fetch the forecast inline on a cache miss, opening a new HTTP
+client each time, so a cold cache or a slow api.weather.gov held up the
+render. The prefetcher refreshes it on a timer instead, through one pooled
+client, and hands each result to core/helpers/poll_day_info.py, which the
+pages read without touching the network.
+
+There is one forecast per location: Austin, plus every lake with
+coordinates. Every CHECK_SECONDS the prefetcher refreshes the locations
+whose forecast is missing or older than REFRESH_SECONDS, concurrently but
+at most MAX_CONCURRENCY requests at a time. A failed location keeps serving
+its previous forecast (up to poll_day_info.FORECAST_MAX_AGE) and is retried
+on the next check.
+
+After each pass the cached forecasts are written to FORECAST_CACHE_PATH and
+read back on start, so a restarted process serves the last known forecasts
+before its first refresh completes.
+
+Unlike the scheduler's jobs this runs in every process: each one serves
+from its own in-memory copy.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import text
+
+from core.db_schema import engine
+from core.helpers.logging import get_logger
+from core.helpers.poll_day_info import (
+    AUSTIN,
+    Location,
+    cached_forecasts,
+    forecast_age_seconds,
+    lake_location,
+    prune_forecasts,
+    store_forecast,
+)
+from core.monitoring.metrics import nws_forecast_age_seconds, nws_forecast_refresh_total
+
+logger = get_logger(__name__)
+
+NWS_BASE = os.environ.get("NWS_BASE_URL", "https://api.weather.gov")
+NWS_USER_AGENT = "SABC-Tournament-App (https://github.com/envasquez/SABC)"
+HTTP_TIMEOUT = float(os.environ.get("NWS_HTTP_TIMEOUT_SECONDS", "5"))
+REFRESH_SECONDS = float(os.environ.get("NWS_REFRESH_SECONDS", "1800"))
+CHECK_SECONDS = float(os.environ.get("NWS_CHECK_SECONDS", "120"))
+MAX_CONCURRENCY = int(os.environ.get("NWS_MAX_CONCURRENCY", "4"))
+FORECAST_CACHE_PATH = os.environ.get(
+    "NWS_FORECAST_CACHE_PATH",
+    "/tmp/sabc_nws_forecast.json",  # nosec B108
+)
+
+_LAKE_COORDINATES_SQL = """
+    SELECT DISTINCT latitude, longitude FROM lakes
+    WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+"""
+
+nws_forecast_age_seconds.set_function(forecast_age_seconds)
+
+
+def forecast_locations() -> List[Location]:
+    """Austin plus every lake with coordinates."""
+    with engine.connect() as conn:
+        rows = conn.execute(text(_LAKE_COORDINATES_SQL)).all()
+    return sorted({AUSTIN} | {lake_location(row.latitude, row.longitude) for row in rows})
+
+
+def load_forecast_file(path: str) -> int:
+    """Serve the forecasts persisted at ``path``; return how many were loaded."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f)
+        forecasts = [
+            (
+                (entry["latitude"], entry["longitude"]),
+                entry["periods"],
+                datetime.fromisoformat(entry["fetched_at"]),
+            )
+            for entry in saved["forecasts"]
+        ]
+    except FileNotFoundError:
+        return 0
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable forecast cache {path}: {e}")
+        return 0
+    for location, periods, fetched_at in forecasts:
+        store_forecast(location, periods, fetched_at)
+    return len(forecasts)
+
+
+def save_forecast_file(path: str) -> None:
+    """Persist every cached forecast atomically, so a crash never leaves a half-written file."""
+    forecasts = [
+        {
+            "latitude": location[0],
+            "longitude": location[1],
+            "fetched_at": fetched_at.isoformat(),
+            "periods": periods,
+        }
+        for location, (fetched_at, periods) in sorted(cached_forecasts().items())
+    ]
+    # Every worker runs a prefetcher and saves to the same path; each writes
+    # its own temp file so two saves never interleave in one.
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"forecasts": forecasts}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not persist forecast cache {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class ForecastPrefetcher:
+    """Keeps every location's cached forecast younger than ``refresh_seconds``."""
+
+    def __init__(
+        self,
+        base_url: str = NWS_BASE,
+        cache_path: str = FORECAST_CACHE_PATH,
+        refresh_seconds: float = REFRESH_SECONDS,
+        check_seconds: float = CHECK_SECONDS,
+        max_concurrency: int = MAX_CONCURRENCY,
+        timeout: float = HTTP_TIMEOUT,
+        locations: Callable[[], List[Location]] = forecast_locations,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.cache_path = cache_path
+        self.refresh_seconds = refresh_seconds
+        self.check_seconds = check_seconds
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.locations = locations
+        self._client: Optional[httpx.AsyncClient] = None
+        self._forecast_urls: Dict[Location, str] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": NWS_USER_AGENT, "Accept": "application/geo+json"},
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_concurrency),
+            )
+        return self._client
+
+    async def _get_json(self, url: str) -> Any:
+        resp = await self._get_client().get(url)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def refresh_location(self, location: Location) -> bool:
+        """Fetch one location's forecast; False (and the old forecast kept) on failure."""
+        try:
+            forecast_url = self._forecast_urls.get(location)
+            if forecast_url is None:
+                latitude, longitude = location
+                points = await self._get_json(f"{self.base_url}/points/{latitude},{longitude}")
+                forecast_url = self._forecast_urls[location] = points["properties"]["forecast"]
+            forecast = await self._get_json(forecast_url)
+            periods = forecast["properties"]["periods"]
+        except (httpx.HTTPError, KeyError, TypeError, ValueError) as e:
+            # The gridpoint behind a location occasionally moves; look it up again.
+            self._forecast_urls.pop(location, None)
+            nws_forecast_refresh_total.labels(result="error").inc()
+            logger.warning(
+                f"NWS forecast refresh failed for {location}: {e!r}",
+                extra={"forecast_age_seconds": forecast_age_seconds(location)},
+            )
+            return False
+        store_forecast(location, periods, datetime.now(timezone.utc))
+        nws_forecast_refresh_total.labels(result="ok").inc()
+        return True
+
+    async def refresh(self) -> int:
+        """Refresh every location whose forecast is due; return how many failed."""
+        started = time.perf_counter()
+        locations = await asyncio.to_thread(self.locations)
+        prune_forecasts(locations)
+        due = [
+            location
+            for location in locations
+            if forecast_age_seconds(location) >= self.refresh_seconds
+        ]
+        if not due:
+            return 0
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(location: Location) -> bool:
+            async with semaphore:
+                return await self.refresh_location(location)
+
+        results = await asyncio.gather(*(bounded(location) for location in due))
+        await asyncio.to_thread(save_forecast_file, self.cache_path)
+        failed = results.count(False)
+        logger.info(
+            "NWS forecasts refreshed",
+            extra={
+                "locations": len(due),
+                "failed": failed,
+                "duration_seconds": round(time.perf_counter() - started, 3),
+            },
+        )
+        return failed
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                # e.g. the lakes query failed; try again on the next check.
+                logger.exception("NWS forecast refresh pass failed")
+            await asyncio.sleep(self.check_seconds)
+
+    def start(self) -> None:
+        """Serve the persisted forecasts, then start refreshing on the running loop."""
+        load_forecast_file(self.cache_path)
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop refreshing and close the HTTP client."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -7,6 +7,7 @@ from urllib.parse import quote
 from fastapi import Depends, HTTPException, Request
 
 from core.db_schema import engine
+from core.helpers.user_cache import cache_user, get_cached_user
 from core.query_service import QueryService
 from core.types import UserDict
 
@@ -57,6 +58,10 @@ def get_current_user(request: Request) -> Optional[UserDict]:
     revoked: the session is cleared and None is returned, forcing a
     re-login.
 
+    The resolved user is memoized on ``request.state`` for the rest of the
+    request and, when USER_CACHE_TTL_SECONDS is set, reused across requests
+    (see core/helpers/user_cache.py).
+
     Args:
         request: FastAPI Request object
 
@@ -66,20 +71,30 @@ def get_current_user(request: Request) -> Optional[UserDict]:
     uid = request.session.get("user_id")
     if not uid:
         return None
-    with engine.connect() as conn:
-        qs = QueryService(conn)
-        user = qs.get_user_by_id(uid)
-    if user is None:
-        # User deleted out from under the session
-        request.session.clear()
-        return None
     session_ver = request.session.get("session_version")
-    db_ver = user.get("session_version")
-    if session_ver != db_ver:
-        # Cookie was issued before this revision was bumped (or pre-dates
-        # the session_version field entirely) -> force re-login.
-        request.session.clear()
-        return None
+    # Resolved once per request: require_* dependencies, route bodies and
+    # helpers all call this. Keyed on the cookie so a login/logout mid-request
+    # re-resolves.
+    memo = getattr(request.state, "current_user_memo", None)
+    if memo is not None and memo[0] == (uid, session_ver):
+        return memo[1]
+    user = get_cached_user(uid, session_ver)
+    if user is None:
+        with engine.connect() as conn:
+            qs = QueryService(conn)
+            user = qs.get_user_by_id(uid)
+        if user is None:
+            # User deleted out from under the session
+            request.session.clear()
+            return None
+        db_ver = user.get("session_version")
+        if session_ver != db_ver:
+            # Cookie was issued before this revision was bumped (or pre-dates
+            # the session_version field entirely) -> force re-login.
+            request.session.clear()
+            return None
+        cache_user(user)
+    request.state.current_user_memo = ((uid, session_ver), user)
     return user
 
 
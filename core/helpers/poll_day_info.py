@@ -1,75 +1,98 @@
 """Sunrise + weather forecast for tournament poll days.
 
-Sunrise is computed locally with `astral` (no API). Weather is pulled from the
-National Weather Service public API and cached in-memory for 30 minutes.
+Both are per location: a lake's coordinates (see ``lake_location``), or
+Austin for lakes without any. Sunrise is computed locally with `astral` (no
+API) and memoized per (date, location). The National Weather Service
+forecast for every location is fetched in the background by
+core/forecast_prefetcher.py and kept here in memory; request paths only ever
+read that copy, so a slow or unreachable NWS never delays a page.
 """
 
+import math
 from datetime import date as date_cls
 from datetime import datetime, time, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
-import httpx
-from astral import LocationInfo
+from astral import Observer
 from astral.sun import sun
 
-from core.helpers.logging import get_logger
-
-logger = get_logger(__name__)
-
 AUSTIN_LAT = 30.2672
 AUSTIN_LON = -97.7431
 AUSTIN_TZ = ZoneInfo("America/Chicago")
-NWS_USER_AGENT = "SABC-Tournament-App (https://github.com/envasquez/SABC)"
-NWS_BASE = "https://api.weather.gov"
-FORECAST_TTL = timedelta(minutes=30)
-HTTP_TIMEOUT = 5.0
+# A forecast older than this is no longer shown; the prefetcher normally
+# replaces it every 30 minutes and keeps serving the last one while NWS is down.
+FORECAST_MAX_AGE = timedelta(hours=12)
+
+# (latitude, longitude), rounded to the 4 decimals api.weather.gov accepts.
+Location = Tuple[float, float]
+AUSTIN: Location = (AUSTIN_LAT, AUSTIN_LON)
+
+# location -> (fetched_at, periods)
+_forecasts: Dict[Location, Tuple[datetime, List[Dict[str, Any]]]] = {}
 
-_austin_location = LocationInfo("Austin", "USA", "America/Chicago", AUSTIN_LAT, AUSTIN_LON)
 
-_forecast_cache: Dict[str, Any] = {"periods": None, "fetched_at": None}
-_forecast_url_cache: Optional[str] = None
+def lake_location(latitude: Optional[float], longitude: Optional[float]) -> Location:
+    """Forecast location for a lake's coordinates; Austin when it has none."""
+    if latitude is None or longitude is None:
+        return AUSTIN
+    return (round(latitude, 4), round(longitude, 4))
 
 
-def get_sunrise(target_date: date_cls) -> time:
-    s = sun(_austin_location.observer, date=target_date, tzinfo=AUSTIN_TZ)
+@lru_cache(maxsize=4096)
+def get_sunrise(target_date: date_cls, location: Location = AUSTIN) -> time:
+    s = sun(Observer(*location), date=target_date, tzinfo=AUSTIN_TZ)
     return s["sunrise"].astimezone(AUSTIN_TZ).time()
 
 
-def _get_forecast_url(client: httpx.Client) -> str:
-    global _forecast_url_cache
-    if _forecast_url_cache is not None:
-        return _forecast_url_cache
-    resp = client.get(f"{NWS_BASE}/points/{AUSTIN_LAT},{AUSTIN_LON}", timeout=HTTP_TIMEOUT)
-    resp.raise_for_status()
-    url: str = resp.json()["properties"]["forecast"]
-    _forecast_url_cache = url
-    return url
-
-
-def _fetch_forecast_periods() -> Optional[List[Dict[str, Any]]]:
-    now = datetime.now(timezone.utc)
-    fetched_at = _forecast_cache.get("fetched_at")
-    if fetched_at and now - fetched_at < FORECAST_TTL:
-        cached: Optional[List[Dict[str, Any]]] = _forecast_cache.get("periods")
-        return cached
-
-    headers = {"User-Agent": NWS_USER_AGENT, "Accept": "application/geo+json"}
-    try:
-        with httpx.Client(headers=headers) as client:
-            forecast_url = _get_forecast_url(client)
-            resp = client.get(forecast_url, timeout=HTTP_TIMEOUT)
-            resp.raise_for_status()
-            periods = resp.json()["properties"]["periods"]
-    except (httpx.HTTPError, KeyError, ValueError) as e:
-        logger.warning(f"NWS forecast fetch failed: {e}")
-        # Serve stale cache on failure if we have any, else None.
-        stale: Optional[List[Dict[str, Any]]] = _forecast_cache.get("periods")
-        return stale
-
-    _forecast_cache["periods"] = periods
-    _forecast_cache["fetched_at"] = now
-    return periods
+def store_forecast(location: Location, periods: List[Dict[str, Any]], fetched_at: datetime) -> None:
+    """Replace ``location``'s cached forecast (called by the prefetcher)."""
+    _forecasts[location] = (fetched_at, periods)
+
+
+def cached_forecasts() -> Dict[Location, Tuple[datetime, List[Dict[str, Any]]]]:
+    """A copy of every cached forecast, keyed by location."""
+    return dict(_forecasts)
+
+
+def prune_forecasts(keep: Iterable[Location]) -> None:
+    """Forget forecasts for locations no longer fetched (a lake moved or was deleted)."""
+    keep = set(keep)
+    for location in list(_forecasts):
+        if location not in keep:
+            _forecasts.pop(location, None)
+
+
+def forecast_fetched_at(location: Location = AUSTIN) -> Optional[datetime]:
+    """When ``location``'s forecast was fetched from NWS, or None if there is none."""
+    cached = _forecasts.get(location)
+    return cached[0] if cached else None
+
+
+def forecast_age_seconds(location: Optional[Location] = None) -> float:
+    """Age of ``location``'s forecast, or of the oldest one when None.
+
+    Infinite when there is nothing cached yet.
+    """
+    if location is None:
+        fetched = [fetched_at for fetched_at, _ in _forecasts.values()]
+    else:
+        cached = _forecasts.get(location)
+        fetched = [cached[0]] if cached else []
+    if not fetched:
+        return math.inf
+    return (datetime.now(timezone.utc) - min(fetched)).total_seconds()
+
+
+def _cached_periods(location: Location) -> Optional[List[Dict[str, Any]]]:
+    # A lake whose first fetch hasn't landed yet gets Austin's forecast, as
+    # every lake did before lakes had coordinates.
+    for candidate in (location, AUSTIN):
+        cached = _forecasts.get(candidate)
+        if cached and forecast_age_seconds(candidate) <= FORECAST_MAX_AGE.total_seconds():
+            return cached[1]
+    return None
 
 
 def _summarize_periods_for_date(
@@ -106,25 +129,22 @@ def _summarize_periods_for_date(
     }
 
 
-def get_weather(target_date: date_cls) -> Optional[Dict[str, Any]]:
+def get_weather(target_date: date_cls, location: Location = AUSTIN) -> Optional[Dict[str, Any]]:
     """Returns forecast summary for `target_date`, or None if outside the window
-    or NWS is unreachable."""
-    periods = _fetch_forecast_periods()
+    or no recent forecast has been fetched."""
+    periods = _cached_periods(location)
     if not periods:
         return None
     return _summarize_periods_for_date(periods, target_date)
 
 
-def get_poll_day_info(target_date: date_cls) -> Dict[str, Any]:
+def get_poll_day_info(target_date: date_cls, location: Location = AUSTIN) -> Dict[str, Any]:
     return {
         "date": target_date,
-        "sunrise": get_sunrise(target_date),
-        "weather": get_weather(target_date),
+        "sunrise": get_sunrise(target_date, location),
+        "weather": get_weather(target_date, location),
     }
 
 
 def _reset_caches_for_test() -> None:
-    global _forecast_url_cache
-    _forecast_url_cache = None
-    _forecast_cache["periods"] = None
-    _forecast_cache["fetched_at"] = None
+    _forecasts.clear()
@@ -0,0 +1,56 @@
+"""Tagged JSON for season snapshot payloads (core/services/season_snapshots.py).
+
+Plain JSON would turn the Decimals, dates and times the live loaders return
+into strings and floats, and a page rendered from a snapshot would no longer
+match the live one. Those values are written as single-key objects
+(``{"$decimal": "12.50"}``) and turned back into their types on decode.
+Tuples come back as lists.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable, Dict
+
+# Version of what snapshot parts contain. Bump it whenever a part's shape
+# changes; readers ignore rows written in any other version.
+SNAPSHOT_FORMAT_VERSION = 1
+
+_DECODERS: Dict[str, Callable[[str], Any]] = {
+    "$decimal": Decimal,
+    "$datetime": datetime.fromisoformat,
+    "$date": date.fromisoformat,
+    "$time": time.fromisoformat,
+}
+
+
+def _tag(value: Any) -> Dict[str, str]:
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    # datetime before date: a datetime is also a date.
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, time):
+        return {"$time": value.isoformat()}
+    raise TypeError(f"Cannot snapshot {type(value).__name__}")
+
+
+def _untag(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        ((key, value),) = obj.items()
+        decoder = _DECODERS.get(key)
+        if decoder is not None:
+            return decoder(value)
+    return obj
+
+
+def encode(value: Any) -> str:
+    """Serialize a snapshot part."""
+    return json.dumps(value, default=_tag, separators=(",", ":"))
+
+
+def decode(payload: str) -> Any:
+    """Inverse of :func:`encode`."""
+    return json.loads(payload, object_hook=_untag)
@@ -1,16 +1,24 @@
-from typing import Any, Dict, List
+import os
+from typing import Any, Dict, Iterable, List, Optional
 
-import pandas as pd
+# Scoring engine used when calculate_tournament_points() is called without
+# ``engine``: "python" (list-based, the default) or "pandas" (the original
+# DataFrame implementation, kept as the reference the python engine is
+# tested against). pandas is imported only when that engine runs, so the web
+# process never loads pandas/numpy on the default path.
+TOURNAMENT_POINTS_ENGINE = os.environ.get("TOURNAMENT_POINTS_ENGINE", "python")
 
 
-def calculate_tournament_points(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def calculate_tournament_points(
+    results: List[Dict[str, Any]], engine: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Calculate tournament places and points with proper weight-based ranking.
 
     Ranking rules (for place_finish):
     1. Total weight (descending - heaviest first)
     2. Big bass weight (tiebreaker - bigger wins)
-    3. Pandas stable sort (if still tied)
+    3. Input order (stable sort, if still tied)
 
     Points rules:
     - Members with fish: Sequential points (100, 99, 98...) with gaps when guests appear
@@ -18,10 +26,115 @@ def calculate_tournament_points(results: List[Dict[str, Any]]) -> List[Dict[str,
     - Member after guest: Gets previous_member_points - 1
     - Member zeros: Get previous_member_points - 2
     - Buy-ins: Separate, placed after all regular results
+
+    Args:
+        results: One tournament's result rows.
+        engine: "python" or "pandas"; defaults to TOURNAMENT_POINTS_ENGINE.
+
+    Returns:
+        Regular results in finishing order, then buy-ins, each with
+        ``calculated_place`` and ``calculated_points``. Disqualified rows are
+        dropped.
     """
+    engine = engine or TOURNAMENT_POINTS_ENGINE
+    if engine == "pandas":
+        return _calculate_with_pandas(results)
+    if engine == "python":
+        return _calculate_with_python(results)
+    raise ValueError(f"Unknown tournament points engine: {engine!r}")
+
+
+def calculate_points_by_tournament(
+    results: Iterable[Dict[str, Any]], engine: Optional[str] = None
+) -> Dict[int, List[Dict[str, Any]]]:
+    """Score many tournaments in one call.
+
+    Args:
+        results: Result rows for any number of tournaments, each carrying
+            ``tournament_id`` (e.g. every result of a season).
+        engine: As for :func:`calculate_tournament_points`.
+
+    Returns:
+        tournament_id -> scored rows, in first-seen tournament order.
+    """
+    by_tournament: Dict[int, List[Dict[str, Any]]] = {}
+    for result in results:
+        by_tournament.setdefault(result["tournament_id"], []).append(result)
+    return {
+        tournament_id: calculate_tournament_points(tournament_results, engine)
+        for tournament_id, tournament_results in by_tournament.items()
+    }
+
+
+def _calculate_with_python(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """List-based engine: one stable sort, then a single pass for places and points."""
+    if not results:
+        return []
+
+    # Mirror the pandas engine: a flag column missing from every row gets a
+    # default on every row.
+    defaults = {
+        flag: default
+        for flag, default in (("buy_in", False), ("disqualified", False), ("was_member", True))
+        if all(flag not in result for result in results)
+    }
+    rows = [
+        {
+            **defaults,
+            **result,
+            "total_weight": float(result["total_weight"]),
+            "big_bass_weight": float(result["big_bass_weight"]),
+        }
+        for result in results
+    ]
+
+    regular = [row for row in rows if not row["buy_in"] and not row["disqualified"]]
+    buy_ins = [row for row in rows if row["buy_in"] and not row["disqualified"]]
+    regular.sort(key=lambda row: (-row["total_weight"], -row["big_bass_weight"]))
+
+    current_member_points = 100
+    last_member_with_fish_points: Optional[int] = None
+    previous_key = None
+    place = 0
+    for i, row in enumerate(regular):
+        key = (row["total_weight"], row["big_bass_weight"])
+        if key != previous_key:
+            place, previous_key = i + 1, key
+        row["calculated_place"] = place
+
+        if not row["was_member"]:
+            row["calculated_points"] = 0
+        elif row["total_weight"] > 0:
+            row["calculated_points"] = current_member_points
+            last_member_with_fish_points = current_member_points
+            current_member_points -= 1
+        elif last_member_with_fish_points is not None:
+            row["calculated_points"] = last_member_with_fish_points - 2
+        else:
+            row["calculated_points"] = 98
+
+    if buy_ins:
+        if regular:
+            buy_in_place = regular[-1]["calculated_place"] + 1
+            buy_in_points = (
+                last_member_with_fish_points - 4 if last_member_with_fish_points is not None else 96
+            )
+        else:
+            buy_in_place, buy_in_points = 1, 96
+        for row in buy_ins:
+            row["calculated_place"] = buy_in_place
+            row["calculated_points"] = buy_in_points
+
+    return regular + buy_ins
+
+
+def _calculate_with_pandas(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reference DataFrame engine; rules as in :func:`calculate_tournament_points`."""
     if not results:
         return []
 
+    import pandas as pd
+
     df = pd.DataFrame(results)
     df["total_weight"] = df["total_weight"].astype(float)
     df["big_bass_weight"] = df["big_bass_weight"].astype(float)
@@ -0,0 +1,99 @@
+"""Short-TTL in-process cache of session users, keyed by (user_id, session_version).
+
+get_current_user resolves the signed-in angler on every authenticated
+request. With USER_CACHE_TTL_SECONDS > 0 a resolved user is reused across
+requests for that long, as long as the cookie's session_version matches the
+one the user was cached with. Disabled (0) by default.
+
+Revocation still works: every ORM flush that updates or deletes an Angler
+(password change, reset, admin edits, merges, account deletion) drops that
+angler's entry, and does so again when the transaction commits so a request
+that re-cached the pre-commit row can't outlive the write. Raw-SQL writers
+call :func:`invalidate_user_on_commit`. Writes made by another process are
+only seen once the TTL expires, which is why it is short, and why app_setup
+refuses to start several workers while the cache is on.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Tuple, cast
+
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import Session
+
+from core.db_schema import Angler
+from core.types import UserDict
+
+USER_CACHE_TTL = float(os.environ.get("USER_CACHE_TTL_SECONDS", "0"))
+
+_lock = threading.Lock()
+# user_id -> (session_version, cached_at, user)
+_entries: Dict[int, Tuple[Any, float, UserDict]] = {}
+
+_PENDING_KEY = "user_cache_pending_angler_ids"
+
+
+def get_cached_user(user_id: int, session_version: Any) -> Optional[UserDict]:
+    """Return a copy of the cached user, or None on a miss or version mismatch."""
+    if USER_CACHE_TTL <= 0:
+        return None
+    entry = _entries.get(user_id)
+    if entry is None or entry[0] != session_version:
+        return None
+    if time.monotonic() - entry[1] >= USER_CACHE_TTL:
+        return None
+    return cast(UserDict, dict(entry[2]))
+
+
+def cache_user(user: UserDict) -> None:
+    """Store ``user`` under its id and session_version."""
+    if USER_CACHE_TTL <= 0:
+        return
+    with _lock:
+        _entries[user["id"]] = (
+            user.get("session_version"),
+            time.monotonic(),
+            cast(UserDict, dict(user)),
+        )
+
+
+def invalidate_cached_user(user_id: Optional[int] = None) -> None:
+    """Drop one angler's entry, or every entry when ``user_id`` is None."""
+    with _lock:
+        if user_id is None:
+            _entries.clear()
+        else:
+            _entries.pop(user_id, None)
+
+
+def invalidate_user_on_commit(conn: Connection, user_id: int) -> None:
+    """Invalidate now and again when ``conn``'s transaction commits."""
+    invalidate_cached_user(user_id)
+    event.listen(conn, "commit", lambda _conn: invalidate_cached_user(user_id), once=True)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_anglers(session: Session, _flush_context: Any) -> None:
+    # dirty/deleted still hold the pre-flush state here.
+    angler_ids: Set[int] = {
+        obj.id
+        for obj in (*session.dirty, *session.deleted)
+        if isinstance(obj, Angler) and obj.id is not None
+    }
+    if not angler_ids:
+        return
+    for angler_id in angler_ids:
+        invalidate_cached_user(angler_id)
+    session.info.setdefault(_PENDING_KEY, set()).update(angler_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_anglers(session: Session) -> None:
+    for angler_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_cached_user(angler_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_anglers(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,92 @@
+"""Per-request SQL statement counts and DB time.
+
+Cursor-execute hooks on every Engine (the sync engine and the async
+engine's underlying one alike) attribute each statement to the tally of the
+current request, held in a contextvar. The contextvar follows the request
+into run_in_threadpool workers, so sync routes and helpers are counted too.
+Statements run outside a tracked request (startup, scripts, scheduled jobs)
+are ignored.
+
+MetricsMiddleware brackets each request with :func:`begin_request` and
+:func:`end_request`. Each request gets its own tally, so concurrent requests
+never share one, even when a client sends them the same X-Request-ID.
+"""
+
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+from sqlalchemy import Engine, event
+
+_START_TIMES_KEY = "query_stats_start_times"
+
+
+@dataclass
+class QueryStats:
+    """Statements executed and seconds spent in the database by one request."""
+
+    count: int = 0
+    seconds: float = 0.0
+    active: bool = True
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _token: Optional["Token[Optional[QueryStats]]"] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def begin_request() -> QueryStats:
+    """Start a tally for the current request and make it current."""
+    stats = QueryStats()
+    stats._token = _current.set(stats)
+    return stats
+
+
+def end_request(stats: QueryStats) -> None:
+    """Stop tallying; statements still running for the request are not counted.
+
+    Must be called from the context :func:`begin_request` was called in.
+    """
+    stats.active = False
+    if stats._token is not None:
+        _current.reset(stats._token)
+        stats._token = None
+
+
+def _current_stats() -> Optional[QueryStats]:
+    stats = _current.get()
+    return stats if stats is not None and stats.active else None
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn: Any, *_args: Any) -> None:
+    if _current_stats() is not None:
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn: Any, *_args: Any) -> None:
+    start_times: List[float] = conn.info.get(_START_TIMES_KEY, [])
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    stats = _current_stats()
+    if stats is not None:
+        stats.record(elapsed)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context: Any) -> None:
+    # after_cursor_execute doesn't fire for a failed statement; drop its start time.
+    start_times = context.connection.info.get(_START_TIMES_KEY) if context.connection else None
+    if start_times:
+        start_times.pop()
@@ -1,6 +1,6 @@
 """Prometheus metrics for SABC application monitoring."""
 
-from prometheus_client import Counter, Histogram, generate_latest
+from prometheus_client import Counter, Gauge, Histogram, generate_latest
 from prometheus_client.core import CollectorRegistry
 
 # Create a custom registry to avoid conflicts with the global default registry
@@ -22,6 +22,78 @@ http_request_duration_seconds = Histogram(
     registry=registry,
 )
 
+# SQL per request, by route template (core/monitoring/db_queries.py)
+db_queries_per_request = Histogram(
+    "db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144),
+    registry=registry,
+)
+
+db_time_per_request_seconds = Histogram(
+    "db_time_per_request_seconds",
+    "Time spent executing SQL per HTTP request in seconds",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    registry=registry,
+)
+
+# /data dashboard query cache (core/query_service/data_cache.py)
+data_cache_requests_total = Counter(
+    "data_cache_requests_total",
+    "Data dashboard query cache lookups",
+    ["query", "result"],
+    registry=registry,
+)
+
+# Anonymous full-page cache (core/page_cache_middleware.py). Hit ratio is
+# hit / (hit + miss); "bypass" counts responses that were not storable.
+page_cache_requests_total = Counter(
+    "page_cache_requests_total",
+    "Anonymous page cache lookups on cacheable routes",
+    ["route", "result"],
+    registry=registry,
+)
+
+page_cache_bytes_saved_total = Counter(
+    "page_cache_bytes_saved_total",
+    "Response body bytes not sent because If-None-Match matched (304)",
+    ["route"],
+    registry=registry,
+)
+
+
+# In-process background scheduler (core/scheduler.py)
+scheduler_job_duration_seconds = Histogram(
+    "scheduler_job_duration_seconds",
+    "Background job run time in seconds",
+    ["job"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+    registry=registry,
+)
+
+scheduler_job_failures_total = Counter(
+    "scheduler_job_failures_total",
+    "Background job runs that raised",
+    ["job"],
+    registry=registry,
+)
+
+# Background NWS forecast refresh (core/forecast_prefetcher.py)
+nws_forecast_age_seconds = Gauge(
+    "nws_forecast_age_seconds",
+    "Age of the cached NWS forecast in seconds (+Inf before the first fetch)",
+    registry=registry,
+)
+
+nws_forecast_refresh_total = Counter(
+    "nws_forecast_refresh_total",
+    "NWS forecast refresh attempts",
+    ["result"],
+    registry=registry,
+)
+
 
 def get_metrics() -> bytes:
     """
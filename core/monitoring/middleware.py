@@ -1,44 +1,108 @@
 """Middleware for tracking metrics and monitoring."""
 
+import os
 import time
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from core.monitoring.metrics import http_request_duration_seconds, http_requests_total
+from core.helpers.logging import get_logger
+from core.monitoring.db_queries import QueryStats, begin_request, end_request
+from core.monitoring.metrics import (
+    db_queries_per_request,
+    db_time_per_request_seconds,
+    http_request_duration_seconds,
+    http_requests_total,
+)
 
+logger = get_logger(__name__)
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to track HTTP request metrics."""
+# Requests slower than this are logged with their SQL count and DB time.
+SLOW_REQUEST_SECONDS = float(os.environ.get("SLOW_REQUEST_SECONDS", "1.0"))
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Track request metrics for each HTTP request.
 
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/route handler
+def _route_template(scope: Scope) -> str:
+    """The matched route's path template, e.g. ``/tournaments/{tournament_id}``."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """Middleware to track HTTP request metrics.
+
+    SQL statements are tallied per request (core/monitoring/db_queries.py).
+
+    Plain ASGI: the duration covers the whole response, streamed body
+    included. Server-Timing, sent with the headers, covers the time until
+    the response started.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = False) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Track request metrics for each HTTP request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        Returns:
-            HTTP response
-        """
         # Record start time
         start_time = time.time()
 
-        # Get endpoint path (strip query params for cleaner metrics)
-        path = request.url.path
-        method = request.method
+        # Get endpoint path (query params are not part of it)
+        path = scope["path"]
+        method = scope["method"]
 
-        # Process request
-        response = await call_next(request)
+        stats = begin_request()
+        # An exception escaping the app becomes a 500 further out.
+        status_code = 500
 
-        # Calculate duration
-        duration = time.time() - start_time
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    elapsed = time.time() - start_time
+                    MutableHeaders(scope=message)["Server-Timing"] = (
+                        f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", '
+                        f"total;dur={elapsed * 1000:.1f}"
+                    )
+            await send(message)
 
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request(stats)
+            self._record(scope, method, path, status_code, time.time() - start_time, stats)
+
+    def _record(
+        self,
+        scope: Scope,
+        method: str,
+        path: str,
+        status_code: int,
+        duration: float,
+        stats: QueryStats,
+    ) -> None:
         # Record metrics
-        http_requests_total.labels(method=method, endpoint=path, status=response.status_code).inc()
+        http_requests_total.labels(method=method, endpoint=path, status=status_code).inc()
 
         http_request_duration_seconds.labels(method=method, endpoint=path).observe(duration)
 
-        return response
+        route = _route_template(scope)
+        db_queries_per_request.labels(method=method, route=route).observe(stats.count)
+        db_time_per_request_seconds.labels(method=method, route=route).observe(stats.seconds)
+
+        if duration >= SLOW_REQUEST_SECONDS:
+            logger.warning(
+                f"Slow request: {method} {route} took {duration * 1000:.0f}ms "
+                f"({stats.count} queries, {stats.seconds * 1000:.0f}ms in DB)",
+                extra={
+                    "route": route,
+                    "duration_ms": round(duration * 1000, 1),
+                    "db_queries": stats.count,
+                    "db_time_ms": round(stats.seconds * 1000, 1),
+                },
+            )
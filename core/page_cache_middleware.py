@@ -0,0 +1,285 @@
+"""Full-page response cache for anonymous visitors.
+
+The public pages (home, awards, tournament results, calendar, /data) are
+mostly requested by visitors without a session user, and their HTML only
+changes when someone writes. PageCacheMiddleware keeps the rendered body of
+those responses keyed on path + query string and tagged with the *page
+generation* current when they were rendered; an entry is served only while
+the generation is unchanged and it is younger than PAGE_CACHE_TTL. The TTL
+bounds staleness for changes that don't come through a request (scheduler
+jobs, the date rolling over).
+
+The page generation combines a counter bumped after every write request from
+a signed-in session (admin edits, member votes) with the results generation
+from ``core.query_service.data_cache``.
+
+Cacheable responses carry a strong ETag; a matching If-None-Match gets a 304.
+
+Only GET requests whose session has no user are served or stored, and only
+for routes in CACHEABLE_ROUTES. A response is never stored if it sets a
+cookie, isn't a 200 HTML page, or was marked with :func:`mark_uncacheable`
+while rendering — ``get_csrf_token`` does so, so no page carrying a CSRF
+token is shared between visitors.
+
+Pages are kept per process, but both generations live in the state store
+(core/state_store.py), so with a shared STATE_STORE a write handled by one
+worker invalidates the pages of every worker. The cache is disabled under
+ENVIRONMENT=test, where each test builds a fresh database behind the same
+process.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.monitoring.metrics import page_cache_bytes_saved_total, page_cache_requests_total
+from core.query_service.data_cache import results_generation
+from core.state_store import bump_generation, generation_key, get_state_store, read_generation
+
+PAGE_CACHE_TTL = float(os.environ.get("PAGE_CACHE_TTL_SECONDS", "300"))
+PAGE_CACHE_MAX_ENTRIES = int(os.environ.get("PAGE_CACHE_MAX_ENTRIES", "500"))
+PAGE_CACHE_ENABLED = os.environ.get("ENVIRONMENT") != "test"
+
+# Route templates whose anonymous responses may be cached.
+CACHEABLE_ROUTES = frozenset(
+    {
+        "/",
+        "/awards",
+        "/awards/{year}",
+        "/tournaments/{tournament_id}",
+        "/calendar",
+        "/data",
+    }
+)
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_UNCACHEABLE_SCOPE_KEY = "sabc_page_uncacheable"
+_GENERATION = "pages"
+
+T = TypeVar("T")
+Generation = Tuple[int, int]
+CacheKey = Tuple[str, bytes]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    generation: Generation
+    stored_at: float
+    route: str
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+
+
+_lock = threading.Lock()
+_entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+
+
+def page_generation() -> Generation:
+    """Current page generation: (write counter, results generation)."""
+    return (read_generation(_GENERATION), results_generation())
+
+
+def bump_page_generation() -> None:
+    """Invalidate every cached page, in every worker."""
+    bump_generation(_GENERATION)
+    with _lock:
+        _entries.clear()
+
+
+async def _off_loop(func: Callable[[], T]) -> T:
+    """Call ``func``, in the threadpool when the state store does I/O."""
+    if get_state_store().shared:
+        return await run_in_threadpool(func)
+    return func()
+
+
+def mark_uncacheable(conn: HTTPConnection) -> None:
+    """Keep the response to this request out of the page cache."""
+    conn.scope[_UNCACHEABLE_SCOPE_KEY] = True
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches ``etag`` (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _lookup(key: CacheKey, generation: Generation) -> Optional[_Entry]:
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            return None
+        if entry.generation != generation or time.monotonic() - entry.stored_at >= PAGE_CACHE_TTL:
+            del _entries[key]
+            return None
+        _entries.move_to_end(key)
+        return entry
+
+
+def _store(key: CacheKey, entry: _Entry, generation: Generation) -> None:
+    # Don't store a page rendered across a bump; the next request re-renders.
+    if generation != entry.generation:
+        return
+    with _lock:
+        _entries[key] = entry
+        _entries.move_to_end(key)
+        while len(_entries) > PAGE_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+
+def _signed_in(scope: Scope) -> bool:
+    return bool(scope.get("session", {}).get("user_id"))
+
+
+def _route(scope: Scope) -> Optional[str]:
+    return getattr(scope.get("route"), "path", None)
+
+
+def _validator_headers(etag: str) -> List[Tuple[bytes, bytes]]:
+    # no-cache: browsers may keep the page but must revalidate it with the ETag.
+    # Vary: Cookie keeps shared caches from serving it to signed-in visitors.
+    return [
+        (b"etag", etag.encode("latin-1")),
+        (b"cache-control", b"no-cache"),
+        (b"vary", b"Cookie"),
+    ]
+
+
+async def _send_cached(entry: _Entry, request_headers: Headers, send: Send) -> None:
+    if etag_matches(request_headers.get("if-none-match"), entry.etag):
+        page_cache_bytes_saved_total.labels(route=entry.route).inc(len(entry.body))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 304,
+                "headers": _validator_headers(entry.etag),
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+        return
+    await send({"type": "http.response.start", "status": entry.status, "headers": entry.headers})
+    await send({"type": "http.response.body", "body": entry.body})
+
+
+class PageCacheMiddleware:
+    """Serve and store anonymous GET responses for the cacheable routes.
+
+    Must run inside SessionMiddleware (it reads ``scope["session"]``) and
+    inside the middleware that decorates every response (security headers,
+    correlation ID, metrics), so cached responses get them too.
+    """
+
+    def __init__(self, app: ASGIApp, routes: frozenset = CACHEABLE_ROUTES) -> None:
+        self.app = app
+        self.routes = routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not PAGE_CACHE_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] not in _SAFE_METHODS:
+            signed_in = _signed_in(scope)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                if signed_in:
+                    await _off_loop(bump_page_generation)
+            return
+
+        if scope["method"] != "GET" or _signed_in(scope):
+            await self.app(scope, receive, send)
+            return
+
+        key: CacheKey = (scope["path"], scope.get("query_string", b""))
+        generation = await _off_loop(page_generation)
+        request_headers = Headers(scope=scope)
+        entry = _lookup(key, generation)
+        if entry is not None:
+            page_cache_requests_total.labels(route=entry.route, result="hit").inc()
+            await _send_cached(entry, request_headers, send)
+            return
+
+        await self._render(scope, receive, send, key, generation, request_headers)
+
+    async def _render(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        key: CacheKey,
+        generation: Generation,
+        request_headers: Headers,
+    ) -> None:
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                route = _route(scope)
+                if route not in self.routes:
+                    await send(message)
+                    return
+                headers = Headers(raw=message.get("headers", []))
+                if (
+                    message["status"] == 200
+                    and headers.get("content-type", "").startswith("text/html")
+                    and "set-cookie" not in headers
+                    and not scope.get(_UNCACHEABLE_SCOPE_KEY)
+                ):
+                    start = message
+                    return
+                page_cache_requests_total.labels(route=route, result="bypass").inc()
+                await send(message)
+                return
+            if start is None:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            route = _route(scope) or ""
+            etag = make_etag(body)
+            headers = MutableHeaders(raw=list(start.get("headers", [])))
+            for name, value in _validator_headers(etag):
+                headers[name.decode("latin-1")] = value.decode("latin-1")
+            entry = _Entry(
+                generation=generation,
+                stored_at=time.monotonic(),
+                route=route,
+                status=start["status"],
+                headers=headers.raw,
+                body=body,
+                etag=etag,
+            )
+            page_cache_requests_total.labels(route=route, result="miss").inc()
+            _store(key, entry, await _off_loop(page_generation))
+            await _send_cached(entry, request_headers, send)
+
+        await self.app(scope, receive, capture)
+
+
+def _reset_cache_for_test() -> None:
+    get_state_store().clear(generation_key(_GENERATION))
+    with _lock:
+        _entries.clear()
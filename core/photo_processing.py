@@ -0,0 +1,223 @@
+"""Image processing for photo uploads, run in a dedicated process pool.
+
+An upload used to be decoded three times on the request threadpool: once to
+verify it, once for the thumbnail and once more for the blur placeholder,
+each a full-resolution decode of a 12 MP phone photo. ``process_photo``
+decodes it once instead. JPEGs are decoded with Pillow's draft mode, which
+has libjpeg scale the image down by up to 8x while decoding, and both
+variants are derived from that one decoded image. A successful decode is
+also the verification: a truncated or corrupt file fails to load.
+
+The work is CPU-bound and holds the GIL, so it runs in a small process pool
+(PHOTO_WORKERS processes) rather than on the threads that render pages.
+Workers are started with ``spawn`` (the server process has threads that a
+fork would copy mid-flight) and replaced every MAX_TASKS_PER_WORKER uploads
+so the memory a big decode leaves behind is handed back to the OS.
+
+``render_variant`` uses the same decode to produce the width-based
+variants (VARIANT_WIDTHS) behind the gallery's srcset; those are made on
+first request by routes/photos/variants.py, or ahead of time by
+scripts/backfill_photo_variants.py.
+
+This module imports only Pillow and the standard library (not the app), so
+a spawned worker starts quickly.
+"""
+
+import asyncio
+import hashlib
+import io
+import math
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+
+from PIL import Image, ImageOps, features
+
+# Cap decoded pixel count to defeat decompression-bomb DoS. 50 MP covers any
+# reasonable phone/camera while a 10 MB malicious PNG that decodes to multi-GB
+# pixel buffers will exceed this and raise instead of OOMing the worker.
+Image.MAX_IMAGE_PIXELS = 50_000_000
+warnings.simplefilter("error", Image.DecompressionBombWarning)
+
+THUMBNAIL_SIZE = (200, 200)  # Match display size for optimal performance
+PLACEHOLDER_SIZE = (20, 20)  # Tiny blur placeholder for instant loading
+WEBP_QUALITY = 80  # Quality for WebP compression (smaller than JPEG at same quality)
+# Decode JPEGs to at least twice the thumbnail size, so LANCZOS still has
+# real pixels to downsample from (the same margin Image.thumbnail uses).
+DRAFT_SIZE = (THUMBNAIL_SIZE[0] * 2, THUMBNAIL_SIZE[1] * 2)
+
+# Widths of the responsive variants; a variant is never wider than its original.
+VARIANT_WIDTHS = (400, 800, 1600)
+# format -> (Pillow encoder options, media type). AVIF is smaller but takes
+# noticeably longer to encode, so it is opt-in.
+VARIANT_FORMATS: Dict[str, Tuple[Dict[str, Any], str]] = {
+    "webp": ({"format": "WEBP", "quality": WEBP_QUALITY, "method": 4}, "image/webp"),
+}
+if os.environ.get("PHOTO_AVIF_VARIANTS", "false").lower() == "true" and features.check("avif"):
+    VARIANT_FORMATS["avif"] = ({"format": "AVIF", "quality": 60, "speed": 6}, "image/avif")
+
+# EXIF orientations that swap width and height.
+_TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+_ORIENTATION_TAG = 0x0112
+
+PHOTO_WORKERS = int(os.environ.get("PHOTO_WORKERS", "2"))
+MAX_TASKS_PER_WORKER = 100
+
+T = TypeVar("T")
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+class InvalidImageError(ValueError):
+    """The upload is not an image Pillow can decode."""
+
+
+class ImageTooLargeError(InvalidImageError):
+    """The upload decodes to more than Image.MAX_IMAGE_PIXELS pixels."""
+
+
+@dataclass(frozen=True)
+class ProcessedPhoto:
+    """The WebP-encoded variants derived from one upload, and what it is."""
+
+    thumbnail: bytes
+    placeholder: bytes
+    width: int  # upright, i.e. after EXIF rotation
+    height: int
+
+
+def _encode_webp(img: Image.Image, quality: int, method: int) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, "WEBP", quality=quality, method=method)
+    return buf.getvalue()
+
+
+def _is_transposed(img: Image.Image) -> bool:
+    return img.getexif().get(_ORIENTATION_TAG) in _TRANSPOSED_ORIENTATIONS
+
+
+def _upright_size(img: Image.Image) -> Tuple[int, int]:
+    """``img``'s size once its EXIF orientation is applied."""
+    width, height = img.size
+    return (height, width) if _is_transposed(img) else (width, height)
+
+
+def _draft_size_for_width(img: Image.Image, width: int) -> Tuple[int, int]:
+    """The draft box, in stored orientation, that keeps a ``width``-wide upright resize sharp."""
+    upright_width, upright_height = _upright_size(img)
+    height = math.ceil(width * upright_height / upright_width)
+    return (height, width) if _is_transposed(img) else (width, height)
+
+
+def _decode(
+    source: Union[bytes, str], width: Optional[int] = None
+) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Decode ``source`` (bytes or a path) once, upright and in RGB.
+
+    JPEGs are decoded at no more than draft size: DRAFT_SIZE for the
+    thumbnail, or enough for a ``width``-wide variant. Returns the image and
+    the original's upright size.
+    """
+    try:
+        img: Image.Image = Image.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+        size = _upright_size(img)
+        # A no-op for every format but JPEG. DRAFT_SIZE is square, so it
+        # holds whichever way the EXIF orientation turns the image.
+        img.draft("RGB", DRAFT_SIZE if width is None else _draft_size_for_width(img, width))
+        img.load()
+        ImageOps.exif_transpose(img, in_place=True)
+    except (Image.DecompressionBombError, Image.DecompressionBombWarning) as e:
+        raise ImageTooLargeError(str(e)) from None
+    except (OSError, ValueError, SyntaxError) as e:
+        raise InvalidImageError(str(e)) from None
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return img, size
+
+
+def process_photo(source: Union[bytes, str]) -> ProcessedPhoto:
+    """Verify an upload (bytes or a path) and derive its thumbnail and blur placeholder
+    from a single decode.
+
+    Raises:
+        ImageTooLargeError: the image is over the decompression-bomb limit.
+        InvalidImageError: the bytes are not a decodable image.
+    """
+    img, (width, height) = _decode(source)
+    img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+    thumbnail = _encode_webp(img, WEBP_QUALITY, method=4)
+    # The placeholder is blurred up to the thumbnail's size by CSS, so
+    # shrinking the thumbnail loses nothing a full-size source would keep.
+    img.thumbnail(PLACEHOLDER_SIZE, Image.Resampling.LANCZOS)
+    placeholder = _encode_webp(img, quality=20, method=6)
+    return ProcessedPhoto(thumbnail=thumbnail, placeholder=placeholder, width=width, height=height)
+
+
+def describe_image(path: str) -> Tuple[str, int, int]:
+    """Content hash and upright size of the image at ``path``, read without decoding it."""
+    with open(path, "rb") as f:
+        content_hash = hashlib.file_digest(f, "sha256").hexdigest()
+    try:
+        with Image.open(path) as img:
+            width, height = _upright_size(img)
+    except (Image.DecompressionBombError, Image.DecompressionBombWarning) as e:
+        raise ImageTooLargeError(str(e)) from None
+    except (OSError, ValueError, SyntaxError) as e:
+        raise InvalidImageError(str(e)) from None
+    return content_hash, width, height
+
+
+def render_variant(source_path: str, width: int, fmt: str = "webp") -> bytes:
+    """Encode the original at ``source_path`` resized to ``width`` pixels wide.
+
+    An original narrower than ``width`` keeps its own width (never upscaled).
+    ``fmt`` is a key of VARIANT_FORMATS.
+    """
+    options, _ = VARIANT_FORMATS[fmt]
+    img, _ = _decode(source_path, width)
+    img.thumbnail((width, img.height), Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, **options)
+    return buf.getvalue()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=PHOTO_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=MAX_TASKS_PER_WORKER,
+        )
+    return _pool
+
+
+async def run_in_photo_pool(func: Callable[..., T], *args: Any) -> T:
+    """Run ``func(*args)`` in a photo worker without blocking the event loop.
+
+    ``func`` and its arguments must be picklable. If a worker died (e.g. it
+    was OOM-killed) the pool is discarded, so the next upload gets a fresh
+    one, and BrokenProcessPool is raised to the caller.
+    """
+    global _pool
+    pool = _get_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, partial(func, *args))
+    except BrokenProcessPool:
+        if _pool is pool:
+            _pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def shutdown_photo_pool() -> None:
+    """Stop the photo workers, if any were started (called on app shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,85 @@
+"""Async variant of QueryServiceBase for routes on the async engine."""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+class AsyncQueryServiceBase:
+    """QueryServiceBase's raw-SQL helpers over an ``AsyncConnection``.
+
+    Usage:
+        async with get_async_engine().connect() as conn:
+            lakes = await AsyncQueryServiceBase(conn).fetch_all("SELECT * FROM lakes")
+    """
+
+    def __init__(self, conn: AsyncConnection) -> None:
+        """
+        Initialize query service with an async database connection.
+
+        Args:
+            conn: SQLAlchemy async database connection
+        """
+        self.conn = conn
+
+    async def execute(self, query: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Execute a SQL query with optional parameters.
+
+        Args:
+            query: SQL query string (use :param_name for parameters)
+            params: Dictionary of parameter names and values
+
+        Returns:
+            SQLAlchemy result object
+        """
+        return await self.conn.execute(text(query), params or {})
+
+    async def fetch_all(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute query and return all results as list of dictionaries.
+
+        Args:
+            query: SQL query string (use :param_name for parameters)
+            params: Dictionary of parameter names and values
+
+        Returns:
+            List of row dictionaries
+        """
+        result = await self.execute(query, params)
+        return [dict(row._mapping) for row in result]
+
+    async def fetch_one(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Execute query and return first result as dictionary.
+
+        Args:
+            query: SQL query string (use :param_name for parameters)
+            params: Dictionary of parameter names and values
+
+        Returns:
+            First row as dictionary, or None if no results
+        """
+        results = await self.fetch_all(query, params)
+        return results[0] if results else None
+
+    async def fetch_value(self, query: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Execute query and return first column of first row.
+
+        Args:
+            query: SQL query string (use :param_name for parameters)
+            params: Dictionary of parameter names and values
+
+        Returns:
+            Value of first column in first row, or None if no results
+        """
+        result = await self.fetch_one(query, params)
+        if result:
+            return next(iter(result.values()))
+        return None
@@ -0,0 +1,690 @@
+"""Single-pass aggregation for the /data dashboard.
+
+The per-method DataQueries getters each rebuild their own view of completed
+tournaments' results; together they scan results/team_results and the two
+result views a dozen times per render. This module pulls each completed
+tournament's per-angler and per-boat rows once (:func:`load_dashboard_facts`)
+and derives every dashboard section from those rows in memory
+(:func:`derive_dashboard`), returning the same dict shapes as the getters.
+
+The derivations deliberately mirror the SQL they replace, including its
+quirks: overview and YTD figures still sum the raw results + team_results
+union, limits/zeros and participation fall back to team_results only for
+tournaments without per-angler rows, and NULL ordering follows PostgreSQL
+(``ORDER BY ... DESC`` puts NULLs first). ``DataQueries.get_dashboard``
+selects between this engine and the per-method SQL so the two can be diffed
+(scripts/compare_dashboard_engines.py).
+"""
+
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.helpers.snapshot_codec import SNAPSHOT_FORMAT_VERSION, decode
+from core.query_service.base import QueryServiceBase
+
+# Engine used when DataQueries.get_dashboard() is called without ``engine``:
+# "single_pass" (this module) or "per_query" (one SQL statement per section).
+DATA_DASHBOARD_ENGINE = os.environ.get("DATA_DASHBOARD_ENGINE", "single_pass")
+
+# Keys of the dict returned by get_dashboard(), in template-context order.
+DASHBOARD_SECTIONS = (
+    "available_years",
+    "overview_stats",
+    "year_comparison",
+    "ytd_trends",
+    "lake_statistics",
+    "limits_zeros_by_year",
+    "big_bass_records",
+    "membership_by_year",
+    "weight_trends",
+    "winning_weights_by_year",
+    "winning_weights_by_lake",
+    "winning_weights_by_lake_year",
+    "tournament_participation",
+)
+
+_TOURNAMENTS_SQL = """
+    SELECT t.id, t.fish_limit, e.year, e.date, l.id as lake_id, l.display_name as lake_name
+    FROM tournaments t
+    LEFT JOIN events e ON t.event_id = e.id
+    LEFT JOIN lakes l ON t.lake_id = l.id
+    WHERE t.complete = true AND {scope}
+"""
+
+_RESULTS_SQL = """
+    SELECT r.tournament_id, r.angler_id, r.num_fish, r.total_weight,
+           r.disqualified, r.was_member
+    FROM results r
+    JOIN tournaments t ON r.tournament_id = t.id
+    WHERE t.complete = true AND {scope}
+"""
+
+_TEAM_RESULTS_SQL = """
+    SELECT tr.tournament_id, tr.angler1_id, tr.angler2_id, tr.num_fish, tr.total_weight,
+           a1.member as angler1_member, a2.member as angler2_member
+    FROM team_results tr
+    JOIN tournaments t ON tr.tournament_id = t.id
+    LEFT JOIN anglers a1 ON tr.angler1_id = a1.id
+    LEFT JOIN anglers a2 ON tr.angler2_id = a2.id
+    WHERE t.complete = true AND {scope}
+"""
+
+_ANGLER_ROWS_SQL = """
+    SELECT vatr.tournament_id, vatr.angler_id, a.name as angler_name, vatr.num_fish,
+           vatr.total_weight, vatr.big_bass_weight, vatr.disqualified, vatr.was_member
+    FROM v_angler_tournament_results vatr
+    JOIN tournaments t ON vatr.tournament_id = t.id
+    JOIN anglers a ON vatr.angler_id = a.id
+    WHERE t.complete = true AND {scope}
+"""
+
+_BOAT_ROWS_SQL = """
+    SELECT vttr.tournament_id, vttr.total_weight, vttr.place_finish
+    FROM v_team_tournament_results vttr
+    JOIN tournaments t ON vttr.tournament_id = t.id
+    WHERE t.complete = true
+        AND vttr.total_weight > 0
+        AND {scope}
+"""
+
+_CANCELLED_EVENTS_SQL = """
+    SELECT e.year, e.date, COALESCE(e.lake_name, 'Cancelled') as lake_name
+    FROM events e
+    WHERE e.is_cancelled = true
+      AND e.event_type IN ('sabc_tournament', 'other_tournament')
+      AND {scope}
+"""
+
+_CURRENT_MEMBERS_SQL = "SELECT COUNT(*) as current_members FROM anglers WHERE member = true"
+
+
+@dataclass
+class DashboardFacts:
+    """Every row the dashboard sections are derived from.
+
+    ``tournaments`` is keyed by tournament id and covers completed
+    tournaments only; all row lists are already restricted to them.
+    """
+
+    tournaments: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    team_results: List[Dict[str, Any]] = field(default_factory=list)
+    angler_rows: List[Dict[str, Any]] = field(default_factory=list)
+    boat_rows: List[Dict[str, Any]] = field(default_factory=list)
+    cancelled_events: List[Dict[str, Any]] = field(default_factory=list)
+    current_members: int = 0
+
+
+# Which events each read covers: {event_id} is the row's event id column.
+# Live reads skip seasons frozen into a snapshot (core/services/season_snapshots.py);
+# those rows come from the snapshot instead.
+_LIVE_SCOPE = """NOT EXISTS (
+        SELECT 1 FROM events fe
+        JOIN season_snapshots s ON s.year = fe.year
+        WHERE fe.id = {event_id} AND s.kind = 'dashboard' AND s.format_version = :format_version
+    )"""
+_SEASON_SCOPE = "EXISTS (SELECT 1 FROM events fe WHERE fe.id = {event_id} AND fe.year = :year)"
+
+_FROZEN_FACTS_SQL = """
+    SELECT payload FROM season_snapshots
+    WHERE kind = 'dashboard' AND format_version = :format_version
+    ORDER BY year
+"""
+
+
+def _read_rows(
+    qs: QueryServiceBase, scope: str, params: Dict[str, Any]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Every per-tournament row the dashboard reads, restricted to ``scope``."""
+
+    def rows(sql: str, event_id: str = "t.event_id") -> List[Dict[str, Any]]:
+        return qs.fetch_all(sql.format(scope=scope.format(event_id=event_id)), params)
+
+    tournaments = rows(_TOURNAMENTS_SQL)
+    for row in tournaments:
+        row["date"] = _as_date(row["date"])
+    cancelled = rows(_CANCELLED_EVENTS_SQL, event_id="e.id")
+    for row in cancelled:
+        row["date"] = _as_date(row["date"])
+    return {
+        "tournaments": tournaments,
+        "results": rows(_RESULTS_SQL),
+        "team_results": rows(_TEAM_RESULTS_SQL),
+        "angler_rows": rows(_ANGLER_ROWS_SQL),
+        "boat_rows": rows(_BOAT_ROWS_SQL),
+        "cancelled_events": cancelled,
+    }
+
+
+def load_season_facts(qs: QueryServiceBase, year: int) -> Dict[str, List[Dict[str, Any]]]:
+    """One year's dashboard rows, as stored in a season snapshot."""
+    return _read_rows(qs, _SEASON_SCOPE, {"year": year})
+
+
+def load_dashboard_facts(qs: QueryServiceBase) -> DashboardFacts:
+    """Read the dashboard's inputs: one scan per source table or view.
+
+    Frozen seasons' rows are read from their snapshots in one more statement.
+    """
+    frozen = [
+        decode(row["payload"])
+        for row in qs.fetch_all(_FROZEN_FACTS_SQL, {"format_version": SNAPSHOT_FORMAT_VERSION})
+    ]
+    live = _read_rows(qs, _LIVE_SCOPE, {"format_version": SNAPSHOT_FORMAT_VERSION})
+    parts = frozen + [live]
+
+    def merged(name: str, key: str) -> List[Dict[str, Any]]:
+        # Stable sort: rows keep their read order within a tournament, and
+        # ties in the derived rankings break the same way frozen or live.
+        return sorted((row for part in parts for row in part[name]), key=itemgetter(key))
+
+    facts = DashboardFacts(
+        tournaments={row["id"]: row for row in merged("tournaments", "id")},
+        results=merged("results", "tournament_id"),
+        team_results=merged("team_results", "tournament_id"),
+        angler_rows=merged("angler_rows", "tournament_id"),
+        boat_rows=merged("boat_rows", "tournament_id"),
+        cancelled_events=merged("cancelled_events", "date"),
+    )
+    members = qs.fetch_one(_CURRENT_MEMBERS_SQL)
+    facts.current_members = members["current_members"] if members else 0
+    return facts
+
+
+def derive_dashboard(facts: DashboardFacts, big_bass_limit: int = 10) -> Dict[str, Any]:
+    """Derive every dashboard section from ``facts``, keyed as DASHBOARD_SECTIONS."""
+    raw_rows = _raw_angler_rows(facts)
+    ranked_boats = _ranked_boats(facts)
+    ytd_trends = ytd_trends_by_year(facts, raw_rows)
+    sections = {
+        "available_years": available_years(facts),
+        "overview_stats": overview_stats(facts, raw_rows),
+        "year_comparison": year_comparison_stats(facts, ytd_trends),
+        "ytd_trends": ytd_trends,
+        "lake_statistics": lake_statistics(facts),
+        "limits_zeros_by_year": limits_zeros_by_year(facts),
+        "big_bass_records": big_bass_records(facts, big_bass_limit),
+        "membership_by_year": membership_by_year(facts),
+        "weight_trends": weight_trends_by_year(facts),
+        "winning_weights_by_year": winning_weights_by_year(facts, ranked_boats),
+        "winning_weights_by_lake": winning_weights_by_lake(facts, ranked_boats),
+        "winning_weights_by_lake_year": winning_weights_by_lake_year(facts, ranked_boats),
+        "tournament_participation": tournament_participation(facts),
+    }
+    return {name: _to_floats(value) for name, value in sections.items()}
+
+
+def available_years(facts: DashboardFacts) -> List[int]:
+    """As DataQueries.get_available_years."""
+    years = {t["year"] for t in facts.tournaments.values() if t["year"] is not None}
+    return sorted(years, reverse=True)
+
+
+def overview_stats(facts: DashboardFacts, raw_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """As DataQueries.get_club_overview_stats."""
+    years = available_years(facts)
+    return {
+        "total_tournaments": len(facts.tournaments),
+        "unique_anglers": len({row["angler_id"] for row in raw_rows}),
+        "total_fish": _sum(row["num_fish"] for row in raw_rows),
+        "total_weight": _sum(row["total_weight"] for row in raw_rows),
+        "current_members": facts.current_members,
+        "first_year": years[-1] if years else None,
+        "last_year": years[0] if years else None,
+    }
+
+
+def year_comparison_stats(facts: DashboardFacts, trends: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """As DataQueries.get_year_comparison_stats, given :func:`ytd_trends_by_year`."""
+    current = trends[-1] if trends else {}
+    previous = trends[-2] if len(trends) > 1 else {}
+    through_month = _current_month(facts)
+    return {
+        "current_anglers": current.get("unique_anglers"),
+        "prev_anglers": previous.get("unique_anglers"),
+        "current_fish": current.get("total_fish"),
+        "prev_fish": previous.get("total_fish"),
+        "current_weight": current.get("total_weight"),
+        "prev_weight": previous.get("total_weight"),
+        "current_avg_weight": current.get("avg_weight_per_angler"),
+        "prev_avg_weight": previous.get("avg_weight_per_angler"),
+        "current_year": current.get("year"),
+        "prev_year": previous.get("year"),
+        # EXTRACT(MONTH ...) is NUMERIC in PostgreSQL, surfaced as a float.
+        "through_month": float(through_month) if through_month is not None else None,
+    }
+
+
+def ytd_trends_by_year(
+    facts: DashboardFacts, raw_rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """As DataQueries.get_ytd_trends_by_year."""
+    through_month = _current_month(facts)
+    if through_month is None:
+        return []
+    by_year: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for row in raw_rows:
+        tournament = facts.tournaments[row["tournament_id"]]
+        if tournament["date"] is not None and tournament["date"].month <= through_month:
+            by_year[tournament["year"]].append(row)
+    trends = []
+    for year in sorted(by_year):
+        rows = by_year[year]
+        total_weight = _sum(row["total_weight"] for row in rows)
+        trends.append(
+            {
+                "year": year,
+                "unique_anglers": len({row["angler_id"] for row in rows}),
+                "total_fish": _sum(row["num_fish"] for row in rows),
+                "total_weight": total_weight,
+                "avg_weight_per_angler": total_weight / len(rows),
+            }
+        )
+    return trends
+
+
+def lake_statistics(facts: DashboardFacts) -> List[Dict[str, Any]]:
+    """As DataQueries.get_lake_statistics."""
+    by_lake: Dict[Tuple[int, str], List[Dict[str, Any]]] = defaultdict(list)
+    for row in facts.angler_rows:
+        tournament = facts.tournaments[row["tournament_id"]]
+        if tournament["lake_id"] is not None and tournament["year"] is not None:
+            by_lake[(tournament["lake_id"], tournament["lake_name"])].append(row)
+    stats = []
+    for (lake_id, lake_name), rows in by_lake.items():
+        tournaments = [facts.tournaments[row["tournament_id"]] for row in rows]
+        total_weight = _sum(row["total_weight"] for row in rows)
+        stats.append(
+            {
+                "lake_id": lake_id,
+                "lake_name": lake_name,
+                "times_fished": len({row["tournament_id"] for row in rows}),
+                "last_fished": max(t["date"] for t in tournaments),
+                "total_weight": total_weight,
+                "avg_weight_per_angler": total_weight / len(rows),
+                "total_limits": sum(
+                    1
+                    for row, t in zip(rows, tournaments)
+                    if row["num_fish"] is not None and row["num_fish"] == t["fish_limit"]
+                ),
+                "total_zeros": sum(
+                    1 for row in rows if row["num_fish"] == 0 and _is(row["disqualified"], False)
+                ),
+                "biggest_bass": _max(row["big_bass_weight"] for row in rows),
+            }
+        )
+    stats.sort(key=lambda s: s["lake_name"])
+    stats.sort(key=lambda s: s["times_fished"], reverse=True)
+    return stats
+
+
+def limits_zeros_by_year(facts: DashboardFacts) -> List[Dict[str, Any]]:
+    """As DataQueries.get_limits_zeros_by_year."""
+    entries = [
+        (row["tournament_id"], row["num_fish"], row["disqualified"]) for row in facts.results
+    ]
+    with_results = {row["tournament_id"] for row in facts.results}
+    entries.extend(
+        (row["tournament_id"], row["num_fish"], False)
+        for row in facts.team_results
+        if row["tournament_id"] not in with_results
+    )
+    by_year: Dict[int, List[Tuple[Any, Any, Any]]] = defaultdict(list)
+    for tournament_id, num_fish, disqualified in entries:
+        tournament = facts.tournaments[tournament_id]
+        if tournament["year"] is not None:
+            by_year[tournament["year"]].append((num_fish, tournament["fish_limit"], disqualified))
+    return [
+        {
+            "year": year,
+            "total_entries": len(rows),
+            "limits": sum(
+                1
+                for num_fish, fish_limit, _ in rows
+                if num_fish is not None and fish_limit is not None and num_fish >= fish_limit
+            ),
+            "zeros": sum(
+                1
+                for num_fish, _, disqualified in rows
+                if num_fish == 0 and _is(disqualified, False)
+            ),
+        }
+        for year, rows in sorted(by_year.items())
+    ]
+
+
+def big_bass_records(facts: DashboardFacts, limit: int = 10) -> List[Dict[str, Any]]:
+    """As DataQueries.get_big_bass_records."""
+    records = []
+    for row in facts.angler_rows:
+        tournament = facts.tournaments[row["tournament_id"]]
+        big_bass = row["big_bass_weight"]
+        if (
+            big_bass is not None
+            and big_bass > 0
+            and tournament["year"] is not None
+            and tournament["lake_id"] is not None
+        ):
+            records.append(
+                {
+                    "angler_name": row["angler_name"],
+                    "big_bass_weight": big_bass,
+                    "lake_name": tournament["lake_name"],
+                    "tournament_date": tournament["date"],
+                    "year": tournament["year"],
+                }
+            )
+    records.sort(key=lambda r: r["big_bass_weight"], reverse=True)
+    return records[:limit]
+
+
+def membership_by_year(facts: DashboardFacts) -> List[Dict[str, Any]]:
+    """As DataQueries.get_membership_by_year."""
+    members: Dict[int, Set[int]] = defaultdict(set)
+    guests: Dict[int, Set[int]] = defaultdict(set)
+    anglers: Dict[int, Set[int]] = defaultdict(set)
+    for row in _angler_rows_with_year(facts):
+        year = facts.tournaments[row["tournament_id"]]["year"]
+        anglers[year].add(row["angler_id"])
+        if _is(row["was_member"], True):
+            members[year].add(row["angler_id"])
+        elif _is(row["was_member"], False):
+            guests[year].add(row["angler_id"])
+    return [
+        {
+            "year": year,
+            "member_count": len(members[year]),
+            "guest_count": len(guests[year]),
+            "total_anglers": len(anglers[year]),
+        }
+        for year in sorted(anglers)
+    ]
+
+
+def weight_trends_by_year(facts: DashboardFacts) -> List[Dict[str, Any]]:
+    """As DataQueries.get_weight_trends_by_year."""
+    by_year: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for row in _angler_rows_with_year(facts):
+        by_year[facts.tournaments[row["tournament_id"]]["year"]].append(row)
+    trends = []
+    for year, rows in sorted(by_year.items()):
+        total_weight = _sum(row["total_weight"] for row in rows)
+        trends.append(
+            {
+                "year": year,
+                "avg_individual_weight": total_weight / len(rows),
+                "avg_tournament_total_weight": total_weight
+                / len({row["tournament_id"] for row in rows}),
+                "max_individual_weight": _max(row["total_weight"] for row in rows),
+            }
+        )
+    return trends
+
+
+def winning_weights_by_year(
+    facts: DashboardFacts, ranked_boats: List[Tuple[int, int, Any]]
+) -> List[Dict[str, Any]]:
+    """As DataQueries.get_winning_weights_by_year."""
+    return _winning_weights(
+        facts,
+        ranked_boats,
+        group=lambda t: (t["year"],) if t["year"] is not None else None,
+        keys=("year",),
+        sort=lambda rows: sorted(rows, key=lambda r: r["year"]),
+        with_count=False,
+    )
+
+
+def winning_weights_by_lake(
+    facts: DashboardFacts, ranked_boats: List[Tuple[int, int, Any]]
+) -> List[Dict[str, Any]]:
+    """As DataQueries.get_winning_weights_by_lake."""
+    rows = _winning_weights(
+        facts,
+        ranked_boats,
+        group=lambda t: (t["lake_id"], t["lake_name"]) if t["lake_id"] is not None else None,
+        keys=("lake_id", "lake_name"),
+        sort=lambda rows: _nulls_first_desc(rows, "avg_1st"),
+        with_count=True,
+    )
+    # The SQL groups by lake_id but only selects the name.
+    for row in rows:
+        del row["lake_id"]
+    return rows
+
+
+def winning_weights_by_lake_year(
+    facts: DashboardFacts, ranked_boats: List[Tuple[int, int, Any]]
+) -> List[Dict[str, Any]]:
+    """As DataQueries.get_winning_weights_by_lake_year."""
+
+    def ordered(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        rows = _nulls_first_desc(rows, "avg_1st")
+        return sorted(rows, key=lambda r: r["year"], reverse=True)
+
+    return _winning_weights(
+        facts,
+        ranked_boats,
+        group=lambda t: (
+            (t["year"], t["lake_name"])
+            if t["year"] is not None and t["lake_id"] is not None
+            else None
+        ),
+        keys=("year", "lake_name"),
+        sort=ordered,
+        with_count=True,
+    )
+
+
+def tournament_participation(facts: DashboardFacts) -> List[Dict[str, Any]]:
+    """As DataQueries.get_tournament_participation."""
+    # (angler_id, was_member) per tournament: results rows when the tournament
+    # has any, otherwise both team_results anglers with their current flag.
+    participants: Dict[int, List[Tuple[int, Any]]] = defaultdict(list)
+    for row in facts.results:
+        participants[row["tournament_id"]].append((row["angler_id"], row["was_member"]))
+    with_results = set(participants)
+    for row in facts.team_results:
+        if row["tournament_id"] in with_results:
+            continue
+        participants[row["tournament_id"]].append((row["angler1_id"], row["angler1_member"]))
+        if row["angler2_id"] is not None:
+            participants[row["tournament_id"]].append((row["angler2_id"], row["angler2_member"]))
+
+    rows = []
+    for tournament_id, anglers in participants.items():
+        tournament = facts.tournaments[tournament_id]
+        if tournament["year"] is None or tournament["lake_id"] is None:
+            continue
+        rows.append(
+            {
+                "tournament_id": tournament_id,
+                "year": tournament["year"],
+                "date": tournament["date"],
+                "lake_name": tournament["lake_name"],
+                "participants": len({angler_id for angler_id, _ in anglers}),
+                "members": len({a for a, member in anglers if _is(member, True)}),
+                "guests": len({a for a, member in anglers if _is(member, False)}),
+            }
+        )
+    rows.extend(
+        {
+            "tournament_id": None,
+            "year": event["year"],
+            "date": event["date"],
+            "lake_name": event["lake_name"],
+            "participants": 0,
+            "members": 0,
+            "guests": 0,
+        }
+        for event in facts.cancelled_events
+    )
+    rows.sort(key=lambda r: r["date"])
+    return [
+        {
+            "tournament_id": row["tournament_id"],
+            "year": row["year"],
+            "tournament_date": row["date"].isoformat(),
+            "lake_name": row["lake_name"],
+            "participants": row["participants"],
+            "members": row["members"],
+            "guests": row["guests"],
+        }
+        for row in rows
+    ]
+
+
+def _raw_angler_rows(facts: DashboardFacts) -> List[Dict[str, Any]]:
+    """The overview/YTD union: every results row plus both team_results anglers.
+
+    Unlike v_angler_tournament_results there is no dedup between the two
+    tables; angler2 is a participant with no fish or weight.
+    """
+    rows = [
+        {
+            "tournament_id": row["tournament_id"],
+            "angler_id": row["angler_id"],
+            "num_fish": row["num_fish"],
+            "total_weight": row["total_weight"],
+        }
+        for row in facts.results
+    ]
+    for row in facts.team_results:
+        rows.append(
+            {
+                "tournament_id": row["tournament_id"],
+                "angler_id": row["angler1_id"],
+                "num_fish": row["num_fish"],
+                "total_weight": row["total_weight"],
+            }
+        )
+        if row["angler2_id"] is not None:
+            rows.append(
+                {
+                    "tournament_id": row["tournament_id"],
+                    "angler_id": row["angler2_id"],
+                    "num_fish": 0,
+                    "total_weight": 0,
+                }
+            )
+    return rows
+
+
+def _current_month(facts: DashboardFacts) -> Optional[int]:
+    """Latest month with a completed tournament in the latest completed year."""
+    dated = [t for t in facts.tournaments.values() if t["date"] is not None]
+    if not dated:
+        return None
+    current_year = max(t["year"] for t in dated)
+    return max(t["date"].month for t in dated if t["year"] == current_year)
+
+
+def _angler_rows_with_year(facts: DashboardFacts) -> Iterable[Dict[str, Any]]:
+    return (
+        row
+        for row in facts.angler_rows
+        if facts.tournaments[row["tournament_id"]]["year"] is not None
+    )
+
+
+def _ranked_boats(facts: DashboardFacts) -> List[Tuple[int, int, Any]]:
+    """(tournament_id, place, total_weight) for every boat placing 1st-3rd.
+
+    place_finish wins when set, otherwise the boat's position by weight
+    within its tournament (ROW_NUMBER() in the SQL).
+    """
+    by_tournament: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for row in facts.boat_rows:
+        by_tournament[row["tournament_id"]].append(row)
+    ranked = []
+    for tournament_id, boats in by_tournament.items():
+        boats = sorted(boats, key=lambda b: b["total_weight"], reverse=True)
+        for position, boat in enumerate(boats, start=1):
+            place = boat["place_finish"] if boat["place_finish"] is not None else position
+            if place <= 3:
+                ranked.append((tournament_id, place, boat["total_weight"]))
+    return ranked
+
+
+def _winning_weights(
+    facts: DashboardFacts,
+    ranked_boats: List[Tuple[int, int, Any]],
+    group: Callable[[Dict[str, Any]], Optional[Tuple[Any, ...]]],
+    keys: Tuple[str, ...],
+    sort: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+    with_count: bool,
+) -> List[Dict[str, Any]]:
+    """Average 1st/2nd/3rd place weights per ``group`` of the tournament."""
+    weights: Dict[Tuple[Any, ...], Dict[int, List[Any]]] = defaultdict(lambda: defaultdict(list))
+    tournaments: Dict[Tuple[Any, ...], Set[int]] = defaultdict(set)
+    for tournament_id, place, total_weight in ranked_boats:
+        key = group(facts.tournaments[tournament_id])
+        if key is None:
+            continue
+        weights[key][place].append(total_weight)
+        tournaments[key].add(tournament_id)
+    rows = []
+    for key, by_place in weights.items():
+        row: Dict[str, Any] = dict(zip(keys, key))
+        row["avg_1st"] = _avg(by_place[1])
+        row["avg_2nd"] = _avg(by_place[2])
+        row["avg_3rd"] = _avg(by_place[3])
+        if with_count:
+            row["tournament_count"] = len(tournaments[key])
+        rows.append(row)
+    return sort(rows)
+
+
+def _nulls_first_desc(rows: List[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+    """Sort like PostgreSQL's ``ORDER BY key DESC`` (NULLs first)."""
+    return sorted(
+        rows, key=lambda r: (r[key] is None, r[key] if r[key] is not None else 0), reverse=True
+    )
+
+
+def _is(value: Any, expected: bool) -> bool:
+    """SQL ``value = expected``: NULL matches neither True nor False."""
+    return value is not None and bool(value) is expected
+
+
+def _sum(values: Iterable[Any]) -> Any:
+    """COALESCE(SUM(...), 0)."""
+    total: Any = 0
+    for value in values:
+        if value is not None:
+            total += value
+    return total
+
+
+def _max(values: Iterable[Any]) -> Any:
+    return max((value for value in values if value is not None), default=None)
+
+
+def _avg(values: List[Any]) -> Any:
+    present = [value for value in values if value is not None]
+    return sum(present) / len(present) if present else None
+
+
+def _as_date(value: Any) -> Optional[date]:
+    """Normalize a DATE column; SQLite hands text() queries ISO strings."""
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(str(value)[:10])
+
+
+def _to_floats(value: Any) -> Any:
+    """Decimal -> float through lists and dicts, as the getters' row conversion does."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, list):
+        return [_to_floats(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_floats(item) for key, item in value.items()}
+    return value
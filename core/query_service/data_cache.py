@@ -0,0 +1,117 @@
+"""Cross-request cache for the /data dashboard queries.
+
+The dashboard's DataQueries methods are heavy analytical scans whose inputs
+(results, team_results, tournaments, events) only change when an admin writes
+them. Entries are keyed by method and arguments and tagged with the *results
+generation* current when they were computed; an entry is served only while
+the generation is unchanged and it is younger than DATA_CACHE_TTL. The TTL
+bounds staleness for inputs that aren't result writes (e.g. membership flags).
+
+Writers invalidate through :func:`invalidate_on_commit` (result writes reach
+it via ``core.services.result_changes.results_changed``) or
+:func:`bump_results_generation` after they have committed.
+
+Entries are kept per process, but the generation lives in the state store
+(core/state_store.py): with a shared STATE_STORE a write handled by one worker
+invalidates the entries of every worker. The cache is disabled under
+ENVIRONMENT=test, where each test builds a fresh database behind the same
+process.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from sqlalchemy import Connection, event
+
+from core.monitoring.metrics import data_cache_requests_total
+from core.query_service.data_queries import DataQueries
+from core.state_store import bump_generation, generation_key, get_state_store, read_generation
+
+DATA_CACHE_TTL = float(os.environ.get("DATA_CACHE_TTL_SECONDS", "900"))
+DATA_CACHE_ENABLED = os.environ.get("ENVIRONMENT") != "test"
+
+# DataQueries methods served through the cache: every public getter.
+CACHEABLE_QUERIES = frozenset(name for name in vars(DataQueries) if name.startswith("get_"))
+
+_GENERATION = "results"
+
+_lock = threading.Lock()
+# (method, args, kwargs) -> (generation, computed_at, value)
+_entries: Dict[Hashable, Tuple[int, float, Any]] = {}
+
+
+def results_generation() -> int:
+    """Current results generation."""
+    return read_generation(_GENERATION)
+
+
+def bump_results_generation() -> None:
+    """Invalidate every cached dashboard query, in every worker."""
+    bump_generation(_GENERATION)
+    with _lock:
+        _entries.clear()
+
+
+def invalidate_on_commit(conn: Connection) -> None:
+    """Invalidate now and again when ``conn``'s transaction commits.
+
+    The first bump stops other requests from serving pre-write values; the
+    second drops anything they cached from not-yet-committed state while the
+    write was in flight.
+    """
+    bump_results_generation()
+    event.listen(conn, "commit", lambda _conn: bump_results_generation(), once=True)
+
+
+def get_or_compute(name: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Return the cached value for ``key`` or compute and store it.
+
+    Values are shared between requests; callers must not mutate them.
+    """
+    if not DATA_CACHE_ENABLED:
+        return compute()
+    generation = results_generation()
+    entry = _entries.get(key)
+    if (
+        entry is not None
+        and entry[0] == generation
+        and time.monotonic() - entry[1] < DATA_CACHE_TTL
+    ):
+        data_cache_requests_total.labels(query=name, result="hit").inc()
+        return entry[2]
+    data_cache_requests_total.labels(query=name, result="miss").inc()
+    value = compute()
+    # Don't store a value computed across a bump; the next read recomputes.
+    if results_generation() == generation:
+        with _lock:
+            _entries[key] = (generation, time.monotonic(), value)
+    return value
+
+
+class CachedDataQueries:
+    """Read-through cache in front of a DataQueries (or QueryService) instance.
+
+    Cacheable getters are wrapped; any other attribute passes straight through.
+    """
+
+    def __init__(self, queries: DataQueries) -> None:
+        self._queries = queries
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._queries, name)
+        if name not in CACHEABLE_QUERIES:
+            return attr
+
+        def cached(*args: Any, **kwargs: Any) -> Any:
+            key = (name, args, tuple(sorted(kwargs.items())))
+            return get_or_compute(name, key, lambda: attr(*args, **kwargs))
+
+        return cached
+
+
+def _reset_cache_for_test() -> None:
+    get_state_store().clear(generation_key(_GENERATION))
+    with _lock:
+        _entries.clear()
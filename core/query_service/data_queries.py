@@ -1,9 +1,14 @@
 """Query service for data dashboard statistics and analytics."""
 
 from decimal import Decimal
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from core.query_service.base import QueryServiceBase
+from core.query_service.dashboard_facts import (
+    DATA_DASHBOARD_ENGINE,
+    derive_dashboard,
+    load_dashboard_facts,
+)
 
 
 def _convert_decimals(value: Any) -> Any:
@@ -32,6 +37,42 @@ class DataQueries(QueryServiceBase):
         result = self.fetch_one(query, params)
         return _convert_row(result) if result else None
 
+    def get_dashboard(
+        self, big_bass_limit: int = 10, engine: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Every /data section, keyed by its template context name.
+
+        Args:
+            big_bass_limit: Number of big bass records to return.
+            engine: "single_pass" reads completed tournaments' rows once and
+                derives each section in memory (core/query_service/dashboard_facts.py);
+                "per_query" runs the getters below, one SQL statement each.
+                Defaults to DATA_DASHBOARD_ENGINE.
+
+        Raises:
+            ValueError: If ``engine`` is not a known engine.
+        """
+        engine = engine or DATA_DASHBOARD_ENGINE
+        if engine == "single_pass":
+            return derive_dashboard(load_dashboard_facts(self), big_bass_limit)
+        if engine == "per_query":
+            return {
+                "available_years": self.get_available_years(),
+                "overview_stats": self.get_club_overview_stats(),
+                "year_comparison": self.get_year_comparison_stats(),
+                "ytd_trends": self.get_ytd_trends_by_year(),
+                "lake_statistics": self.get_lake_statistics(),
+                "limits_zeros_by_year": self.get_limits_zeros_by_year(),
+                "big_bass_records": self.get_big_bass_records(limit=big_bass_limit),
+                "membership_by_year": self.get_membership_by_year(),
+                "weight_trends": self.get_weight_trends_by_year(),
+                "winning_weights_by_year": self.get_winning_weights_by_year(),
+                "winning_weights_by_lake": self.get_winning_weights_by_lake(),
+                "winning_weights_by_lake_year": self.get_winning_weights_by_lake_year(),
+                "tournament_participation": self.get_tournament_participation(),
+            }
+        raise ValueError(f"Unknown dashboard engine: {engine!r}")
+
     def get_available_years(self) -> List[int]:
         """Get all years that have tournament data."""
         query = """
@@ -270,3 +270,222 @@ class TournamentQueries(QueryServiceBase):
         """
 
         return self.fetch_all(query, {"items_per_page": items_per_page})  # nosec B608
+
+    def get_tournament_page_summary(
+        self,
+        tournament_id: int,
+        today: Any,
+        min_big_bass_weight: float,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Everything on the tournament results page that is one value, in one row.
+
+        Returns the tournament + event columns, the header stats, the big bass
+        flags, the unclaimed big bass pot from earlier tournaments and the
+        Prev/Next navigation ids. Each result view is read once for this
+        tournament (the ``angler_stats`` / ``boat_stats`` CTEs aggregate with
+        CASE instead of one subquery per figure), and the carryover is one
+        indexed lookup in big_bass_ledger (core/services/big_bass_ledger.py).
+
+        Args:
+            tournament_id: Tournament ID
+            today: Today's date, matching the homepage past/upcoming boundary
+            min_big_bass_weight: A big bass must be heavier than this to win the pot
+
+        Returns:
+            Summary row, or None if the tournament does not exist
+        """
+        return self.fetch_one(
+            f"""
+            WITH cur AS (
+                SELECT t.id, t.event_id, e.date as event_date, e.name as event_name,
+                       e.description as event_description, t.lake_name, t.ramp_name,
+                       t.entry_fee, t.fish_limit, t.complete, e.event_type,
+                       COALESCE(t.big_bass_carryover, 0) as big_bass_carryover,
+                       COALESCE(t.aoy_points, TRUE) as aoy_points,
+                       t.start_time, t.end_time
+                FROM tournaments t
+                JOIN events e ON t.event_id = e.id
+                WHERE t.id = :tournament_id
+            ),
+            angler_stats AS (
+                SELECT COUNT(DISTINCT CASE WHEN disqualified = FALSE THEN angler_id END)
+                           as total_anglers,
+                       COALESCE(SUM(CASE WHEN disqualified = FALSE THEN num_fish END), 0)
+                           as total_fish,
+                       COALESCE(SUM(CASE WHEN disqualified = FALSE THEN total_weight END), 0)
+                           as total_weight,
+                       COALESCE(SUM(CASE WHEN buy_in = TRUE THEN 1 ELSE 0 END), 0) as buy_ins,
+                       COALESCE(MAX(CASE WHEN disqualified = FALSE THEN big_bass_weight END), 0)
+                           as biggest_bass,
+                       COALESCE(MAX(CASE WHEN disqualified = FALSE THEN total_weight END), 0)
+                           as heavy_stringer
+                FROM v_angler_tournament_results
+                WHERE tournament_id = :tournament_id
+            ),
+            boat_stats AS (
+                SELECT COUNT(*) as total_boats,
+                       COALESCE(SUM(CASE WHEN vttr.num_fish >= COALESCE(NULLIF(cur.fish_limit, 0), 5)
+                                         THEN 1 ELSE 0 END), 0) as limits,
+                       COALESCE(SUM(CASE WHEN vttr.num_fish = 0 THEN 1 ELSE 0 END), 0) as zeros
+                FROM v_team_tournament_results vttr
+                JOIN cur ON vttr.tournament_id = cur.id
+            ),
+            -- Big bass candidates. Individual format: results rows, eligible if a
+            -- member at the time. Team format: boats, eligible if either angler
+            -- is a member.
+            bass AS (
+                SELECT r.big_bass_weight as weight, COALESCE(r.was_member, FALSE) as is_member
+                FROM results r
+                JOIN cur ON r.tournament_id = cur.id
+                WHERE cur.aoy_points = TRUE
+                  AND r.disqualified = FALSE
+                  AND r.big_bass_weight > 0
+                UNION ALL
+                SELECT tr.big_bass_weight,
+                       (COALESCE(a1.member, FALSE) OR COALESCE(a2.member, FALSE))
+                FROM team_results tr
+                JOIN cur ON tr.tournament_id = cur.id
+                JOIN anglers a1 ON tr.angler1_id = a1.id
+                LEFT JOIN anglers a2 ON tr.angler2_id = a2.id
+                WHERE cur.aoy_points = FALSE
+                  AND tr.big_bass_weight > 0
+            )
+            SELECT cur.*, angler_stats.*, boat_stats.*,
+                   EXISTS (SELECT 1 FROM bass WHERE is_member = TRUE AND weight > :min_weight)
+                       as member_caught_big_bass,
+                   (SELECT is_member FROM bass ORDER BY weight DESC LIMIT 1)
+                       as top_bass_by_member,
+                   (SELECT l.carryover
+                    FROM big_bass_ledger l
+                    WHERE l.event_date < cur.event_date
+                    ORDER BY l.event_date DESC, l.tournament_id DESC
+                    LIMIT 1) as unclaimed_big_bass,
+                   (SELECT t.id
+                    FROM tournaments t
+                    JOIN events e ON t.event_id = e.id
+                    WHERE {self._NAVIGABLE_PREDICATE}
+                      AND (e.date > cur.event_date
+                           OR (e.date = cur.event_date AND t.id > cur.id))
+                    ORDER BY e.date ASC, t.id ASC
+                    LIMIT 1) as next_tournament_id,
+                   (SELECT t.id
+                    FROM tournaments t
+                    JOIN events e ON t.event_id = e.id
+                    WHERE {self._NAVIGABLE_PREDICATE}
+                      AND (e.date < cur.event_date
+                           OR (e.date = cur.event_date AND t.id < cur.id))
+                    ORDER BY e.date DESC, t.id DESC
+                    LIMIT 1) as prev_tournament_id
+            FROM cur, angler_stats, boat_stats
+        """,
+            {
+                "tournament_id": tournament_id,
+                "today": today,
+                "min_weight": min_big_bass_weight,
+            },
+        )  # nosec B608
+
+    def get_tournament_page_rows(self, tournament_id: int) -> List[Dict[str, Any]]:
+        """
+        Per-angler and per-boat result rows for the tournament results page.
+
+        One UNION ALL over the same rows as :meth:`get_tournament_results`
+        (``kind = 'angler'``) and :meth:`get_team_results` (``kind = 'team'``),
+        with the two shapes aligned on angler1_* / angler2_* columns. Angler
+        rows come first, each kind ordered as its standalone query orders it.
+        """
+        return self.fetch_all(
+            """
+            SELECT 'angler' as kind, r.id, vatr.angler_id as angler1_id,
+                   CAST(NULL AS INTEGER) as angler2_id,
+                   a.name as angler1_name, CAST(NULL AS VARCHAR) as angler2_name,
+                   a.member as angler1_member, CAST(NULL AS BOOLEAN) as angler2_member,
+                   vatr.was_member as angler1_was_member,
+                   CAST(NULL AS BOOLEAN) as angler2_was_member,
+                   vatr.num_fish as num_fish, vatr.total_weight as total_weight,
+                   vatr.big_bass_weight as big_bass_weight,
+                   vatr.dead_fish_penalty as dead_fish_penalty,
+                   vatr.disqualified as disqualified, vatr.buy_in as buy_in,
+                   CAST(NULL AS INTEGER) as place_finish
+            FROM v_angler_tournament_results vatr
+            JOIN anglers a ON vatr.angler_id = a.id
+            LEFT JOIN results r ON r.tournament_id = vatr.tournament_id
+                AND r.angler_id = vatr.angler_id
+            WHERE vatr.tournament_id = :tournament_id
+            UNION ALL
+            SELECT 'team', tr.id, vttr.angler1_id, vttr.angler2_id,
+                   a1.name, a2.name, a1.member, a2.member,
+                   COALESCE(r1.was_member, TRUE), COALESCE(r2.was_member, TRUE),
+                   vttr.num_fish, vttr.total_weight, vttr.big_bass_weight,
+                   NULL, NULL, NULL, vttr.place_finish
+            FROM v_team_tournament_results vttr
+            JOIN team_results tr ON tr.tournament_id = vttr.tournament_id
+                AND tr.angler1_id = vttr.angler1_id
+                AND ((tr.angler2_id IS NULL AND vttr.angler2_id IS NULL)
+                     OR tr.angler2_id = vttr.angler2_id)
+            JOIN anglers a1 ON vttr.angler1_id = a1.id
+            LEFT JOIN anglers a2 ON vttr.angler2_id = a2.id
+            LEFT JOIN results r1 ON vttr.angler1_id = r1.angler_id
+                AND vttr.tournament_id = r1.tournament_id
+            LEFT JOIN results r2 ON vttr.angler2_id = r2.angler_id
+                AND vttr.tournament_id = r2.tournament_id
+            WHERE vttr.tournament_id = :tournament_id
+              AND vttr.source = 'team_results'
+              AND COALESCE(r1.buy_in, FALSE) = FALSE
+              AND COALESCE(r2.buy_in, FALSE) = FALSE
+            ORDER BY kind, total_weight DESC, big_bass_weight DESC
+        """,
+            {"tournament_id": tournament_id},
+        )
+
+    def get_tournament_page_snapshot(
+        self, tournament_id: int, today: Any, format_version: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        A frozen season's stored results page for this tournament, in one row.
+
+        Prev/Next are looked up live: later seasons keep adding tournaments
+        after this one's season was frozen (core/services/season_snapshots.py).
+
+        Args:
+            tournament_id: Tournament ID
+            today: Today's date, matching the homepage past/upcoming boundary
+            format_version: Snapshot format the caller can decode
+
+        Returns:
+            ``payload``, ``next_tournament_id`` and ``prev_tournament_id``, or
+            None if the tournament's season isn't frozen in ``format_version``
+        """
+        return self.fetch_one(
+            f"""
+            WITH cur AS (
+                SELECT t.id, e.date as event_date, s.payload
+                FROM season_snapshots s
+                JOIN tournaments t ON t.id = s.item_id
+                JOIN events e ON t.event_id = e.id
+                WHERE s.kind = 'tournament'
+                  AND s.item_id = :tournament_id
+                  AND s.format_version = :format_version
+            )
+            SELECT cur.payload,
+                   (SELECT t.id
+                    FROM tournaments t
+                    JOIN events e ON t.event_id = e.id
+                    WHERE {self._NAVIGABLE_PREDICATE}
+                      AND (e.date > cur.event_date
+                           OR (e.date = cur.event_date AND t.id > cur.id))
+                    ORDER BY e.date ASC, t.id ASC
+                    LIMIT 1) as next_tournament_id,
+                   (SELECT t.id
+                    FROM tournaments t
+                    JOIN events e ON t.event_id = e.id
+                    WHERE {self._NAVIGABLE_PREDICATE}
+                      AND (e.date < cur.event_date
+                           OR (e.date = cur.event_date AND t.id < cur.id))
+                    ORDER BY e.date DESC, t.id DESC
+                    LIMIT 1) as prev_tournament_id
+            FROM cur
+        """,
+            {"tournament_id": tournament_id, "today": today, "format_version": format_version},
+        )  # nosec B608
@@ -2,6 +2,7 @@
 
 from typing import Any, Dict, Optional, cast
 
+from core.helpers.user_cache import invalidate_user_on_commit
 from core.query_service.base import QueryServiceBase
 from core.types import UserDict
 
@@ -69,6 +70,7 @@ class UserQueries(QueryServiceBase):
         params = {**updates, "id": user_id}
         # Safe: column names validated against whitelist, values parameterized
         self.execute(f"UPDATE anglers SET {set_clause} WHERE id = :id", params)  # nosec B608
+        invalidate_user_on_commit(self.conn, user_id)
 
     def create_user(
         self,
@@ -115,3 +117,4 @@ class UserQueries(QueryServiceBase):
             user_id: ID of user to delete
         """
         self.execute("DELETE FROM anglers WHERE id = :id", {"id": user_id})
+        invalidate_user_on_commit(self.conn, user_id)
@@ -0,0 +1,24 @@
+"""The app's one slowapi rate limiter.
+
+Every route module decorates its endpoints with this ``limiter``, and
+app_setup.py installs it as ``app.state.limiter``. Its counters live in the
+state store (core/state_store.py), so with STATE_STORE set to a shared
+backend a limit such as 5/minute holds across all workers rather than per
+worker. Each endpoint keeps its own window: slowapi keys a hit by client
+address and route.
+
+Disabled in the test environment so test suites don't trip the limits.
+"""
+
+import os
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from core.state_store import StateStoreStorage
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    enabled=os.environ.get("ENVIRONMENT") != "test",
+    storage_uri=f"{StateStoreStorage.STORAGE_SCHEME[0]}://",
+)
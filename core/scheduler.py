@@ -0,0 +1,162 @@
+"""In-process background scheduler for periodic sweeps.
+
+Periodic writes (finalizing closed polls, completing past tournaments,
+purging expired reset tokens) used to piggyback on GET requests, so read
+traffic opened write transactions. They run here instead, started and
+stopped by the app's lifespan (see app_setup.py).
+
+Only one process runs jobs at a time. On every tick the scheduler claims or
+renews a lease row in ``scheduler_leases``; a process that finds an
+unexpired lease held by someone else skips the tick. If the leader dies its
+lease expires after LEASE_SECONDS and the next process to tick takes over.
+Jobs must be idempotent: a new leader runs every job on its first tick.
+
+The lease is renewed before each job, so a tick running several jobs keeps
+it, and a leader that lost it mid-tick stops before its next job. It is not
+renewed while a job runs: a single job that runs longer than LEASE_SECONDS
+(90 s by default) can overlap with the same job on the next leader. Keep jobs
+well under the lease, or raise SCHEDULER_LEASE_SECONDS.
+"""
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Sequence
+
+from sqlalchemy import delete, or_, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+
+from core.db_schema import SchedulerLease, get_session, utc_now
+from core.helpers.logging import get_logger
+from core.monitoring.metrics import scheduler_job_duration_seconds, scheduler_job_failures_total
+
+logger = get_logger(__name__)
+
+TICK_SECONDS = float(os.environ.get("SCHEDULER_TICK_SECONDS", "30"))
+LEASE_SECONDS = float(os.environ.get("SCHEDULER_LEASE_SECONDS", "90"))
+LEASE_NAME = "background_jobs"
+
+
+@dataclass
+class Job:
+    """A periodic job: ``func`` runs every ``interval`` seconds on the leader."""
+
+    name: str
+    func: Callable[[], Any]
+    interval: float
+    next_run: float = 0.0
+
+
+def try_acquire_lease(holder: str, name: str = LEASE_NAME, now: Optional[datetime] = None) -> bool:
+    """Claim or renew lease ``name`` for ``holder``; False if someone else holds it."""
+    now = now or utc_now()
+    expires_at = now + timedelta(seconds=LEASE_SECONDS)
+    with get_session() as session:
+        claimed = session.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == name)
+            .where(or_(SchedulerLease.holder == holder, SchedulerLease.expires_at < now))
+            .values(holder=holder, expires_at=expires_at)
+        )
+        if claimed.rowcount:  # type: ignore[attr-defined]
+            return True
+        if session.get(SchedulerLease, name) is not None:
+            return False
+        session.add(SchedulerLease(name=name, holder=holder, expires_at=expires_at))
+        try:
+            session.flush()
+        except IntegrityError:
+            # Another process inserted the row first.
+            session.rollback()
+            return False
+    return True
+
+
+def release_lease(holder: str, name: str = LEASE_NAME) -> None:
+    """Give up lease ``name`` if ``holder`` has it, so another process can lead at once."""
+    with get_session() as session:
+        session.execute(
+            delete(SchedulerLease)
+            .where(SchedulerLease.name == name)
+            .where(SchedulerLease.holder == holder)
+        )
+
+
+def _run_job(job: Job) -> None:
+    started = time.perf_counter()
+    try:
+        job.func()
+    except Exception:
+        scheduler_job_failures_total.labels(job=job.name).inc()
+        logger.exception(f"Scheduled job {job.name} failed")
+    finally:
+        scheduler_job_duration_seconds.labels(job=job.name).observe(time.perf_counter() - started)
+
+
+class Scheduler:
+    """Runs due jobs on a fixed tick while this process holds the lease."""
+
+    def __init__(
+        self,
+        jobs: Sequence[Job],
+        holder: Optional[str] = None,
+        tick_seconds: float = TICK_SECONDS,
+    ) -> None:
+        self.jobs = list(jobs)
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.tick_seconds = tick_seconds
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _hold_lease(self) -> bool:
+        """Claim or renew the lease; False if another process holds it."""
+        try:
+            return try_acquire_lease(self.holder)
+        except SQLAlchemyError:
+            logger.exception("Scheduler could not claim its lease")
+            return False
+
+    def run_pending(self, now: Optional[float] = None) -> List[str]:
+        """Run one tick synchronously and return the names of the jobs that ran."""
+        if not self._hold_lease():
+            return []
+        now = time.monotonic() if now is None else now
+        ran: List[str] = []
+        for job in self.jobs:
+            if job.next_run > now:
+                continue
+            # The earlier jobs may have used up most of the lease.
+            if ran and not self._hold_lease():
+                break
+            job.next_run = now + job.interval
+            _run_job(job)
+            ran.append(job.name)
+        return ran
+
+    async def _loop(self) -> None:
+        while True:
+            await run_in_threadpool(self.run_pending)
+            await asyncio.sleep(self.tick_seconds)
+
+    def start(self) -> None:
+        """Start ticking on the running event loop."""
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop ticking and hand the lease back."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        try:
+            await run_in_threadpool(release_lease, self.holder)
+        except SQLAlchemyError:
+            logger.exception("Scheduler could not release its lease")
@@ -1,46 +1,66 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+# script-src omits 'unsafe-inline': every inline on*= handler and
+# inline <script> block has been migrated to addEventListener and
+# external files (Phase 4+5+6 of the audit). This closes the single
+# biggest XSS amplifier — any future escape gap is now blocked by
+# the browser rather than fully exploitable.
+# style-src still allows 'unsafe-inline' because templates carry
+# inline style="" attributes (Tabler card layouts, photo-grid
+# positioning, etc.). Migrating those to classes is a follow-up.
+_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' "
+    "https://cdn.jsdelivr.net https://unpkg.com https://challenges.cloudflare.com; "
+    "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://fonts.googleapis.com; "
+    "font-src 'self' https://cdn.jsdelivr.net https://fonts.gstatic.com; "
+    "img-src 'self' data: https:; "
+    "frame-src https://www.google.com https://maps.google.com https://challenges.cloudflare.com; "
+    "connect-src 'self' https://challenges.cloudflare.com"
+)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
+_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "0",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
+}
+
+
+class SecurityHeadersMiddleware:
+    """Add the security headers and Content-Security-Policy to every HTTP response.
+
+    Plain ASGI: the headers go into the ``http.response.start`` message, so
+    streaming responses pass through unbuffered.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Check if request is HTTPS (directly or via reverse proxy)
         is_https = (
-            request.url.scheme == "https" or request.headers.get("x-forwarded-proto") == "https"
+            scope.get("scheme") == "https"
+            or Headers(scope=scope).get("x-forwarded-proto") == "https"
         )
 
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "0"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-
-        if is_https:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        # script-src omits 'unsafe-inline': every inline on*= handler and
-        # inline <script> block has been migrated to addEventListener and
-        # external files (Phase 4+5+6 of the audit). This closes the single
-        # biggest XSS amplifier — any future escape gap is now blocked by
-        # the browser rather than fully exploitable.
-        # style-src still allows 'unsafe-inline' because templates carry
-        # inline style="" attributes (Tabler card layouts, photo-grid
-        # positioning, etc.). Migrating those to classes is a follow-up.
-        csp = (
-            "default-src 'self'; "
-            "script-src 'self' "
-            "https://cdn.jsdelivr.net https://unpkg.com https://challenges.cloudflare.com; "
-            "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://fonts.googleapis.com; "
-            "font-src 'self' https://cdn.jsdelivr.net https://fonts.gstatic.com; "
-            "img-src 'self' data: https:; "
-            "frame-src https://www.google.com https://maps.google.com https://challenges.cloudflare.com; "
-            "connect-src 'self' https://challenges.cloudflare.com"
-        )
-        # Only upgrade insecure requests in production (HTTPS)
-        if is_https:
-            csp += "; upgrade-insecure-requests"
-        response.headers["Content-Security-Policy"] = csp
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in _HEADERS.items():
+                    headers[name] = value
+                if is_https:
+                    headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+                # Only upgrade insecure requests in production (HTTPS)
+                headers["Content-Security-Policy"] = (
+                    f"{_CSP}; upgrade-insecure-requests" if is_https else _CSP
+                )
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
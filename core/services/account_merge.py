@@ -18,6 +18,7 @@ from core.db_schema.models import (
     Tournament,
 )
 from core.helpers.logging import get_logger
+from core.services.result_changes import results_changed
 
 logger = get_logger(__name__)
 
@@ -202,6 +203,23 @@ def execute_merge(
                 {"poll_id": poll_id, "poll_title": title} for poll_id, title in duplicate_votes
             ]
 
+            # Tournaments whose results move between anglers; derived result
+            # data for them is refreshed once the UPDATEs below have run.
+            affected_tournament_ids = {
+                tid
+                for (tid,) in session.query(Result.tournament_id).filter(
+                    Result.angler_id == source_angler_id
+                )
+            } | {
+                tid
+                for (tid,) in session.query(TeamResult.tournament_id).filter(
+                    or_(
+                        TeamResult.angler1_id == source_angler_id,
+                        TeamResult.angler2_id == source_angler_id,
+                    )
+                )
+            }
+
             # Update results
             session.execute(
                 update(Result)
@@ -285,6 +303,8 @@ def execute_merge(
                 .delete(synchronize_session=False)
             )
 
+            results_changed(session.connection(), affected_tournament_ids)
+
             session.commit()
 
             logger.info(
@@ -0,0 +1,223 @@
+"""Precomputed Angler-of-the-Year standings.
+
+AoY points depend on every result in a tournament (places, member/guest
+point gaps, buy-in and zero rules — see calculate_tournament_points), so they
+used to be recomputed for a whole year on every /awards hit. They now live in
+two tables:
+
+* ``aoy_tournament_points`` — one row per (tournament, angler), rebuilt for
+  a single tournament whenever its results change.
+* ``aoy_standings`` — per-year totals per angler, re-aggregated from the
+  points table for the years those tournaments belong to.
+
+Writers reach :func:`refresh_tournament_points` through
+``core.services.result_changes.results_changed``. Readers only read, via
+:func:`get_aoy_standings` / :func:`get_aoy_positions`. A year that has
+results but was never built (fresh deploy, or results loaded outside the
+app) is built by :func:`build_missing_years`, a background scheduler job.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Connection, text
+
+from core.helpers.tournament_points import calculate_points_by_tournament
+from core.query_service.dialect_helpers import safe_in_clause
+
+_TOURNAMENT_RESULTS_SQL = """
+    SELECT vatr.tournament_id, e.year, vatr.angler_id, vatr.total_weight, vatr.num_fish,
+           vatr.big_bass_weight, vatr.buy_in, vatr.disqualified, vatr.was_member
+    FROM v_angler_tournament_results vatr
+    JOIN tournaments t ON vatr.tournament_id = t.id
+    JOIN events e ON t.event_id = e.id
+    WHERE e.year IS NOT NULL AND {where_sql}
+    ORDER BY vatr.tournament_id, vatr.total_weight DESC
+"""
+
+_UNBUILT_YEARS_SQL = """
+    SELECT DISTINCT e.year
+    FROM tournaments t
+    JOIN events e ON t.event_id = e.id
+    WHERE e.year IS NOT NULL
+      AND (
+          EXISTS (SELECT 1 FROM results r WHERE r.tournament_id = t.id)
+          OR EXISTS (SELECT 1 FROM team_results tr WHERE tr.tournament_id = t.id)
+      )
+      AND NOT EXISTS (SELECT 1 FROM aoy_standings s WHERE s.year = e.year)
+    ORDER BY e.year
+"""
+
+_INSERT_POINTS_SQL = """
+    INSERT INTO aoy_tournament_points
+        (tournament_id, angler_id, year, place, points, num_fish, total_weight)
+    VALUES (:tournament_id, :angler_id, :year, :place, :points, :num_fish, :total_weight)
+"""
+
+_STANDINGS_SQL = """
+    SELECT a.id as angler_id, a.name, s.total_points, s.total_fish, s.total_weight,
+           s.tournaments_fished
+    FROM aoy_standings s
+    JOIN anglers a ON s.angler_id = a.id
+    WHERE s.year = :year AND a.member = true
+    ORDER BY s.total_points DESC, s.total_weight DESC, a.name
+"""
+
+
+def _in_clause(conn: Connection, values: Sequence[int], prefix: str) -> Tuple[str, Dict[str, Any]]:
+    return safe_in_clause(list(values), prefix, conn.dialect.name)  # type: ignore[arg-type]
+
+
+def _points_rows(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Score every tournament in ``results`` and shape the rows for aoy_tournament_points."""
+    return [
+        {
+            "tournament_id": int(scored["tournament_id"]),
+            "angler_id": int(scored["angler_id"]),
+            "year": int(scored["year"]),
+            "place": int(scored["calculated_place"]),
+            "points": int(scored["calculated_points"]),
+            "num_fish": int(scored.get("num_fish") or 0),
+            "total_weight": float(scored.get("total_weight") or 0),
+        }
+        for tournament_results in calculate_points_by_tournament(results).values()
+        for scored in tournament_results
+    ]
+
+
+def _insert_points(conn: Connection, where_sql: str, params: Dict[str, Any]) -> None:
+    """Score the results matching ``where_sql`` (over vatr/e) and insert their points rows."""
+    results: List[Dict[str, Any]] = []
+    for row in conn.execute(text(_TOURNAMENT_RESULTS_SQL.format(where_sql=where_sql)), params):
+        result = dict(row._mapping)
+        # SQLite hands booleans back as 0/1; the scorer masks on real bools.
+        for flag in ("buy_in", "disqualified", "was_member"):
+            result[flag] = bool(result[flag])
+        results.append(result)
+    rows = _points_rows(results)
+    if rows:
+        conn.execute(text(_INSERT_POINTS_SQL), rows)
+
+
+def rebuild_year_standings(conn: Connection, years: Iterable[int]) -> None:
+    """Re-aggregate aoy_standings for ``years`` from aoy_tournament_points."""
+    year_list = sorted(set(years))
+    if not year_list:
+        return
+    in_sql, params = _in_clause(conn, year_list, "years")
+    conn.execute(text(f"DELETE FROM aoy_standings WHERE year {in_sql}"), params)  # nosec B608
+    conn.execute(
+        text(
+            f"""INSERT INTO aoy_standings
+                   (year, angler_id, total_points, total_fish, total_weight, tournaments_fished)
+               SELECT year, angler_id, SUM(points), SUM(num_fish), SUM(total_weight), COUNT(*)
+               FROM aoy_tournament_points
+               WHERE year {in_sql}
+               GROUP BY year, angler_id"""  # nosec B608
+        ),
+        params,
+    )
+
+
+def refresh_tournament_points(conn: Connection, tournament_ids: Iterable[int]) -> None:
+    """Recompute AoY points for the given tournaments and the standings of their years.
+
+    Runs in the caller's transaction. Years are collected both from the rows
+    being replaced and from the tournaments' events, so moving an event to
+    another year re-aggregates both. A year that was never built is built in
+    full first, so a single write can't leave it holding one tournament.
+    """
+    ids = sorted(set(tournament_ids))
+    if not ids:
+        return
+    in_sql, params = _in_clause(conn, ids, "tids")
+    years = {
+        row[0]
+        for row in conn.execute(
+            text(
+                f"""SELECT year FROM aoy_tournament_points WHERE tournament_id {in_sql}
+                    UNION
+                    SELECT e.year FROM tournaments t JOIN events e ON t.event_id = e.id
+                    WHERE t.id {in_sql} AND e.year IS NOT NULL"""  # nosec B608
+            ),
+            params,
+        )
+    }
+    for year in sorted(years):
+        if not _year_built(conn, year):
+            rebuild_year(conn, year)
+    conn.execute(
+        text(f"DELETE FROM aoy_tournament_points WHERE tournament_id {in_sql}"),  # nosec B608
+        params,
+    )
+    _insert_points(conn, f"vatr.tournament_id {in_sql}", params)
+    rebuild_year_standings(conn, years)
+
+
+def rebuild_year(conn: Connection, year: int) -> None:
+    """Recompute every tournament's points for ``year`` and its standings."""
+    conn.execute(text("DELETE FROM aoy_tournament_points WHERE year = :year"), {"year": year})
+    _insert_points(conn, "e.year = :year", {"year": year})
+    rebuild_year_standings(conn, [year])
+
+
+def _year_built(conn: Connection, year: int) -> bool:
+    return (
+        conn.execute(
+            text("SELECT 1 FROM aoy_standings WHERE year = :year LIMIT 1"), {"year": year}
+        ).first()
+        is not None
+    )
+
+
+def ensure_year_built(conn: Connection, year: int) -> bool:
+    """Build ``year`` if it has no stored standings; return True if rows were written.
+
+    A year with no results stays empty and is cheap to re-check. Callers own
+    the transaction and must commit when this returns True.
+    """
+    if _year_built(conn, year):
+        return False
+    rebuild_year(conn, year)
+    return _year_built(conn, year)
+
+
+def build_missing_years(conn: Connection) -> List[int]:
+    """Build every year that has results but no stored standings; return those years.
+
+    Callers own the transaction.
+    """
+    years = [int(row[0]) for row in conn.execute(text(_UNBUILT_YEARS_SQL))]
+    for year in years:
+        rebuild_year(conn, year)
+    return years
+
+
+def get_aoy_standings(conn: Connection, year: int) -> List[Dict[str, Any]]:
+    """Current members' AoY standings for ``year``, best first.
+
+    Reads the stored table only; unbuilt years come back empty until
+    :func:`build_missing_years` has run.
+    """
+    return [
+        {
+            "angler_id": row["angler_id"],
+            "name": row["name"],
+            "total_points": int(row["total_points"] or 0),
+            "total_fish": int(row["total_fish"] or 0),
+            "total_weight": float(row["total_weight"] or 0),
+            "tournaments_fished": int(row["tournaments_fished"] or 0),
+        }
+        for row in (r._mapping for r in conn.execute(text(_STANDINGS_SQL), {"year": year}))
+    ]
+
+
+def get_aoy_positions(
+    conn: Connection, year: int, angler_ids: Optional[Iterable[int]] = None
+) -> Dict[int, int]:
+    """Map angler_id -> 1-based AoY position among current members for ``year``."""
+    wanted = set(angler_ids) if angler_ids is not None else None
+    return {
+        standing["angler_id"]: position
+        for position, standing in enumerate(get_aoy_standings(conn, year), start=1)
+        if wanted is None or standing["angler_id"] in wanted
+    }
@@ -0,0 +1,200 @@
+"""Stored big bass pot carryover.
+
+The big bass pot rolls over whenever no member (at the time) catches a bass
+over BIG_BASS_MINIMUM_WEIGHT. Working out what a tournament inherits used to
+mean scanning every earlier tournament on each results-page view. The
+``big_bass_ledger`` table keeps one row per tournament with results instead:
+its entry count, what it put into the pot, whether a member won, and the
+running carryover left after it.
+
+Rows only depend on earlier rows, so a change is handled by recomputing
+forward from the earliest changed tournament's date
+(:func:`refresh_big_bass_ledger`, reached through
+``core.services.result_changes.results_changed``). Readers look up a single
+row (:func:`get_carryover`). Tournaments with results but no row (fresh
+deploy, or results loaded outside the app) are picked up by
+:func:`build_missing_ledger`, a background scheduler job.
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import Connection, text
+
+from core.query_service.dialect_helpers import safe_in_clause
+
+# Big bass pot rates per SABC bylaws (Article V). The bylaws changed in 2026:
+# earlier tournaments fund the pot per angler, team-format ones per boat.
+PAYOUT_BIG_BASS_PER_BOAT = Decimal("8.00")  # 2026+ team format: $8/boat
+PAYOUT_BIG_BASS_PER_ANGLER_2025 = Decimal("4.00")  # 2025 and earlier: $4/angler
+BIG_BASS_MINIMUM_WEIGHT = Decimal("5.0")  # Must be over 5 lbs to qualify
+TEAM_FORMAT_START_YEAR = 2026
+
+_ZERO = Decimal("0.00")
+
+# Tournaments on or after :start that have rows in either result view, with
+# their per-angler and per-boat entry counts and whether a member won.
+_TOURNAMENTS_SQL = """
+    WITH scope AS (
+        SELECT t.id, e.date, e.year
+        FROM tournaments t
+        JOIN events e ON t.event_id = e.id
+        WHERE e.date >= :start
+    ),
+    angler_counts AS (
+        SELECT vatr.tournament_id,
+               COUNT(DISTINCT vatr.angler_id) as angler_count,
+               MAX(CASE WHEN vatr.was_member = TRUE
+                             AND vatr.big_bass_weight > :min_weight
+                             AND vatr.disqualified = FALSE THEN 1 ELSE 0 END) as member_won
+        FROM v_angler_tournament_results vatr
+        WHERE vatr.tournament_id IN (SELECT id FROM scope)
+        GROUP BY vatr.tournament_id
+    ),
+    boat_counts AS (
+        SELECT vttr.tournament_id, COUNT(*) as boat_count
+        FROM v_team_tournament_results vttr
+        WHERE vttr.tournament_id IN (SELECT id FROM scope)
+        GROUP BY vttr.tournament_id
+    )
+    SELECT scope.id as tournament_id, scope.date as event_date, scope.year,
+           COALESCE(ac.angler_count, 0) as angler_count,
+           COALESCE(bc.boat_count, 0) as boat_count,
+           COALESCE(ac.member_won, 0) as member_won
+    FROM scope
+    LEFT JOIN angler_counts ac ON ac.tournament_id = scope.id
+    LEFT JOIN boat_counts bc ON bc.tournament_id = scope.id
+    WHERE ac.tournament_id IS NOT NULL OR bc.tournament_id IS NOT NULL
+    ORDER BY scope.date, scope.id
+"""
+
+_CARRYOVER_BEFORE_SQL = """
+    SELECT carryover FROM big_bass_ledger
+    WHERE event_date < :event_date
+    ORDER BY event_date DESC, tournament_id DESC
+    LIMIT 1
+"""
+
+_INSERT_SQL = """
+    INSERT INTO big_bass_ledger
+        (tournament_id, event_date, entries, pot_contribution, member_won, carryover)
+    VALUES (:tournament_id, :event_date, :entries, :pot_contribution, :member_won, :carryover)
+"""
+
+_EARLIEST_MISSING_SQL = """
+    SELECT MIN(e.date)
+    FROM tournaments t
+    JOIN events e ON t.event_id = e.id
+    WHERE (
+        EXISTS (SELECT 1 FROM v_angler_tournament_results vatr WHERE vatr.tournament_id = t.id)
+        OR EXISTS (SELECT 1 FROM v_team_tournament_results vttr WHERE vttr.tournament_id = t.id)
+    )
+      AND NOT EXISTS (SELECT 1 FROM big_bass_ledger l WHERE l.tournament_id = t.id)
+"""
+
+
+def _team_format(year: Optional[int]) -> bool:
+    return year is not None and year >= TEAM_FORMAT_START_YEAR
+
+
+def entry_count(year: Optional[int], angler_count: int, boat_count: int) -> int:
+    """Entries funding the pot: boats from 2026 on, anglers before.
+
+    Falls back to the other count when the preferred one is zero.
+    """
+    if _team_format(year):
+        return boat_count or angler_count
+    return angler_count or boat_count
+
+
+def pot_contribution(year: Optional[int], entries: int) -> Decimal:
+    """What one tournament puts into the big bass pot, at its year's bylaw rate."""
+    rate = PAYOUT_BIG_BASS_PER_BOAT if _team_format(year) else PAYOUT_BIG_BASS_PER_ANGLER_2025
+    return rate * Decimal(entries)
+
+
+def _as_decimal(value: Any) -> Decimal:
+    # SQLite hands NUMERIC back as float.
+    return Decimal(str(value)).quantize(_ZERO) if value is not None else _ZERO
+
+
+def get_carryover(conn: Connection, event_date: Any) -> Decimal:
+    """The unclaimed pot a tournament on ``event_date`` inherits from earlier ones."""
+    return _as_decimal(
+        conn.execute(text(_CARRYOVER_BEFORE_SQL), {"event_date": event_date}).scalar()
+    )
+
+
+def rebuild_ledger_from(conn: Connection, start: date) -> int:
+    """Recompute every ledger row dated on or after ``start``; return how many were written.
+
+    Starts from the running carryover of the last row before ``start``.
+    Callers own the transaction.
+    """
+    carryover = get_carryover(conn, start)
+    conn.execute(text("DELETE FROM big_bass_ledger WHERE event_date >= :start"), {"start": start})
+    rows: List[Dict[str, Any]] = []
+    for t in conn.execute(
+        text(_TOURNAMENTS_SQL), {"start": start, "min_weight": float(BIG_BASS_MINIMUM_WEIGHT)}
+    ):
+        entries = entry_count(t.year, int(t.angler_count), int(t.boat_count))
+        contribution = pot_contribution(t.year, entries)
+        member_won = t.member_won == 1
+        # A member's win pays the pot out; otherwise it rolls into the next tournament.
+        carryover = _ZERO if member_won else carryover + contribution
+        rows.append(
+            {
+                "tournament_id": t.tournament_id,
+                "event_date": t.event_date,
+                "entries": entries,
+                "pot_contribution": float(contribution),
+                "member_won": member_won,
+                "carryover": float(carryover),
+            }
+        )
+    if rows:
+        conn.execute(text(_INSERT_SQL), rows)
+    return len(rows)
+
+
+def refresh_big_bass_ledger(conn: Connection, tournament_ids: Iterable[int]) -> None:
+    """Recompute the ledger forward from the earliest of the given tournaments.
+
+    Runs in the caller's transaction. Dates are taken both from the rows
+    being replaced and from the tournaments' events, so moving an event
+    earlier or later recomputes from whichever date comes first.
+    """
+    ids = sorted(set(tournament_ids))
+    if not ids:
+        return
+    in_sql, params = safe_in_clause(ids, "tids", conn.dialect.name)  # type: ignore[arg-type]
+    start = conn.execute(
+        text(
+            f"""SELECT MIN(d) FROM (
+                    SELECT event_date as d FROM big_bass_ledger WHERE tournament_id {in_sql}
+                    UNION ALL
+                    SELECT e.date FROM tournaments t JOIN events e ON t.event_id = e.id
+                    WHERE t.id {in_sql}
+                ) changed"""  # nosec B608
+        ),
+        params,
+    ).scalar()
+    if start is not None:
+        rebuild_ledger_from(conn, _as_date(start))
+
+
+def build_missing_ledger(conn: Connection) -> int:
+    """Fill in tournaments that have results but no ledger row; return rows written.
+
+    Callers own the transaction.
+    """
+    start = conn.execute(text(_EARLIEST_MISSING_SQL)).scalar()
+    if start is None:
+        return 0
+    return rebuild_ledger_from(conn, _as_date(start))
+
+
+def _as_date(value: Any) -> date:
+    # SQLite returns MIN() over a DATE column as an ISO string.
+    return date.fromisoformat(value) if isinstance(value, str) else value
@@ -0,0 +1,40 @@
+"""Single hook for keeping derived result data in step with result writes.
+
+Every route or service that INSERTs/UPDATEs/DELETEs ``results`` or
+``team_results`` calls :func:`results_changed` with the tournaments it touched,
+inside the same transaction and before committing. Anything derived from the
+raw result tables (the materialized result views, then the precomputed
+Angler-of-the-Year points and standings and the big bass carryover ledger)
+is refreshed here, snapshots of frozen seasons the write touches are
+dropped, and the /data dashboard cache is invalidated, so writers don't each
+need to know what to invalidate.
+"""
+
+from typing import Iterable
+
+from sqlalchemy import Connection
+
+from core.db_schema.materialized_views import refresh_result_views
+from core.query_service.data_cache import invalidate_on_commit
+from core.services.aoy_standings import refresh_tournament_points
+from core.services.big_bass_ledger import refresh_big_bass_ledger
+from core.services.season_snapshots import drop_touched_seasons
+
+
+def results_changed(conn: Connection, tournament_ids: Iterable[int]) -> None:
+    """Refresh derived result data for the given tournaments.
+
+    Args:
+        conn: Connection inside the writing transaction.
+        tournament_ids: Tournaments whose results/team_results rows changed.
+    """
+    ids = sorted(set(tournament_ids))
+    if not ids:
+        return
+    # Order matters: AoY points and the ledger are computed from the result
+    # views, which must already reflect the write when they are materialized.
+    refresh_result_views(conn, ids)
+    refresh_tournament_points(conn, ids)
+    refresh_big_bass_ledger(conn, ids)
+    drop_touched_seasons(conn, ids)
+    invalidate_on_commit(conn)
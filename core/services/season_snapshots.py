@@ -0,0 +1,206 @@
+"""Frozen snapshots of completed seasons.
+
+Once a season is over its awards page, its tournaments' results pages and
+its rows of the /data dashboard never change, yet they were rebuilt from raw
+results on every request. Freezing a season (scripts/freeze_season.py)
+stores each of them as a part in ``season_snapshots``; the read paths serve
+a part when one exists and fall back to live queries otherwise, which is
+always the case for the current year since it can't be frozen.
+
+Parts are tagged JSON (core/helpers/snapshot_codec.py) stamped with
+SNAPSHOT_FORMAT_VERSION. Readers ignore parts written in another version and
+fall back to live queries until the season is frozen again.
+
+A snapshot keeps angler names and membership flags as they were when it was
+built. Admin writes to a frozen season's results, events or tournaments (a
+correction, an account merge) drop its snapshot, and every later season's,
+whose big bass carryover runs through it: result writes through
+``core.services.result_changes.results_changed``, event and tournament edits
+through routes/admin/events/update_helpers.py. Freeze it again afterwards.
+
+:func:`freeze_season` and :func:`thaw_season` are run from
+scripts/freeze_season.py. Each part is built with the loader its live page
+uses, so a page served from a snapshot renders exactly as the live page did
+when the season was frozen.
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import Connection, bindparam, text
+
+from core.db_schema import utc_now
+from core.helpers.logging import get_logger
+from core.helpers.snapshot_codec import SNAPSHOT_FORMAT_VERSION, decode, encode
+from core.query_service import QueryService
+from core.query_service.dashboard_facts import load_season_facts
+from core.query_service.data_cache import invalidate_on_commit
+from core.services.aoy_standings import build_missing_years
+from core.services.big_bass_ledger import build_missing_ledger
+
+logger = get_logger(__name__)
+
+# Part kinds. Year-wide parts (awards, dashboard) use item_id YEAR_PART;
+# tournament parts use the tournament id.
+AWARDS = "awards"
+TOURNAMENT = "tournament"
+DASHBOARD = "dashboard"
+YEAR_PART = 0
+
+_INSERT_SQL = """
+    INSERT INTO season_snapshots (year, kind, item_id, format_version, built_at, payload)
+    VALUES (:year, :kind, :item_id, :format_version, :built_at, :payload)
+"""
+
+_PART_SQL = """
+    SELECT payload FROM season_snapshots
+    WHERE year = :year AND kind = :kind AND item_id = :item_id
+      AND format_version = :format_version
+"""
+
+_SEASONS_SQL = """
+    SELECT year, format_version, MIN(built_at) as built_at, COUNT(*) as parts
+    FROM season_snapshots
+    GROUP BY year, format_version
+    ORDER BY year
+"""
+
+_SEASON_TOURNAMENTS_SQL = """
+    SELECT t.id FROM tournaments t
+    JOIN events e ON t.event_id = e.id
+    WHERE e.year = :year
+    ORDER BY e.date, t.id
+"""
+
+# Frozen seasons a result write to these tournaments makes stale: the year
+# they are in now, the year they were frozen under if their event has moved,
+# and every later season, whose big bass carryover runs through them.
+_TOUCHED_SEASONS_SQL = text(
+    """
+    SELECT DISTINCT year FROM season_snapshots
+    WHERE year >= (
+        SELECT MIN(touched.year) FROM (
+            SELECT e.year FROM tournaments t JOIN events e ON t.event_id = e.id
+            WHERE t.id IN :ids
+            UNION ALL
+            SELECT year FROM season_snapshots WHERE kind = 'tournament' AND item_id IN :ids
+        ) touched
+    )
+    ORDER BY year
+    """
+).bindparams(bindparam("ids", expanding=True))
+
+
+def is_completed_season(year: int, today: date) -> bool:
+    """Only seasons before the current year can be frozen."""
+    return year < today.year
+
+
+def store_season(conn: Connection, year: int, parts: Mapping[Tuple[str, int], Any]) -> int:
+    """Replace ``year``'s snapshot with ``parts`` ((kind, item_id) -> payload).
+
+    Returns the number of parts written. Callers own the transaction.
+    """
+    delete_season(conn, year)
+    built_at = utc_now()
+    rows = [
+        {
+            "year": year,
+            "kind": kind,
+            "item_id": item_id,
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "built_at": built_at,
+            "payload": encode(payload),
+        }
+        for (kind, item_id), payload in parts.items()
+    ]
+    if rows:
+        conn.execute(text(_INSERT_SQL), rows)
+    return len(rows)
+
+
+def delete_season(conn: Connection, year: int) -> int:
+    """Drop ``year``'s snapshot; return how many parts were removed."""
+    result = conn.execute(text("DELETE FROM season_snapshots WHERE year = :year"), {"year": year})
+    return result.rowcount  # type: ignore[attr-defined, no-any-return]
+
+
+def get_season_part(
+    conn: Connection, year: int, kind: str, item_id: int = YEAR_PART
+) -> Optional[Any]:
+    """Decoded part, or None when the season isn't frozen in the current format."""
+    payload = conn.execute(
+        text(_PART_SQL),
+        {
+            "year": year,
+            "kind": kind,
+            "item_id": item_id,
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+        },
+    ).scalar()
+    return decode(payload) if payload is not None else None
+
+
+def list_seasons(conn: Connection) -> List[Dict[str, Any]]:
+    """Frozen seasons with their format version, build time and part count."""
+    return [dict(row._mapping) for row in conn.execute(text(_SEASONS_SQL))]
+
+
+def drop_touched_seasons(conn: Connection, tournament_ids: Iterable[int]) -> None:
+    """Drop the snapshots of frozen seasons a write to these tournaments makes stale.
+
+    Runs in the caller's transaction. The season's pages fall back to live
+    queries until it is frozen again.
+    """
+    ids = sorted(set(tournament_ids))
+    if not ids:
+        return
+    years = [row.year for row in conn.execute(_TOUCHED_SEASONS_SQL, {"ids": ids})]
+    for year in years:
+        delete_season(conn, year)
+        logger.warning(
+            f"Result write touched frozen season {year}; snapshot dropped until it is re-frozen",
+            extra={"year": year, "tournament_ids": ids},
+        )
+
+
+def build_season_parts(conn: Connection, year: int, today: date) -> Dict[Tuple[str, int], Any]:
+    """Every snapshot part for ``year``, keyed (kind, item_id)."""
+    # The page loaders read snapshots through this module; import them here
+    # to avoid a circular import.
+    from routes.pages.awards import load_season_awards
+    from routes.tournaments.data import load_tournament_page, tournament_page_snapshot
+
+    qs = QueryService(conn)
+    parts: Dict[Tuple[str, int], Any] = {(AWARDS, YEAR_PART): load_season_awards(conn, year)}
+    for row in qs.fetch_all(_SEASON_TOURNAMENTS_SQL, {"year": year}):
+        page = load_tournament_page(qs, row["id"], today)
+        parts[(TOURNAMENT, row["id"])] = tournament_page_snapshot(page)
+    parts[(DASHBOARD, YEAR_PART)] = load_season_facts(qs, year)
+    return parts
+
+
+def freeze_season(conn: Connection, year: int, today: date) -> int:
+    """Build and store ``year``'s snapshot, replacing any existing one.
+
+    Returns the number of parts written. Callers own the transaction.
+
+    Raises:
+        ValueError: If ``year`` is not a completed season
+    """
+    if not is_completed_season(year, today):
+        raise ValueError(f"{year} is not a completed season")
+    # The awards and results pages read stored AoY standings and the big
+    # bass ledger; make sure the background jobs haven't left gaps.
+    build_missing_years(conn)
+    build_missing_ledger(conn)
+    written = store_season(conn, year, build_season_parts(conn, year, today))
+    invalidate_on_commit(conn)
+    return written
+
+
+def thaw_season(conn: Connection, year: int) -> int:
+    """Drop ``year``'s snapshot so its pages are served live; return parts removed."""
+    removed = delete_season(conn, year)
+    invalidate_on_commit(conn)
+    return removed
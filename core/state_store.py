@@ -0,0 +1,321 @@
+"""Expiring counters shared by every worker: login lockout, rate limits, cache generations.
+
+The login lockout (routes/auth/login.py) and slowapi's rate limits
+(core/rate_limit.py) both count events per key over a time window. They keep
+those counts here rather than in module globals, so running more than one
+worker neither multiplies the thresholds nor lets an attacker spread
+attempts across processes.
+
+The /data query cache and the anonymous page cache tag their entries with a
+*generation* that writers bump (:func:`bump_generation`). The generations live
+here too, so a write handled by one worker invalidates every worker's copies.
+
+STATE_STORE picks the backend:
+
+- ``memory`` (default): a dict in this process. Right for a single worker,
+  development and tests; each worker would count on its own.
+- ``database``: the ``state_counters`` table in the app's own database, for
+  workers spread over several containers.
+- ``sqlite:////path/state.db``: a SQLite file, for workers sharing one
+  container. The table is created on first use.
+
+Neither shared backend needs a service the deployment doesn't already run.
+Each increment is a single upsert, so concurrent workers never lose a count.
+"""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Type, Union
+
+from limits.storage import Storage
+from sqlalchemy import case, create_engine, delete, event, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from core.db_schema import StateCounter
+from core.db_schema import engine as app_engine
+from core.helpers.logging import get_logger
+
+logger = get_logger(__name__)
+
+STATE_STORE = os.environ.get("STATE_STORE", "memory")
+# Bounds the memory backend against attackers submitting endless unique keys
+# (e.g. random emails); the least recently used counter is dropped first.
+MEMORY_MAX_KEYS = int(os.environ.get("STATE_STORE_MAX_KEYS", "100000"))
+# How often the database backends delete expired rows.
+PURGE_INTERVAL_SECONDS = 60.0
+# Generations are counters that never expire in practice.
+GENERATION_EXPIRY_SECONDS = 10 * 365 * 24 * 3600.0
+
+
+class StateStore(ABC):
+    """Counters that expire a fixed number of seconds after they start.
+
+    The interface mirrors the storage API of the ``limits`` package that
+    slowapi is built on, plus ``elastic_expiry`` for the login lockout.
+    """
+
+    #: Whether every worker sees the same counters.
+    shared = False
+
+    @abstractmethod
+    def incr(self, key: str, expiry: float, amount: int = 1, elastic_expiry: bool = False) -> int:
+        """Add ``amount`` to ``key`` and return the new count.
+
+        A missing or expired counter starts over and expires ``expiry``
+        seconds from now. With ``elastic_expiry`` every increment pushes the
+        expiry back to ``expiry`` seconds from now.
+        """
+
+    @abstractmethod
+    def get(self, key: str) -> int:
+        """The current count of ``key``; 0 if it is missing or expired."""
+
+    @abstractmethod
+    def get_expiry(self, key: str) -> float:
+        """When ``key`` expires, as a Unix timestamp; now if it is missing."""
+
+    @abstractmethod
+    def clear(self, key: str) -> None:
+        """Forget ``key``."""
+
+    @abstractmethod
+    def reset(self) -> int:
+        """Forget every counter; returns how many there were."""
+
+    def check(self) -> bool:
+        """Whether the backend is reachable."""
+        return True
+
+
+class MemoryStateStore(StateStore):
+    """Counters in this process's memory, capped at ``max_keys``."""
+
+    def __init__(self, max_keys: int = MEMORY_MAX_KEYS) -> None:
+        self._max_keys = max_keys
+        # key -> (count, expires_at), least recently used first
+        self._counters: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _live(self, key: str, now: float) -> Optional[Tuple[int, float]]:
+        """The unexpired entry for ``key``. Caller MUST hold _lock."""
+        entry = self._counters.get(key)
+        if entry is not None and entry[1] <= now:
+            del self._counters[key]
+            return None
+        return entry
+
+    def _make_room(self, now: float) -> None:
+        """Drop expired entries, then the least recently used. Caller MUST hold _lock."""
+        if len(self._counters) < self._max_keys:
+            return
+        for key in [k for k, (_, expires_at) in self._counters.items() if expires_at <= now]:
+            del self._counters[key]
+        while len(self._counters) >= self._max_keys:
+            self._counters.popitem(last=False)
+
+    def incr(self, key: str, expiry: float, amount: int = 1, elastic_expiry: bool = False) -> int:
+        now = time.time()
+        with self._lock:
+            entry = self._live(key, now)
+            if entry is None:
+                self._make_room(now)
+                count, expires_at = amount, now + expiry
+            else:
+                count = entry[0] + amount
+                expires_at = now + expiry if elastic_expiry else entry[1]
+                self._counters.move_to_end(key)
+            self._counters[key] = (count, expires_at)
+            return count
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            entry = self._live(key, time.time())
+            return entry[0] if entry else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._lock:
+            entry = self._live(key, now)
+            return entry[1] if entry else now
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def reset(self) -> int:
+        with self._lock:
+            count = len(self._counters)
+            self._counters.clear()
+            return count
+
+
+class SqlStateStore(StateStore):
+    """Counters in the ``state_counters`` table of a PostgreSQL or SQLite database."""
+
+    shared = True
+
+    def __init__(self, engine: Engine) -> None:
+        if engine.dialect.name not in ("postgresql", "sqlite"):
+            raise ValueError(f"No state store for {engine.dialect.name} databases")
+        self._engine = engine
+        self._next_purge = 0.0
+
+    @classmethod
+    def from_url(cls, url: str) -> "SqlStateStore":
+        """A store in its own SQLite file, created if needed and shared by every local process."""
+        engine = create_engine(url, connect_args={"timeout": 30})
+
+        @event.listens_for(engine, "connect")
+        def _use_wal(dbapi_connection: Any, _record: Any) -> None:
+            # Readers don't block the writer, and one upsert is one short write.
+            dbapi_connection.execute("PRAGMA journal_mode=WAL")
+            dbapi_connection.execute("PRAGMA synchronous=NORMAL")
+
+        StateCounter.__table__.create(engine, checkfirst=True)  # type: ignore[attr-defined]
+        return cls(engine)
+
+    def _purge_expired(self, now: float) -> None:
+        if time.monotonic() < self._next_purge:
+            return
+        self._next_purge = time.monotonic() + PURGE_INTERVAL_SECONDS
+        with self._engine.begin() as conn:
+            conn.execute(delete(StateCounter).where(StateCounter.expires_at <= now))
+
+    def incr(self, key: str, expiry: float, amount: int = 1, elastic_expiry: bool = False) -> int:
+        now = time.time()
+        self._purge_expired(now)
+        dialect = postgresql if self._engine.dialect.name == "postgresql" else sqlite
+        insert = dialect.insert(StateCounter).values(key=key, count=amount, expires_at=now + expiry)
+        # Column references in the SET clause read the existing row.
+        expired = StateCounter.expires_at <= now
+        upsert = insert.on_conflict_do_update(
+            index_elements=[StateCounter.key],
+            set_={
+                "count": case(
+                    (expired, insert.excluded.count),
+                    else_=StateCounter.count + insert.excluded.count,
+                ),
+                "expires_at": (
+                    insert.excluded.expires_at
+                    if elastic_expiry
+                    else case((expired, insert.excluded.expires_at), else_=StateCounter.expires_at)
+                ),
+            },
+        ).returning(StateCounter.count)
+        with self._engine.begin() as conn:
+            count: int = conn.execute(upsert).scalar_one()
+        return count
+
+    def _live_row(self, key: str, now: float) -> Optional[Tuple[int, float]]:
+        with self._engine.connect() as conn:
+            row = conn.execute(
+                select(StateCounter.count, StateCounter.expires_at)
+                .where(StateCounter.key == key)
+                .where(StateCounter.expires_at > now)
+            ).first()
+        # Not row.count: Row is a tuple, and that is tuple.count.
+        return (row[0], row[1]) if row else None
+
+    def get(self, key: str) -> int:
+        row = self._live_row(key, time.time())
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        row = self._live_row(key, now)
+        return row[1] if row else now
+
+    def clear(self, key: str) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(delete(StateCounter).where(StateCounter.key == key))
+
+    def reset(self) -> int:
+        with self._engine.begin() as conn:
+            deleted: int = conn.execute(delete(StateCounter)).rowcount
+        return deleted
+
+    def check(self) -> bool:
+        try:
+            with self._engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except SQLAlchemyError:
+            logger.warning("State store database is unreachable", exc_info=True)
+            return False
+        return True
+
+
+def create_state_store(url: str) -> StateStore:
+    """The store a STATE_STORE value names: ``memory``, ``database`` or a ``sqlite:///`` URL."""
+    if url == "memory":
+        return MemoryStateStore()
+    if url == "database":
+        return SqlStateStore(app_engine)
+    if url.startswith("sqlite:///"):
+        return SqlStateStore.from_url(url)
+    raise ValueError(f"STATE_STORE must be memory, database or a sqlite:/// URL, not {url!r}")
+
+
+_store: Optional[StateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_state_store() -> StateStore:
+    """The process's state store, created from STATE_STORE on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = create_state_store(STATE_STORE)
+    return _store
+
+
+def generation_key(name: str) -> str:
+    """The state store key holding generation ``name``."""
+    return f"generation:{name}"
+
+
+def read_generation(name: str) -> int:
+    """The current value of generation ``name``; 0 until it is first bumped."""
+    return get_state_store().get(generation_key(name))
+
+
+def bump_generation(name: str) -> int:
+    """Advance generation ``name`` for every worker and return the new value."""
+    return get_state_store().incr(generation_key(name), GENERATION_EXPIRY_SECONDS)
+
+
+class StateStoreStorage(Storage):
+    """Rate-limit storage for slowapi (``storage_uri="sabc-state://"``) backed by the state store.
+
+    Looks the store up on every call rather than holding one, so it follows
+    whatever ``get_state_store()`` returns.
+    """
+
+    STORAGE_SCHEME = ["sabc-state"]
+
+    @property
+    def base_exceptions(self) -> Union[Type[Exception], Tuple[Type[Exception], ...]]:
+        return SQLAlchemyError
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        return get_state_store().incr(key, expiry, amount)
+
+    def get(self, key: str) -> int:
+        return get_state_store().get(key)
+
+    def get_expiry(self, key: str) -> float:
+        return get_state_store().get_expiry(key)
+
+    def check(self) -> bool:
+        return get_state_store().check()
+
+    def reset(self) -> Optional[int]:
+        return get_state_store().reset()
+
+    def clear(self, key: str) -> None:
+        get_state_store().clear(key)
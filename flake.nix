@@ -29,6 +29,7 @@
           # Database - PostgreSQL only
           sqlalchemy
           psycopg2  # PostgreSQL adapter
+          asyncpg  # Async PostgreSQL adapter (ASYNC_DB_ENABLED)
 
           # Data processing and validation
           pandas  # Data manipulation for points calculation
@@ -54,6 +55,7 @@
           pytest-cov
           pytest-xdist  # Parallel test execution (-n auto)
           httpx  # Required by FastAPI TestClient
+          aiosqlite  # Async engine against the SQLite test database
 
           # Development tools
           pip   # bootstraps the vendored pip packages in shellHook
@@ -299,6 +301,7 @@
             jinja2
             sqlalchemy
             psycopg2
+            asyncpg
             python-multipart
             itsdangerous
             bcrypt
@@ -91,6 +91,14 @@ else
     $COMPOSE build web
 fi
 
+# 4b. Fingerprint and precompress static assets into static/dist/ (bind-mounted
+#     into both nginx and web) with the new image. Files from the previous
+#     build stay, so the old web container keeps serving pages whose asset
+#     URLs still resolve until the swap.
+echo "🗜️  Building static assets..."
+$COMPOSE run --rm --no-deps -T --user "$(id -u):$(id -g)" -v "$PWD/static:/build/static" \
+    web python scripts/build_static_assets.py --static-dir /build/static
+
 # 5. Run migrations BEFORE swapping the web container, via a one-shot
 #    container spun from the freshly built image. The OLD web container is
 #    still serving traffic during this step — briefly against the NEW schema.
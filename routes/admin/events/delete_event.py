@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from core.db_schema import Event, Poll, PollOption, PollVote, Result, Tournament
 from core.helpers.crud import bulk_delete, delete_entity
+from core.query_service.data_cache import invalidate_on_commit
 
 router = APIRouter()
 
@@ -39,6 +40,7 @@ def _delete_event_cascade(session: Session, event_id: int) -> None:
 
     # Delete tournaments
     bulk_delete(session, Tournament, [Tournament.event_id == event_id])
+    invalidate_on_commit(session.connection())
 
 
 @router.delete("/admin/events/{event_id}")
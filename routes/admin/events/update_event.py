@@ -7,6 +7,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from core.db_schema import Event, get_session
 from core.helpers.auth import require_admin
 from core.helpers.timezone import now_local
+from core.query_service.data_cache import bump_results_generation
 from routes.admin.events.error_handlers import handle_event_error
 from routes.admin.events.param_builders import prepare_event_params
 from routes.admin.events.update_helpers import (
@@ -78,6 +79,9 @@ def _do_event_update(
                     status_code=303,
                 )
 
+    # Event date/year/lake feed the /data dashboard's per-year and per-lake stats.
+    bump_results_generation()
+
     if event_type == "sabc_tournament":
         update_poll_closing_date(event_id, poll_closes_date)
         if poll_id:
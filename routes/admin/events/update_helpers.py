@@ -6,6 +6,8 @@ from sqlalchemy.orm import Session
 from core.db_schema import Event, Poll, Tournament, get_session
 from core.helpers.logging import get_logger
 from core.helpers.timezone import make_aware
+from core.services.result_changes import results_changed
+from core.services.season_snapshots import drop_touched_seasons
 from routes.admin.events.param_builders import parse_hhmm, resolve_lake_ramp_ids
 
 logger = get_logger(__name__)
@@ -14,7 +16,9 @@ logger = get_logger(__name__)
 def update_event_record(session: Session, event_params: Dict[str, Any]) -> int:
     event = session.query(Event).filter(Event.id == event_params["event_id"]).first()
     if event:
-        event.date = datetime.strptime(event_params["date"], "%Y-%m-%d").date()
+        new_date = datetime.strptime(event_params["date"], "%Y-%m-%d").date()
+        moved = event.year != event_params["year"] or event.date != new_date
+        event.date = new_date
         event.year = event_params["year"]
         event.name = event_params["name"]
         event.event_type = event_params["event_type"]
@@ -36,6 +40,17 @@ def update_event_record(session: Session, event_params: Dict[str, Any]) -> int:
         # Update is_cancelled if provided
         if "is_cancelled" in event_params:
             event.is_cancelled = event_params["is_cancelled"]
+        session.flush()
+        tournament_ids = [
+            tid for (tid,) in session.query(Tournament.id).filter(Tournament.event_id == event.id)
+        ]
+        if moved:
+            # AoY standings are stored per year and the big bass ledger runs
+            # in date order; move this event's rows.
+            results_changed(session.connection(), tournament_ids)
+        else:
+            # Names, times and fees show on a frozen season's pages too.
+            drop_touched_seasons(session.connection(), tournament_ids)
         return 1
     return 0
 
@@ -60,6 +75,8 @@ def update_tournament_record(session: Session, tournament_params: Dict[str, Any]
     tournament.fish_limit = tournament_params["fish_limit"]
     tournament.entry_fee = tournament_params["entry_fee"]
     tournament.aoy_points = tournament_params["aoy_points"]
+    session.flush()
+    drop_touched_seasons(session.connection(), [tournament.id])
     return 1
 
 
@@ -1,3 +1,5 @@
+from typing import Optional, Tuple
+
 from fastapi import APIRouter, Form, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
@@ -48,6 +50,19 @@ def create_lake(
         return error_redirect("/admin/lakes", "Failed to create lake")
 
 
+def _parse_coordinates(latitude: str, longitude: str) -> Tuple[Optional[float], Optional[float]]:
+    """Both blank clears the coordinates; otherwise both must be valid degrees."""
+    if not latitude.strip() and not longitude.strip():
+        return None, None
+    try:
+        lat, lon = float(latitude), float(longitude)
+    except ValueError:
+        raise ValueError("Latitude and longitude must both be numbers")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError("Latitude or longitude is out of range")
+    return lat, lon
+
+
 @router.post("/admin/lakes/{lake_id}/update")
 def update_lake(
     request: Request,
@@ -55,8 +70,14 @@ def update_lake(
     name: str = Form(...),
     display_name: str = Form(...),
     google_maps_embed: str = Form(""),
+    latitude: str = Form(""),
+    longitude: str = Form(""),
 ) -> RedirectResponse:
     _user = require_admin(request)
+    try:
+        coordinates = _parse_coordinates(latitude, longitude)
+    except ValueError as e:
+        return error_redirect(f"/admin/lakes/{lake_id}/edit", str(e))
     try:
         with get_session() as session:
             lake = session.query(Lake).filter(Lake.id == lake_id).first()
@@ -66,6 +87,7 @@ def update_lake(
             lake.yaml_key = name.strip().lower().replace(" ", "_")
             lake.display_name = display_name.strip()
             lake.google_maps_iframe = sanitize_iframe(google_maps_embed)
+            lake.latitude, lake.longitude = coordinates
         return RedirectResponse("/admin/lakes?success=Lake updated successfully", status_code=303)
     except HTTPException:
         raise
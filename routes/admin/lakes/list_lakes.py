@@ -43,6 +43,8 @@ def edit_lake_page(request: Request, lake_id: int) -> Response:
             "yaml_key": lake_obj.yaml_key,
             "display_name": lake_obj.display_name,
             "google_maps_iframe": lake_obj.google_maps_iframe,
+            "latitude": lake_obj.latitude,
+            "longitude": lake_obj.longitude,
         }
 
         ramps: List[Dict[str, Any]] = [
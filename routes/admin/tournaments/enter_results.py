@@ -9,7 +9,6 @@ from core.deps import get_db, templates
 from core.helpers.auth import require_admin
 from core.query_service import QueryService
 from core.types import UserDict
-from routes.tournaments.helpers import auto_complete_past_tournaments
 
 router = APIRouter()
 
@@ -21,10 +20,6 @@ def enter_results_page(
     user: UserDict = Depends(require_admin),
     conn: Connection = Depends(get_db),
 ) -> Response:
-    # Auto-complete this tournament only (single-row write on index lookup
-    # instead of a full-table scan).
-    auto_complete_past_tournaments(tournament_id)
-
     qs = QueryService(conn)
 
     tournament = qs.get_tournament_by_id(tournament_id)
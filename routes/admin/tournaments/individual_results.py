@@ -11,6 +11,7 @@ from core.deps import get_db
 from core.helpers.auth import require_admin
 from core.helpers.forms import get_form_bool, get_form_float, get_form_int
 from core.query_service import QueryService
+from core.services.result_changes import results_changed
 from core.types import UserDict
 
 router = APIRouter()
@@ -124,6 +125,7 @@ async def save_result(
                 {"weight": team_total_weight, "team_id": teammate_result["team_result_id"]},
             )
 
+        await run_in_threadpool(results_changed, conn, [tournament_id])
         await run_in_threadpool(conn.commit)
 
         # Check if this is an AJAX request
@@ -163,6 +165,7 @@ def delete_result(
             "DELETE FROM results WHERE id = :id AND tournament_id = :tid",
             {"id": result_id, "tid": tournament_id},
         )
+        results_changed(conn, [tournament_id])
         conn.commit()
 
         # Return success response
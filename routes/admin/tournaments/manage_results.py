@@ -7,6 +7,8 @@ from sqlalchemy import Connection
 from core.deps import get_db
 from core.helpers.auth import require_admin
 from core.query_service import QueryService
+from core.query_service.data_cache import bump_results_generation
+from core.services.result_changes import results_changed
 from core.types import UserDict
 
 router = APIRouter()
@@ -51,6 +53,7 @@ def delete_result(
         "DELETE FROM results WHERE id = :id AND tournament_id = :tid",
         {"id": result_id, "tid": tournament_id},
     )
+    results_changed(conn, [tournament_id])
     logger.info("Committing transaction")
     conn.commit()
     logger.info(f"Successfully deleted result {result_id}")
@@ -92,6 +95,8 @@ def delete_team_result(
         {"id": team_result_id, "tid": tournament_id},
     )
 
+    results_changed(conn, [tournament_id])
+
     # Commit the transaction
     conn.commit()
 
@@ -121,6 +126,8 @@ def toggle_tournament_complete(
         {"status": new_status, "id": tournament_id},
     )
     conn.commit()
+    # The /data dashboard only counts complete tournaments.
+    bump_results_generation()
 
     return JSONResponse(
         {
@@ -11,6 +11,7 @@ from core.deps import get_db
 from core.helpers.auth import require_admin
 from core.helpers.forms import get_form_float, get_form_int
 from core.query_service import QueryService
+from core.services.result_changes import results_changed
 from core.types import UserDict
 
 router = APIRouter()
@@ -181,6 +182,7 @@ async def save_team_result(
                    WHERE tournament_id = :tid""",
                 {"tid": tournament_id},
             )
+        await run_in_threadpool(results_changed, conn, [tournament_id])
         await run_in_threadpool(conn.commit)
         if request.headers.get("X-Requested-With") == "XMLHttpRequest":
             return JSONResponse({"success": True, "message": "Team result saved successfully"})
@@ -1,31 +1,43 @@
+from typing import Any, List
+
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
-from core.db_schema import Lake, Ramp, get_session
+from core.db_schema import Lake, Ramp, async_engine, get_async_session, get_session
 from core.helpers.logging import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+_LAKES_QUERY = select(Lake.id, Lake.yaml_key, Lake.display_name).order_by(Lake.display_name)
+
+
+def _fetch_lakes() -> List[Any]:
+    with get_session() as session:
+        return list(session.execute(_LAKES_QUERY).all())
+
 
 @router.get("/api/lakes")
-def api_get_lakes() -> JSONResponse:
+async def api_get_lakes() -> JSONResponse:
     try:
-        with get_session() as session:
-            lakes_query = (
-                session.query(Lake.id, Lake.yaml_key, Lake.display_name)
-                .order_by(Lake.display_name)
-                .all()
-            )
-            lakes = [
-                {
-                    "key": yaml_key,
-                    "name": display_name,
-                    "id": lake_id,
-                }
-                for lake_id, yaml_key, display_name in lakes_query
-            ]
+        # Read on the async engine when it's enabled; otherwise hop to the
+        # threadpool so the sync query never runs on the event loop.
+        if async_engine.ASYNC_DB_ENABLED:
+            async with get_async_session() as session:
+                lakes_query = list((await session.execute(_LAKES_QUERY)).all())
+        else:
+            lakes_query = await run_in_threadpool(_fetch_lakes)
+        lakes = [
+            {
+                "key": yaml_key,
+                "name": display_name,
+                "id": lake_id,
+            }
+            for lake_id, yaml_key, display_name in lakes_query
+        ]
         return JSONResponse(lakes)
     except SQLAlchemyError as exc:
         # Log and surface a real error rather than silently returning an empty
@@ -1,13 +1,7 @@
-import os
-import threading
-import time
-from collections import OrderedDict
-from typing import List
+import hashlib
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import RedirectResponse, Response
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from sqlalchemy.exc import SQLAlchemyError
 
 from core.db_schema import Angler, get_session
@@ -15,82 +9,43 @@ from core.helpers.forms import normalize_email
 from core.helpers.logging import SecurityEvent, get_logger, log_security_event
 from core.helpers.passwords import bcrypt_gensalt
 from core.helpers.response import get_client_ip, get_safe_redirect_url, set_user_session
+from core.rate_limit import limiter
+from core.state_store import get_state_store
 from routes.dependencies import bcrypt, get_current_user, templates
 
 router = APIRouter()
 logger = get_logger("auth.login")
-# Disable rate limiting in test environment
-is_test_env = os.environ.get("ENVIRONMENT") == "test"
-limiter = Limiter(key_func=get_remote_address, enabled=not is_test_env)
 
 # --- Account lockout (defense-in-depth alongside rate limiting) ---
 #
-# DEPLOYMENT CONSTRAINT: this lockout state — and slowapi's per-IP rate-limit
-# state — lives in-process. It is correct ONLY because production runs a
-# single uvicorn worker per container (see core/db_schema/engine.py, which
-# sizes the connection pool on that same assumption). With N workers the
-# effective lockout threshold becomes N * _MAX_FAILED_ATTEMPTS and a restart
-# clears all counters.
+# Failed attempts are counted per email in the state store
+# (core/state_store.py), next to slowapi's per-IP limits. With STATE_STORE
+# set to a shared backend every worker sees the same count, so the
+# threshold holds however many workers run; with the default memory store
+# each worker counts on its own (see app_setup._assert_single_worker).
 #
-# If this app is ever scaled to multiple workers/containers, this state MUST
-# move to a shared store (Redis, or a small failed_login_attempts table) and
-# slowapi must be given a matching storage backend. Until then, keep the
-# single-worker deployment invariant.
+# Each failure pushes the counter's expiry back, so an account unlocks
+# _LOCKOUT_SECONDS after the last failed attempt.
 _MAX_FAILED_ATTEMPTS = 10
 _LOCKOUT_SECONDS = 900  # 15 minutes
-# Cap total number of tracked emails to bound memory growth from attackers
-# submitting unique random emails.
-_FAILED_ATTEMPTS_MAX = 10000
-_failed_attempts: "OrderedDict[str, List[float]]" = OrderedDict()
-_lockout_lock = threading.Lock()
 
 
-def _purge_expired_entries() -> None:
-    """Drop entries whose newest attempt is older than the lockout window.
-
-    Caller MUST hold _lockout_lock.
-    """
-    cutoff = time.monotonic() - _LOCKOUT_SECONDS
-    # Iterate over a snapshot of keys since we mutate during iteration.
-    for email in list(_failed_attempts.keys()):
-        attempts = _failed_attempts[email]
-        if not attempts or attempts[-1] <= cutoff:
-            del _failed_attempts[email]
+def _lockout_key(email: str) -> str:
+    # Hashed: bounds the key length and keeps emails out of the store.
+    return f"login-lockout/{hashlib.sha256(email.encode()).hexdigest()}"
 
 
 def _is_account_locked(email: str) -> bool:
     """Check if an account is temporarily locked due to failed login attempts."""
-    with _lockout_lock:
-        attempts = _failed_attempts.get(email)
-        if not attempts:
-            return False
-        cutoff = time.monotonic() - _LOCKOUT_SECONDS
-        fresh = [t for t in attempts if t > cutoff]
-        if fresh:
-            _failed_attempts[email] = fresh
-        else:
-            _failed_attempts.pop(email, None)
-        return len(fresh) >= _MAX_FAILED_ATTEMPTS
+    return get_state_store().get(_lockout_key(email)) >= _MAX_FAILED_ATTEMPTS
 
 
 def _record_failed_attempt(email: str) -> None:
-    with _lockout_lock:
-        # Opportunistic purge of stale entries before bookkeeping.
-        _purge_expired_entries()
-        if email in _failed_attempts:
-            # Move-to-end so this key becomes the most-recently-used.
-            _failed_attempts.move_to_end(email)
-            _failed_attempts[email].append(time.monotonic())
-            return
-        # New key — enforce the size cap by evicting the oldest entry first.
-        if len(_failed_attempts) >= _FAILED_ATTEMPTS_MAX:
-            _failed_attempts.popitem(last=False)
-        _failed_attempts[email] = [time.monotonic()]
+    get_state_store().incr(_lockout_key(email), _LOCKOUT_SECONDS, elastic_expiry=True)
 
 
 def _clear_failed_attempts(email: str) -> None:
-    with _lockout_lock:
-        _failed_attempts.pop(email, None)
+    get_state_store().clear(_lockout_key(email))
 
 
 @router.get("/login")
@@ -2,15 +2,16 @@ from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse, Response
-from sqlalchemy import case, desc, func, literal, text
+from sqlalchemy import case, func, text
 from sqlalchemy.exc import SQLAlchemyError
 
-from core.db_schema import Angler, Event, Result, Tournament, get_session
+from core.db_schema import Angler, Event, Tournament, get_session
 from core.db_schema.views import v_team_tournament_results
 from core.enums import TOURNAMENT_DATA_START_YEAR
 from core.helpers.logging import get_logger
 from core.helpers.timezone import now_local
 from core.query_service.dialect_helpers import DialectName, month_extract, year_extract
+from core.services.aoy_standings import get_aoy_positions
 from routes.dependencies import get_current_user, templates
 
 router = APIRouter()
@@ -288,102 +289,12 @@ def profile_page(request: Request) -> Response:
             if year_str in monthly_data and 0 <= month_idx < 12:
                 monthly_data[year_str][month_idx] = float(weight or 0)
 
-        # AOY position (complex query - keeping similar structure)
+        # AOY position among current members, read from the precomputed
+        # standings so it always agrees with /awards.
         aoy_position: Optional[int] = None
         try:
-            # This is a complex query with CTEs - using text query would be acceptable
-            # but let's try to do it with ORM
-
-            # First subquery: tournament_standings
-            tournament_standings_subquery = (
-                session.query(
-                    Result.angler_id,
-                    Result.tournament_id,
-                    Result.total_weight.label("adjusted_weight"),
-                    Result.num_fish,
-                    Result.disqualified,
-                    Result.buy_in,
-                    func.dense_rank()
-                    .over(
-                        partition_by=Result.tournament_id,
-                        order_by=desc(
-                            case(
-                                (
-                                    Result.disqualified.is_(True),
-                                    literal(0),
-                                ),
-                                else_=Result.total_weight
-                                - func.coalesce(Result.dead_fish_penalty, 0),
-                            )
-                        ),
-                    )
-                    .label("place_finish"),
-                    func.count()
-                    .over(partition_by=Result.tournament_id)
-                    .label("total_participants"),
-                )
-                .join(Tournament, Result.tournament_id == Tournament.id)
-                .join(Event, Tournament.event_id == Event.id)
-                .filter(Event.year == current_year)
-                .subquery()
-            )
-
-            # Second subquery: points_calc
-            points_calc_subquery = (
-                session.query(
-                    tournament_standings_subquery.c.angler_id,
-                    tournament_standings_subquery.c.tournament_id,
-                    tournament_standings_subquery.c.adjusted_weight,
-                    tournament_standings_subquery.c.num_fish,
-                    tournament_standings_subquery.c.place_finish,
-                    case(
-                        (tournament_standings_subquery.c.disqualified.is_(True), 0),
-                        else_=101 - tournament_standings_subquery.c.place_finish,
-                    ).label("points"),
-                )
-                .select_from(tournament_standings_subquery)
-                .subquery()
-            )
-
-            # Third subquery: aoy_standings
-            aoy_standings_subquery = (
-                session.query(
-                    Angler.id,
-                    Angler.name,
-                    func.sum(
-                        case((Angler.member.is_(True), points_calc_subquery.c.points), else_=0)
-                    ).label("total_points"),
-                    func.sum(points_calc_subquery.c.adjusted_weight).label("total_weight"),
-                    func.row_number()
-                    .over(
-                        order_by=[
-                            desc(
-                                func.sum(
-                                    case(
-                                        (Angler.member.is_(True), points_calc_subquery.c.points),
-                                        else_=0,
-                                    )
-                                )
-                            ),
-                            desc(func.sum(points_calc_subquery.c.adjusted_weight)),
-                        ]
-                    )
-                    .label("position"),
-                )
-                .join(points_calc_subquery, Angler.id == points_calc_subquery.c.angler_id)
-                .filter(Angler.member.is_(True))
-                .group_by(Angler.id, Angler.name)
-                .subquery()
-            )
-
-            # Final query: get position for current user
-            aoy_result = (
-                session.query(aoy_standings_subquery.c.position)
-                .filter(aoy_standings_subquery.c.id == user["id"])
-                .first()
-            )
-            if aoy_result:
-                aoy_position = aoy_result[0]
+            conn = session.connection()
+            aoy_position = get_aoy_positions(conn, current_year, [user["id"]]).get(user["id"])
         except SQLAlchemyError as e:
             logger.warning(f"Failed to calculate AOY standings for user {user['id']}: {e}")
             # aoy_position remains None, which is acceptable
@@ -1,23 +1,19 @@
 """Profile update routes."""
 
-import os
 from typing import Optional
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse, Response
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from core.db_schema import Angler, get_session
 from core.helpers.auth import get_current_user
 from core.helpers.logging import get_logger
+from core.rate_limit import limiter
 from routes.auth.profile_update.delete import delete_account
 from routes.auth.profile_update.fields import update_profile_fields
 
 router = APIRouter()
 logger = get_logger("auth.profile_update")
-_is_test_env = os.environ.get("ENVIRONMENT") == "test"
-limiter = Limiter(key_func=get_remote_address, enabled=not _is_test_env)
 
 
 @router.post("/profile/update")
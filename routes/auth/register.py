@@ -1,9 +1,5 @@
-import os
-
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import RedirectResponse, Response
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from core.db_schema import Angler, get_session
@@ -13,13 +9,11 @@ from core.helpers.logging import SecurityEvent, get_logger, log_security_event
 from core.helpers.password_validator import validate_password_strength
 from core.helpers.passwords import bcrypt_gensalt
 from core.helpers.response import set_user_session
+from core.rate_limit import limiter
 from routes.dependencies import bcrypt, get_current_user, templates
 
 router = APIRouter()
 logger = get_logger("auth.register")
-# Disable rate limiting in test environment
-is_test_env = os.environ.get("ENVIRONMENT") == "test"
-limiter = Limiter(key_func=get_remote_address, enabled=not is_test_env)
 
 
 @router.get("/register")
@@ -1,14 +1,15 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Request
 from fastapi.responses import Response
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Connection
 
 from core.db_schema import engine
 from core.deps import templates
 from core.helpers.auth import get_user_optional
-from core.helpers.tournament_points import calculate_tournament_points
 from core.query_service import QueryService
+from core.services.aoy_standings import get_aoy_standings
+from core.services.season_snapshots import AWARDS, get_season_part, is_completed_season
 from routes.pages.awards_helpers import (
     get_big_bass_query,
     get_heavy_stringer_query,
@@ -16,117 +17,83 @@ from routes.pages.awards_helpers import (
     get_team_big_bass_query,
     get_team_heavy_stringer_query,
     get_team_wins_query,
-    get_tournament_results_query,
     get_years_query,
 )
 
 router = APIRouter()
 
 
+def load_season_awards(conn: Connection, year: int) -> Dict[str, Any]:
+    """Everything awards.html shows for ``year`` apart from the year list.
+
+    Also the payload of a frozen season's awards part
+    (core/services/season_snapshots.py).
+    """
+    qs = QueryService(conn)
+    stats = qs.fetch_one(get_stats_query(), {"year": year}) or {
+        "total_tournaments": 0,
+        "unique_anglers": 0,
+        "total_fish": 0,
+        "total_weight": 0.0,
+        "avg_weight": 0.0,
+    }
+    # AoY standings are precomputed per tournament on result writes
+    # (core/services/aoy_standings.py); the read is a single indexed
+    # SELECT filtered to current members, matching the profile page.
+    aoy_standings = get_aoy_standings(conn, year)
+
+    # Determine if this is the new team format (2026+)
+    is_team_format = year >= 2026
+
+    # Get awards data based on format
+    if is_team_format:
+        # 2026+ team format - use team queries
+        heavy_stringer = qs.fetch_all(get_team_heavy_stringer_query(), {"year": year})
+        big_bass = qs.fetch_all(get_team_big_bass_query(), {"year": year})
+        team_wins = qs.fetch_all(get_team_wins_query(), {"year": year})
+    else:
+        # Pre-2026 individual format
+        heavy_stringer = qs.fetch_all(get_heavy_stringer_query(), {"year": year})
+        big_bass = qs.fetch_all(get_big_bass_query(), {"year": year})
+        team_wins = []
+
+    return {
+        "aoy_standings": aoy_standings,
+        "heavy_stringer": heavy_stringer[0] if heavy_stringer else None,
+        "big_bass": big_bass[0] if big_bass else None,
+        "year_stats": stats,
+        "is_team_format": is_team_format,
+        "team_wins": team_wins,
+    }
+
+
 @router.get("/awards")
 @router.get("/awards/{year}")
 def awards(request: Request, year: Optional[int] = None) -> Response:
     from core.helpers.timezone import now_local
 
     user = get_user_optional(request)
+    today = now_local().date()
     if year is None:
-        year = now_local().year
+        year = today.year
     with engine.connect() as conn:
         qs = QueryService(conn)
-        current_year = now_local().year
-        available_years = qs.fetch_all(get_years_query(), {"year": current_year})
+        available_years = qs.fetch_all(get_years_query(), {"year": today.year})
         years = [row["year"] for row in available_years]
         if not years:
-            years = [now_local().year]
+            years = [today.year]
         if year not in years:
             year = years[0]
-        stats = qs.fetch_one(get_stats_query(), {"year": year}) or {
-            "total_tournaments": 0,
-            "unique_anglers": 0,
-            "total_fish": 0,
-            "total_weight": 0.0,
-            "avg_weight": 0.0,
-        }
-        all_tournament_results = qs.fetch_all(get_tournament_results_query(), {"year": year})
-        tournaments_points: Dict[int, List[Dict[str, Any]]] = {}
-        angler_totals: Dict[int, Dict[str, Any]] = {}
-
-        try:
-            current_tournament_id: Optional[int] = None
-            current_tournament_results: List[Dict[str, Any]] = []
-            for result in all_tournament_results:
-                if current_tournament_id != result["tournament_id"]:
-                    if current_tournament_results:
-                        tournaments_points[current_tournament_id] = calculate_tournament_points(  # type: ignore[index]
-                            current_tournament_results
-                        )
-                    current_tournament_id, current_tournament_results = result["tournament_id"], []
-                current_tournament_results.append(dict(result))
-            if current_tournament_results:
-                tournaments_points[current_tournament_id] = calculate_tournament_points(  # type: ignore[index]
-                    current_tournament_results
-                )
-            for tournament_results in tournaments_points.values():
-                for result in tournament_results:
-                    angler_id = result["angler_id"]
-                    if angler_id not in angler_totals:
-                        angler_totals[angler_id] = {
-                            "name": result["angler_name"],
-                            "total_points": 0,
-                            "total_fish": 0,
-                            "total_weight": 0.0,
-                            "tournaments_fished": 0,
-                        }
-                    angler_totals[angler_id]["total_points"] += result.get("calculated_points", 0)
-                    angler_totals[angler_id]["total_fish"] += result.get("num_fish", 0)
-                    angler_totals[angler_id]["total_weight"] += float(result.get("total_weight", 0))
-                    angler_totals[angler_id]["tournaments_fished"] += 1
-        except (SQLAlchemyError, ValueError, KeyError) as e:
-            # Log error but continue - show empty standings
-            from core.helpers.logging import get_logger
-
-            logger = get_logger(__name__)
-            logger.error(f"Error calculating tournament points: {e}")
-
-        # Filter to only include current members (matching profile page logic)
-        current_members_query = "SELECT id FROM anglers WHERE member = true"
-        current_member_ids = {row["id"] for row in qs.fetch_all(current_members_query, {})}
-        angler_totals_members_only = {
-            aid: data for aid, data in angler_totals.items() if aid in current_member_ids
-        }
-
-        aoy_standings = list(angler_totals_members_only.values())
-        aoy_standings.sort(key=lambda x: (x["total_points"], x["total_weight"]), reverse=True)
-
-        # Determine if this is the new team format (2026+)
-        # Note: year is guaranteed to be set at this point (line 31 or 40 above)
         assert year is not None
-        is_team_format = year >= 2026
-
-        # Get awards data based on format
-        if is_team_format:
-            # 2026+ team format - use team queries
-            heavy_stringer = qs.fetch_all(get_team_heavy_stringer_query(), {"year": year})
-            big_bass = qs.fetch_all(get_team_big_bass_query(), {"year": year})
-            team_wins = qs.fetch_all(get_team_wins_query(), {"year": year})
-        else:
-            # Pre-2026 individual format
-            heavy_stringer = qs.fetch_all(get_heavy_stringer_query(), {"year": year})
-            big_bass = qs.fetch_all(get_big_bass_query(), {"year": year})
-            team_wins = []
+        # Completed seasons may be frozen into a snapshot; otherwise live.
+        season = None
+        if is_completed_season(year, today):
+            season = get_season_part(conn, year, AWARDS)
+        if season is None:
+            season = load_season_awards(conn, year)
 
         return templates.TemplateResponse(
             request,
             "awards.html",
-            {
-                "user": user,
-                "current_year": year,
-                "available_years": years,
-                "aoy_standings": aoy_standings,
-                "heavy_stringer": heavy_stringer[0] if heavy_stringer else None,
-                "big_bass": big_bass[0] if big_bass else None,
-                "year_stats": stats,
-                "is_team_format": is_team_format,
-                "team_wins": team_wins,
-            },
+            {"user": user, "current_year": year, "available_years": years, **season},
         )
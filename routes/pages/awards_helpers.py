@@ -13,14 +13,6 @@ def get_stats_query() -> str:
        WHERE e.year = :year"""
 
 
-def get_tournament_results_query() -> str:
-    return """SELECT t.id as tournament_id, a.id as angler_id, a.name as angler_name, vatr.total_weight, vatr.num_fish,
-       vatr.big_bass_weight, vatr.buy_in, vatr.disqualified, vatr.was_member
-       FROM v_angler_tournament_results vatr JOIN anglers a ON vatr.angler_id = a.id
-       JOIN tournaments t ON vatr.tournament_id = t.id
-       JOIN events e ON t.event_id = e.id WHERE e.year = :year ORDER BY t.id, vatr.total_weight DESC"""
-
-
 def get_heavy_stringer_query() -> str:
     return """SELECT a.name, vatr.total_weight, vatr.num_fish, e.name as tournament_name, e.date
        FROM v_angler_tournament_results vatr JOIN anglers a ON vatr.angler_id = a.id
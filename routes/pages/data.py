@@ -6,6 +6,7 @@ from fastapi.responses import Response
 from core.deps import get_query_service, templates
 from core.helpers.auth import get_user_optional
 from core.query_service import QueryService
+from core.query_service.data_cache import CachedDataQueries
 
 router = APIRouter()
 
@@ -18,38 +19,14 @@ def data_dashboard(
     """Display the club data dashboard with statistics and charts."""
     user = get_user_optional(request)
 
-    # Get all the data
-    available_years = qs.get_available_years()
-    overview_stats = qs.get_club_overview_stats()
-    year_comparison = qs.get_year_comparison_stats()
-    ytd_trends = qs.get_ytd_trends_by_year()
-    lake_statistics = qs.get_lake_statistics()
-    limits_zeros_by_year = qs.get_limits_zeros_by_year()
-    big_bass_records = qs.get_big_bass_records(limit=10)
-    membership_by_year = qs.get_membership_by_year()
-    weight_trends = qs.get_weight_trends_by_year()
-    winning_weights_by_year = qs.get_winning_weights_by_year()
-    winning_weights_by_lake = qs.get_winning_weights_by_lake()
-    winning_weights_by_lake_year = qs.get_winning_weights_by_lake_year()
-    tournament_participation = qs.get_tournament_participation()
+    # Served from the cross-request cache until a results write bumps the
+    # generation (see core/query_service/data_cache.py). On a miss every
+    # section is derived from one read of the completed tournaments' rows
+    # unless DATA_DASHBOARD_ENGINE=per_query.
+    dashboard = CachedDataQueries(qs).get_dashboard(big_bass_limit=10)
 
     return templates.TemplateResponse(
         request,
         "data.html",
-        {
-            "user": user,
-            "available_years": available_years,
-            "overview_stats": overview_stats,
-            "year_comparison": year_comparison,
-            "ytd_trends": ytd_trends,
-            "lake_statistics": lake_statistics,
-            "limits_zeros_by_year": limits_zeros_by_year,
-            "big_bass_records": big_bass_records,
-            "membership_by_year": membership_by_year,
-            "weight_trends": weight_trends,
-            "winning_weights_by_year": winning_weights_by_year,
-            "winning_weights_by_lake": winning_weights_by_lake,
-            "winning_weights_by_lake_year": winning_weights_by_lake_year,
-            "tournament_participation": tournament_participation,
-        },
+        {"user": user, **dashboard},
     )
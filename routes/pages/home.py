@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import re
@@ -8,8 +9,6 @@ from typing import Any, Dict, List, Optional
 import httpx
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import RedirectResponse, Response
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from sqlalchemy import case, func
 from sqlalchemy.orm import Query, Session, aliased
 from starlette.concurrency import run_in_threadpool
@@ -24,7 +23,6 @@ from core.db_schema import (
     PollVote,
     Ramp,
     Tournament,
-    engine,
     get_session,
 )
 from core.db_schema.views import v_angler_tournament_results, v_team_tournament_results
@@ -34,10 +32,11 @@ from core.helpers.auth import get_user_optional
 from core.helpers.forms import is_valid_email
 from core.helpers.logging import get_logger
 from core.helpers.pagination import PaginationState
-from core.helpers.poll_day_info import get_poll_day_info
+from core.helpers.poll_day_info import get_poll_day_info, lake_location
 from core.helpers.response import error_redirect, success_redirect
 from core.helpers.timezone import now_local
 from core.query_service import QueryService
+from core.rate_limit import limiter
 from core.types import UserDict
 from routes.dependencies import get_lakes_list
 
@@ -45,10 +44,6 @@ router = APIRouter()
 
 logger = get_logger(__name__)
 
-# Rate limiter (disabled under tests, matching routes/auth/*).
-is_test_env = os.environ.get("ENVIRONMENT") == "test"
-limiter = Limiter(key_func=get_remote_address, enabled=not is_test_env)
-
 EXCLUDED_EMAIL_DOMAINS = ("@sabc.com", "@saustinbc.com")
 
 # Cloudflare Turnstile CAPTCHA
@@ -123,6 +118,8 @@ def build_tournament_query(
             Ramp.name.label("ramp_name"),
             Ramp.google_maps_iframe.label("ramp_google_maps"),
             Lake.google_maps_iframe.label("lake_google_maps"),
+            Lake.latitude.label("lake_latitude"),
+            Lake.longitude.label("lake_longitude"),
             Tournament.start_time,
             Tournament.end_time,
             Tournament.entry_fee,
@@ -156,6 +153,8 @@ def build_tournament_query(
             Ramp.name,
             Ramp.google_maps_iframe,
             Lake.google_maps_iframe,
+            Lake.latitude,
+            Lake.longitude,
             Tournament.start_time,
             Tournament.end_time,
             Tournament.entry_fee,
@@ -407,14 +406,15 @@ def _assemble_tournament_card(
     tournament_date = tournament.date
     is_past = tournament_date < date.today() if tournament_date else False
 
-    # Sunrise + forecast for upcoming, non-cancelled tournaments. Sunrise
+    # Sunrise + forecast at the lake for upcoming, non-cancelled tournaments. Sunrise
     # is always available; weather is only populated within the NWS
     # forecast window (~7 days), otherwise the weather field is None.
     day_info: Any = None
     is_cancelled = tournament.is_cancelled or False
     if not is_past and not is_cancelled and tournament_date:
         try:
-            day_info = get_poll_day_info(tournament_date)
+            location = lake_location(tournament.lake_latitude, tournament.lake_longitude)
+            day_info = get_poll_day_info(tournament_date, location)
         except Exception as e:
             logger.warning(f"day info lookup failed for tournament {tournament.id}: {e}")
 
@@ -567,9 +567,20 @@ def _compute_page_range(page: int, total_pages: int) -> range:
     return range(start_page, end_page + 1)
 
 
-async def home_paginated(request: Request, page: int = 1) -> Response:
-    user = get_user_optional(request)
+def _load_tournament_cards(user: Optional[UserDict], page: int) -> Dict[str, Any]:
+    """Load the paginated tournament cards and their pagination metadata.
+
+    Synchronous; runs in the threadpool. The count, tournament rows and
+    per-card batches depend on each other so they share one session.
+
+    Args:
+        user: The current user, or None for anonymous visitors.
+        page: Requested page number.
 
+    Returns:
+        Template context for the tournament list, or ``{"redirect_page": n}``
+        when ``page`` is past the last page.
+    """
     with get_session() as session:
         # Get total COMPLETED SABC tournament count (for pagination)
         # Includes cancelled tournaments since they appear in the completed tab
@@ -589,7 +600,7 @@ async def home_paginated(request: Request, page: int = 1) -> Response:
         )
 
         if pagination.is_out_of_range():
-            return RedirectResponse(f"/?p={pagination.total_pages}", status_code=303)
+            return {"redirect_page": pagination.total_pages}
 
         page = max(1, page)
         pagination = PaginationState(
@@ -598,7 +609,6 @@ async def home_paginated(request: Request, page: int = 1) -> Response:
             total_items=total_completed_tournaments,
         )
         offset = pagination.offset
-        total_pages = pagination.total_pages
 
         # Fetch completed (paginated) + upcoming tournament rows.
         tournaments_query, total_upcoming_tournaments = _fetch_homepage_tournaments(session, offset)
@@ -614,13 +624,12 @@ async def home_paginated(request: Request, page: int = 1) -> Response:
 
         now = now_local() if poll_ids else None
 
-        # Card assembly is synchronous and includes a (cached) NWS forecast
-        # fetch via httpx.Client. Offload to the threadpool so the event loop
-        # is never blocked on a network call — and so the rest of the page
-        # render stays responsive even on a cold cache.
-        tournaments_with_results: List[Dict[str, Any]] = [
-            await run_in_threadpool(
-                _assemble_tournament_card,
+        # Card assembly is CPU work: poll option JSON decoding, sunrise
+        # calculation and a read of the prefetched forecast cache (the network
+        # fetch happens in ForecastPrefetcher). It runs here, off the event
+        # loop, with the queries.
+        tournaments_with_results = [
+            _assemble_tournament_card(
                 tournament,
                 user,
                 top_results_by_tid,
@@ -632,6 +641,30 @@ async def home_paginated(request: Request, page: int = 1) -> Response:
             for tournament in tournaments_query
         ]
 
+    return {
+        "all_tournaments": tournaments_with_results,
+        "current_page": pagination.page,
+        "total_pages": pagination.total_pages,
+        "page_range": _compute_page_range(page, pagination.total_pages),
+        "has_prev": pagination.has_prev,
+        "has_next": pagination.has_next,
+        "start_index": offset + 1,
+        "end_index": min(offset + ITEMS_PER_PAGE, total_completed_tournaments),
+        "total_tournaments": total_completed_tournaments,
+        "total_upcoming_tournaments": total_upcoming_tournaments,
+    }
+
+
+def _load_homepage_sidebar() -> Dict[str, Any]:
+    """Load the homepage data that doesn't depend on the requested page.
+
+    Synchronous; runs in the threadpool alongside :func:`_load_tournament_cards`.
+
+    Returns:
+        Template context for news, member count, year links, lakes and the
+        cancelled-tournament banner.
+    """
+    with get_session() as session:
         # Get member count (only members with current dues)
         member_count = (
             session.query(func.count(Angler.id))
@@ -643,15 +676,10 @@ async def home_paginated(request: Request, page: int = 1) -> Response:
         cancelled_tournaments = _fetch_cancelled_tournaments(session)
         latest_news = _fetch_latest_news(session)
 
-    # Pagination metadata (total_pages already calculated above)
-    start_index = offset + 1
-    end_index = min(offset + ITEMS_PER_PAGE, total_completed_tournaments)
-    page_range = _compute_page_range(page, total_pages)
-
-    # Get year navigation links
-    with engine.connect() as conn:
-        qs = QueryService(conn)
-        year_links = qs.get_tournament_years_with_first_id(ITEMS_PER_PAGE)
+        # Get year navigation links
+        year_links = QueryService(session.connection()).get_tournament_years_with_first_id(
+            ITEMS_PER_PAGE
+        )
 
     # Get lakes data for poll results rendering. Single LEFT JOIN query;
     # was previously 1 + N_lakes connections per home-page render.
@@ -664,27 +692,32 @@ async def home_paginated(request: Request, page: int = 1) -> Response:
         for lake in get_lakes_list(with_ramps=True)
     ]
 
+    return {
+        "latest_news": latest_news,
+        "member_count": member_count,
+        "year_links": year_links,
+        "lakes_data": lakes_data,
+        "cancelled_tournaments": cancelled_tournaments,
+    }
+
+
+async def home_paginated(request: Request, page: int = 1) -> Response:
+    # All database work happens in the threadpool so a slow query never
+    # stalls the event loop (and with it every other request on this
+    # worker). The tournament cards and the page-independent sidebar data
+    # load concurrently, each on its own connection.
+    user = await run_in_threadpool(get_user_optional, request)
+    cards, sidebar = await asyncio.gather(
+        run_in_threadpool(_load_tournament_cards, user, page),
+        run_in_threadpool(_load_homepage_sidebar),
+    )
+    if "redirect_page" in cards:
+        return RedirectResponse(f"/?p={cards['redirect_page']}", status_code=303)
+
     return templates.TemplateResponse(
         request,
         "index.html",
-        {
-            "user": user,
-            "all_tournaments": tournaments_with_results,
-            "current_page": pagination.page,
-            "total_pages": pagination.total_pages,
-            "page_range": page_range,
-            "has_prev": pagination.has_prev,
-            "has_next": pagination.has_next,
-            "start_index": start_index,
-            "end_index": end_index,
-            "total_tournaments": total_completed_tournaments,
-            "total_upcoming_tournaments": total_upcoming_tournaments,
-            "latest_news": latest_news,
-            "member_count": member_count,
-            "year_links": year_links,
-            "lakes_data": lakes_data,
-            "cancelled_tournaments": cancelled_tournaments,
-        },
+        {"user": user, **cards, **sidebar},
     )
 
 
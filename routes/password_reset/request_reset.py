@@ -1,9 +1,5 @@
-import os
-
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import RedirectResponse, Response
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -12,6 +8,7 @@ from core.email import create_password_reset_token, send_password_reset_email
 from core.helpers.forms import normalize_email
 from core.helpers.logging import get_logger
 from core.helpers.response import error_redirect
+from core.rate_limit import limiter
 from routes.dependencies import templates
 from routes.password_reset.request_logging import (
     log_reset_email_failed,
@@ -22,8 +19,6 @@ from routes.password_reset.request_logging import (
 
 router = APIRouter()
 logger = get_logger("password_reset")
-is_test_env = os.environ.get("ENVIRONMENT") == "test"
-limiter = Limiter(key_func=get_remote_address, enabled=not is_test_env)
 
 
 @router.get("/forgot-password")
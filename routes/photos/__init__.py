@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 
 from .gallery import router as gallery_router
+from .variants import router as variants_router
 
 router = APIRouter()
 
 router.include_router(gallery_router)
+router.include_router(variants_router)
@@ -1,17 +1,13 @@
 """Photo gallery routes."""
 
-import io
 import os
-import uuid
-import warnings
-from typing import Any, Dict, List, Optional
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, File, Form, Request, UploadFile
 from fastapi.responses import RedirectResponse
-from PIL import Image, ImageOps
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlalchemy import or_
+from sqlalchemy import or_, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Query, Session
 from starlette.concurrency import run_in_threadpool
@@ -20,143 +16,79 @@ from core.db_schema import Angler, Event, Photo, TeamResult, Tournament, get_ses
 from core.helpers.auth import get_current_user, require_member
 from core.helpers.logging import get_logger
 from core.helpers.response import error_redirect, success_redirect
+from core.photo_processing import (
+    VARIANT_FORMATS,
+    ImageTooLargeError,
+    InvalidImageError,
+    ProcessedPhoto,
+    process_photo,
+    run_in_photo_pool,
+)
+from core.rate_limit import limiter
 from core.types import UserDict
 from routes.dependencies import templates
-
-# Cap decoded pixel count to defeat decompression-bomb DoS. 50 MP covers any
-# reasonable phone/camera while a 10 MB malicious PNG that decodes to multi-GB
-# pixel buffers will exceed this and raise instead of OOMing the worker.
-Image.MAX_IMAGE_PIXELS = 50_000_000
-warnings.simplefilter("error", Image.DecompressionBombWarning)
+from routes.photos import storage
+from routes.photos.storage import (
+    IncomingUpload,
+    UploadTooLargeError,
+    get_photo_url,
+    get_placeholder_url,
+    get_thumbnail_url,
+    get_variant_srcset,
+)
 
 router = APIRouter()
 logger = get_logger(__name__)
-is_test_env = os.environ.get("ENVIRONMENT") == "test"
-limiter = Limiter(key_func=get_remote_address, enabled=not is_test_env)
 
-# Upload directory configuration
-UPLOAD_DIR = "uploads/photos"
-THUMBNAIL_DIR = "uploads/photos/thumbnails"
-PLACEHOLDER_DIR = "uploads/photos/placeholders"
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
-THUMBNAIL_SIZE = (200, 200)  # Match display size for optimal performance
-PLACEHOLDER_SIZE = (20, 20)  # Tiny blur placeholder for instant loading
-WEBP_QUALITY = 80  # Quality for WebP compression (smaller than JPEG at same quality)
 PHOTOS_PER_PAGE = 24  # Photos per page for pagination
 
 
-def ensure_upload_dir() -> None:
-    """Create upload directories if they don't exist."""
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-    os.makedirs(THUMBNAIL_DIR, exist_ok=True)
-    os.makedirs(PLACEHOLDER_DIR, exist_ok=True)
-
-
-def get_photo_url(filename: str) -> str:
-    """Get the URL for a photo."""
-    return f"/uploads/photos/{filename}"
-
-
-def get_thumbnail_url(filename: str) -> str:
-    """Get the URL for a photo thumbnail."""
-    return f"/uploads/photos/thumbnails/{filename}"
-
-
-def get_placeholder_url(filename: str) -> str:
-    """Get the URL for a blur placeholder."""
-    return f"/uploads/photos/placeholders/{filename}"
-
-
-def generate_placeholder(contents: bytes, filename: str) -> Optional[str]:
-    """
-    Generate a tiny blur placeholder for instant loading.
-
-    Args:
-        contents: Original image bytes
-        filename: Target filename for placeholder
-
-    Returns:
-        Placeholder filename if successful, None otherwise
-    """
-    try:
-        original = Image.open(io.BytesIO(contents))
-
-        # Apply EXIF orientation (fixes rotated phone photos)
-        transposed = ImageOps.exif_transpose(original)
-        if transposed is not original:
-            original.close()
-
-        # Convert to RGB if necessary
-        if transposed.mode in ("RGBA", "P"):
-            img = transposed.convert("RGB")
-            transposed.close()
-        else:
-            img = transposed
-
-        # Create tiny placeholder (will be scaled up with CSS blur)
-        img.thumbnail(PLACEHOLDER_SIZE, Image.Resampling.LANCZOS)
-
-        # Save as WebP with low quality (tiny file, ~500 bytes)
-        placeholder_filename = os.path.splitext(filename)[0] + ".webp"
-        placeholder_path = os.path.join(PLACEHOLDER_DIR, placeholder_filename)
-
-        img.save(placeholder_path, "WEBP", quality=20, method=6)
-        logger.debug(f"Placeholder generated: {placeholder_filename}")
-
-        return placeholder_filename
-    except (OSError, ValueError, Image.DecompressionBombError) as e:
-        logger.error(f"Failed to generate placeholder: {e}")
-        return None
-
-
-def generate_thumbnail(contents: bytes, filename: str) -> tuple[Optional[str], Optional[str]]:
-    """
-    Generate a WebP thumbnail and blur placeholder from image contents.
-
-    Args:
-        contents: Original image bytes
-        filename: Target filename for thumbnail
-
-    Returns:
-        Tuple of (thumbnail_filename, placeholder_filename) - either may be None
-    """
-    thumb_filename = None
-    placeholder_filename = None
-
-    try:
-        # Open image from bytes
-        original = Image.open(io.BytesIO(contents))
-
-        # Apply EXIF orientation (fixes rotated phone photos)
-        transposed = ImageOps.exif_transpose(original)
-        if transposed is not original:
-            original.close()
-
-        # Convert to RGB if necessary (for PNG with transparency, etc.)
-        if transposed.mode in ("RGBA", "P"):
-            img = transposed.convert("RGB")
-            transposed.close()
-        else:
-            img = transposed
-
-        # Calculate thumbnail size maintaining aspect ratio
-        img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-
-        # Save thumbnail as WebP (30% smaller than JPEG at same quality)
-        thumb_filename = os.path.splitext(filename)[0] + ".webp"
-        thumb_path = os.path.join(THUMBNAIL_DIR, thumb_filename)
+def find_stored_upload(content_hash: str) -> Optional[Dict[str, Any]]:
+    """The files and size of an earlier upload of the same image, if they are still on disk."""
+    with get_session() as session:
+        photo = (
+            session.query(Photo)
+            .filter(Photo.content_hash == content_hash, Photo.thumbnail_filename.isnot(None))
+            .order_by(Photo.id)
+            .first()
+        )
+        if photo is None or not os.path.exists(storage.original_path(photo.filename)):
+            return None
+        if not os.path.exists(storage.thumbnail_path(photo.thumbnail_filename or "")):
+            return None
+        return {
+            "filename": photo.filename,
+            "thumbnail_filename": photo.thumbnail_filename,
+            "placeholder_filename": photo.placeholder_filename,
+            "width": photo.width,
+            "height": photo.height,
+        }
 
-        img.save(thumb_path, "WEBP", quality=WEBP_QUALITY, method=4)
-        logger.info(f"Thumbnail generated: {thumb_filename}")
 
-        # Generate blur placeholder
-        placeholder_filename = generate_placeholder(contents, filename)
+def _store_upload(incoming: IncomingUpload, ext: str, processed: ProcessedPhoto) -> Dict[str, Any]:
+    """Move a verified upload into place and write its thumbnail and placeholder."""
+    filename = storage.original_filename(incoming.content_hash, ext)
+    derived = storage.derived_filename(incoming.content_hash)
+    storage.write_file(storage.thumbnail_path(derived), processed.thumbnail)
+    storage.write_file(storage.placeholder_path(derived), processed.placeholder)
+    storage.move_file(incoming.path, storage.original_path(filename))
+    return {
+        "filename": filename,
+        "thumbnail_filename": derived,
+        "placeholder_filename": derived,
+        "width": processed.width,
+        "height": processed.height,
+    }
 
-    except (OSError, ValueError, Image.DecompressionBombError) as e:
-        logger.error(f"Failed to generate thumbnail: {e}")
 
-    return thumb_filename, placeholder_filename
+def _stored_paths(stored: Dict[str, Any]) -> List[str]:
+    return [
+        storage.original_path(stored["filename"]),
+        storage.thumbnail_path(stored["thumbnail_filename"]),
+        storage.placeholder_path(stored["placeholder_filename"]),
+    ]
 
 
 def can_upload_photo(user: UserDict, tournament_id: Optional[int]) -> bool:
@@ -210,7 +142,25 @@ def build_photo_query(
     if big_bass_bool:
         query = query.filter(Photo.is_big_bass.is_(True))
 
-    return query.order_by(Photo.uploaded_at.desc())
+    # id breaks ties between photos uploaded in the same instant, so the
+    # order is total and a cursor names exactly one position in it.
+    return query.order_by(Photo.uploaded_at.desc(), Photo.id.desc())
+
+
+def encode_cursor(photo: Photo) -> Optional[str]:
+    """The cursor for the page after ``photo``: its (uploaded_at, id) position."""
+    if photo.uploaded_at is None:
+        return None
+    return f"{photo.uploaded_at.isoformat()},{photo.id}"
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """Parse a cursor from encode_cursor; None if it is malformed."""
+    uploaded_at, _, photo_id = cursor.rpartition(",")
+    try:
+        return datetime.fromisoformat(uploaded_at), int(photo_id)
+    except ValueError:
+        return None
 
 
 def photo_to_dict(
@@ -232,11 +182,20 @@ def photo_to_dict(
     if photo.placeholder_filename:
         placeholder_url = get_placeholder_url(photo.placeholder_filename)
 
+    # Responsive variants, once the photo's hash and width are known
+    srcset = avif_srcset = None
+    if photo.content_hash and photo.width:
+        srcset = get_variant_srcset(photo.content_hash, photo.width)
+        if "avif" in VARIANT_FORMATS:
+            avif_srcset = get_variant_srcset(photo.content_hash, photo.width, "avif")
+
     return {
         "id": photo.id,
         "url": get_photo_url(photo.filename),
         "thumbnail_url": thumbnail_url,
         "placeholder_url": placeholder_url,
+        "srcset": srcset,
+        "avif_srcset": avif_srcset,
         "caption": photo.caption,
         "is_big_bass": photo.is_big_bass,
         "uploaded_at": photo.uploaded_at,
@@ -256,8 +215,15 @@ def gallery(
     angler_id: Optional[str] = None,
     big_bass: Optional[str] = None,
     page: int = 1,
+    before: Optional[str] = None,
 ) -> Any:
-    """Display the photo gallery with optional filters and pagination."""
+    """Display the photo gallery with optional filters and pagination.
+
+    Infinite scroll asks for each next page with ``before``, a cursor at the
+    last photo shown, and gets it by seeking the (uploaded_at, id) index
+    rather than with OFFSET, so page 50 costs about what page 1 does.
+    ``page`` is the offset fallback, for links without a cursor.
+    """
     user = get_current_user(request)
 
     # Parse filter parameters (empty strings become None)
@@ -284,41 +250,43 @@ def gallery(
     if page < 1:
         page = 1
 
-    offset = (page - 1) * PHOTOS_PER_PAGE
+    position = decode_cursor(before) if before else None
+    is_htmx = request.headers.get("HX-Request") == "true"
 
     with get_session() as session:
         query = build_photo_query(session, tournament_id_int, angler_id_int, big_bass_bool)
+        if position is not None:
+            page_query = query.filter(tuple_(Photo.uploaded_at, Photo.id) < position)
+        else:
+            page_query = query.offset((page - 1) * PHOTOS_PER_PAGE)
 
-        # Get total count for pagination
-        total_photos = query.count()
-        total_pages = (total_photos + PHOTOS_PER_PAGE - 1) // PHOTOS_PER_PAGE
-        has_more = page < total_pages
-
-        # Get paginated results
-        results = query.limit(PHOTOS_PER_PAGE).offset(offset).all()
+        # One row more than a page says whether there is a next one, without
+        # counting every matching photo on each scroll.
+        results = page_query.limit(PHOTOS_PER_PAGE + 1).all()
+        has_more = len(results) > PHOTOS_PER_PAGE
+        results = results[:PHOTOS_PER_PAGE]
+        next_cursor = encode_cursor(results[-1][0]) if has_more else None
 
         photos: List[Dict[str, Any]] = [
             photo_to_dict(photo, angler, tournament, user) for photo, angler, tournament in results
         ]
-
-        # Check if this is an HTMX request for infinite scroll
-        is_htmx = request.headers.get("HX-Request") == "true"
+        grid_context = {
+            "user": user,
+            "photos": photos,
+            "page": page,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+            "tournament_id": tournament_id_int,
+            "angler_id": angler_id_int,
+            "big_bass": big_bass_bool,
+        }
 
         if is_htmx:
             # Return just the photo grid items for infinite scroll
-            return templates.TemplateResponse(
-                request,
-                "photos/_photo_grid.html",
-                {
-                    "user": user,
-                    "photos": photos,
-                    "page": page,
-                    "has_more": has_more,
-                    "tournament_id": tournament_id_int,
-                    "angler_id": angler_id_int,
-                    "big_bass": big_bass_bool,
-                },
-            )
+            return templates.TemplateResponse(request, "photos/_photo_grid.html", grid_context)
+
+        # The total is only shown on the full page
+        total_photos = query.order_by(None).count()
 
         # Get filter options
         tournaments = (
@@ -343,15 +311,12 @@ def gallery(
         request,
         "photos/gallery.html",
         {
-            "user": user,
-            "photos": photos,
+            **grid_context,
             "tournament_options": tournament_options,
             "angler_options": angler_options,
             "selected_tournament": tournament_id_int,
             "selected_angler": angler_id_int,
             "selected_big_bass": big_bass_bool,
-            "page": page,
-            "has_more": has_more,
             "total_photos": total_photos,
         },
     )
@@ -435,77 +400,70 @@ async def upload_photo(
             "You have reached the upload limit (2 photos per tournament).",
         )
 
-    # Read and validate file size
-    logger.info("Photo upload: reading file contents...")
-    contents = await photo.read()
-    logger.info(f"Photo upload: file read complete, size={len(contents)} bytes")
-    if len(contents) > MAX_FILE_SIZE:
-        return error_redirect(
-            "/photos/upload",
-            f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB.",
-        )
-
-    # Verify the bytes are a genuine image before writing anything to disk.
-    # Extension/Content-Type are client-controlled and easily spoofed. The
-    # decode is CPU-bound and must not block the event loop.
-    def _verify_bytes() -> None:
-        with Image.open(io.BytesIO(contents)) as probe:
-            probe.verify()
-
+    # Stream the upload to disk in chunks, hashing it on the way, rather
+    # than holding up to MAX_FILE_SIZE bytes in memory (synchronous disk
+    # I/O — offload from event loop).
+    logger.info("Photo upload: streaming file to disk...")
+    storage.ensure_upload_dir()
     try:
-        await run_in_threadpool(_verify_bytes)
-    except Image.DecompressionBombError as e:
-        logger.warning(f"Photo upload rejected: decompression bomb: {e}")
+        incoming = await run_in_threadpool(storage.stream_to_incoming, photo.file, MAX_FILE_SIZE)
+    except UploadTooLargeError:
         return error_redirect(
             "/photos/upload",
-            "Image is too large to process. Please upload a smaller image.",
-        )
-    except (OSError, ValueError, SyntaxError) as e:
-        logger.warning(f"Photo upload rejected: not a valid image: {e}")
-        return error_redirect(
-            "/photos/upload",
-            "Invalid or corrupt image file. Please upload a valid image.",
+            f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB.",
         )
-
-    # Generate unique filename
-    filename = f"{uuid.uuid4()}{ext}"
-    ensure_upload_dir()
-    filepath = os.path.join(UPLOAD_DIR, filename)
-
-    # Save file (synchronous disk I/O — offload from event loop)
-    logger.info(f"Photo upload: saving to {filepath}...")
-
-    def _write_bytes() -> None:
-        with open(filepath, "wb") as f:
-            f.write(contents)
-
-    try:
-        await run_in_threadpool(_write_bytes)
-        logger.info("Photo upload: file saved successfully")
     except OSError as e:
         logger.error(f"Failed to save photo: {e}")
         return error_redirect("/photos/upload", "Failed to save photo. Please try again.")
-
-    # Generate thumbnail and blur placeholder. A failure here means the image
-    # could not be processed, so abort the upload rather than leaving an
-    # orphaned original on disk with no thumbnail. PIL decode + WEBP encode
-    # are CPU-bound — offload to threadpool.
-    logger.info("Photo upload: generating thumbnail and placeholder...")
-    thumbnail_filename, placeholder_filename = await run_in_threadpool(
-        generate_thumbnail, contents, filename
+    logger.info(
+        f"Photo upload: file streamed, size={incoming.size} bytes, hash={incoming.content_hash}"
     )
-    if not thumbnail_filename:
-        logger.error("Photo upload: thumbnail generation failed; aborting upload")
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        if placeholder_filename:
-            placeholder_path = os.path.join(PLACEHOLDER_DIR, placeholder_filename)
-            if os.path.exists(placeholder_path):
-                os.remove(placeholder_path)
-        return error_redirect(
-            "/photos/upload",
-            "Failed to process image. Please try a different photo.",
-        )
+
+    created: List[str] = []
+    try:
+        # The same image uploaded again (say, a big-bass shot posted by both
+        # partners) shares the first upload's files and variants.
+        stored = await run_in_threadpool(find_stored_upload, incoming.content_hash)
+        if stored is not None:
+            logger.info(f"Photo upload: duplicate of {stored['filename']}, reusing its files")
+        else:
+            # Verify the bytes are a genuine image and derive the thumbnail
+            # and blur placeholder before moving anything into place:
+            # extension/Content-Type are client-controlled and easily
+            # spoofed. The decode is CPU-bound, so it runs in the photo
+            # worker pool, off the event loop and the page threads.
+            logger.info("Photo upload: processing image...")
+            try:
+                processed = await run_in_photo_pool(process_photo, incoming.path)
+            except ImageTooLargeError as e:
+                logger.warning(f"Photo upload rejected: decompression bomb: {e}")
+                return error_redirect(
+                    "/photos/upload",
+                    "Image is too large to process. Please upload a smaller image.",
+                )
+            except InvalidImageError as e:
+                logger.warning(f"Photo upload rejected: not a valid image: {e}")
+                return error_redirect(
+                    "/photos/upload",
+                    "Invalid or corrupt image file. Please upload a valid image.",
+                )
+            except (OSError, BrokenProcessPool) as e:
+                logger.error(f"Photo upload: image processing failed: {e!r}")
+                return error_redirect(
+                    "/photos/upload",
+                    "Failed to process image. Please try a different photo.",
+                )
+
+            try:
+                stored = await run_in_threadpool(_store_upload, incoming, ext, processed)
+                created = _stored_paths(stored)
+                logger.info(f"Photo upload: saved as {stored['filename']}")
+            except OSError as e:
+                logger.error(f"Failed to save photo: {e}")
+                return error_redirect("/photos/upload", "Failed to save photo. Please try again.")
+    finally:
+        # Gone already if it was moved into place.
+        await run_in_threadpool(storage.remove_files, [incoming.path])
 
     # Create database record
     logger.info("Photo upload: creating database record...")
@@ -514,31 +472,19 @@ async def upload_photo(
             photo_record = Photo(
                 angler_id=user["id"],
                 tournament_id=tournament_id_int,
-                filename=filename,
-                thumbnail_filename=thumbnail_filename,
-                placeholder_filename=placeholder_filename,
+                content_hash=incoming.content_hash,
                 caption=caption[:200] if caption else None,
                 is_big_bass=is_big_bass,
+                **stored,
             )
             session.add(photo_record)
             # get_session() commits on __exit__; no inner commit needed.
-        logger.info(
-            f"Photo upload: success! filename={filename}, "
-            f"thumbnail={thumbnail_filename}, placeholder={placeholder_filename}"
-        )
+        logger.info(f"Photo upload: success! filename={stored['filename']}")
     except SQLAlchemyError as e:
         logger.error(f"Failed to create photo record: {e}")
-        # Clean up files if database insert fails
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        if thumbnail_filename:
-            thumb_path = os.path.join(THUMBNAIL_DIR, thumbnail_filename)
-            if os.path.exists(thumb_path):
-                os.remove(thumb_path)
-        if placeholder_filename:
-            placeholder_path = os.path.join(PLACEHOLDER_DIR, placeholder_filename)
-            if os.path.exists(placeholder_path):
-                os.remove(placeholder_path)
+        # Clean up files if database insert fails (but not a duplicate's,
+        # which belong to the earlier upload)
+        storage.remove_files(created)
         return error_redirect("/photos/upload", "Failed to save photo. Please try again.")
 
     return success_redirect("/photos", "Photo uploaded successfully!")
@@ -557,31 +503,24 @@ def delete_photo(request: Request, photo_id: int) -> RedirectResponse:
         if not can_delete_photo(user, photo):
             return error_redirect("/photos", "You don't have permission to delete this photo.")
 
-        # Delete original file
-        filepath = os.path.join(UPLOAD_DIR, photo.filename)
-        if os.path.exists(filepath):
+        # Delete the files unless another upload of the same image still uses them
+        shared = (
+            session.query(Photo.id)
+            .filter(Photo.id != photo.id, Photo.filename == photo.filename)
+            .first()
+        )
+        if shared is None:
+            paths = [storage.original_path(photo.filename)]
+            if photo.thumbnail_filename:
+                paths.append(storage.thumbnail_path(photo.thumbnail_filename))
+            if photo.placeholder_filename:
+                paths.append(storage.placeholder_path(photo.placeholder_filename))
+            if photo.content_hash:
+                paths.extend(storage.variant_paths(photo.content_hash))
             try:
-                os.remove(filepath)
+                storage.remove_files(paths)
             except OSError as e:
-                logger.error(f"Failed to delete photo file: {e}")
-
-        # Delete thumbnail if exists
-        if photo.thumbnail_filename:
-            thumb_path = os.path.join(THUMBNAIL_DIR, photo.thumbnail_filename)
-            if os.path.exists(thumb_path):
-                try:
-                    os.remove(thumb_path)
-                except OSError as e:
-                    logger.error(f"Failed to delete thumbnail: {e}")
-
-        # Delete placeholder if exists
-        if photo.placeholder_filename:
-            placeholder_path = os.path.join(PLACEHOLDER_DIR, photo.placeholder_filename)
-            if os.path.exists(placeholder_path):
-                try:
-                    os.remove(placeholder_path)
-                except OSError as e:
-                    logger.error(f"Failed to delete placeholder: {e}")
+                logger.error(f"Failed to delete photo files: {e}")
 
         # Delete database record (get_session() commits on __exit__)
         session.delete(photo)
@@ -0,0 +1,239 @@
+"""Where photo files live on disk, and the URLs they are served at.
+
+Uploads are content-addressed: every file derived from an upload is named by
+the sha256 of its original, sharded two levels deep by the hash's leading
+hex digits so no directory holds more than a sliver of the gallery::
+
+    uploads/photos/ab/cd/<hash>.jpg                  original
+    uploads/photos/thumbnails/ab/cd/<hash>.webp      200px thumbnail
+    uploads/photos/placeholders/ab/cd/<hash>.webp    blur placeholder
+    uploads/photos/variants/ab/cd/<hash>-800.webp    responsive variants
+
+Photo.filename, thumbnail_filename and placeholder_filename hold paths
+relative to their directory ("ab/cd/<hash>.jpg"). Photos uploaded before
+this layout have flat uuid names, which keep working until
+scripts/migrate_photo_storage.py moves them (``migrate_storage``).
+
+Identical uploads share one set of files, so a file is only removed along
+with the last Photo row that refers to it.
+
+Uploads are streamed into INCOMING_DIR in CHUNK_SIZE pieces and hashed on
+the way, rather than read into memory whole, then moved into place once the
+image has been verified.
+"""
+
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterable, List
+
+from core.db_schema import Photo, get_session
+from core.helpers.logging import get_logger
+from core.photo_processing import VARIANT_FORMATS, VARIANT_WIDTHS
+
+logger = get_logger(__name__)
+
+UPLOAD_DIR = "uploads/photos"
+THUMBNAIL_DIR = "uploads/photos/thumbnails"
+PLACEHOLDER_DIR = "uploads/photos/placeholders"
+VARIANT_DIR = "uploads/photos/variants"  # Responsive variants, made on first request
+INCOMING_DIR = "uploads/photos/incoming"  # Uploads in flight; same filesystem, so moves are renames
+CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """The upload is larger than the size limit it was streamed with."""
+
+
+@dataclass(frozen=True)
+class IncomingUpload:
+    """An upload streamed to disk, not yet verified or stored."""
+
+    path: str
+    content_hash: str
+    size: int
+
+
+def ensure_upload_dir() -> None:
+    """Create upload directories if they don't exist."""
+    for directory in (UPLOAD_DIR, THUMBNAIL_DIR, PLACEHOLDER_DIR, VARIANT_DIR, INCOMING_DIR):
+        os.makedirs(directory, exist_ok=True)
+
+
+def shard(content_hash: str) -> str:
+    """The sharded stem of every file named by ``content_hash``: ab/cd/<hash>."""
+    return f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+
+
+def original_filename(content_hash: str, ext: str) -> str:
+    return shard(content_hash) + ext
+
+
+def derived_filename(content_hash: str) -> str:
+    """Name of the thumbnail and placeholder (each in its own directory)."""
+    return shard(content_hash) + ".webp"
+
+
+def original_path(filename: str) -> str:
+    return os.path.join(UPLOAD_DIR, filename)
+
+
+def thumbnail_path(filename: str) -> str:
+    return os.path.join(THUMBNAIL_DIR, filename)
+
+
+def placeholder_path(filename: str) -> str:
+    return os.path.join(PLACEHOLDER_DIR, filename)
+
+
+def get_photo_url(filename: str) -> str:
+    """Get the URL for a photo."""
+    return f"/uploads/photos/{filename}"
+
+
+def get_thumbnail_url(filename: str) -> str:
+    """Get the URL for a photo thumbnail."""
+    return f"/uploads/photos/thumbnails/{filename}"
+
+
+def get_placeholder_url(filename: str) -> str:
+    """Get the URL for a blur placeholder."""
+    return f"/uploads/photos/placeholders/{filename}"
+
+
+def get_variant_url(content_hash: str, width: int, fmt: str = "webp") -> str:
+    """Get the URL of a responsive variant (see routes/photos/variants.py)."""
+    return f"/photos/variants/{content_hash}/{width}.{fmt}"
+
+
+def get_variant_path(content_hash: str, width: int, fmt: str = "webp") -> str:
+    """Get where a responsive variant is cached on disk."""
+    return os.path.join(VARIANT_DIR, f"{shard(content_hash)}-{width}.{fmt}")
+
+
+def get_variant_srcset(content_hash: str, original_width: int, fmt: str = "webp") -> str:
+    """Build a srcset of a photo's variants, described by their real widths.
+
+    Variants are never upscaled, so widths past the original collapse into
+    one candidate at the original's width.
+    """
+    candidates: Dict[int, str] = {}
+    for width in VARIANT_WIDTHS:
+        candidates.setdefault(min(width, original_width), get_variant_url(content_hash, width, fmt))
+    return ", ".join(f"{url} {width}w" for width, url in candidates.items())
+
+
+def variant_paths(content_hash: str) -> List[str]:
+    """Every path a variant of ``content_hash`` may be cached at."""
+    return [
+        get_variant_path(content_hash, width, fmt)
+        for width in VARIANT_WIDTHS
+        for fmt in VARIANT_FORMATS
+    ]
+
+
+def stream_to_incoming(source: BinaryIO, max_size: int) -> IncomingUpload:
+    """Copy ``source`` into INCOMING_DIR chunk by chunk, hashing it on the way.
+
+    Raises UploadTooLargeError (leaving nothing behind) once more than
+    ``max_size`` bytes have been read.
+    """
+    path = os.path.join(INCOMING_DIR, f"{uuid.uuid4()}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, "wb") as f:
+            while chunk := source.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(f"upload exceeds {max_size} bytes")
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        remove_files([path])
+        raise
+    return IncomingUpload(path=path, content_hash=digest.hexdigest(), size=size)
+
+
+def write_file(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` atomically, creating its shard directories."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def move_file(source: str, path: str) -> None:
+    """Move ``source`` to ``path`` (a rename), creating its shard directories."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(source, path)
+
+
+def remove_files(paths: Iterable[str]) -> None:
+    """Remove whichever of ``paths`` exist."""
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _move_or_drop(source: str, path: str) -> None:
+    """Move ``source`` to ``path``, or drop it if a duplicate got there first."""
+    if os.path.exists(path):
+        os.remove(source)
+    else:
+        move_file(source, path)
+
+
+def _migrate_photo(photo: Photo) -> None:
+    # Each name is updated only once its file has moved, so the row always
+    # points at files that exist even if a later move fails.
+    source = original_path(photo.filename)
+    if not photo.content_hash:
+        with open(source, "rb") as f:
+            photo.content_hash = hashlib.file_digest(f, "sha256").hexdigest()
+    content_hash = photo.content_hash
+    filename = original_filename(content_hash, os.path.splitext(photo.filename)[1].lower())
+    _move_or_drop(source, original_path(filename))
+    photo.filename = filename
+
+    derived = derived_filename(content_hash)
+    if photo.thumbnail_filename and os.path.exists(thumbnail_path(photo.thumbnail_filename)):
+        _move_or_drop(thumbnail_path(photo.thumbnail_filename), thumbnail_path(derived))
+        photo.thumbnail_filename = derived
+    if photo.placeholder_filename and os.path.exists(placeholder_path(photo.placeholder_filename)):
+        _move_or_drop(placeholder_path(photo.placeholder_filename), placeholder_path(derived))
+        photo.placeholder_filename = derived
+    # Variants cached before they were sharded
+    for width in VARIANT_WIDTHS:
+        for fmt in VARIANT_FORMATS:
+            flat = os.path.join(VARIANT_DIR, f"{content_hash}-{width}.{fmt}")
+            if os.path.exists(flat):
+                move_file(flat, get_variant_path(content_hash, width, fmt))
+
+
+def migrate_storage() -> Dict[str, int]:
+    """Move every photo still stored under a flat uuid name into the sharded layout.
+
+    Each photo is committed as it is moved, so an interrupted or failed run
+    can simply be repeated. Returns counts of photos moved, already in
+    place, and failed.
+    """
+    counts = {"moved": 0, "skipped": 0, "failed": 0}
+    with get_session() as session:
+        photo_ids = [photo_id for (photo_id,) in session.query(Photo.id).order_by(Photo.id)]
+    for photo_id in photo_ids:
+        with get_session() as session:
+            photo = session.get(Photo, photo_id)
+            if photo is None or "/" in photo.filename:
+                counts["skipped"] += 1
+                continue
+            try:
+                _migrate_photo(photo)
+                counts["moved"] += 1
+            except OSError as e:
+                # Whatever did move is committed with the session.
+                logger.error(f"Cannot move photo {photo_id} ({photo.filename}): {e}")
+                counts["failed"] += 1
+    return counts
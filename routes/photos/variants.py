@@ -0,0 +1,155 @@
+"""Responsive photo variants, made on first request and cached on disk.
+
+``/photos/variants/{content_hash}/{width}.{fmt}`` serves the photo whose
+original hashes to ``content_hash``, resized to one of VARIANT_WIDTHS. The
+first request renders it in the photo worker pool and writes it to
+storage.VARIANT_DIR; later ones are served straight from disk. The URL names the
+original's content, so a response never changes and is cached by browsers
+for a year without revalidation.
+
+``backfill_variants`` does the same ahead of time for every photo, filling
+in the content_hash/width/height of photos uploaded before variants existed.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+
+from core.db_schema import Photo, get_session
+from core.helpers.logging import get_logger
+from core.photo_processing import (
+    VARIANT_FORMATS,
+    VARIANT_WIDTHS,
+    InvalidImageError,
+    describe_image,
+    render_variant,
+    run_in_photo_pool,
+)
+from routes.photos import storage
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+_CONTENT_HASH = re.compile(r"^[0-9a-f]{64}$")
+
+# Variant path -> the render in progress, so concurrent first requests
+# for one variant share a single render.
+_rendering: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+
+
+def _original_filename(content_hash: str) -> Optional[str]:
+    with get_session() as session:
+        return (
+            session.query(Photo.filename)
+            .filter(Photo.content_hash == content_hash)
+            .order_by(Photo.id)
+            .limit(1)
+            .scalar()
+        )
+
+
+async def _render(content_hash: str, width: int, fmt: str, path: str) -> Optional[str]:
+    filename = await run_in_threadpool(_original_filename, content_hash)
+    if filename is None:
+        return None
+    source_path = storage.original_path(filename)
+    try:
+        data = await run_in_photo_pool(render_variant, source_path, width, fmt)
+    except InvalidImageError as e:
+        logger.error(f"Cannot render variant of {filename}: {e}")
+        return None
+    await run_in_threadpool(storage.write_file, path, data)
+    logger.info(f"Photo variant rendered: {path} ({len(data)} bytes)")
+    return path
+
+
+async def ensure_variant(content_hash: str, width: int, fmt: str) -> Optional[str]:
+    """Path of a cached variant, rendering it first if needed; None if there is no such photo."""
+    path = storage.get_variant_path(content_hash, width, fmt)
+    if os.path.exists(path):
+        return path
+    render = _rendering.get(path)
+    if render is None:
+        render = asyncio.ensure_future(_render(content_hash, width, fmt, path))
+        _rendering[path] = render
+        render.add_done_callback(lambda _: _rendering.pop(path, None))
+    # Shielded, so a client hanging up doesn't cancel a render others await.
+    return await asyncio.shield(render)
+
+
+@router.get("/photos/variants/{content_hash}/{width}.{fmt}")
+async def photo_variant(content_hash: str, width: int, fmt: str) -> FileResponse:
+    """Serve a responsive variant of a photo."""
+    valid = _CONTENT_HASH.match(content_hash) and width in VARIANT_WIDTHS and fmt in VARIANT_FORMATS
+    if not valid:
+        raise HTTPException(status_code=404)
+    path = await ensure_variant(content_hash, width, fmt)
+    if path is None:
+        raise HTTPException(status_code=404)
+    return FileResponse(
+        path,
+        media_type=VARIANT_FORMATS[fmt][1],
+        headers={"Cache-Control": IMMUTABLE},
+    )
+
+
+def backfill_variants(workers: int = 4, formats: Optional[List[str]] = None) -> Dict[str, int]:
+    """Describe every photo that predates variants, then render each missing variant.
+
+    Renders run ``workers`` at a time in their own process pool. Returns
+    counts of photos described, variants rendered and failures.
+    """
+    formats = formats or list(VARIANT_FORMATS)
+    counts = {"described": 0, "rendered": 0, "failed": 0}
+    with get_session() as session:
+        photos = session.query(Photo).order_by(Photo.id).all()
+        for photo in photos:
+            if photo.content_hash and photo.width:
+                continue
+            try:
+                photo.content_hash, photo.width, photo.height = describe_image(
+                    storage.original_path(photo.filename)
+                )
+                counts["described"] += 1
+            except (OSError, InvalidImageError) as e:
+                logger.error(f"Cannot read original of photo {photo.id}: {e}")
+                counts["failed"] += 1
+        # Render from the oldest photo with each hash, as the endpoint does.
+        originals = {
+            photo.content_hash: storage.original_path(photo.filename)
+            for photo in reversed(photos)
+            if photo.content_hash
+        }
+
+    missing = [
+        (content_hash, source_path, width, fmt)
+        for content_hash, source_path in originals.items()
+        for width in VARIANT_WIDTHS
+        for fmt in formats
+        if not os.path.exists(storage.get_variant_path(content_hash, width, fmt))
+    ]
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    with pool:
+        futures = {
+            pool.submit(render_variant, source_path, width, fmt): (content_hash, width, fmt)
+            for content_hash, source_path, width, fmt in missing
+        }
+        for future in as_completed(futures):
+            content_hash, width, fmt = futures[future]
+            try:
+                storage.write_file(
+                    storage.get_variant_path(content_hash, width, fmt), future.result()
+                )
+                counts["rendered"] += 1
+            except (OSError, InvalidImageError) as e:
+                logger.error(f"Cannot render {width}w {fmt} variant of {content_hash}: {e}")
+                counts["failed"] += 1
+    return counts
@@ -1,9 +1,13 @@
+from dataclasses import dataclass, field
+from datetime import date
 from decimal import Decimal
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from core.helpers.snapshot_codec import SNAPSHOT_FORMAT_VERSION, decode
 from core.helpers.tournament_points import calculate_tournament_points
 from core.models import TournamentStats, TournamentWithEvent
 from core.query_service import QueryService
+from core.services.big_bass_ledger import BIG_BASS_MINIMUM_WEIGHT, PAYOUT_BIG_BASS_PER_BOAT
 from routes.tournaments.formatters import (
     format_buy_in_results,
     format_disqualified_results,
@@ -20,93 +24,9 @@ from routes.tournaments.formatters import (
 PAYOUT_FIRST_PLACE_PER_BOAT = Decimal("20.00")
 PAYOUT_SECOND_PLACE_PER_BOAT = Decimal("14.00")
 PAYOUT_THIRD_PLACE_PER_BOAT = Decimal("8.00")
-PAYOUT_BIG_BASS_PER_BOAT = Decimal("8.00")  # 2026+ team format: $8/boat
-PAYOUT_BIG_BASS_PER_ANGLER_2025 = Decimal("4.00")  # 2025 and earlier: $4/angler
-BIG_BASS_MINIMUM_WEIGHT = Decimal("5.0")  # Must be over 5 lbs to qualify
-
-# Bylaws changed in 2026 - different big bass pot contribution rates
-TEAM_FORMAT_START_YEAR = 2026
-
-
-def calculate_big_bass_carryover(qs: QueryService, tournament_id: int, event_date: str) -> Decimal:
-    """Calculate the big bass carryover for a tournament by looking at previous tournaments.
-
-    The big bass pot rolls over when no member catches a bass > 5 lbs.
-    We scan backwards through tournaments until we find one where a member won,
-    accumulating the pot from each tournament where it wasn't won.
-
-    Handles both formats with different rates based on bylaws:
-    - Individual format (2025 and earlier): $4/angler from results table
-    - Team format (2026+): $8/boat from team_results table
-
-    Args:
-        qs: QueryService instance
-        tournament_id: The tournament to calculate carryover for
-        event_date: The date of the tournament
-
-    Returns:
-        The accumulated carryover amount from previous tournaments
-    """
-    # Get previous tournaments with angler + boat counts and a "member won
-    # big bass" flag. Pre-Phase-13 this LEFT JOIN'd BOTH raw tables to the
-    # same tournament which created a Cartesian fanout — the CASE-WHEN
-    # cascade hid it but boat_count / angler_count were inflated. The
-    # unified views give us clean per-angler and per-boat aggregates.
-    previous_tournaments = qs.fetch_all(
-        """SELECT t.id, e.date, e.year,
-                  (SELECT COUNT(DISTINCT vatr.angler_id)
-                   FROM v_angler_tournament_results vatr
-                   WHERE vatr.tournament_id = t.id) as angler_count,
-                  (SELECT COUNT(*)
-                   FROM v_team_tournament_results vttr
-                   WHERE vttr.tournament_id = t.id) as boat_count,
-                  COALESCE(
-                      (SELECT MAX(CASE WHEN vatr.was_member = TRUE
-                                            AND vatr.big_bass_weight > :min_weight
-                                            AND vatr.disqualified = FALSE THEN 1 ELSE 0 END)
-                       FROM v_angler_tournament_results vatr
-                       WHERE vatr.tournament_id = t.id),
-                      0
-                  ) as member_won_big_bass
-           FROM tournaments t
-           JOIN events e ON t.event_id = e.id
-           WHERE e.date < :event_date
-             AND (
-                 EXISTS (SELECT 1 FROM v_angler_tournament_results vatr WHERE vatr.tournament_id = t.id)
-                 OR EXISTS (SELECT 1 FROM v_team_tournament_results vttr WHERE vttr.tournament_id = t.id)
-             )
-           ORDER BY e.date DESC""",
-        {"event_date": event_date, "min_weight": float(BIG_BASS_MINIMUM_WEIGHT)},
-    )
-
-    carryover = Decimal("0.00")
-
-    for t in previous_tournaments:
-        member_won = t["member_won_big_bass"] == 1
-
-        if member_won:
-            # A member won big bass at this tournament - pot was paid out
-            # Stop accumulating, carryover resets after this tournament
-            break
-
-        # No member won big bass - add this tournament's contribution to carryover
-        # Use different rates based on bylaws year
-        angler_count = t["angler_count"] or 0
-        boat_count = t["boat_count"] or 0
-        tournament_year = t["year"]
-
-        if tournament_year >= TEAM_FORMAT_START_YEAR:
-            # 2026+ team format: $8 per boat
-            entry_count = boat_count if boat_count > 0 else angler_count
-            pot_contribution = PAYOUT_BIG_BASS_PER_BOAT * Decimal(entry_count)
-        else:
-            # 2025 and earlier individual format: $4 per angler
-            entry_count = angler_count if angler_count > 0 else boat_count
-            pot_contribution = PAYOUT_BIG_BASS_PER_ANGLER_2025 * Decimal(entry_count)
-
-        carryover += pot_contribution
-
-    return carryover
+# The big bass pot rates (PAYOUT_BIG_BASS_PER_BOAT for 2026+, $4/angler before)
+# and the 5 lb minimum live with the carryover ledger in
+# core/services/big_bass_ledger.py.
 
 
 def calculate_tournament_payouts(
@@ -158,176 +78,141 @@ def calculate_tournament_payouts(
     }
 
 
-def fetch_tournament_data(
-    qs: QueryService, tournament_id: int
-) -> Tuple[
-    TournamentWithEvent,
-    TournamentStats,
-    List[Tuple[Any, ...]],
-    List[Tuple[Any, ...]],
-    int,
-    List[Tuple[Any, ...]],
-    List[Tuple[Any, ...]],
-    Dict[str, Decimal],
-]:
-    """Fetch all tournament data including results and statistics."""
-    # Get tournament basic info
-    tournament_data = qs.fetch_one(
-        """SELECT t.id, t.event_id, e.date as event_date, e.name as event_name,
-           e.description as event_description, t.lake_name, t.ramp_name, t.entry_fee,
-           t.fish_limit, t.complete, e.event_type,
-           COALESCE(t.big_bass_carryover, 0) as big_bass_carryover,
-           COALESCE(t.aoy_points, TRUE) as aoy_points,
-           t.start_time, t.end_time
-           FROM tournaments t
-           JOIN events e ON t.event_id = e.id
-           WHERE t.id = :tournament_id""",
-        {"tournament_id": tournament_id},
-    )
+@dataclass
+class TournamentPage:
+    """Everything tournament_results.html renders for one tournament.
 
-    if not tournament_data:
-        raise ValueError("Tournament not found")
-
-    tournament = TournamentWithEvent(**tournament_data)
-
-    # Tournament header stats — single query that works for both formats
-    # by sourcing per-angler aggregates from v_angler_tournament_results
-    # and per-boat aggregates from v_team_tournament_results. Pre-Phase-13
-    # this was a branch on tournament.aoy_points with two ~20-line queries
-    # whose differences in semantics (per-angler vs per-boat counts) made
-    # the two-branch design fragile.
-    stats_data = qs.fetch_one(
-        """SELECT
-           (SELECT COUNT(DISTINCT angler_id) FROM v_angler_tournament_results
-            WHERE tournament_id = :id AND disqualified = FALSE) as total_anglers,
-           (SELECT COUNT(*) FROM v_team_tournament_results
-            WHERE tournament_id = :id) as total_boats,
-           (SELECT COALESCE(SUM(num_fish), 0) FROM v_angler_tournament_results
-            WHERE tournament_id = :id AND disqualified = FALSE) as total_fish,
-           (SELECT COALESCE(SUM(total_weight), 0) FROM v_angler_tournament_results
-            WHERE tournament_id = :id AND disqualified = FALSE) as total_weight,
-           (SELECT COUNT(*) FROM v_team_tournament_results
-            WHERE tournament_id = :id AND num_fish >= :fish_limit) as limits,
-           (SELECT COUNT(*) FROM v_team_tournament_results
-            WHERE tournament_id = :id AND num_fish = 0) as zeros,
-           (SELECT COUNT(*) FROM v_angler_tournament_results
-            WHERE tournament_id = :id AND buy_in = TRUE) as buy_ins,
-           (SELECT COALESCE(MAX(big_bass_weight), 0) FROM v_angler_tournament_results
-            WHERE tournament_id = :id AND disqualified = FALSE) as biggest_bass,
-           (SELECT COALESCE(MAX(total_weight), 0) FROM v_angler_tournament_results
-            WHERE tournament_id = :id AND disqualified = FALSE) as heavy_stringer""",
-        {"id": tournament_id, "fish_limit": tournament.fish_limit or 5},
-    )
+    Result lists hold the formatter tuples (see routes/tournaments/formatters.py).
+    """
 
-    stats = TournamentStats(**stats_data) if stats_data else TournamentStats()
+    tournament: TournamentWithEvent
+    stats: TournamentStats
+    team_results: List[Tuple[Any, ...]] = field(default_factory=list)
+    individual_results: List[Tuple[Any, ...]] = field(default_factory=list)
+    buy_in_place: int = 0
+    buy_in_results: List[Tuple[Any, ...]] = field(default_factory=list)
+    disqualified_results: List[Tuple[Any, ...]] = field(default_factory=list)
+    payouts: Dict[str, Any] = field(default_factory=dict)
+    next_tournament_id: Optional[int] = None
+    prev_tournament_id: Optional[int] = None
 
-    # Get and format team results
-    team_results_raw = qs.get_team_results(tournament_id)
-    team_results = format_team_results(team_results_raw)
 
-    # Get and format individual results
-    individual_results_raw = qs.get_tournament_results(tournament_id)
-    calculated_results = calculate_tournament_points(individual_results_raw)
-    individual_results = format_individual_results(calculated_results)
+def load_tournament_page(qs: QueryService, tournament_id: int, today: date) -> TournamentPage:
+    """Load a tournament's results page in two statements.
 
-    # Get and format buy-in results
-    buy_in_place, buy_in_results = format_buy_in_results(calculated_results)
+    ``get_tournament_page_summary`` returns the single-valued parts (tournament,
+    header stats, big bass flags, carryover, Prev/Next) and
+    ``get_tournament_page_rows`` the angler and boat rows; scoring, formatting
+    and payouts are computed here from those two reads.
 
-    # Get and format disqualified results
-    disqualified_raw = qs.fetch_all(
-        """SELECT a.name, a.member, r.was_member
-           FROM results r
-           JOIN anglers a ON r.angler_id = a.id
-           WHERE r.tournament_id = :id AND r.disqualified = TRUE""",
-        {"id": tournament_id},
+    Raises:
+        ValueError: If the tournament does not exist
+    """
+    summary = qs.get_tournament_page_summary(
+        tournament_id, today, min_big_bass_weight=float(BIG_BASS_MINIMUM_WEIGHT)
     )
-    disqualified_results = format_disqualified_results(disqualified_raw)
+    if not summary:
+        raise ValueError("Tournament not found")
+
+    tournament = TournamentWithEvent(**summary)
+    stats = TournamentStats(**summary)
+
+    angler_rows: List[Dict[str, Any]] = []
+    team_rows: List[Dict[str, Any]] = []
+    for row in qs.get_tournament_page_rows(tournament_id):
+        if row["kind"] == "angler":
+            angler_rows.append(
+                {
+                    "tournament_id": tournament_id,
+                    "angler_id": row["angler1_id"],
+                    "num_fish": row["num_fish"],
+                    "total_weight": row["total_weight"],
+                    "big_bass_weight": row["big_bass_weight"],
+                    "dead_fish_penalty": row["dead_fish_penalty"],
+                    "disqualified": row["disqualified"],
+                    "buy_in": row["buy_in"],
+                    "was_member": row["angler1_was_member"],
+                    "id": row["id"],
+                    "angler_name": row["angler1_name"],
+                    "member": row["angler1_member"],
+                }
+            )
+        else:
+            row["tournament_id"] = tournament_id
+            row["total_fish"] = row.pop("num_fish")
+            team_rows.append(row)
 
-    # Check if biggest bass was caught by a member (guests can't win big bass pot)
-    # Only members at the time of the tournament (was_member) can win
-    # For team format: at least ONE angler on the team must be a member
-    if not tournament.aoy_points:
-        # Team format: check team_results for big bass
-        # Team is eligible if either angler1 OR angler2 is a member
-        big_bass_winner = qs.fetch_one(
-            """SELECT tr.big_bass_weight,
-                      (COALESCE(a1.member, FALSE) OR COALESCE(a2.member, FALSE)) as has_member,
-                      a1.name
-               FROM team_results tr
-               JOIN anglers a1 ON tr.angler1_id = a1.id
-               LEFT JOIN anglers a2 ON tr.angler2_id = a2.id
-               WHERE tr.tournament_id = :id
-               AND tr.big_bass_weight > :min_weight
-               AND (a1.member = TRUE OR a2.member = TRUE)
-               ORDER BY tr.big_bass_weight DESC
-               LIMIT 1""",
-            {"id": tournament_id, "min_weight": float(BIG_BASS_MINIMUM_WEIGHT)},
-        )
-        overall_big_bass = qs.fetch_one(
-            """SELECT tr.big_bass_weight,
-                      (COALESCE(a1.member, FALSE) OR COALESCE(a2.member, FALSE)) as was_member
-               FROM team_results tr
-               JOIN anglers a1 ON tr.angler1_id = a1.id
-               LEFT JOIN anglers a2 ON tr.angler2_id = a2.id
-               WHERE tr.tournament_id = :id
-               AND tr.big_bass_weight > 0
-               ORDER BY tr.big_bass_weight DESC
-               LIMIT 1""",
-            {"id": tournament_id},
-        )
-    else:
-        # Standard format: check results table
-        big_bass_winner = qs.fetch_one(
-            """SELECT r.big_bass_weight, r.was_member, a.name
-               FROM results r
-               JOIN anglers a ON r.angler_id = a.id
-               WHERE r.tournament_id = :id
-               AND r.disqualified = FALSE
-               AND r.big_bass_weight > :min_weight
-               AND r.was_member = TRUE
-               ORDER BY r.big_bass_weight DESC
-               LIMIT 1""",
-            {"id": tournament_id, "min_weight": float(BIG_BASS_MINIMUM_WEIGHT)},
-        )
-        overall_big_bass = qs.fetch_one(
-            """SELECT r.big_bass_weight, r.was_member
-               FROM results r
-               WHERE r.tournament_id = :id
-               AND r.disqualified = FALSE
-               AND r.big_bass_weight > 0
-               ORDER BY r.big_bass_weight DESC
-               LIMIT 1""",
-            {"id": tournament_id},
-        )
-    member_has_qualifying_big_bass = big_bass_winner is not None
-    big_bass_caught_by_guest = (
-        overall_big_bass is not None
-        and overall_big_bass["big_bass_weight"] > 0
-        and not overall_big_bass["was_member"]
+    calculated_results = calculate_tournament_points(angler_rows)
+    buy_in_place, buy_in_results = format_buy_in_results(calculated_results)
+    disqualified_results = format_disqualified_results(
+        [
+            {"name": r["angler_name"], "member": r["member"], "was_member": r["was_member"]}
+            for r in angler_rows
+            if r["disqualified"]
+        ]
     )
 
-    # Calculate payouts based on bylaws
+    unclaimed = summary["unclaimed_big_bass"]
+    carryover = Decimal(str(unclaimed)).quantize(Decimal("0.00")) if unclaimed else Decimal("0.00")
     entry_fee = Decimal(str(tournament.entry_fee)) if tournament.entry_fee else Decimal("50.00")
-    # Dynamically calculate carryover from previous tournaments
-    carryover = calculate_big_bass_carryover(qs, tournament_id, str(tournament.event_date))
     # Use total_boats for payout calculation (team format = boats, standard = anglers)
     payouts = calculate_tournament_payouts(
         total_boats=stats.total_boats,
         biggest_bass=stats.biggest_bass,
         entry_fee=entry_fee,
         big_bass_carryover=carryover,
-        member_caught_big_bass=member_has_qualifying_big_bass,
+        member_caught_big_bass=bool(summary["member_caught_big_bass"]),
+    )
+    # Guests can't win the big bass pot; flag a guest's heaviest bass for display.
+    # For team format a boat counts as a member's if either angler is one.
+    top_bass_by_member = summary["top_bass_by_member"]
+    payouts["big_bass_caught_by_guest"] = top_bass_by_member is not None and not top_bass_by_member
+
+    return TournamentPage(
+        tournament=tournament,
+        stats=stats,
+        team_results=format_team_results(team_rows),
+        individual_results=format_individual_results(calculated_results),
+        buy_in_place=buy_in_place,
+        buy_in_results=buy_in_results,
+        disqualified_results=disqualified_results,
+        payouts=payouts,
+        next_tournament_id=summary["next_tournament_id"],
+        prev_tournament_id=summary["prev_tournament_id"],
     )
-    # Add guest indicator for display
-    payouts["big_bass_caught_by_guest"] = big_bass_caught_by_guest
 
-    return (
-        tournament,
-        stats,
-        team_results,
-        individual_results,
-        buy_in_place,
-        buy_in_results,
-        disqualified_results,
-        payouts,
+
+def tournament_page_snapshot(page: TournamentPage) -> Dict[str, Any]:
+    """``page`` as a season snapshot part; Prev/Next are left out and looked up live."""
+    return {
+        "tournament": page.tournament.model_dump(),
+        "stats": page.stats.model_dump(),
+        "team_results": page.team_results,
+        "individual_results": page.individual_results,
+        "buy_in_place": page.buy_in_place,
+        "buy_in_results": page.buy_in_results,
+        "disqualified_results": page.disqualified_results,
+        "payouts": page.payouts,
+    }
+
+
+def load_frozen_tournament_page(
+    qs: QueryService, tournament_id: int, today: date
+) -> Optional[TournamentPage]:
+    """Load a tournament's results page from its frozen season in one statement.
+
+    Returns None when the tournament's season has no snapshot in the current
+    format (see core/services/season_snapshots.py); callers fall back to
+    :func:`load_tournament_page`.
+    """
+    row = qs.get_tournament_page_snapshot(tournament_id, today, SNAPSHOT_FORMAT_VERSION)
+    if not row:
+        return None
+    part = decode(row["payload"])
+    return TournamentPage(
+        tournament=TournamentWithEvent(**part.pop("tournament")),
+        stats=TournamentStats(**part.pop("stats")),
+        next_tournament_id=row["next_tournament_id"],
+        prev_tournament_id=row["prev_tournament_id"],
+        **part,
     )
@@ -40,7 +40,7 @@ def format_individual_results(calculated_results: List[dict]) -> List[Tuple[Any,
     # `r.id` comes back NULL. Numeric DB fields (num_fish, total_weight,
     # big_bass_weight) are also nullable in the schema. `r.get(k) or 0`
     # collapses both missing-key and explicit-None to zero. calculated_*
-    # come from pandas and are guaranteed int via astype.
+    # are always ints from calculate_tournament_points (either engine).
     regular_results = [
         r for r in calculated_results if not r.get("buy_in") and not r.get("disqualified")
     ]
@@ -6,19 +6,18 @@ from sqlalchemy import text
 from sqlalchemy.engine import Result
 
 from core.db_schema import get_session
+from core.query_service.data_cache import bump_results_generation
 
 
 def auto_complete_past_tournaments(tournament_id: Optional[int] = None) -> int:
     """
     Mark a past tournament complete if its event date has passed AND it has results.
 
-    Previously this ran a full-table UPDATE on every page render of
-    ``/tournaments/{id}`` and the admin enter-results page. Now scoped to a
-    single tournament_id when provided, so it becomes a one-row index lookup
-    instead of a table scan.
-
-    When ``tournament_id`` is ``None`` (legacy / batch usage) the original
-    full-table behavior is preserved.
+    Runs as a periodic sweep on the background scheduler (see
+    ``_scheduled_jobs`` in app_setup.py); page renders of
+    ``/tournaments/{id}`` and the admin enter-results page no longer call it.
+    When ``tournament_id`` is provided only that tournament is considered (a
+    one-row index lookup instead of a table scan).
 
     Args:
         tournament_id: Specific tournament to consider. Required for the
@@ -48,8 +47,7 @@ def auto_complete_past_tournaments(tournament_id: Optional[int] = None) -> int:
                 {"tid": tournament_id},
             )
         else:
-            # Legacy batch path: still supported for callers that genuinely
-            # want a sweep (e.g. cron, scripts).
+            # Batch sweep: the scheduled job.
             result = session.execute(
                 text(
                     """
@@ -69,4 +67,8 @@ def auto_complete_past_tournaments(tournament_id: Optional[int] = None) -> int:
             )
         session.commit()
         # MyPy doesn't recognize rowcount on Result[Any], but it exists at runtime
-        return result.rowcount if result.rowcount is not None else 0  # type: ignore[attr-defined]
+        updated: int = result.rowcount if result.rowcount is not None else 0  # type: ignore[attr-defined]
+        if updated:
+            # Newly complete tournaments appear on the /data dashboard.
+            bump_results_generation()
+        return updated
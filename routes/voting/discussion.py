@@ -9,14 +9,11 @@ midnight ending the tournament day (see ``_discussion_is_open``). Deleting is
 allowed for the author or an admin at any time.
 """
 
-import os
 from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, Request
 from fastapi.responses import Response
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from sqlalchemy import func, or_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
@@ -35,13 +32,12 @@ from core.email.config import WEBSITE_URL
 from core.helpers.auth import require_member
 from core.helpers.logging import get_logger
 from core.helpers.timezone import now_local
+from core.rate_limit import limiter
 from core.types import UserDict
 
 router = APIRouter()
 logger = get_logger("discussion")
 
-_is_test_env = os.environ.get("ENVIRONMENT") == "test"
-limiter = Limiter(key_func=get_remote_address, enabled=not _is_test_env)
 
 # Guard rails on comment length so the textarea can't be used to dump huge
 # payloads into the page.
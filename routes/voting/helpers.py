@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import case, distinct, exists, extract, false, func, select
+from sqlalchemy import case, distinct, exists, extract, false, func, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -215,13 +215,92 @@ def get_seasonal_tournament_history(
     return history
 
 
+def _tournament_from_winning_option(
+    poll_id: int,
+    event_id: int,
+    event: Any,
+    option_text: Optional[str],
+    option_data_str: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    """Column values for the Tournament a won location poll creates.
+
+    Returns None when the winning option's data can't be parsed; the poll is
+    still closed, it just doesn't get a tournament.
+    """
+    try:
+        option_data = json.loads(option_data_str) if option_data_str else {}
+
+        tournament_start_time = option_data.get(
+            "start_time", str(event.start_time) if event.start_time else "06:00"
+        )
+        tournament_end_time = option_data.get(
+            "end_time", str(event.weigh_in_time) if event.weigh_in_time else "15:00"
+        )
+
+        # Parse lake and ramp names from option text
+        lake_name, ramp_name = "", ""
+        if option_text and " - " in option_text:
+            parts = option_text.split(" - ")
+            lake_name = parts[0].strip()
+            ramp_name = parts[1].split(" (")[0].strip()
+
+        # Convert time strings to time objects
+        start_time_obj = (
+            datetime.strptime(tournament_start_time, "%H:%M").time()
+            if isinstance(tournament_start_time, str)
+            else tournament_start_time
+        )
+        end_time_obj = (
+            datetime.strptime(tournament_end_time, "%H:%M").time()
+            if isinstance(tournament_end_time, str)
+            else tournament_end_time
+        )
+    except (json.JSONDecodeError, KeyError, ValueError):
+        return None
+
+    return {
+        "event_id": event_id,
+        "poll_id": poll_id,
+        "name": event.name,
+        "lake_id": option_data.get("lake_id"),
+        "ramp_id": option_data.get("ramp_id"),
+        "lake_name": lake_name,
+        "ramp_name": ramp_name,
+        "entry_fee": event.entry_fee or Decimal("50.0"),
+        "fish_limit": 5,  # Default fish limit
+        "start_time": start_time_obj,
+        "end_time": end_time_obj,
+        "complete": False,
+        "is_team": True,
+        "is_paper": False,
+    }
+
+
 def process_closed_polls() -> int:
+    """Finalize every closed, unprocessed tournament-location poll.
+
+    Set-based: one query finds the polls, one windowed query picks every
+    winner (most votes, ties broken by lowest option id), then all polls are
+    closed, winners recorded and tournaments inserted in bulk — a constant
+    number of statements however large the backlog. A poll with no options
+    is closed without a winner or tournament.
+
+    Returns:
+        Number of polls finalized.
+    """
     try:
         with get_session() as session:
             # Find closed polls that need processing
             now = now_local()
             closed_polls_query = (
-                select(Poll.id, Poll.event_id, Poll.poll_type, Poll.closes_at)
+                select(
+                    Poll.id,
+                    Poll.event_id,
+                    Event.name,
+                    Event.entry_fee,
+                    Event.start_time,
+                    Event.weigh_in_time,
+                )
                 .join(Event, Poll.event_id == Event.id)
                 .where(Poll.closed.is_(false()))
                 .where(Poll.closes_at < now)
@@ -235,104 +314,66 @@ def process_closed_polls() -> int:
                 )
                 .where(Event.event_type == "sabc_tournament")
             )
-
             closed_polls = session.execute(closed_polls_query).all()
-
-            for poll_id, event_id, poll_type, closes_at in closed_polls:
-                # Mark poll as closed
-                poll = session.query(Poll).filter(Poll.id == poll_id).first()
-                if poll:
-                    poll.closed = True
-
-                # Find winning option (most votes, ties broken by lowest ID)
-                vote_counts_subquery = (
-                    select(PollOption.id, func.count(PollVote.id).label("vote_count"))
-                    .outerjoin(PollVote, PollVote.option_id == PollOption.id)
-                    .where(PollOption.poll_id == poll_id)
-                    .group_by(PollOption.id)
-                    .subquery()
+            if not closed_polls:
+                return 0
+            poll_ids = [row.id for row in closed_polls]
+
+            vote_counts = (
+                select(
+                    PollOption.id,
+                    PollOption.poll_id,
+                    PollOption.option_text,
+                    PollOption.option_data,
+                    func.count(PollVote.id).label("vote_count"),
                 )
-
-                max_votes = session.query(func.max(vote_counts_subquery.c.vote_count)).scalar() or 0
-
-                winning_option_query = (
-                    select(PollOption.id, PollOption.option_text, PollOption.option_data)
-                    .join(vote_counts_subquery, PollOption.id == vote_counts_subquery.c.id)
-                    .where(vote_counts_subquery.c.vote_count == max_votes)
-                    .order_by(PollOption.id)
-                    .limit(1)
+                .outerjoin(PollVote, PollVote.option_id == PollOption.id)
+                .where(PollOption.poll_id.in_(poll_ids))
+                .group_by(
+                    PollOption.id,
+                    PollOption.poll_id,
+                    PollOption.option_text,
+                    PollOption.option_data,
                 )
+                .subquery()
+            )
+            ranked = select(
+                vote_counts,
+                func.row_number()
+                .over(
+                    partition_by=vote_counts.c.poll_id,
+                    order_by=(vote_counts.c.vote_count.desc(), vote_counts.c.id),
+                )
+                .label("rank"),
+            ).subquery()
+            winners = {
+                row.poll_id: row
+                for row in session.execute(
+                    select(
+                        ranked.c.poll_id, ranked.c.id, ranked.c.option_text, ranked.c.option_data
+                    ).where(ranked.c.rank == 1)
+                )
+            }
 
-                winning_option_result = session.execute(winning_option_query).first()
+            session.execute(update(Poll).where(Poll.id.in_(poll_ids)).values(closed=True))
+            if winners:
+                session.execute(
+                    update(Poll),
+                    [{"id": poll_id, "winning_option_id": w.id} for poll_id, w in winners.items()],
+                )
 
-                if not winning_option_result:
+            new_tournaments = []
+            for poll in closed_polls:
+                winner = winners.get(poll.id)
+                if winner is None:
                     continue
-
-                option_id, option_text, option_data_str = winning_option_result
-
-                # Update poll with winning option
-                if poll:
-                    poll.winning_option_id = option_id
-
-                # Create tournament from winning option
-                if poll_type == "tournament_location":
-                    try:
-                        option_data = json.loads(option_data_str) if option_data_str else {}
-
-                        # Get event details
-                        event = session.query(Event).filter(Event.id == event_id).first()
-                        if not event:
-                            continue
-
-                        lake_id = option_data.get("lake_id")
-                        ramp_id = option_data.get("ramp_id")
-                        tournament_start_time = option_data.get(
-                            "start_time", str(event.start_time) if event.start_time else "06:00"
-                        )
-                        tournament_end_time = option_data.get(
-                            "end_time", str(event.weigh_in_time) if event.weigh_in_time else "15:00"
-                        )
-
-                        # Parse lake and ramp names from option text
-                        lake_name, ramp_name = "", ""
-                        if option_text and " - " in option_text:
-                            parts = option_text.split(" - ")
-                            lake_name = parts[0].strip()
-                            ramp_name = parts[1].split(" (")[0].strip()
-
-                        # Convert time strings to time objects
-                        start_time_obj = (
-                            datetime.strptime(tournament_start_time, "%H:%M").time()
-                            if isinstance(tournament_start_time, str)
-                            else tournament_start_time
-                        )
-                        end_time_obj = (
-                            datetime.strptime(tournament_end_time, "%H:%M").time()
-                            if isinstance(tournament_end_time, str)
-                            else tournament_end_time
-                        )
-
-                        # Create tournament
-                        new_tournament = Tournament(
-                            event_id=event_id,
-                            poll_id=poll_id,
-                            name=event.name,
-                            lake_id=lake_id,
-                            ramp_id=ramp_id,
-                            lake_name=lake_name,
-                            ramp_name=ramp_name,
-                            entry_fee=event.entry_fee or Decimal("50.0"),
-                            fish_limit=5,  # Default fish limit
-                            start_time=start_time_obj,
-                            end_time=end_time_obj,
-                            complete=False,
-                            is_team=True,
-                            is_paper=False,
-                        )
-                        session.add(new_tournament)
-
-                    except (json.JSONDecodeError, KeyError, ValueError):
-                        continue
+                values = _tournament_from_winning_option(
+                    poll.id, poll.event_id, poll, winner.option_text, winner.option_data
+                )
+                if values is not None:
+                    new_tournaments.append(values)
+            if new_tournaments:
+                session.execute(insert(Tournament), new_tournaments)
 
             return len(closed_polls)
     except SQLAlchemyError:
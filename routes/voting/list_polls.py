@@ -1,14 +1,24 @@
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Request
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import RedirectResponse, Response
 from sqlalchemy import case, exists, false, func, select, true
 
-from core.db_schema import Angler, Event, Poll, PollComment, PollVote, engine, get_session
+from core.db_schema import (
+    Angler,
+    Event,
+    Lake,
+    Poll,
+    PollComment,
+    PollVote,
+    Tournament,
+    engine,
+    get_session,
+)
 from core.deps import templates
 from core.helpers.auth import is_dues_current, require_auth
 from core.helpers.logging import get_logger
-from core.helpers.poll_day_info import get_poll_day_info
+from core.helpers.poll_day_info import Location, get_poll_day_info, lake_location
 from core.helpers.timezone import now_local
 from core.query_service import QueryService
 from core.types import UserDict
@@ -16,7 +26,6 @@ from routes.dependencies import get_lakes_list
 from routes.voting.helpers import (
     get_poll_options,
     get_seasonal_tournament_history,
-    process_closed_polls,
 )
 
 logger = get_logger(__name__)
@@ -26,7 +35,6 @@ router = APIRouter()
 @router.get("/polls")
 def polls(
     request: Request,
-    background_tasks: BackgroundTasks,
     user: UserDict = Depends(require_auth),
     tab: Optional[str] = None,
     p: int = 1,
@@ -37,8 +45,6 @@ def polls(
 
         raise HTTPException(status_code=403, detail="Only members can view polls")
 
-    background_tasks.add_task(process_closed_polls)
-
     # Calculate dues banner visibility (admins never see banner - they can always vote)
     show_dues_banner = False
     if user.get("member") and not user.get("is_admin") and not is_dues_current(user):
@@ -210,11 +216,21 @@ def polls(
         # poll_row, so the redundant per-poll `session.query(Poll)...first()`
         # is dropped entirely.
         event_ids = [poll_row.event_id for poll_row in polls_data if poll_row.event_id is not None]
+        # The same query picks up the coordinates of the tournament's lake,
+        # once one is set, for the lake-specific sunrise and forecast.
         events_by_id: Dict[int, Event] = {}
+        event_locations: Dict[int, Location] = {}
         if event_ids:
-            events_by_id = {
-                e.id: e for e in session.query(Event).filter(Event.id.in_(event_ids)).all()
-            }
+            event_rows = (
+                session.query(Event, Lake.latitude, Lake.longitude)
+                .outerjoin(Tournament, Tournament.event_id == Event.id)
+                .outerjoin(Lake, Tournament.lake_id == Lake.id)
+                .filter(Event.id.in_(event_ids))
+                .all()
+            )
+            for e, latitude, longitude in event_rows:
+                events_by_id[e.id] = e
+                event_locations[e.id] = lake_location(latitude, longitude)
 
         # Build a minimal Poll-shaped object for the seasonal helper. The
         # helper only uses .event_id, so reusing a real Poll fetch would be
@@ -254,7 +270,9 @@ def polls(
 
                     if event_obj.date:
                         try:
-                            day_info = get_poll_day_info(event_obj.date)
+                            day_info = get_poll_day_info(
+                                event_obj.date, event_locations[event_obj.id]
+                            )
                         except Exception as e:
                             # Never let sunrise/weather lookup break the poll page.
                             logger.warning(f"poll_day_info failed for poll {poll_row.id}: {e}")
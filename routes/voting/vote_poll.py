@@ -1,11 +1,8 @@
 import json
-import os
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import RedirectResponse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from core.db_schema import Angler, Poll, PollOption, PollVote, get_session
@@ -13,6 +10,7 @@ from core.helpers.auth import is_dues_current, require_auth
 from core.helpers.logging import get_logger
 from core.helpers.response import get_safe_redirect_url, sanitize_error_message
 from core.helpers.timezone import now_local
+from core.rate_limit import limiter
 from core.types import UserDict
 from routes.voting.vote_validation import (
     get_or_create_option_id,
@@ -22,8 +20,6 @@ from routes.voting.vote_validation import (
 
 router = APIRouter()
 logger = get_logger("voting")
-_is_test_env = os.environ.get("ENVIRONMENT") == "test"
-limiter = Limiter(key_func=get_remote_address, enabled=not _is_test_env)
 
 
 @router.post("/polls/{poll_id}/vote")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Render the gallery's responsive variants for every existing photo.
+
+Variants are otherwise made on the first request for each one (see
+routes/photos/variants.py). This fills in content_hash/width/height for
+photos uploaded before variants existed, so the gallery emits a srcset for
+them, and renders every missing variant in parallel.
+
+Safe to re-run: photos already described and variants already on disk are
+skipped. Run from the app directory, so uploads/photos resolves.
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/backfill_photo_variants.py [--workers 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.photo_processing import VARIANT_FORMATS  # noqa: E402
+from routes.photos.variants import backfill_variants  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument(
+        "--format",
+        dest="formats",
+        action="append",
+        choices=sorted(VARIANT_FORMATS),
+        help="Only render this format (repeatable; default: every enabled format)",
+    )
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    started = time.perf_counter()
+    counts = backfill_variants(workers=args.workers, formats=args.formats)
+    print(
+        f"✅ {counts['described']} photos described, {counts['rendered']} variants rendered, "
+        f"{counts['failed']} failed in {time.perf_counter() - started:.1f}s"
+    )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Compare read throughput of the sync+threadpool and async database paths.
+
+Fires --requests concurrent reads (at most --concurrency in flight) at the
+database two ways, inside one event loop as a web worker would:
+
+* ``sync+threadpool`` — sync engine session, hopped through run_in_threadpool
+  (anyio's default limiter: 40 threads).
+* ``async``           — get_async_session on the async engine, no thread hop.
+
+The default query is the /api/lakes read; --sleep-ms adds pg_sleep() so the
+query holds its connection like a slow page query would (PostgreSQL only).
+Pool sizes come from DB_POOL_SIZE / DB_MAX_OVERFLOW, as in the app.
+
+Run it against PostgreSQL. On SQLite the async path is not pooled (see
+core/db_schema/async_engine.py) and aiosqlite runs every connection on a
+thread of its own, so it measures slower than the threadpool path there.
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/bench_async_db.py \\
+        [--requests 2000] [--concurrency 100] [--sleep-ms 0]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable, List
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+from starlette.concurrency import run_in_threadpool  # noqa: E402
+
+from core.db_schema import get_async_session, get_session  # noqa: E402
+from core.db_schema.async_engine import dispose_async_engine  # noqa: E402
+
+
+def _query(sleep_ms: int) -> str:
+    sql = "SELECT id, yaml_key, display_name FROM lakes ORDER BY display_name"
+    if sleep_ms:
+        sql = f"SELECT l.* FROM ({sql}) l, (SELECT pg_sleep({sleep_ms / 1000})) s"
+    return sql
+
+
+async def _measure(
+    read: Callable[[], Awaitable[None]], requests: int, concurrency: int
+) -> tuple[float, List[float]]:
+    gate = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one() -> None:
+        async with gate:
+            started = time.perf_counter()
+            await read()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return requests / (time.perf_counter() - started), latencies
+
+
+async def _bench(args: argparse.Namespace) -> None:
+    sql = text(_query(args.sleep_ms))
+
+    def sync_read() -> None:
+        with get_session() as session:
+            session.execute(sql).all()
+
+    async def threadpool_read() -> None:
+        await run_in_threadpool(sync_read)
+
+    async def async_read() -> None:
+        async with get_async_session() as session:
+            (await session.execute(sql)).all()
+
+    print(f"{'path':<16} {'req/s':>10} {'p50 ms':>10} {'p95 ms':>10}")
+    for label, read in (("sync+threadpool", threadpool_read), ("async", async_read)):
+        await _measure(read, min(args.requests, 50), args.concurrency)  # warm the pool
+        throughput, latencies = await _measure(read, args.requests, args.concurrency)
+        latencies.sort()
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        print(
+            f"{label:<16} {throughput:>10.0f} {statistics.median(latencies) * 1000:>10.1f}"
+            f" {p95 * 1000:>10.1f}"
+        )
+    await dispose_async_engine()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--sleep-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    asyncio.run(_bench(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark process_closed_polls on a backlog of closed, unprocessed polls.
+
+Seeds --polls tournament-location polls (each on its own event, with
+--options options and a few votes), all closed yesterday, then times one
+process_closed_polls() call and counts the statements it issues. Everything
+the run created — voters, events, polls, options, votes and the tournaments
+the polls produced — is deleted afterwards.
+
+Intended for a scratch or staging database (e.g. a restored dump); never run
+it against production.
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/bench_closed_polls.py [--polls 300]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Dict
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, event, func, select, update  # noqa: E402
+
+from core.db_schema import (  # noqa: E402
+    Angler,
+    Event,
+    Poll,
+    PollOption,
+    PollVote,
+    Tournament,
+    engine,
+    get_session,
+)
+from core.helpers.timezone import now_local  # noqa: E402
+from routes.voting.helpers import process_closed_polls  # noqa: E402
+
+BENCH_TAG = "bench-closed-polls"
+_stats: Dict[str, float] = {"statements": 0}
+
+
+def _count_statement(*_args: Any) -> None:
+    _stats["statements"] += 1
+
+
+def _seed(polls: int, options: int) -> None:
+    now = now_local()
+    with get_session() as session:
+        # Far-future dates so the events can't collide with real ones (events.date is unique).
+        last = session.execute(select(func.max(Event.date))).scalar() or date.today()
+        voters = [
+            Angler(name=f"{BENCH_TAG} voter {i}", email=f"{BENCH_TAG}-{i}@example.invalid")
+            for i in range(3)
+        ]
+        session.add_all(voters)
+        session.flush()
+        for i in range(polls):
+            bench_event = Event(
+                date=last + timedelta(days=365 + i),
+                year=(last + timedelta(days=365 + i)).year,
+                name=BENCH_TAG,
+                event_type="sabc_tournament",
+            )
+            session.add(bench_event)
+            session.flush()
+            poll = Poll(
+                title=BENCH_TAG,
+                poll_type="tournament_location",
+                event_id=bench_event.id,
+                starts_at=now - timedelta(days=8),
+                closes_at=now - timedelta(days=1),
+                closed=False,
+            )
+            session.add(poll)
+            session.flush()
+            poll_options = [
+                PollOption(
+                    poll_id=poll.id,
+                    option_text=f"Lake {n} - Ramp {n}",
+                    option_data=json.dumps({"start_time": "06:00", "end_time": "15:00"}),
+                )
+                for n in range(options)
+            ]
+            session.add_all(poll_options)
+            session.flush()
+            for n, voter in enumerate(voters):
+                chosen = poll_options[(i + n) % options]
+                session.add(PollVote(poll_id=poll.id, option_id=chosen.id, angler_id=voter.id))
+
+
+def _cleanup() -> None:
+    with get_session() as session:
+        poll_ids = select(Poll.id).where(Poll.title == BENCH_TAG).scalar_subquery()
+        event_ids = select(Event.id).where(Event.name == BENCH_TAG).scalar_subquery()
+        session.execute(delete(Tournament).where(Tournament.event_id.in_(event_ids)))
+        session.execute(delete(PollVote).where(PollVote.poll_id.in_(poll_ids)))
+        session.execute(update(Poll).where(Poll.title == BENCH_TAG).values(winning_option_id=None))
+        session.execute(delete(PollOption).where(PollOption.poll_id.in_(poll_ids)))
+        session.execute(delete(Poll).where(Poll.title == BENCH_TAG))
+        session.execute(delete(Event).where(Event.name == BENCH_TAG))
+        session.execute(delete(Angler).where(Angler.name.like(f"{BENCH_TAG} voter %")))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--polls", type=int, default=300)
+    parser.add_argument("--options", type=int, default=4)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    _cleanup()
+    _seed(args.polls, args.options)
+    event.listen(engine, "before_cursor_execute", _count_statement)
+    try:
+        started = time.perf_counter()
+        finalized = process_closed_polls()
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine, "before_cursor_execute", _count_statement)
+        _cleanup()
+
+    print(f"{'polls finalized':<16} {finalized:>10}")
+    print(f"{'statements':<16} {int(_stats['statements']):>10}")
+    print(f"{'seconds':<16} {elapsed:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
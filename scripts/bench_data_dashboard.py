@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark /data latency with a cold vs warm dashboard query cache.
+
+Renders /data through the real app (TestClient). "Cold" bumps the results
+generation before every render, as a result write would; "warm" renders
+repeatedly against a populated cache. See core/query_service/data_cache.py.
+
+Run against a database populated by scripts/seed_staging_data.py (the
+dashboard SQL is PostgreSQL-only):
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/bench_data_dashboard.py [--iterations 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app_setup import create_app  # noqa: E402
+from core.query_service import data_cache  # noqa: E402
+
+
+def _render_ms(client: TestClient, iterations: int, cold: bool) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        if cold:
+            data_cache.bump_results_generation()
+        started = time.perf_counter()
+        response = client.get("/data")
+        timings.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            raise SystemExit(f"❌ GET /data returned {response.status_code}")
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    data_cache.DATA_CACHE_ENABLED = True
+    client = TestClient(create_app())
+    client.get("/data")  # warm pool, templates and imports
+
+    cold = _render_ms(client, args.iterations, cold=True)
+    warm = _render_ms(client, args.iterations, cold=False)
+
+    print(f"{'cache':<6} {'median ms':>10} {'p95 ms':>10}")
+    for label, timings in (("cold", cold), ("warm", warm)):
+        p95 = sorted(timings)[max(0, int(len(timings) * 0.95) - 1)]
+        print(f"{label:<6} {statistics.median(timings):>10.1f} {p95:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark the request middleware stack: BaseHTTPMiddleware vs plain ASGI.
+
+Pushes --requests GETs of a trivial route straight through two ASGI stacks,
+with no server or network in between, so the difference is the middleware
+itself. The old stack re-creates the BaseHTTPMiddleware versions of the
+security headers, correlation ID and metrics middleware; the new one is the
+app's own (core/security_middleware.py, core/correlation_middleware.py,
+core/monitoring/middleware.py), nested as in app_setup.create_app(). Reports
+requests per second for each, best of --repeat runs. Needs no database.
+
+Usage:
+    python scripts/bench_middleware.py [--requests 20000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Dict
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import PlainTextResponse, Response  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+from starlette.types import ASGIApp, Message  # noqa: E402
+
+from core.correlation_middleware import (  # noqa: E402
+    CORRELATION_ID_HEADER,
+    CorrelationIDMiddleware,
+    correlation_id_var,
+    generate_correlation_id,
+)
+from core.monitoring.db_queries import begin_request, end_request  # noqa: E402
+from core.monitoring.metrics import http_requests_total  # noqa: E402
+from core.monitoring.middleware import MetricsMiddleware  # noqa: E402
+from core.security_middleware import _CSP, _HEADERS, SecurityHeadersMiddleware  # noqa: E402
+
+
+class OldSecurityHeaders(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        for name, value in _HEADERS.items():
+            response.headers[name] = value
+        response.headers["Content-Security-Policy"] = _CSP
+        return response
+
+
+class OldCorrelationID(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        correlation_id = request.headers.get(CORRELATION_ID_HEADER) or generate_correlation_id()
+        token = correlation_id_var.set(correlation_id)
+        request.state.correlation_id = correlation_id
+        try:
+            response = await call_next(request)
+            response.headers[CORRELATION_ID_HEADER] = correlation_id
+            return response
+        finally:
+            correlation_id_var.reset(token)
+
+
+class OldMetrics(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        start_time = time.time()
+        stats = begin_request()
+        try:
+            response = await call_next(request)
+        finally:
+            end_request(stats)
+        http_requests_total.labels(
+            method=request.method, endpoint=request.url.path, status=response.status_code
+        ).inc()
+        response.headers["Server-Timing"] = f"total;dur={(time.time() - start_time) * 1000:.1f}"
+        return response
+
+
+def _hello(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("hello")
+
+
+def _old_stack() -> ASGIApp:
+    app = Starlette(routes=[Route("/hello", _hello)])
+    return OldSecurityHeaders(OldCorrelationID(OldMetrics(app)))
+
+
+def _new_stack() -> ASGIApp:
+    app = Starlette(routes=[Route("/hello", _hello)])
+    return SecurityHeadersMiddleware(
+        CorrelationIDMiddleware(MetricsMiddleware(app, server_timing=True))
+    )
+
+
+_SCOPE: Dict[str, Any] = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/hello",
+    "raw_path": b"/hello",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"bench")],
+    "client": ("127.0.0.1", 1234),
+    "server": ("bench", 80),
+}
+
+
+async def _requests_per_second(app: ASGIApp, requests: int) -> float:
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(_SCOPE), receive, send)
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stacks = {"BaseHTTPMiddleware": _old_stack(), "plain ASGI": _new_stack()}
+    results = {}
+    for label, app in stacks.items():
+        asyncio.run(_requests_per_second(app, 500))  # warm up
+        results[label] = max(
+            asyncio.run(_requests_per_second(app, args.requests)) for _ in range(args.repeat)
+        )
+        print(f"{label:<20} {results[label]:>9.0f} req/s")
+
+    speedup = results["plain ASGI"] / results["BaseHTTPMiddleware"]
+    print(f"✅ plain ASGI stack handles {speedup:.2f}x the requests per second")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
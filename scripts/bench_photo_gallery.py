@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark the gallery's infinite-scroll query at a deep page, OFFSET vs cursor.
+
+Seeds --photos photos (spread over --anglers anglers, one in ten a big
+bass), then times fetching scroll page --page both ways the gallery has
+done it: COUNT(*) plus LIMIT/OFFSET, as every scroll request used to, and
+the (uploaded_at, id) keyset seek it does now, which neither counts nor
+skips rows. Each is timed unfiltered and under the angler and big-bass
+filters. Everything the run created is deleted afterwards.
+
+Intended for a scratch or staging database (e.g. a restored dump); never run
+it against production.
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/bench_photo_gallery.py [--photos 50000] [--page 50]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, insert, select, tuple_  # noqa: E402
+
+from core.db_schema import Angler, Photo, get_session  # noqa: E402
+from routes.photos.gallery import PHOTOS_PER_PAGE, build_photo_query  # noqa: E402
+
+BENCH_TAG = "bench-photo-gallery"
+
+
+def _seed(photos: int, anglers: int) -> List[int]:
+    started = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    with get_session() as session:
+        bench_anglers = [Angler(name=f"{BENCH_TAG} {i}") for i in range(anglers)]
+        session.add_all(bench_anglers)
+        session.flush()
+        angler_ids = [a.id for a in bench_anglers]
+        for batch in range(0, photos, 5000):
+            session.execute(
+                insert(Photo),
+                [
+                    {
+                        "angler_id": angler_ids[i % anglers],
+                        "filename": f"{BENCH_TAG}/{i}.jpg",
+                        "is_big_bass": i % 10 == 0,
+                        "uploaded_at": started + timedelta(minutes=i),
+                    }
+                    for i in range(batch, min(batch + 5000, photos))
+                ],
+            )
+    return angler_ids
+
+
+def _cleanup() -> None:
+    with get_session() as session:
+        angler_ids = select(Angler.id).where(Angler.name.like(f"{BENCH_TAG} %")).scalar_subquery()
+        session.execute(delete(Photo).where(Photo.angler_id.in_(angler_ids)))
+        session.execute(delete(Angler).where(Angler.name.like(f"{BENCH_TAG} %")))
+
+
+def _offset_page(filters: Dict[str, Any], page: int) -> None:
+    with get_session() as session:
+        query = build_photo_query(session, **filters)
+        query.count()
+        query.limit(PHOTOS_PER_PAGE).offset((page - 1) * PHOTOS_PER_PAGE).all()
+
+
+def _cursor_before(filters: Dict[str, Any], page: int) -> Optional[tuple]:
+    """The cursor the scroll request for ``page`` carries: the last photo of the page before."""
+    with get_session() as session:
+        row = (
+            build_photo_query(session, **filters)
+            .offset((page - 1) * PHOTOS_PER_PAGE - 1)
+            .limit(1)
+            .first()
+        )
+        return (row[0].uploaded_at, row[0].id) if row else None
+
+
+def _keyset_page(filters: Dict[str, Any], position: tuple) -> None:
+    with get_session() as session:
+        (
+            build_photo_query(session, **filters)
+            .filter(tuple_(Photo.uploaded_at, Photo.id) < position)
+            .limit(PHOTOS_PER_PAGE + 1)
+            .all()
+        )
+
+
+def _median_ms(run: Callable[[], None], repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        runs.append(time.perf_counter() - started)
+    return statistics.median(runs) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--photos", type=int, default=50_000)
+    parser.add_argument("--anglers", type=int, default=40)
+    parser.add_argument("--page", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    _cleanup()
+    try:
+        angler_ids = _seed(args.photos, args.anglers)
+        no_filter = {"tournament_id_int": None, "angler_id_int": None, "big_bass_bool": None}
+        cases = {
+            "all photos": no_filter,
+            "one angler": {**no_filter, "angler_id_int": angler_ids[0]},
+            "big bass": {**no_filter, "big_bass_bool": True},
+        }
+        print(f"{args.photos} photos; ms for scroll page {args.page} (median of {args.repeat})")
+        print(f"{'filter':<12} {'count+offset':>13} {'cursor':>8}")
+        for label, filters in cases.items():
+            position = _cursor_before(filters, args.page)
+            if position is None:
+                print(f"{label:<12} fewer than {args.page} pages")
+                continue
+            offset_ms = _median_ms(lambda: _offset_page(filters, args.page), args.repeat)
+            keyset_ms = _median_ms(lambda: _keyset_page(filters, position), args.repeat)
+            print(f"{label:<12} {offset_ms:>13.1f} {keyset_ms:>8.1f}")
+    finally:
+        _cleanup()
+    print("✅ Bench data removed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Benchmark CPU time and peak RSS per photo upload, old pipeline vs new.
+
+"three-decode" is the pipeline uploads used before core/photo_processing.py:
+Image.verify(), then a full-resolution decode for the thumbnail and another
+for the blur placeholder. "single-decode" is core.photo_processing.
+process_photo: one draft-mode decode that both variants are derived from.
+
+Each upload is processed in a freshly spawned process, as in the photo
+worker pool, so its CPU time and peak RSS are measured on their own. The
+RSS reported is the peak above the worker's baseline, which already holds
+Pillow and the upload's bytes.
+
+Without arguments, phone-like JPEGs are synthesized (12 MP landscape, 12 MP
+portrait with an EXIF rotation, 48 MP); pass your own files to use those.
+
+Usage:
+    python scripts/bench_photo_pipeline.py [--iterations 5] [photo.jpg ...]
+"""
+
+import argparse
+import io
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageOps  # noqa: E402
+
+from core.photo_processing import (  # noqa: E402
+    PLACEHOLDER_SIZE,
+    THUMBNAIL_SIZE,
+    WEBP_QUALITY,
+    process_photo,
+)
+
+SYNTHETIC = {
+    "12MP landscape": ((4032, 3024), None),
+    "12MP portrait (EXIF 6)": ((4032, 3024), 6),
+    "48MP landscape": ((8064, 6048), None),
+}
+
+
+def synthesize_jpeg(size: Tuple[int, int], orientation: Optional[int]) -> bytes:
+    """Gradients plus sensor-like noise, so the JPEG is about as big as a real phone photo."""
+    gradient = Image.merge(
+        "RGB", [Image.linear_gradient("L").resize(size).rotate(angle) for angle in (0, 90, 180)]
+    )
+    noise = Image.merge("RGB", [Image.effect_noise(size, sigma) for sigma in (30, 45, 60)])
+    img = Image.blend(gradient, noise, 0.2)
+    exif = Image.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    buf = io.BytesIO()
+    img.save(buf, "JPEG", quality=85, exif=exif)
+    return buf.getvalue()
+
+
+def _webp(img: Image.Image, size: Tuple[int, int], quality: int, method: int) -> bytes:
+    img.thumbnail(size, Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, "WEBP", quality=quality, method=method)
+    return buf.getvalue()
+
+
+def _full_decode(contents: bytes) -> Image.Image:
+    original = Image.open(io.BytesIO(contents))
+    img = ImageOps.exif_transpose(original)
+    return img.convert("RGB") if img.mode in ("RGBA", "P") else img
+
+
+def three_decode(contents: bytes) -> None:
+    with Image.open(io.BytesIO(contents)) as probe:
+        probe.verify()
+    _webp(_full_decode(contents), THUMBNAIL_SIZE, WEBP_QUALITY, method=4)
+    _webp(_full_decode(contents), PLACEHOLDER_SIZE, quality=20, method=6)
+
+
+PIPELINES: Dict[str, Callable[[bytes], object]] = {
+    "three-decode": three_decode,
+    "single-decode": process_photo,
+}
+
+
+def _peak_rss_mb() -> float:
+    # On Linux a spawned process inherits its parent's ru_maxrss, so read the
+    # process's own high-water mark instead (reset by _reset_peak_rss).
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is in bytes on macOS.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024)
+
+
+def _reset_peak_rss() -> None:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _measure(name: str, contents: bytes) -> Tuple[float, float, float]:
+    """Run one pipeline here: CPU seconds, wall seconds, peak RSS MB above the baseline."""
+    _reset_peak_rss()
+    baseline = _peak_rss_mb()
+    cpu_started, wall_started = time.process_time(), time.perf_counter()
+    PIPELINES[name](contents)
+    cpu, wall = time.process_time() - cpu_started, time.perf_counter() - wall_started
+    return cpu, wall, _peak_rss_mb() - baseline
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("photos", nargs="*", help="JPEGs to use instead of synthetic ones")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.photos:
+        inputs = {}
+        for path in args.photos:
+            with open(path, "rb") as f:
+                inputs[os.path.basename(path)] = f.read()
+    else:
+        inputs = {label: synthesize_jpeg(*spec) for label, spec in SYNTHETIC.items()}
+
+    # One process per upload: max_tasks_per_child=1 gives every run a fresh peak RSS.
+    pool = ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    )
+    print(
+        f"{'photo':<26} {'MB':>5}  {'pipeline':<14} {'cpu ms':>8} {'wall ms':>8} {'peak RSS MB':>12}"
+    )
+    try:
+        for label, contents in inputs.items():
+            for name in PIPELINES:
+                runs: List[Tuple[float, float, float]] = [
+                    pool.submit(_measure, name, contents).result() for _ in range(args.iterations)
+                ]
+                cpu, wall, rss = (statistics.median(column) for column in zip(*runs))
+                print(
+                    f"{label:<26} {len(contents) / 1e6:>5.1f}  {name:<14} "
+                    f"{cpu * 1000:>8.0f} {wall * 1000:>8.0f} {rss:>12.0f}"
+                )
+    finally:
+        pool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark upload memory and directory listing, read-whole/flat vs streamed/sharded.
+
+Memory: before routes/photos/storage.py, an upload was read into one bytes
+object (up to MAX_FILE_SIZE) and pickled across to the photo worker pool,
+so each upload in flight held two copies of the file in the server process.
+Now it is streamed from Starlette's spooled temp file to INCOMING_DIR in
+CHUNK_SIZE pieces, and only the path is sent to the pool. This runs
+``--concurrent`` uploads of ``--size`` MB at once in threads, as the
+request threadpool would, and reports the peak Python heap for both
+(tracemalloc).
+
+Listing: ``--files`` originals stored under flat uuid names in one
+directory vs sharded by content hash (ab/cd/<hash>.jpg), timing a full
+listing of each directory a lookup or backup walks through.
+
+Usage:
+    python scripts/bench_photo_storage.py [--concurrent 8] [--size 10] [--files 50000]
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, List
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routes.photos import storage  # noqa: E402
+
+SPOOL_MAX_SIZE = 1024 * 1024  # starlette.datastructures.UploadFile's default
+
+
+def read_whole(source: BinaryIO) -> None:
+    contents = source.read()
+    hashlib.sha256(contents).hexdigest()
+    pickle.dumps(contents)  # what run_in_photo_pool sends the worker
+
+
+def streamed(source: BinaryIO) -> None:
+    incoming = storage.stream_to_incoming(source, max_size=sys.maxsize)
+    pickle.dumps(incoming.path)
+    os.remove(incoming.path)
+
+
+def _spooled_upload(data: bytes) -> BinaryIO:
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    spool.write(data)
+    spool.seek(0)
+    return spool  # type: ignore[return-value]
+
+
+def peak_mb(handle: Callable[[BinaryIO], None], data: bytes, concurrent: int) -> float:
+    """Peak heap (MB) while ``concurrent`` uploads of ``data`` are handled at once."""
+    uploads = [_spooled_upload(data) for _ in range(concurrent)]
+    tracemalloc.start()
+    with ThreadPoolExecutor(max_workers=concurrent) as pool:
+        list(pool.map(handle, uploads))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    for upload in uploads:
+        upload.close()
+    return peak / (1024 * 1024)
+
+
+def _listing_ms(directory: str, repeat: int = 5) -> float:
+    runs: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with os.scandir(directory) as entries:
+            for _ in entries:
+                pass
+        runs.append(time.perf_counter() - started)
+    return statistics.median(runs) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--concurrent", type=int, default=8)
+    parser.add_argument("--size", type=float, default=10, help="MB per upload")
+    parser.add_argument("--files", type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage.INCOMING_DIR = os.path.join(tmp, "incoming")
+        os.makedirs(storage.INCOMING_DIR)
+        data = os.urandom(int(args.size * 1024 * 1024))
+        print(f"{args.concurrent} concurrent uploads of {args.size:g} MB; peak heap MB")
+        for name, handle in (("read whole", read_whole), ("streamed", streamed)):
+            total = peak_mb(handle, data, args.concurrent)
+            print(f"  {name:<12} {total:>8.1f} total {total / args.concurrent:>8.2f} per upload")
+
+        flat = os.path.join(tmp, "flat")
+        sharded = os.path.join(tmp, "sharded")
+        os.makedirs(flat)
+        for i in range(args.files):
+            open(os.path.join(flat, f"{uuid.uuid4()}.jpg"), "w").close()
+            path = os.path.join(
+                sharded, storage.original_filename(hashlib.sha256(b"%d" % i).hexdigest(), ".jpg")
+            )
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+        top = sorted(os.listdir(sharded))[0]
+        leaf = os.path.join(sharded, top, sorted(os.listdir(os.path.join(sharded, top)))[0])
+
+        print(f"\n{args.files} photos; ms to list a directory (entries)")
+        for label, directory in (
+            ("flat", flat),
+            ("shard root", sharded),
+            ("shard level 1", os.path.join(sharded, top)),
+            ("shard level 2", leaf),
+        ):
+            count = len(os.listdir(directory))
+            print(f"  {label:<14} {_listing_ms(directory):>8.2f} ({count})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark bytes transferred per gallery page, thumbnails/originals vs variants.
+
+Before responsive variants, a gallery card loaded the 200px WebP thumbnail
+and the lightbox loaded the original upload. Now both pick from the 400/800/
+1600 WebP variants through srcset. For one page of photos (PHOTOS_PER_PAGE
+synthetic phone JPEGs, or the files given) this renders every thumbnail and
+variant with the real pipeline, picks the candidate a browser would for a
+few common screens (the smallest at least slot width x device pixel ratio),
+and totals the bytes for loading the page and for opening every photo.
+
+Usage:
+    python scripts/bench_photo_variants.py [photo.jpg ...]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_photo_pipeline import synthesize_jpeg  # noqa: E402
+
+from core.photo_processing import VARIANT_WIDTHS, process_photo, render_variant  # noqa: E402
+from routes.photos.gallery import PHOTOS_PER_PAGE  # noqa: E402
+
+# name -> (viewport CSS width, device pixel ratio)
+SCREENS: Dict[str, Tuple[int, float]] = {
+    "phone 390@3x": (390, 3.0),
+    "tablet 820@2x": (820, 2.0),
+    "laptop 1440@1x": (1440, 1.0),
+    "desktop 1920@2x": (1920, 2.0),
+}
+
+
+def grid_slot(viewport: int) -> float:
+    """The card width the grid's sizes attribute gives (templates/photos/_photo_grid.html)."""
+    if viewport < 480:
+        return viewport
+    if viewport < 768:
+        return viewport / 2
+    if viewport < 992:
+        return viewport / 3
+    return 320
+
+
+def lightbox_slot(viewport: int) -> float:
+    return 1140 if viewport >= 1200 else viewport
+
+
+def pick(candidates: List[Tuple[int, int]], needed: float) -> int:
+    """Bytes of the smallest (width, bytes) candidate at least ``needed`` wide, else the largest."""
+    for width, size in sorted(candidates):
+        if width >= needed:
+            return size
+    return max(candidates)[1]
+
+
+def _photos(paths: List[str]) -> List[bytes]:
+    if paths:
+        contents = []
+        for path in paths:
+            with open(path, "rb") as f:
+                contents.append(f.read())
+        return contents
+    # Mostly 12 MP phone shots, a third of them portrait.
+    return [
+        synthesize_jpeg((4032, 3024), 6 if i % 3 == 0 else None) for i in range(PHOTOS_PER_PAGE)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("photos", nargs="*", help="JPEGs to use instead of synthetic ones")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, contents in enumerate(_photos(args.photos)):
+            path = os.path.join(tmp, f"{i}.jpg")
+            with open(path, "wb") as f:
+                f.write(contents)
+            processed = process_photo(contents)
+            variants = {}
+            for width in VARIANT_WIDTHS:
+                variants.setdefault(min(width, processed.width), len(render_variant(path, width)))
+            rows.append((len(processed.thumbnail), len(contents), list(variants.items())))
+
+    count = len(rows)
+    print(f"{count} photos; KB per page\n")
+    print(
+        f"{'screen':<18} {'grid before':>12} {'grid after':>11} {'+ open all before':>18} {'after':>9}"
+    )
+    for name, (viewport, dpr) in SCREENS.items():
+        grid_before = sum(thumb for thumb, _, _ in rows)
+        grid_after = sum(pick(variants, grid_slot(viewport) * dpr) for _, _, variants in rows)
+        open_before = sum(original for _, original, _ in rows)
+        open_after = sum(pick(variants, lightbox_slot(viewport) * dpr) for _, _, variants in rows)
+        print(
+            f"{name:<18} {grid_before / 1024:>12.0f} {grid_after / 1024:>11.0f} "
+            f"{(grid_before + open_before) / 1024:>18.0f} {(grid_after + open_after) / 1024:>9.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark per-page DB time with live vs materialized result views.
+
+Renders the hot public pages through the real app (TestClient) and records the
+statement count and total cursor time each page spends in the database, first
+with the live views and then with the materialized summary tables. The
+database is returned to the backend it started in.
+
+Run against a database populated by scripts/seed_staging_data.py:
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/bench_result_views.py [--iterations 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+
+from app_setup import create_app  # noqa: E402
+from core.db_schema import engine  # noqa: E402
+from core.db_schema.materialized_views import (  # noqa: E402
+    dematerialize_result_views,
+    materialize_result_views,
+    result_views_materialized,
+)
+
+_stats: Dict[str, float] = {"statements": 0, "seconds": 0.0}
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    conn.info.setdefault("bench_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    started = conn.info["bench_start"].pop()
+    _stats["statements"] += 1
+    _stats["seconds"] += time.perf_counter() - started
+
+
+def _pages() -> List[str]:
+    """Public pages that read the result views, with ids from the dataset."""
+    with engine.connect() as conn:
+        year = conn.execute(text("SELECT MAX(year) FROM events WHERE date < CURRENT_DATE")).scalar()
+        tournament_id = conn.execute(
+            text(
+                "SELECT MAX(t.id) FROM tournaments t JOIN events e ON t.event_id = e.id "
+                "WHERE e.date < CURRENT_DATE"
+            )
+        ).scalar()
+    return ["/", f"/awards/{year}", "/data", f"/tournaments/{tournament_id}"]
+
+
+def _measure(client: TestClient, path: str, iterations: int) -> Optional[Tuple[int, float]]:
+    """Return (statements per render, median DB milliseconds per render).
+
+    Returns None if the page does not render (e.g. PostgreSQL-only SQL on
+    the /data dashboard when benchmarking a SQLite copy).
+    """
+    client.get(path)  # warm caches/pool
+    timings = []
+    statements = 0
+    for _ in range(iterations):
+        _stats["statements"], _stats["seconds"] = 0, 0.0
+        response = client.get(path, follow_redirects=False)
+        if response.status_code != 200:
+            print(f"⚠️  GET {path} returned {response.status_code}; skipping")
+            return None
+        timings.append(_stats["seconds"] * 1000)
+        statements = int(_stats["statements"])
+    return statements, statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    with engine.connect() as conn:
+        started_materialized = result_views_materialized(conn)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    client = TestClient(create_app(), raise_server_exceptions=False)
+    pages = _pages()
+    results: Dict[str, Dict[str, Optional[Tuple[int, float]]]] = {}
+
+    try:
+        for backend in ("live", "materialized"):
+            with engine.begin() as conn:
+                if backend == "live":
+                    dematerialize_result_views(conn)
+                else:
+                    materialize_result_views(conn)
+            results[backend] = {path: _measure(client, path, args.iterations) for path in pages}
+    finally:
+        with engine.begin() as conn:
+            if started_materialized:
+                materialize_result_views(conn)
+            else:
+                dematerialize_result_views(conn)
+
+    print(f"{'page':<24} {'stmts':>6} {'live ms':>10} {'mat. ms':>10} {'speedup':>8}")
+    for path in pages:
+        live, mat = results["live"][path], results["materialized"][path]
+        if live is None or mat is None:
+            print(f"{path:<24} {'n/a':>6}")
+            continue
+        statements, live_ms = live
+        _, mat_ms = mat
+        speedup = live_ms / mat_ms if mat_ms else float("inf")
+        print(f"{path:<24} {statements:>6} {live_ms:>10.1f} {mat_ms:>10.1f} {speedup:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark season snapshot build time and page latency live vs frozen.
+
+For each completed season with tournaments (or the --year given), times
+freezing it, then renders /awards/{year}, every tournament results page of
+that year and /data through the real app (TestClient) with the season live
+and with it frozen. The anonymous page cache and the /data query cache are
+turned off so every render does its full work. Seasons that were not frozen
+before the run are thawed again afterwards.
+
+Run against a database populated by scripts/seed_staging_data.py (the
+2020-present dataset):
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/bench_season_snapshots.py [--iterations 10]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app_setup import create_app  # noqa: E402
+from core import page_cache_middleware  # noqa: E402
+from core.db_schema import engine  # noqa: E402
+from core.helpers.timezone import now_local  # noqa: E402
+from core.query_service import data_cache  # noqa: E402
+from core.services.season_snapshots import freeze_season, list_seasons, thaw_season  # noqa: E402
+
+
+def _season_paths(year: int) -> Dict[str, List[str]]:
+    with engine.connect() as conn:
+        ids = conn.execute(
+            text(
+                "SELECT t.id FROM tournaments t JOIN events e ON t.event_id = e.id "
+                "WHERE e.year = :year ORDER BY e.date"
+            ),
+            {"year": year},
+        ).scalars()
+        return {
+            "awards": [f"/awards/{year}"],
+            "tournaments": [f"/tournaments/{tid}" for tid in ids],
+            "data": ["/data"],
+        }
+
+
+def _render_ms(client: TestClient, paths: List[str], iterations: int) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        for path in paths:
+            started = time.perf_counter()
+            response = client.get(path)
+            timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise SystemExit(f"❌ GET {path} returned {response.status_code}")
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--year", type=int, action="append", dest="years")
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    today = now_local().date()
+    with engine.connect() as conn:
+        already_frozen = {season["year"] for season in list_seasons(conn)}
+        years = args.years or [
+            row.year
+            for row in conn.execute(
+                text(
+                    "SELECT DISTINCT e.year FROM tournaments t JOIN events e ON t.event_id = e.id "
+                    "WHERE e.year < :year ORDER BY e.year"
+                ),
+                {"year": today.year},
+            )
+        ]
+
+    page_cache_middleware.PAGE_CACHE_ENABLED = False
+    data_cache.DATA_CACHE_ENABLED = False
+    client = TestClient(create_app())
+    client.get("/data")  # warm pool, templates and imports
+
+    build_seconds: Dict[int, float] = {}
+    print(f"{'year':<6} {'page':<12} {'live ms':>9} {'frozen ms':>10} {'speedup':>8}")
+    try:
+        for year in years:
+            paths = _season_paths(year)
+            with engine.begin() as conn:
+                thaw_season(conn, year)
+            live = {page: _render_ms(client, p, args.iterations) for page, p in paths.items()}
+
+            started = time.perf_counter()
+            with engine.begin() as conn:
+                freeze_season(conn, year, today)
+            build_seconds[year] = time.perf_counter() - started
+            frozen = {page: _render_ms(client, p, args.iterations) for page, p in paths.items()}
+
+            for page in paths:
+                live_ms = statistics.median(live[page])
+                frozen_ms = statistics.median(frozen[page])
+                print(
+                    f"{year:<6} {page:<12} {live_ms:>9.1f} {frozen_ms:>10.1f} "
+                    f"{live_ms / frozen_ms:>7.1f}x"
+                )
+    finally:
+        with engine.begin() as conn:
+            for year in years:
+                if year not in already_frozen:
+                    thaw_season(conn, year)
+
+    print()
+    print(f"{'year':<6} {'build s':>8}")
+    for year, seconds in build_seconds.items():
+        print(f"{year:<6} {seconds:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
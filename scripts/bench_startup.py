@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Measure web-process startup cost: import + create_app() time and RSS.
+
+Each measurement runs in a fresh interpreter so import caches don't carry
+over. Two variants are reported:
+
+* ``current``  — the app as it boots today (pandas is not imported).
+* ``+pandas``  — pandas imported first, reproducing the old import path
+  where core/helpers/tournament_points.py imported it at module load.
+
+Usage:
+    python scripts/bench_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess  # nosec B404
+import sys
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside the child interpreter; prints one JSON line.
+_CHILD = """
+import json, sys, time
+started = time.perf_counter()
+if {preload_pandas}:
+    import pandas  # noqa: F401
+from app_setup import create_app
+create_app()
+elapsed = time.perf_counter() - started
+rss_kb = 0
+with open("/proc/self/status") as status:
+    for line in status:
+        if line.startswith("VmRSS:"):
+            rss_kb = int(line.split()[1])
+print(json.dumps({{"seconds": elapsed, "rss_kb": rss_kb, "pandas": "pandas" in sys.modules}}))
+"""
+
+
+def _run(preload_pandas: bool) -> Dict[str, float]:
+    env = {
+        **os.environ,
+        "DATABASE_URL": os.environ.get("DATABASE_URL", "sqlite:///bench_startup.db"),
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "x" * 32),
+        "LOG_LEVEL": "ERROR",
+    }
+    output = subprocess.run(  # nosec B603
+        [sys.executable, "-c", _CHILD.format(preload_pandas=preload_pandas)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/status"):
+        print("❌ RSS is read from /proc/self/status — run this on Linux.")
+        return 1
+
+    print(f"{'variant':<10} {'startup ms':>12} {'RSS MiB':>10} {'pandas loaded':>14}")
+    for label, preload in (("current", False), ("+pandas", True)):
+        runs: List[Dict[str, float]] = [_run(preload) for _ in range(args.runs)]
+        seconds = statistics.median(run["seconds"] for run in runs)
+        rss_mib = statistics.median(run["rss_kb"] for run in runs) / 1024
+        print(f"{label:<10} {seconds * 1000:>12.0f} {rss_mib:>10.1f} {str(runs[0]['pandas']):>14}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
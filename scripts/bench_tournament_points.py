@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the tournament points engines.
+
+Scores synthetic seasons of 1, 100 and 10,000 tournaments (~30 results each,
+with ties, guests, buy-ins and DQs) through calculate_points_by_tournament with
+the pandas reference engine and the list-based python engine, and prints the
+median wall time per run. No database is needed.
+
+Usage:
+    python scripts/bench_tournament_points.py [--repeat 5] [--field-size 30]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.helpers.tournament_points import calculate_points_by_tournament  # noqa: E402
+
+TOURNAMENT_COUNTS = (1, 100, 10_000)
+ENGINES = ("pandas", "python")
+
+
+def _season(tournaments: int, field_size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    rows = []
+    for tournament_id in range(1, tournaments + 1):
+        for angler_id in range(1, field_size + 1):
+            rows.append(
+                {
+                    "tournament_id": tournament_id,
+                    "angler_id": angler_id,
+                    "num_fish": rng.randint(0, 5),
+                    "total_weight": round(rng.choice([0.0, rng.uniform(2, 25)]), 2),
+                    "big_bass_weight": round(rng.uniform(0, 8), 2),
+                    "buy_in": rng.random() < 0.05,
+                    "disqualified": rng.random() < 0.02,
+                    "was_member": rng.random() < 0.85,
+                }
+            )
+    return rows
+
+
+def _median_seconds(rows: List[Dict[str, Any]], engine: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        calculate_points_by_tournament(rows, engine=engine)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--field-size", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'tournaments':>12} {'pandas ms':>12} {'python ms':>12} {'speedup':>8}")
+    for count in TOURNAMENT_COUNTS:
+        rows = _season(count, args.field_size)
+        # Fewer repeats for the large season so the pandas run stays bearable.
+        repeat = 1 if count >= 10_000 else args.repeat
+        pandas_s, python_s = (_median_seconds(rows, engine, repeat) for engine in ENGINES)
+        speedup = pandas_s / python_s if python_s else float("inf")
+        print(f"{count:>12} {pandas_s * 1000:>12.2f} {python_s * 1000:>12.2f} {speedup:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark request throughput with 1, 2 and 4 uvicorn workers.
+
+Starts the app under uvicorn once per --workers value, with the login
+lockout and rate-limit counters in a shared SQLite-file state store (see
+core/state_store.py), and drives --path from --clients load processes of
+--concurrency connections each for --seconds. Reports requests per second,
+median and p95 latency, and non-2xx responses per worker count.
+
+The default path, /login, renders a template without touching the database.
+Pages that read it need DATABASE_URL, which is passed through to the
+server; the scheduler and forecast prefetcher are switched off.
+
+Usage:
+    python scripts/bench_workers.py [--workers 1 2 4] [--path /login] [--seconds 10]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _drive(url: str, concurrency: int, seconds: float) -> Tuple[List[float], int]:
+    """Request ``url`` from ``concurrency`` connections for ``seconds``; latencies and failures."""
+
+    async def run() -> Tuple[List[float], int]:
+        latencies: List[float] = []
+        failures = 0
+        deadline = time.perf_counter() + seconds
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+
+            async def connection() -> None:
+                nonlocal failures
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    response = await client.get(url)
+                    latencies.append(time.perf_counter() - started)
+                    if not response.is_success:
+                        failures += 1
+
+            await asyncio.gather(*(connection() for _ in range(concurrency)))
+        return latencies, failures
+
+    return asyncio.run(run())
+
+
+def _wait_until_up(url: str, server: subprocess.Popen, timeout: float = 60) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and server.poll() is None:
+        try:
+            if httpx.get(url, timeout=2).status_code < 500:
+                return True
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def _bench(workers: int, args: argparse.Namespace, state_store: str) -> bool:
+    env = {
+        **os.environ,
+        "STATE_STORE": state_store,
+        "SABC_ALLOW_MULTIPLE_WORKERS": "1",
+        "SCHEDULER_ENABLED": "false",
+        "NWS_PREFETCH_ENABLED": "false",
+        "WEB_CONCURRENCY": str(workers),
+        "LOG_LEVEL": "ERROR",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(args.port),
+            "--workers",
+            str(workers),
+            "--no-access-log",
+            "--log-level",
+            "warning",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    url = f"http://127.0.0.1:{args.port}{args.path}"
+    try:
+        if not _wait_until_up(url, server):
+            print(f"❌ Server with {workers} worker(s) did not come up")
+            return False
+        _drive(url, args.concurrency, 1.0)  # warm every worker up
+        with multiprocessing.get_context("spawn").Pool(args.clients) as pool:
+            results = pool.starmap(_drive, [(url, args.concurrency, args.seconds)] * args.clients)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    latencies = sorted(latency for client_latencies, _ in results for latency in client_latencies)
+    failures = sum(client_failures for _, client_failures in results)
+    p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+    print(
+        f"{workers:>7} {len(latencies) / args.seconds:>9.0f} "
+        f"{statistics.median(latencies) * 1000 if latencies else 0.0:>8.1f} "
+        f"{p95 * 1000:>8.1f} {failures:>7}"
+    )
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--path", default="/login")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=4, help="Load-generating processes")
+    parser.add_argument("--concurrency", type=int, default=16, help="Connections per client")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_store = f"sqlite:///{os.path.join(tmp, 'state.db')}"
+        print(
+            f"GET {args.path} for {args.seconds:.0f}s from {args.clients}x{args.concurrency} "
+            f"connections; state store {state_store}"
+        )
+        print(f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'non-2xx':>7}")
+        for workers in args.workers:
+            if not _bench(workers, args, state_store):
+                return 1
+    print("✅ Done")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Fingerprint static assets by content hash and precompress them.
+
+Copies every file under static/ into static/dist/ as <name>.<hash>.<ext>,
+writes .gz and .br siblings of the compressible ones, and records the names
+in static/dist/manifest.json, which templates resolve through asset_url()
+(see core/assets.py). Needs no network or database; restart.sh runs it on
+every deploy. Unchanged files keep their hashed names, so browsers keep
+their cached copies.
+
+Files from earlier builds are kept, so pages rendered before a deploy can
+still load theirs; --prune removes those the new manifest doesn't list.
+
+Usage:
+    python scripts/build_static_assets.py [--static-dir static] [--prune]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.assets import STATIC_DIR, build_assets  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--static-dir", default=STATIC_DIR)
+    parser.add_argument(
+        "--prune", action="store_true", help="Remove files earlier builds left in dist/"
+    )
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.static_dir):
+        print(f"❌ No such directory: {args.static_dir}")
+        return 1
+
+    started = time.perf_counter()
+    counts = build_assets(args.static_dir, prune=args.prune)
+    print(
+        f"✅ {counts['assets']} assets fingerprinted, {counts['written']} files written, "
+        f"{counts['pruned']} pruned in {time.perf_counter() - started:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
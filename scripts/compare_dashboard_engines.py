@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Diff the /data dashboard's single-pass engine against the per-query SQL.
+
+Runs DataQueries.get_dashboard with both engines against the same database,
+prints each engine's wall time and every section that differs. Floats are
+compared to 6 decimal places; rows that match but come back in a different
+order (ties on the sort key, e.g. equal big bass weights) are reported as
+order-only differences.
+
+Run against a database populated by scripts/seed_staging_data.py (the
+per-query SQL is PostgreSQL-only):
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/compare_dashboard_engines.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.db_schema import engine  # noqa: E402
+from core.query_service import QueryService  # noqa: E402
+from core.query_service.dashboard_facts import DASHBOARD_SECTIONS  # noqa: E402
+
+ENGINES = ("per_query", "single_pass")
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    return value
+
+
+def _run(name: str) -> Tuple[Dict[str, Any], float]:
+    with engine.connect() as conn:
+        started = time.perf_counter()
+        dashboard = QueryService(conn).get_dashboard(engine=name)
+        return dashboard, time.perf_counter() - started
+
+
+def _sorted_rows(rows: List[Any]) -> List[str]:
+    return sorted(json.dumps(row, sort_keys=True, default=str) for row in rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    runs = {name: _run(name) for name in ENGINES}
+    for name, (_, seconds) in runs.items():
+        print(f"{name:<12} {seconds * 1000:>8.1f} ms")
+
+    expected, actual = (_normalize(runs[name][0]) for name in ENGINES)
+    differing = 0
+    for section in DASHBOARD_SECTIONS:
+        if expected[section] == actual[section]:
+            continue
+        same_rows = isinstance(expected[section], list) and (
+            _sorted_rows(expected[section]) == _sorted_rows(actual[section])
+        )
+        if same_rows:
+            print(f"~ {section}: same rows, order differs among ties")
+            continue
+        differing += 1
+        print(f"❌ {section}")
+        print(f"   per_query:   {json.dumps(expected[section], default=str)}")
+        print(f"   single_pass: {json.dumps(actual[section], default=str)}")
+
+    if differing:
+        print(f"❌ {differing} section(s) differ")
+        return 1
+    print("✅ All sections match")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
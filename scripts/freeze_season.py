@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Freeze completed seasons into snapshots, or thaw them back to live queries.
+
+A frozen season's /awards/{year} page, tournament results pages and /data
+rows are served from the ``season_snapshots`` table instead of being
+recomputed from raw results. See core/services/season_snapshots.py.
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/freeze_season.py status
+    DATABASE_URL='postgresql://...' python scripts/freeze_season.py freeze 2024 [2025 ...]
+    DATABASE_URL='postgresql://...' python scripts/freeze_season.py freeze --all-completed
+    DATABASE_URL='postgresql://...' python scripts/freeze_season.py thaw 2024 [...]
+
+Commands:
+    status: List frozen seasons
+    freeze: Build (or rebuild) the snapshot for each year
+    thaw: Drop each year's snapshot
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+
+from core.db_schema import engine  # noqa: E402
+from core.helpers.timezone import now_local  # noqa: E402
+from core.services.season_snapshots import freeze_season, list_seasons, thaw_season  # noqa: E402
+
+
+def _completed_years(today_year: int) -> list:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT DISTINCT e.year FROM tournaments t JOIN events e ON t.event_id = e.id "
+                "WHERE e.year < :year ORDER BY e.year"
+            ),
+            {"year": today_year},
+        )
+        return [row.year for row in rows]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("command", choices=["status", "freeze", "thaw"])
+    parser.add_argument("years", type=int, nargs="*")
+    parser.add_argument(
+        "--all-completed", action="store_true", help="Freeze every season before this year"
+    )
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    today = now_local().date()
+    years = args.years
+    if args.command == "freeze" and args.all_completed:
+        years = _completed_years(today.year)
+    if args.command != "status" and not years:
+        print("❌ Give at least one year (or --all-completed).")
+        return 1
+
+    for year in years:
+        started = time.perf_counter()
+        try:
+            with engine.begin() as conn:
+                if args.command == "freeze":
+                    parts = freeze_season(conn, year, today)
+                else:
+                    parts = thaw_season(conn, year)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        elapsed = time.perf_counter() - started
+        verb = "froze" if args.command == "freeze" else "thawed"
+        print(f"✅ {verb} {year}: {parts} parts in {elapsed:.2f}s")
+
+    with engine.connect() as conn:
+        seasons = list_seasons(conn)
+    print(f"{'year':<6} {'format':>6} {'parts':>6}  built at")
+    for season in seasons:
+        print(
+            f"{season['year']:<6} {season['format_version']:>6} {season['parts']:>6}  "
+            f"{season['built_at']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
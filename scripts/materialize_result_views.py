@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Switch the tournament result views between live and materialized backends.
+
+With the live backend (the default after ``alembic upgrade head``) every read
+of v_angler_tournament_results / v_team_tournament_results re-derives the
+results/team_results dedup. ``enable`` swaps both views for summary tables of
+the same name that the admin result routes refresh per tournament. See
+core/db_schema/materialized_views.py.
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/materialize_result_views.py status
+    DATABASE_URL='postgresql://...' python scripts/materialize_result_views.py enable
+    DATABASE_URL='postgresql://...' python scripts/materialize_result_views.py refresh [--tournament-id N ...]
+    DATABASE_URL='postgresql://...' python scripts/materialize_result_views.py disable
+
+Commands:
+    status: Print which backend is active
+    enable: Replace the views with fully populated summary tables
+    refresh: Rebuild summary rows (all tournaments, or only those given)
+    disable: Drop the summary tables and restore the live views
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.db_schema import engine  # noqa: E402
+from core.db_schema.materialized_views import (  # noqa: E402
+    dematerialize_result_views,
+    materialize_result_views,
+    refresh_result_views,
+    result_views_materialized,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("command", choices=["status", "enable", "refresh", "disable"])
+    parser.add_argument(
+        "--tournament-id",
+        type=int,
+        action="append",
+        dest="tournament_ids",
+        help="Limit refresh to this tournament (repeatable)",
+    )
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    with engine.begin() as conn:
+        if args.command == "enable":
+            materialize_result_views(conn)
+        elif args.command == "disable":
+            dematerialize_result_views(conn)
+        elif args.command == "refresh":
+            if not result_views_materialized(conn):
+                print("❌ Result views are live; run 'enable' first.")
+                return 1
+            refresh_result_views(conn, args.tournament_ids)
+        backend = "materialized" if result_views_materialized(conn) else "live"
+
+    print(f"Result views backend: {backend}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
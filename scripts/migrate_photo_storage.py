@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Move photos uploaded under flat uuid names into the content-addressed layout.
+
+New uploads are stored as uploads/photos/ab/cd/<sha256>.<ext>, with their
+thumbnail, placeholder and variants sharded the same way (see
+routes/photos/storage.py). This moves every older photo's files there and
+updates its row; copies of the same image collapse into one set of files.
+
+Safe to re-run, and safe while the app is serving: each photo is committed
+as soon as its files have moved, and photos already in the new layout are
+skipped. Run from the app directory, so uploads/photos resolves.
+
+Usage:
+    DATABASE_URL='postgresql://...' python scripts/migrate_photo_storage.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routes.photos.storage import migrate_storage  # noqa: E402
+
+
+def main() -> int:
+    argparse.ArgumentParser(description=__doc__.split("\n")[0]).parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("❌ DATABASE_URL is not set — refusing to run.")
+        return 1
+
+    started = time.perf_counter()
+    counts = migrate_storage()
+    print(
+        f"✅ {counts['moved']} photos moved, {counts['skipped']} already in place, "
+        f"{counts['failed']} failed in {time.perf_counter() - started:.1f}s"
+    )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
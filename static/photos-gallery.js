@@ -1,7 +1,9 @@
 /**
  * Photo gallery page JavaScript.
  *
- * Opens the lightbox modal when a photo thumbnail is clicked. Delete
+ * Opens the lightbox modal when a photo thumbnail is clicked, loading the
+ * responsive variant that fits the modal (data-srcset) rather than the
+ * original upload when the photo has variants. Delete
  * confirmation is handled by the generic data-confirm helper in utils.js.
  * Uses event delegation so HTMX-inserted photo cards are covered too.
  */
@@ -20,6 +22,8 @@
             const link = e.target.closest('.gallery-link');
             if (link) {
                 e.preventDefault();
+                // srcset before src, so the original is never requested first.
+                lightboxImage.srcset = link.dataset.srcset || '';
                 lightboxImage.src = link.href;
                 lightboxCaption.textContent = link.dataset.caption || '';
                 modal.show();
@@ -22,8 +22,9 @@ os.environ["LOG_LEVEL"] = "ERROR"
 os.environ["BCRYPT_ROUNDS"] = "4"
 
 # ruff: noqa: E402 - Must set env vars before imports
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, Iterator, List, Optional
 
 import bcrypt
 import pytest
@@ -44,6 +45,7 @@ from core.db_schema import (
     Ramp,
     Tournament,
 )
+from tests.fake_nws import FakeNWS
 
 # Create test engine with in-memory SQLite
 test_engine = create_engine(
@@ -511,9 +513,41 @@ def admin_client(client: TestClient, admin_user: Angler, test_password: str) ->
     return client
 
 
+@pytest.fixture
+def fake_nws() -> Generator[FakeNWS, None, None]:
+    """A local api.weather.gov stand-in (tests/fake_nws.py), reset per test."""
+    server = FakeNWS().start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
 # Helper functions for tests
 
 
+@contextmanager
+def count_statements(contains: str = "") -> Iterator[List[str]]:
+    """Collect the SQL statements the app's engine executes inside the block.
+
+    Only statements containing ``contains`` are kept, so
+    ``len(statements)`` is the queries-per-request figure for that pattern.
+    """
+    from core.db_schema import engine as app_engine
+
+    statements: List[str] = []
+
+    def _record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if contains in statement:
+            statements.append(statement)
+
+    event.listen(app_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(app_engine, "before_cursor_execute", _record)
+
+
 def login_user(client: TestClient, email: str, password: str) -> bool:
     """Helper to log in a user and return success status."""
     # Get CSRF token first
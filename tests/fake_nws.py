@@ -0,0 +1,92 @@
+"""A local stand-in for api.weather.gov, served over real HTTP on 127.0.0.1.
+
+Used through the ``fake_nws`` fixture in tests/conftest.py. Tests set
+``periods`` to what the forecast endpoint returns (``forecasts`` overrides
+it per (latitude, longitude)), ``status`` to make every request fail, and
+``delay`` to make responses slow. ``max_in_flight`` records the most
+requests that were being served at once.
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+_POINTS = re.compile(r"^/points/(-?[\d.]+),(-?[\d.]+)$")
+_FORECAST = re.compile(r"^/gridpoints/EWX/(-?[\d.]+),(-?[\d.]+)/forecast$")
+
+
+class FakeNWS:
+    def __init__(self) -> None:
+        self.periods: List[Dict[str, Any]] = []
+        self.forecasts: Dict[Tuple[float, float], List[Dict[str, Any]]] = {}
+        self.status = 200
+        self.delay = 0.0
+        self.requests: List[str] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+
+    def start(self) -> "FakeNWS":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _respond(self, path: str) -> tuple:
+        with self._lock:
+            self.requests.append(path)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            return self._route(path)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _route(self, path: str) -> tuple:
+        if self.status != 200:
+            return self.status, {"title": "Unexpected Problem"}
+        points = _POINTS.match(path)
+        if points:
+            lat, lon = points.groups()
+            forecast = f"{self.base_url}/gridpoints/EWX/{lat},{lon}/forecast"
+            return 200, {"properties": {"forecast": forecast}}
+        forecast_match = _FORECAST.match(path)
+        if forecast_match:
+            lat, lon = (float(value) for value in forecast_match.groups())
+            return 200, {"properties": {"periods": self.forecasts.get((lat, lon), self.periods)}}
+        return 404, {"title": "Not Found"}
+
+    def _handler(self) -> type:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                status, body = fake._respond(self.path)
+                payload = json.dumps(body).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/geo+json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # The client timed out and hung up.
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
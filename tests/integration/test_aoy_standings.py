@@ -0,0 +1,206 @@
+"""Tests for the precomputed Angler-of-the-Year store.
+
+aoy_tournament_points holds calculate_tournament_points output per tournament
+and aoy_standings the per-year totals; result writes rebuild only the touched
+tournament. See core/services/aoy_standings.py.
+"""
+
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.db_schema import Angler, Result, Tournament
+from core.services.aoy_standings import (
+    build_missing_years,
+    ensure_year_built,
+    get_aoy_positions,
+    get_aoy_standings,
+)
+from core.services.result_changes import results_changed
+from tests.conftest import delete_with_csrf, post_with_csrf
+
+
+@pytest.fixture
+def guest(db_session: Session) -> Angler:
+    angler = Angler(name="Guest Angler", email="guest@example.com", member=False)
+    db_session.add(angler)
+    db_session.commit()
+    return angler
+
+
+@pytest.fixture
+def seeded_results(
+    db_session: Session,
+    test_tournament: Tournament,
+    member_user: Angler,
+    admin_user: Angler,
+    guest: Angler,
+) -> None:
+    db_session.add_all(
+        [
+            Result(
+                tournament_id=test_tournament.id,
+                angler_id=member_user.id,
+                num_fish=5,
+                total_weight=Decimal("12.50"),
+                big_bass_weight=Decimal("4.25"),
+            ),
+            Result(
+                tournament_id=test_tournament.id,
+                angler_id=guest.id,
+                num_fish=5,
+                total_weight=Decimal("10.00"),
+                big_bass_weight=Decimal("3.00"),
+                was_member=False,
+            ),
+            Result(
+                tournament_id=test_tournament.id,
+                angler_id=admin_user.id,
+                num_fish=3,
+                total_weight=Decimal("6.00"),
+                big_bass_weight=Decimal("2.50"),
+            ),
+        ]
+    )
+    db_session.commit()
+
+
+def _points(db_session: Session, tournament_id: int) -> dict:
+    return {
+        row.angler_id: row.points
+        for row in db_session.execute(
+            text("SELECT angler_id, points FROM aoy_tournament_points WHERE tournament_id = :tid"),
+            {"tid": tournament_id},
+        )
+    }
+
+
+class TestAoyStore:
+    def test_first_read_builds_year(
+        self,
+        db_session: Session,
+        seeded_results: None,
+        test_tournament: Tournament,
+        member_user: Angler,
+        admin_user: Angler,
+        guest: Angler,
+    ):
+        conn = db_session.connection()
+        assert ensure_year_built(conn, 2025) is True
+        assert ensure_year_built(conn, 2025) is False
+
+        # Member 100, guest 0 (placed but no points), next member 99.
+        assert _points(db_session, test_tournament.id) == {
+            member_user.id: 100,
+            guest.id: 0,
+            admin_user.id: 99,
+        }
+        standings = get_aoy_standings(conn, 2025)
+        assert [s["angler_id"] for s in standings] == [member_user.id, admin_user.id]
+        assert standings[0]["total_points"] == 100
+        assert standings[0]["total_weight"] == 12.5
+        assert standings[0]["tournaments_fished"] == 1
+        assert get_aoy_positions(conn, 2025, [admin_user.id]) == {admin_user.id: 2}
+
+    def test_build_missing_years_builds_each_unbuilt_year_once(
+        self, db_session: Session, seeded_results: None
+    ):
+        conn = db_session.connection()
+        assert build_missing_years(conn) == [2025]
+        assert build_missing_years(conn) == []
+        assert len(get_aoy_standings(conn, 2025)) == 2
+
+    def test_empty_year_stays_unbuilt(self, db_session: Session):
+        assert ensure_year_built(db_session.connection(), 2025) is False
+        assert get_aoy_standings(db_session.connection(), 2025) == []
+
+    def test_results_changed_rebuilds_tournament(
+        self,
+        db_session: Session,
+        seeded_results: None,
+        test_tournament: Tournament,
+        member_user: Angler,
+        admin_user: Angler,
+    ):
+        conn = db_session.connection()
+        ensure_year_built(conn, 2025)
+        db_session.execute(
+            text("UPDATE results SET total_weight = 20.0 WHERE angler_id = :aid"),
+            {"aid": admin_user.id},
+        )
+        results_changed(db_session.connection(), [test_tournament.id])
+        db_session.commit()
+
+        standings = get_aoy_standings(db_session.connection(), 2025)
+        assert standings[0]["angler_id"] == admin_user.id
+        assert standings[0]["total_points"] == 100
+        assert standings[1]["angler_id"] == member_user.id
+
+    def test_non_members_filtered_at_read(
+        self, db_session: Session, seeded_results: None, admin_user: Angler
+    ):
+        ensure_year_built(db_session.connection(), 2025)
+        admin_user.member = False
+        db_session.commit()
+        ids = [s["angler_id"] for s in get_aoy_standings(db_session.connection(), 2025)]
+        assert admin_user.id not in ids
+
+
+class TestAoyRoutes:
+    def test_awards_page_lists_standings(
+        self, client: TestClient, db_session: Session, seeded_results: None, member_user: Angler
+    ):
+        build_missing_years(db_session.connection())
+        db_session.commit()
+        response = client.get("/awards/2025")
+        assert response.status_code == 200
+        assert member_user.name in response.text
+
+    def test_delete_result_updates_standings(
+        self,
+        admin_client: TestClient,
+        db_session: Session,
+        seeded_results: None,
+        test_tournament: Tournament,
+        member_user: Angler,
+    ):
+        ensure_year_built(db_session.connection(), 2025)
+        result_id = db_session.execute(
+            text("SELECT id FROM results WHERE angler_id = :aid"), {"aid": member_user.id}
+        ).scalar()
+        db_session.commit()
+
+        response = delete_with_csrf(
+            admin_client, f"/admin/tournaments/{test_tournament.id}/results/{result_id}"
+        )
+        assert response.status_code == 200
+
+        ids = [s["angler_id"] for s in get_aoy_standings(db_session.connection(), 2025)]
+        assert member_user.id not in ids
+
+    def test_save_result_updates_standings(
+        self,
+        admin_client: TestClient,
+        db_session: Session,
+        test_tournament: Tournament,
+        member_user: Angler,
+    ):
+        response = post_with_csrf(
+            admin_client,
+            f"/admin/tournaments/{test_tournament.id}/results",
+            data={
+                "angler_id": str(member_user.id),
+                "num_fish": "4",
+                "total_weight": "11.25",
+                "big_bass_weight": "3.50",
+                "was_member": "true",
+            },
+            follow_redirects=False,
+        )
+        assert response.status_code in [200, 302, 303]
+
+        standings = get_aoy_standings(db_session.connection(), 2025)
+        assert [(s["angler_id"], s["total_points"]) for s in standings] == [(member_user.id, 100)]
@@ -0,0 +1,226 @@
+"""Tests for the stored big bass carryover ledger (core/services/big_bass_ledger.py)."""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, List
+
+import pytest
+from sqlalchemy import Connection, text
+from sqlalchemy.orm import Session
+
+from core.db_schema import (
+    Angler,
+    BigBassLedgerEntry,
+    Event,
+    Result,
+    TeamResult,
+    Tournament,
+    engine,
+)
+from core.query_service import QueryService
+from core.services.big_bass_ledger import (
+    BIG_BASS_MINIMUM_WEIGHT,
+    PAYOUT_BIG_BASS_PER_ANGLER_2025,
+    PAYOUT_BIG_BASS_PER_BOAT,
+    TEAM_FORMAT_START_YEAR,
+    build_missing_ledger,
+    get_carryover,
+)
+from core.services.result_changes import results_changed
+from routes.tournaments.data import load_tournament_page
+from tests.conftest import count_statements
+
+
+def _scan_carryover(conn: Connection, event_date: Any) -> Decimal:
+    """The pre-ledger scanner: walk every earlier tournament newest-first."""
+    previous = conn.execute(
+        text(
+            """SELECT t.id, e.date, e.year,
+                      (SELECT COUNT(DISTINCT vatr.angler_id)
+                       FROM v_angler_tournament_results vatr
+                       WHERE vatr.tournament_id = t.id) as angler_count,
+                      (SELECT COUNT(*)
+                       FROM v_team_tournament_results vttr
+                       WHERE vttr.tournament_id = t.id) as boat_count,
+                      COALESCE(
+                          (SELECT MAX(CASE WHEN vatr.was_member = TRUE
+                                                AND vatr.big_bass_weight > :min_weight
+                                                AND vatr.disqualified = FALSE THEN 1 ELSE 0 END)
+                           FROM v_angler_tournament_results vatr
+                           WHERE vatr.tournament_id = t.id),
+                          0
+                      ) as member_won_big_bass
+               FROM tournaments t
+               JOIN events e ON t.event_id = e.id
+               WHERE e.date < :event_date
+                 AND (
+                     EXISTS (SELECT 1 FROM v_angler_tournament_results vatr
+                             WHERE vatr.tournament_id = t.id)
+                     OR EXISTS (SELECT 1 FROM v_team_tournament_results vttr
+                                WHERE vttr.tournament_id = t.id)
+                 )
+               ORDER BY e.date DESC"""
+        ),
+        {"event_date": event_date, "min_weight": float(BIG_BASS_MINIMUM_WEIGHT)},
+    )
+    carryover = Decimal("0.00")
+    for t in previous:
+        if t.member_won_big_bass == 1:
+            break
+        if t.year >= TEAM_FORMAT_START_YEAR:
+            entries = t.boat_count if t.boat_count > 0 else t.angler_count
+            carryover += PAYOUT_BIG_BASS_PER_BOAT * Decimal(entries)
+        else:
+            entries = t.angler_count if t.angler_count > 0 else t.boat_count
+            carryover += PAYOUT_BIG_BASS_PER_ANGLER_2025 * Decimal(entries)
+    return carryover
+
+
+def _tournament(db_session: Session, day: date) -> Tournament:
+    event = Event(date=day, year=day.year, name=f"Event {day}", event_type="sabc_tournament")
+    db_session.add(event)
+    db_session.flush()
+    tournament = Tournament(
+        event_id=event.id,
+        name=event.name,
+        fish_limit=5,
+        aoy_points=day.year < TEAM_FORMAT_START_YEAR,
+        complete=True,
+    )
+    db_session.add(tournament)
+    db_session.flush()
+    return tournament
+
+
+@pytest.fixture
+def history(db_session: Session) -> List[Tournament]:
+    """Three seasons either side of the 2026 format change, with random big bass."""
+    rng = random.Random(1234)
+    anglers = [
+        Angler(name=f"Angler {i}", email=f"angler{i}@example.com", member=i % 4 != 0)
+        for i in range(10)
+    ]
+    db_session.add_all(anglers)
+    db_session.flush()
+    tournaments = []
+    for n in range(18):
+        tournament = _tournament(db_session, date(2024, 3, 1) + timedelta(days=61 * n))
+        tournaments.append(tournament)
+        fishing = rng.sample(anglers, rng.randint(2, 8))
+        if tournament.aoy_points:
+            for angler in fishing:
+                db_session.add(
+                    Result(
+                        tournament_id=tournament.id,
+                        angler_id=angler.id,
+                        num_fish=rng.randint(0, 5),
+                        total_weight=Decimal(rng.randint(0, 200)) / 10,
+                        big_bass_weight=Decimal(rng.randint(0, 62)) / 10,
+                        was_member=angler.member,
+                        disqualified=rng.random() < 0.1,
+                    )
+                )
+        else:
+            for angler1, angler2 in zip(fishing[::2], fishing[1::2]):
+                db_session.add(
+                    TeamResult(
+                        tournament_id=tournament.id,
+                        angler1_id=angler1.id,
+                        angler2_id=angler2.id,
+                        num_fish=rng.randint(0, 5),
+                        total_weight=Decimal(rng.randint(0, 200)) / 10,
+                        big_bass_weight=Decimal(rng.randint(0, 62)) / 10,
+                    )
+                )
+    db_session.commit()
+    with engine.begin() as conn:
+        build_missing_ledger(conn)
+    return tournaments
+
+
+def _event(db_session: Session, tournament: Tournament) -> Event:
+    return db_session.get(Event, tournament.event_id)
+
+
+def _assert_matches_scanner(db_session: Session) -> None:
+    dates = sorted(day for (day,) in db_session.query(Event.date))
+    with engine.connect() as conn:
+        for day in dates + [dates[-1] + timedelta(days=30)]:
+            assert get_carryover(conn, day) == _scan_carryover(conn, day), day
+
+
+def _ledger(db_session: Session) -> List[BigBassLedgerEntry]:
+    db_session.expire_all()
+    return db_session.query(BigBassLedgerEntry).order_by(BigBassLedgerEntry.event_date).all()
+
+
+class TestEquivalence:
+    def test_matches_scanner_for_every_tournament(self, db_session: Session, history):
+        _assert_matches_scanner(db_session)
+
+    def test_history_exercises_both_outcomes(self, db_session: Session, history):
+        rows = _ledger(db_session)
+        assert len(rows) == len(history)
+        assert any(r.member_won for r in rows) and any(not r.member_won for r in rows)
+        assert any(r.carryover > 0 for r in rows)
+
+    def test_matches_after_a_result_changes(self, db_session: Session, history):
+        target = next(
+            r.tournament_id
+            for r in _ledger(db_session)
+            if not r.member_won and r.event_date.year < TEAM_FORMAT_START_YEAR
+        )
+        winner = db_session.query(Result).filter(Result.tournament_id == target).first()
+        winner.big_bass_weight, winner.was_member, winner.disqualified = Decimal(9), True, False
+        db_session.commit()
+        with engine.begin() as conn:
+            results_changed(conn, [target])
+        assert db_session.get(BigBassLedgerEntry, target).member_won
+        _assert_matches_scanner(db_session)
+
+    def test_matches_after_an_event_moves(self, db_session: Session, history):
+        moved = history[2]
+        _event(db_session, moved).date = _event(db_session, history[-1]).date + timedelta(days=10)
+        db_session.commit()
+        with engine.begin() as conn:
+            results_changed(conn, [moved.id])
+        _assert_matches_scanner(db_session)
+
+
+class TestLedger:
+    def test_rates_follow_the_format_change(self, db_session: Session, history):
+        for row in _ledger(db_session):
+            if row.event_date.year >= TEAM_FORMAT_START_YEAR:
+                assert Decimal(str(row.pot_contribution)) == PAYOUT_BIG_BASS_PER_BOAT * row.entries
+            else:
+                expected = PAYOUT_BIG_BASS_PER_ANGLER_2025 * row.entries
+                assert Decimal(str(row.pot_contribution)) == expected
+
+    def test_recompute_leaves_earlier_rows_alone(self, db_session: Session, history):
+        target = history[10]
+        db_session.query(Result).filter(Result.tournament_id == target.id).delete()
+        db_session.commit()
+        with count_statements("big_bass_ledger") as statements:
+            with engine.begin() as conn:
+                results_changed(conn, [target.id])
+        delete = next(s for s in statements if s.lstrip().startswith("DELETE"))
+        assert "event_date >=" in delete
+        assert target.id not in {r.tournament_id for r in _ledger(db_session)}
+        _assert_matches_scanner(db_session)
+
+    def test_build_missing_is_a_no_op_when_complete(self, history):
+        with engine.begin() as conn:
+            assert build_missing_ledger(conn) == 0
+
+    def test_results_page_reads_one_row(self, db_session: Session, history):
+        with engine.connect() as conn:
+            qs = QueryService(conn)
+            with count_statements() as statements:
+                page = load_tournament_page(qs, history[-1].id, date.today())
+            expected = _scan_carryover(conn, _event(db_session, history[-1]).date)
+        assert page.payouts["big_bass_carryover"] == expected
+        assert len(statements) == 2
+        assert not any(
+            "v_angler_tournament_results vatr" in s and "e.date <" in s for s in statements
+        )
@@ -0,0 +1,129 @@
+"""Tests for the per-request and short-TTL caches behind get_current_user.
+
+Queries-per-request are counted with ``count_statements``: the anglers
+lookup runs at most once per request, and not at all while the TTL cache
+holds the user. Revocation (session_version bumps, deletes) must still
+take effect immediately with the cache enabled.
+"""
+
+from typing import Any, Dict, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from core.db_schema import Angler, engine
+from core.helpers import user_cache
+from core.helpers.auth import get_current_user
+from core.query_service import QueryService
+from tests.conftest import count_statements, login_user, post_with_csrf
+
+ANGLER_LOOKUP = "FROM anglers WHERE id"
+
+
+def _request(session: Dict[str, Any]) -> Request:
+    return Request({"type": "http", "session": session, "headers": []})
+
+
+@pytest.fixture(autouse=True)
+def empty_user_cache() -> Iterator[None]:
+    user_cache.invalidate_cached_user()
+    yield
+    user_cache.invalidate_cached_user()
+
+
+@pytest.fixture
+def user_cache_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(user_cache, "USER_CACHE_TTL", 60.0)
+
+
+class TestPerRequestMemo:
+    def test_one_lookup_per_request(self, member_user: Angler):
+        request = _request({"user_id": member_user.id, "session_version": 1})
+        with count_statements(ANGLER_LOOKUP) as statements:
+            first = get_current_user(request)
+            second = get_current_user(request)
+        assert first is not None and first is second
+        assert len(statements) == 1
+
+    def test_new_identity_is_resolved_again(self, member_user: Angler, admin_user: Angler):
+        session: Dict[str, Any] = {"user_id": member_user.id, "session_version": 1}
+        request = _request(session)
+        assert get_current_user(request)["id"] == member_user.id  # type: ignore[index]
+        session["user_id"] = admin_user.id
+        assert get_current_user(request)["id"] == admin_user.id  # type: ignore[index]
+
+    def test_page_runs_one_lookup_without_cache(self, member_client: TestClient):
+        with count_statements(ANGLER_LOOKUP) as statements:
+            assert member_client.get("/profile").status_code == 200
+        assert len(statements) == 1
+
+
+@pytest.mark.usefixtures("user_cache_enabled")
+class TestUserCache:
+    def test_cached_user_skips_lookup(self, member_client: TestClient):
+        member_client.get("/profile")
+        with count_statements(ANGLER_LOOKUP) as statements:
+            assert member_client.get("/profile").status_code == 200
+        assert statements == []
+
+    def test_entry_expires(self, member_client: TestClient, monkeypatch: pytest.MonkeyPatch):
+        member_client.get("/profile")
+        monkeypatch.setattr(user_cache, "USER_CACHE_TTL", 1e-9)
+        with count_statements(ANGLER_LOOKUP) as statements:
+            member_client.get("/profile")
+        assert len(statements) == 1
+
+    def test_out_of_band_version_bump_revokes(
+        self, member_client: TestClient, member_user: Angler, db_session: Session
+    ):
+        assert member_client.get("/profile").status_code == 200
+        angler = db_session.get(Angler, member_user.id)
+        assert angler is not None
+        angler.session_version += 1
+        db_session.commit()
+
+        response = member_client.get("/profile", follow_redirects=False)
+        assert response.status_code in (302, 303, 307)
+        assert "/login" in response.headers["location"]
+
+    def test_password_change_logs_out_cached_session(
+        self, client: TestClient, member_user: Angler, test_password: str
+    ):
+        assert member_user.email is not None
+        other = TestClient(client.app)
+        assert login_user(client, member_user.email, test_password)
+        assert login_user(other, member_user.email, test_password)
+        assert other.get("/profile").status_code == 200
+
+        new_password = "BrandNewPassword9!@#$"
+        post_with_csrf(
+            client,
+            "/profile/update",
+            data={
+                "email": member_user.email,
+                "phone": member_user.phone or "",
+                "year_joined": member_user.year_joined or 2023,
+                "current_password": test_password,
+                "new_password": new_password,
+                "confirm_password": new_password,
+            },
+            follow_redirects=False,
+        )
+
+        assert other.get("/profile", follow_redirects=False).status_code in (302, 303, 307)
+        assert client.get("/profile").status_code == 200
+
+    def test_raw_sql_update_invalidates(self, member_client: TestClient, member_user: Angler):
+        member_client.get("/profile")
+        assert member_user.id in user_cache._entries
+        with engine.connect() as conn:
+            QueryService(conn).update_user(member_user.id, {"phone": "555-0100"})
+            conn.commit()
+        assert member_user.id not in user_cache._entries
+
+    def test_zero_ttl_disables_cache(self, member_client: TestClient, monkeypatch):
+        monkeypatch.setattr(user_cache, "USER_CACHE_TTL", 0.0)
+        member_client.get("/profile")
+        assert user_cache._entries == {}
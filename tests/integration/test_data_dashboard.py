@@ -0,0 +1,76 @@
+"""Integration tests for the /data dashboard's single-pass engine.
+
+The per-query engine's SQL is PostgreSQL-only; the single-pass engine reads
+with portable SQL, so it is exercised end-to-end against SQLite here.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from core.db_schema import Angler, Event, Result, TeamResult, Tournament
+from core.query_service import QueryService
+
+
+@pytest.fixture
+def completed_results(
+    db_session: Session,
+    test_tournament: Tournament,
+    test_team_format_tournament: Tournament,
+    member_user: Angler,
+    regular_user: Angler,
+) -> None:
+    db_session.add_all(
+        [
+            Result(
+                tournament_id=test_tournament.id,
+                angler_id=member_user.id,
+                num_fish=5,
+                total_weight=Decimal("12.50"),
+                big_bass_weight=Decimal("4.25"),
+            ),
+            Result(
+                tournament_id=test_tournament.id,
+                angler_id=regular_user.id,
+                num_fish=0,
+                total_weight=Decimal("0"),
+                was_member=False,
+            ),
+            TeamResult(
+                tournament_id=test_team_format_tournament.id,
+                angler1_id=member_user.id,
+                angler2_id=regular_user.id,
+                num_fish=4,
+                total_weight=Decimal("9.00"),
+                big_bass_weight=Decimal("3.10"),
+                place_finish=1,
+            ),
+        ]
+    )
+    test_tournament.complete = True
+    test_team_format_tournament.complete = True
+    db_session.commit()
+
+
+class TestSinglePassDashboard:
+    def test_sections_from_sqlite(
+        self, db_session: Session, completed_results, test_team_format_tournament
+    ):
+        dashboard = QueryService(db_session.connection()).get_dashboard(engine="single_pass")
+
+        team_year = db_session.get(Event, test_team_format_tournament.event_id).year
+        assert dashboard["available_years"] == sorted({2025, team_year}, reverse=True)
+        assert dashboard["overview_stats"]["total_tournaments"] == 2
+        assert dashboard["overview_stats"]["total_fish"] == 9
+        assert dashboard["overview_stats"]["total_weight"] == pytest.approx(21.5)
+        assert dashboard["lake_statistics"][0]["last_fished"] >= date(2025, 11, 15)
+        assert [r["big_bass_weight"] for r in dashboard["big_bass_records"]] == [4.25, 3.1]
+        assert [p["participants"] for p in dashboard["tournament_participation"]] == [2, 2]
+
+    def test_page_renders(self, client: TestClient, completed_results):
+        response = client.get("/data")
+        assert response.status_code == 200
+        assert "Test Lake" in response.text
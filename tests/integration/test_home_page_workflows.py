@@ -4,12 +4,15 @@ Tests the main landing page functionality including content display,
 navigation, and user-specific features.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from core.db_schema import Angler, Event, News, Result, Tournament
+from routes.pages import home
 
 
 class TestHomePageAccess:
@@ -425,3 +428,28 @@ class TestHealthCheck:
         response = client.get("/health")
 
         assert response.status_code == 200
+
+
+class TestHomePageEventLoop:
+    """The homepage's database work must not run on the event loop."""
+
+    def test_health_is_served_while_homepage_loads(self, client: TestClient, monkeypatch):
+        """A slow homepage load leaves the loop free for other requests."""
+        entered = threading.Event()
+        release = threading.Event()
+        load_sidebar = home._load_homepage_sidebar
+
+        def slow_sidebar():
+            entered.set()
+            release.wait(timeout=10)
+            return load_sidebar()
+
+        monkeypatch.setattr(home, "_load_homepage_sidebar", slow_sidebar)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            homepage = pool.submit(client.get, "/")
+            assert entered.wait(timeout=5)
+
+            assert client.get("/health").status_code == 200
+            assert not homepage.done()
+            release.set()
+            assert homepage.result(timeout=10).status_code == 200
@@ -0,0 +1,112 @@
+"""Lake-specific sunrise and forecast on homepage cards and the lake admin page."""
+
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from core.db_schema import Event, Lake, Ramp, Tournament
+from core.helpers import poll_day_info
+from core.helpers.poll_day_info import AUSTIN, AUSTIN_TZ, store_forecast
+from tests.conftest import post_with_csrf
+
+TRAVIS = (30.3916, -97.9079)
+
+
+def _forecast(day: date, short_forecast: str):
+    return [
+        {
+            "startTime": datetime.combine(day, time(6), AUSTIN_TZ).isoformat(),
+            "isDaytime": True,
+            "temperature": 80,
+            "temperatureUnit": "F",
+            "shortForecast": short_forecast,
+        }
+    ]
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    poll_day_info._reset_caches_for_test()
+    yield
+    poll_day_info._reset_caches_for_test()
+
+
+def _next_tournament(db_session: Session, latitude=None, longitude=None) -> date:
+    """The homepage's next-tournament card, on a lake with the given coordinates."""
+    day = date.today() + timedelta(days=3)
+    lake = Lake(yaml_key="travis", display_name="Travis", latitude=latitude, longitude=longitude)
+    event = Event(date=day, year=day.year, name="Travis Event")
+    db_session.add_all([lake, event])
+    db_session.flush()
+    ramp = Ramp(lake_id=lake.id, name="Mansfield Dam")
+    db_session.add(ramp)
+    db_session.flush()
+    db_session.add(
+        Tournament(
+            event_id=event.id,
+            name=event.name,
+            lake_id=lake.id,
+            ramp_id=ramp.id,
+            start_time=time(6),
+            end_time=time(15),
+        )
+    )
+    db_session.commit()
+    return day
+
+
+class TestHomepageCard:
+    def test_uses_the_lakes_forecast(self, client: TestClient, db_session: Session):
+        day = _next_tournament(db_session, *TRAVIS)
+        now = datetime.now(timezone.utc)
+        store_forecast(TRAVIS, _forecast(day, "Travis Storms"), now)
+        store_forecast(AUSTIN, _forecast(day, "Austin Sunny"), now)
+
+        html = client.get("/").text
+        assert "Travis Storms" in html
+        assert "Austin Sunny" not in html
+
+    def test_lake_without_coordinates_uses_austin(self, client: TestClient, db_session: Session):
+        day = _next_tournament(db_session)
+        store_forecast(AUSTIN, _forecast(day, "Austin Sunny"), datetime.now(timezone.utc))
+        assert "Austin Sunny" in client.get("/").text
+
+
+class TestLakeAdmin:
+    def _update(self, admin_client: TestClient, lake: Lake, **coordinates: str):
+        data = {"name": lake.yaml_key, "display_name": lake.display_name, **coordinates}
+        return post_with_csrf(
+            admin_client, f"/admin/lakes/{lake.id}/update", data=data, follow_redirects=False
+        )
+
+    def test_coordinates_are_saved_and_cleared(
+        self, admin_client: TestClient, db_session: Session, test_lake: Lake
+    ):
+        response = self._update(admin_client, test_lake, latitude="30.3916", longitude="-97.9079")
+        assert response.status_code == 303
+        db_session.refresh(test_lake)
+        assert (test_lake.latitude, test_lake.longitude) == TRAVIS
+        assert "30.3916" in admin_client.get(f"/admin/lakes/{test_lake.id}/edit").text
+
+        self._update(admin_client, test_lake, latitude="", longitude="")
+        db_session.refresh(test_lake)
+        assert (test_lake.latitude, test_lake.longitude) == (None, None)
+
+    @pytest.mark.parametrize(
+        "latitude, longitude", [("30.39", ""), ("north", "-97.9"), ("95", "-97.9")]
+    )
+    def test_invalid_coordinates_are_rejected(
+        self,
+        admin_client: TestClient,
+        db_session: Session,
+        test_lake: Lake,
+        latitude: str,
+        longitude: str,
+    ):
+        response = self._update(admin_client, test_lake, latitude=latitude, longitude=longitude)
+        assert response.status_code in (302, 303)
+        assert "error=" in response.headers["location"]
+        db_session.refresh(test_lake)
+        assert test_lake.latitude is None
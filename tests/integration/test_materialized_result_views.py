@@ -0,0 +1,192 @@
+"""Tests for the materialized backend of the tournament result views.
+
+Once materialized, v_angler_tournament_results / v_team_tournament_results are
+summary tables holding exactly what the live views return, refreshed only for
+the tournaments a result write touched. See core/db_schema/materialized_views.py.
+"""
+
+from decimal import Decimal
+from typing import Any, Generator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.db_schema import Angler, Result, TeamResult, Tournament
+from core.db_schema.materialized_views import (
+    dematerialize_result_views,
+    materialize_result_views,
+    refresh_result_views,
+    result_views_materialized,
+)
+from tests.conftest import delete_with_csrf, post_with_csrf
+
+
+def _rows(db_session: Session, relation: str) -> List[Any]:
+    """All rows of a result relation in a stable order, numerics as floats."""
+    rows = db_session.execute(text(f"SELECT * FROM {relation}")).mappings().all()
+    normalized = [
+        tuple(float(v) if isinstance(v, Decimal) else v for v in row.values()) for row in rows
+    ]
+    return sorted(normalized, key=repr)
+
+
+@pytest.fixture
+def materialized(db_session: Session) -> Generator[None, None, None]:
+    """Switch the result views to summary tables for one test."""
+    materialize_result_views(db_session.connection())
+    db_session.commit()
+    yield
+    db_session.rollback()
+    dematerialize_result_views(db_session.connection())
+    db_session.commit()
+
+
+@pytest.fixture
+def seeded_results(
+    db_session: Session,
+    test_tournament: Tournament,
+    test_team_format_tournament: Tournament,
+    member_user: Angler,
+    admin_user: Angler,
+) -> None:
+    db_session.add_all(
+        [
+            Result(
+                tournament_id=test_tournament.id,
+                angler_id=member_user.id,
+                num_fish=5,
+                total_weight=Decimal("12.50"),
+                big_bass_weight=Decimal("4.25"),
+            ),
+            TeamResult(
+                tournament_id=test_team_format_tournament.id,
+                angler1_id=member_user.id,
+                angler2_id=admin_user.id,
+                num_fish=8,
+                total_weight=Decimal("20.00"),
+                big_bass_weight=Decimal("5.50"),
+                place_finish=1,
+            ),
+        ]
+    )
+    db_session.commit()
+
+
+class TestMaterializedBackend:
+    def test_live_by_default(self, db_session: Session):
+        assert result_views_materialized(db_session.connection()) is False
+
+    def test_materialized_rows_match_live_views(self, db_session: Session, seeded_results: None):
+        live_angler = _rows(db_session, "v_angler_tournament_results")
+        live_team = _rows(db_session, "v_team_tournament_results")
+
+        materialize_result_views(db_session.connection())
+        db_session.commit()
+        try:
+            assert result_views_materialized(db_session.connection()) is True
+            assert _rows(db_session, "v_angler_tournament_results") == live_angler
+            assert _rows(db_session, "v_team_tournament_results") == live_team
+        finally:
+            dematerialize_result_views(db_session.connection())
+            db_session.commit()
+
+        assert result_views_materialized(db_session.connection()) is False
+        assert _rows(db_session, "v_angler_tournament_results") == live_angler
+
+    def test_refresh_only_touches_given_tournaments(
+        self,
+        db_session: Session,
+        seeded_results: None,
+        materialized: None,
+        test_tournament: Tournament,
+        test_team_format_tournament: Tournament,
+    ):
+        db_session.execute(text("UPDATE results SET total_weight = 15.0"))
+        db_session.execute(text("UPDATE team_results SET total_weight = 25.0"))
+
+        refresh_result_views(db_session.connection(), [test_tournament.id])
+        db_session.commit()
+
+        weights = {
+            row.tournament_id: row.weight
+            for row in db_session.execute(
+                text(
+                    "SELECT tournament_id, MAX(total_weight) AS weight "
+                    "FROM v_angler_tournament_results GROUP BY tournament_id"
+                )
+            )
+        }
+        assert float(weights[test_tournament.id]) == 15.0
+        # Not refreshed yet: still the value captured when materialized.
+        assert float(weights[test_team_format_tournament.id]) == 20.0
+
+        refresh_result_views(db_session.connection(), [test_team_format_tournament.id])
+        db_session.commit()
+        weight = db_session.execute(
+            text("SELECT total_weight FROM v_team_tournament_results WHERE tournament_id = :tid"),
+            {"tid": test_team_format_tournament.id},
+        ).scalar()
+        assert weight is not None and float(weight) == 25.0
+
+    def test_refresh_is_noop_for_live_views(self, db_session: Session, seeded_results: None):
+        before = _rows(db_session, "v_angler_tournament_results")
+        refresh_result_views(db_session.connection(), None)
+        assert _rows(db_session, "v_angler_tournament_results") == before
+
+
+class TestResultRoutesRefresh:
+    """The admin result routes refresh the summary tables for their tournament."""
+
+    def test_save_result_refreshes(
+        self,
+        admin_client: TestClient,
+        db_session: Session,
+        materialized: None,
+        test_tournament: Tournament,
+        member_user: Angler,
+    ):
+        response = post_with_csrf(
+            admin_client,
+            f"/admin/tournaments/{test_tournament.id}/results",
+            data={
+                "angler_id": str(member_user.id),
+                "num_fish": "4",
+                "total_weight": "11.25",
+                "big_bass_weight": "3.50",
+                "was_member": "true",
+            },
+            follow_redirects=False,
+        )
+        assert response.status_code in [200, 302, 303]
+
+        rows = _rows(db_session, "v_angler_tournament_results")
+        assert len(rows) == 1
+        assert 11.25 in rows[0]
+
+    def test_delete_team_result_refreshes(
+        self,
+        admin_client: TestClient,
+        db_session: Session,
+        seeded_results: None,
+        materialized: None,
+        test_team_format_tournament: Tournament,
+    ):
+        team_result_id = db_session.execute(
+            text("SELECT id FROM team_results WHERE tournament_id = :tid"),
+            {"tid": test_team_format_tournament.id},
+        ).scalar()
+        db_session.commit()
+
+        response = delete_with_csrf(
+            admin_client,
+            f"/admin/tournaments/{test_team_format_tournament.id}/team-results/{team_result_id}",
+        )
+        assert response.status_code == 200
+
+        remaining = db_session.execute(
+            text("SELECT COUNT(*) FROM v_team_tournament_results WHERE tournament_id = :tid"),
+            {"tid": test_team_format_tournament.id},
+        ).scalar()
+        assert remaining == 0
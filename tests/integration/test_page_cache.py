@@ -0,0 +1,217 @@
+"""Tests for the anonymous full-page cache (core/page_cache_middleware.py)."""
+
+from datetime import date
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, PlainTextResponse
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+from app_setup import get_csrf_token
+from core import page_cache_middleware
+from core.db_schema import Tournament
+from core.monitoring.metrics import registry
+from core.page_cache_middleware import PageCacheMiddleware, etag_matches, make_etag
+from core.query_service.data_cache import bump_results_generation
+from tests.conftest import count_statements
+
+
+def _sample(name: str, labels: dict) -> float:
+    return registry.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture(autouse=True)
+def enabled_cache(monkeypatch):
+    monkeypatch.setattr(page_cache_middleware, "PAGE_CACHE_ENABLED", True)
+    page_cache_middleware._reset_cache_for_test()
+    yield
+    page_cache_middleware._reset_cache_for_test()
+
+
+def _app() -> FastAPI:
+    """A small app whose routes count renders, behind the session middleware."""
+    app = FastAPI()
+    app.state.renders = 0
+
+    @app.get("/page")
+    def page(request: Request) -> HTMLResponse:
+        app.state.renders += 1
+        return HTMLResponse(f"<p>{request.query_params.get('q', '')}</p>")
+
+    @app.get("/form")
+    def form(request: Request) -> HTMLResponse:
+        app.state.renders += 1
+        return HTMLResponse(f'<input name="csrf_token" value="{get_csrf_token(request)}">')
+
+    @app.get("/cookie")
+    def cookie() -> HTMLResponse:
+        app.state.renders += 1
+        response = HTMLResponse("<p>cookie</p>")
+        response.set_cookie("seen", "1")
+        return response
+
+    @app.get("/text")
+    def plain() -> PlainTextResponse:
+        app.state.renders += 1
+        return PlainTextResponse("text")
+
+    @app.post("/login")
+    def login(request: Request) -> PlainTextResponse:
+        request.session["user_id"] = 1
+        return PlainTextResponse("ok")
+
+    @app.post("/write")
+    def write() -> PlainTextResponse:
+        return PlainTextResponse("ok")
+
+    app.add_middleware(
+        PageCacheMiddleware, routes=frozenset({"/page", "/form", "/cookie", "/text"})
+    )
+    app.add_middleware(SessionMiddleware, secret_key="test")
+    return app
+
+
+class TestAnonymousCaching:
+    def test_second_request_is_served_from_cache(self):
+        app = _app()
+        client = TestClient(app)
+        first = client.get("/page")
+        second = client.get("/page")
+        assert app.state.renders == 1
+        assert second.text == first.text
+        assert second.headers["etag"] == first.headers["etag"] == make_etag(first.content)
+        assert second.headers["cache-control"] == "no-cache"
+        assert second.headers["vary"] == "Cookie"
+
+    def test_query_string_is_part_of_the_key(self):
+        app = _app()
+        client = TestClient(app)
+        assert client.get("/page?q=a").text == "<p>a</p>"
+        assert client.get("/page?q=b").text == "<p>b</p>"
+        assert app.state.renders == 2
+
+    def test_matching_if_none_match_gets_304(self):
+        client = TestClient(_app())
+        etag = client.get("/page").headers["etag"]
+        saved_before = _sample("page_cache_bytes_saved_total", {"route": "/page"})
+
+        response = client.get("/page", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        saved = _sample("page_cache_bytes_saved_total", {"route": "/page"})
+        assert saved - saved_before == len(b"<p></p>")
+
+        stale = client.get("/page", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+
+    def test_hit_and_miss_counters(self):
+        client = TestClient(_app())
+        labels = {"route": "/page", "result": "hit"}
+        hits_before = _sample("page_cache_requests_total", labels)
+        misses_before = _sample("page_cache_requests_total", {**labels, "result": "miss"})
+        for _ in range(3):
+            client.get("/page")
+        assert _sample("page_cache_requests_total", labels) - hits_before == 2
+        misses = _sample("page_cache_requests_total", {**labels, "result": "miss"})
+        assert misses - misses_before == 1
+
+    def test_off_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(page_cache_middleware, "PAGE_CACHE_ENABLED", False)
+        app = _app()
+        client = TestClient(app)
+        client.get("/page")
+        assert "etag" not in client.get("/page").headers
+        assert app.state.renders == 2
+
+
+class TestNeverCached:
+    @pytest.mark.parametrize("path", ["/form", "/cookie", "/text"])
+    def test_personalized_or_non_html_responses(self, path: str):
+        app = _app()
+        client = TestClient(app)
+        client.get(path)
+        assert "etag" not in client.get(path).headers
+        assert app.state.renders == 2
+
+    def test_signed_in_sessions_bypass_the_cache(self):
+        app = _app()
+        client = TestClient(app)
+        client.get("/page")
+        client.post("/login")
+        assert "etag" not in client.get("/page").headers
+        assert app.state.renders == 2
+
+
+class TestInvalidation:
+    def test_signed_in_write_bumps_the_generation(self):
+        app = _app()
+        anonymous, signed_in = TestClient(app), TestClient(app)
+        signed_in.post("/login")
+        anonymous.get("/page")
+        anonymous.post("/write")  # anonymous writes don't invalidate
+        anonymous.get("/page")
+        assert app.state.renders == 1
+
+        signed_in.post("/write")
+        anonymous.get("/page")
+        assert app.state.renders == 2
+
+    def test_results_generation_invalidates(self):
+        app = _app()
+        client = TestClient(app)
+        client.get("/page")
+        bump_results_generation()
+        client.get("/page")
+        assert app.state.renders == 2
+
+    def test_ttl_expires_entries(self, monkeypatch):
+        monkeypatch.setattr(page_cache_middleware, "PAGE_CACHE_TTL", 0.0)
+        app = _app()
+        client = TestClient(app)
+        client.get("/page")
+        client.get("/page")
+        assert app.state.renders == 2
+
+    def test_entry_count_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(page_cache_middleware, "PAGE_CACHE_MAX_ENTRIES", 2)
+        app = _app()
+        client = TestClient(app)
+        for q in ("a", "b", "c", "a"):
+            client.get(f"/page?q={q}")
+        assert app.state.renders == 4
+
+
+class TestEtagMatching:
+    def test_comparison(self):
+        etag = make_etag(b"body")
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+
+
+class TestPublicPages:
+    @pytest.fixture
+    def paths(self, test_tournament: Tournament) -> list:
+        return [
+            "/",
+            "/awards",
+            f"/awards/{date.today().year}",
+            f"/tournaments/{test_tournament.id}",
+            "/calendar",
+            "/data",
+        ]
+
+    def test_anonymous_pages_are_cached(self, client: TestClient, paths: list):
+        for path in paths:
+            first = client.get(path)
+            assert first.status_code == 200, path
+            assert "etag" in first.headers, path
+            with count_statements() as statements:
+                second = client.get(path)
+            assert second.text == first.text, path
+            assert statements == [], path
+            assert "x-content-type-options" in second.headers, path
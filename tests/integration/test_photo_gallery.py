@@ -1,13 +1,20 @@
 """Photo gallery tests."""
 
+import hashlib
 import io
+import re
 import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
+from PIL import Image
+from sqlalchemy.orm import Query, Session
 
 from core.db_schema import Angler, Photo, Tournament
+from routes.photos import gallery, storage
 from tests.conftest import post_with_csrf
 
 
@@ -37,7 +44,7 @@ class TestPhotoGallery:
         assert response.status_code == 200
         assert b"Upload Photo" in response.content
 
-    @patch("routes.photos.gallery.UPLOAD_DIR", tempfile.gettempdir())
+    @patch("routes.photos.storage.UPLOAD_DIR", tempfile.gettempdir())
     def test_upload_photo_member(
         self, member_client: TestClient, db_session: Session, member_user: Angler
     ):
@@ -184,10 +191,136 @@ class TestPhotoGallery:
         assert response.status_code == 200
 
 
+class TestPhotoUploadProcessing:
+    """Test uploads are verified and their variants written in one pass."""
+
+    @pytest.fixture
+    def upload_dirs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        for name in (
+            "UPLOAD_DIR",
+            "THUMBNAIL_DIR",
+            "PLACEHOLDER_DIR",
+            "VARIANT_DIR",
+            "INCOMING_DIR",
+        ):
+            monkeypatch.setattr(storage, name, str(tmp_path / name.lower()))
+        return tmp_path
+
+    @staticmethod
+    def _files(upload_dirs: Path) -> list:
+        return sorted(
+            str(p.relative_to(upload_dirs)) for p in upload_dirs.rglob("*") if p.is_file()
+        )
+
+    @staticmethod
+    def _jpeg() -> bytes:
+        buf = io.BytesIO()
+        Image.new("RGB", (1600, 1200), (30, 120, 60)).save(buf, "JPEG")
+        return buf.getvalue()
+
+    def _upload(self, client: TestClient, content: bytes, filename: str = "catch.jpg"):
+        return post_with_csrf(
+            client,
+            "/photos/upload",
+            data={"caption": "Big one"},
+            files={"photo": (filename, io.BytesIO(content), "image/jpeg")},
+            follow_redirects=False,
+        )
+
+    def test_valid_jpeg_writes_original_thumbnail_and_placeholder(
+        self, member_client: TestClient, db_session: Session, upload_dirs: Path
+    ):
+        """Test a phone-style JPEG is stored with both WebP variants."""
+        content = self._jpeg()
+        response = self._upload(member_client, content)
+        assert response.status_code == 303
+        assert "error" not in response.headers["location"]
+
+        photo = db_session.query(Photo).one()
+        content_hash = hashlib.sha256(content).hexdigest()
+        assert photo.content_hash == content_hash
+        shard = f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+        assert photo.filename == f"{shard}.jpg"
+        assert photo.thumbnail_filename == photo.placeholder_filename == f"{shard}.webp"
+        original = upload_dirs / "upload_dir" / photo.filename
+        assert original.read_bytes() == content
+        with Image.open(upload_dirs / "thumbnail_dir" / photo.thumbnail_filename) as thumb:
+            assert thumb.size == (200, 150)
+        with Image.open(upload_dirs / "placeholder_dir" / photo.placeholder_filename) as ph:
+            assert ph.size == (20, 15)
+
+    def test_invalid_image_writes_nothing(
+        self, member_client: TestClient, db_session: Session, upload_dirs: Path
+    ):
+        """Test a spoofed JPEG is rejected before anything reaches disk."""
+        response = self._upload(member_client, b"\xff\xd8\xff" + b"\x00" * 100)
+        assert response.status_code == 303
+        assert "error" in response.headers["location"]
+        assert db_session.query(Photo).count() == 0
+        assert self._files(upload_dirs) == []
+
+    def test_too_large_upload_is_rejected_while_streaming(
+        self,
+        member_client: TestClient,
+        db_session: Session,
+        upload_dirs: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test an oversized upload stops at the limit and leaves nothing behind."""
+        monkeypatch.setattr(gallery, "MAX_FILE_SIZE", 1000)
+        monkeypatch.setattr(storage, "CHUNK_SIZE", 256)
+        response = self._upload(member_client, self._jpeg())
+        assert "File%20too%20large" in response.headers["location"]
+        assert db_session.query(Photo).count() == 0
+        assert self._files(upload_dirs) == []
+
+    def test_duplicate_upload_reuses_the_stored_files(
+        self,
+        member_client: TestClient,
+        db_session: Session,
+        upload_dirs: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test the same image uploaded twice is stored and processed once."""
+        content = self._jpeg()
+        self._upload(member_client, content)
+        stored = self._files(upload_dirs)
+
+        async def no_processing(*args):
+            raise AssertionError("processed again")
+
+        monkeypatch.setattr(gallery, "run_in_photo_pool", no_processing)
+        response = self._upload(member_client, content, filename="same.jpeg")
+        assert "error" not in response.headers["location"]
+
+        first, second = db_session.query(Photo).order_by(Photo.id).all()
+        assert second.filename == first.filename
+        assert second.thumbnail_filename == first.thumbnail_filename
+        assert (second.width, second.height) == (1600, 1200)
+        assert self._files(upload_dirs) == stored
+
+    def test_deleting_a_duplicate_keeps_the_shared_files(
+        self, member_client: TestClient, db_session: Session, upload_dirs: Path
+    ):
+        """Test shared files are removed only with the last photo using them."""
+        content = self._jpeg()
+        self._upload(member_client, content)
+        self._upload(member_client, content)
+        first, second = db_session.query(Photo).order_by(Photo.id).all()
+        first_id, second_id = first.id, second.id
+        stored = self._files(upload_dirs)
+
+        post_with_csrf(member_client, f"/photos/{first_id}/delete", data={})
+        assert self._files(upload_dirs) == stored
+
+        post_with_csrf(member_client, f"/photos/{second_id}/delete", data={})
+        assert self._files(upload_dirs) == []
+
+
 class TestPhotoUploadLimits:
     """Test photo upload limits."""
 
-    @patch("routes.photos.gallery.UPLOAD_DIR", tempfile.gettempdir())
+    @patch("routes.photos.storage.UPLOAD_DIR", tempfile.gettempdir())
     def test_member_upload_limit(
         self,
         member_client: TestClient,
@@ -224,7 +357,7 @@ class TestPhotoUploadLimits:
         # Should redirect with error about limit
         assert response.status_code in [200, 303]
 
-    @patch("routes.photos.gallery.UPLOAD_DIR", tempfile.gettempdir())
+    @patch("routes.photos.storage.UPLOAD_DIR", tempfile.gettempdir())
     def test_admin_no_upload_limit(
         self,
         admin_client: TestClient,
@@ -447,3 +580,68 @@ class TestPhotoEdit:
         """Test editing nonexistent photo returns error."""
         response = member_client.get("/photos/99999/edit", follow_redirects=False)
         assert response.status_code in [200, 303]
+
+
+class TestGalleryPagination:
+    """Test infinite scroll pages through photos by (uploaded_at, id) cursor."""
+
+    @pytest.fixture
+    def photos(self, db_session: Session, member_user: Angler) -> list:
+        """30 photos, newest first; pairs share an upload time to exercise the id tiebreak."""
+        start = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+        photos = [
+            Photo(
+                angler_id=member_user.id,
+                filename=f"photo{i}.jpg",
+                caption=f"photo {i}",
+                is_big_bass=i % 3 == 0,
+                uploaded_at=start + timedelta(minutes=i // 2),
+            )
+            for i in range(30)
+        ]
+        db_session.add_all(photos)
+        db_session.commit()
+        return sorted(photos, key=lambda p: (p.uploaded_at, p.id), reverse=True)
+
+    @staticmethod
+    def _captions(html: str) -> list:
+        return re.findall(r'data-caption="(photo \d+)"', html)
+
+    @staticmethod
+    def _next_url(html: str) -> str:
+        match = re.search(r'id="load-more-trigger"[^>]*hx-get="([^"]+)"', html, re.S)
+        assert match, "no load-more trigger"
+        return match.group(1).replace("&amp;", "&")
+
+    def test_scrolling_visits_every_photo_once_in_order(
+        self, client: TestClient, photos: list, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the cursor pages cover the gallery without gaps, repeats or counts."""
+        first = client.get("/photos").text
+        assert "of 30 photos" in first
+        next_url = self._next_url(first)
+        assert "before=" in next_url
+
+        def no_count(*args, **kwargs):
+            raise AssertionError("scroll page counted photos")
+
+        monkeypatch.setattr(Query, "count", no_count)
+        rest = client.get(next_url, headers={"HX-Request": "true"}).text
+        assert "load-more-trigger" not in rest
+        assert self._captions(first) + self._captions(rest) == [p.caption for p in photos]
+
+    def test_cursor_keeps_the_filters(self, client: TestClient, photos: list):
+        """Test filters carry over to the next page's URL from the full page."""
+        with patch.object(gallery, "PHOTOS_PER_PAGE", 4):
+            first = client.get("/photos?big_bass=true").text
+            next_url = self._next_url(first)
+            assert "big_bass=true" in next_url
+            rest = client.get(next_url, headers={"HX-Request": "true"}).text
+        big_bass = [p.caption for p in photos if p.is_big_bass]
+        assert self._captions(first) + self._captions(rest) == big_bass[:8]
+
+    def test_malformed_cursor_starts_from_the_top(self, client: TestClient, photos: list):
+        """Test a garbled cursor is ignored rather than an error."""
+        response = client.get("/photos?before=yesterday,x", headers={"HX-Request": "true"})
+        assert response.status_code == 200
+        assert self._captions(response.text)[0] == photos[0].caption
@@ -0,0 +1,110 @@
+"""Tests for the content-addressed photo storage (routes/photos/storage.py)."""
+
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import Session
+
+from core.db_schema import Angler, Photo
+from routes.photos import storage
+
+
+@pytest.fixture
+def upload_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    for name in ("UPLOAD_DIR", "THUMBNAIL_DIR", "PLACEHOLDER_DIR", "VARIANT_DIR", "INCOMING_DIR"):
+        monkeypatch.setattr(storage, name, str(tmp_path / name.lower()))
+    storage.ensure_upload_dir()
+    return tmp_path
+
+
+def _files(directory: Path) -> list:
+    return sorted(str(p.relative_to(directory)) for p in directory.rglob("*") if p.is_file())
+
+
+class TestStreaming:
+    def test_streams_and_hashes_in_chunks(self, upload_dirs: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(storage, "CHUNK_SIZE", 10)
+        data = bytes(range(256)) * 4
+        incoming = storage.stream_to_incoming(io.BytesIO(data), max_size=len(data))
+        assert incoming.content_hash == hashlib.sha256(data).hexdigest()
+        assert incoming.size == len(data)
+        assert Path(incoming.path).read_bytes() == data
+
+    def test_too_large_leaves_nothing_behind(self, upload_dirs: Path):
+        with pytest.raises(storage.UploadTooLargeError):
+            storage.stream_to_incoming(io.BytesIO(b"x" * 101), max_size=100)
+        assert _files(upload_dirs) == []
+
+    def test_names_are_sharded_by_hash(self, upload_dirs: Path):
+        content_hash = "abcd" + "0" * 60
+        assert storage.original_filename(content_hash, ".jpg") == f"ab/cd/{content_hash}.jpg"
+        assert storage.get_variant_path(content_hash, 800) == str(
+            upload_dirs / "variant_dir" / "ab" / "cd" / f"{content_hash}-800.webp"
+        )
+
+
+class TestMigrateStorage:
+    def _legacy_photo(
+        self, db_session: Session, angler: Angler, upload_dirs: Path, name: str, data: bytes
+    ) -> Photo:
+        (upload_dirs / "upload_dir" / f"{name}.jpg").write_bytes(data)
+        (upload_dirs / "thumbnail_dir" / f"{name}.webp").write_bytes(b"thumb")
+        (upload_dirs / "placeholder_dir" / f"{name}.webp").write_bytes(b"placeholder")
+        photo = Photo(
+            angler_id=angler.id,
+            filename=f"{name}.jpg",
+            thumbnail_filename=f"{name}.webp",
+            placeholder_filename=f"{name}.webp",
+        )
+        db_session.add(photo)
+        db_session.commit()
+        return photo
+
+    def test_moves_flat_files_into_shards(
+        self, db_session: Session, member_user: Angler, upload_dirs: Path
+    ):
+        data = b"original bytes"
+        content_hash = hashlib.sha256(data).hexdigest()
+        photo = self._legacy_photo(db_session, member_user, upload_dirs, "1234-uuid", data)
+        flat_variant = upload_dirs / "variant_dir" / f"{content_hash}-400.webp"
+        flat_variant.write_bytes(b"variant")
+
+        assert storage.migrate_storage() == {"moved": 1, "skipped": 0, "failed": 0}
+        db_session.refresh(photo)
+        shard = f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+        assert photo.content_hash == content_hash
+        assert photo.filename == f"{shard}.jpg"
+        assert photo.thumbnail_filename == photo.placeholder_filename == f"{shard}.webp"
+        assert (upload_dirs / "upload_dir" / photo.filename).read_bytes() == data
+        assert (upload_dirs / "thumbnail_dir" / photo.thumbnail_filename).read_bytes() == b"thumb"
+        assert Path(storage.get_variant_path(content_hash, 400)).read_bytes() == b"variant"
+        assert not flat_variant.exists()
+
+        # Running it again finds nothing left to move.
+        assert storage.migrate_storage() == {"moved": 0, "skipped": 1, "failed": 0}
+
+    def test_duplicates_end_up_sharing_one_copy(
+        self, db_session: Session, member_user: Angler, upload_dirs: Path
+    ):
+        first = self._legacy_photo(db_session, member_user, upload_dirs, "first", b"same")
+        second = self._legacy_photo(db_session, member_user, upload_dirs, "second", b"same")
+
+        assert storage.migrate_storage() == {"moved": 2, "skipped": 0, "failed": 0}
+        db_session.refresh(first)
+        db_session.refresh(second)
+        assert first.filename == second.filename
+        # One original, thumbnail and placeholder between them
+        assert len(_files(upload_dirs)) == 3
+
+    def test_missing_originals_are_reported(
+        self, db_session: Session, member_user: Angler, upload_dirs: Path
+    ):
+        photo = Photo(angler_id=member_user.id, filename="gone.jpg")
+        db_session.add(photo)
+        db_session.commit()
+
+        assert storage.migrate_storage() == {"moved": 0, "skipped": 0, "failed": 1}
+        db_session.refresh(photo)
+        assert photo.filename == "gone.jpg"
@@ -0,0 +1,185 @@
+"""Tests for the responsive photo variants (routes/photos/variants.py)."""
+
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from core.db_schema import Angler, Photo
+from routes.photos import storage, variants
+from tests.conftest import post_with_csrf
+
+
+def _jpeg(size=(2000, 1500)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, (30, 120, 60)).save(buf, "JPEG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def upload_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    for name in ("UPLOAD_DIR", "THUMBNAIL_DIR", "PLACEHOLDER_DIR", "VARIANT_DIR", "INCOMING_DIR"):
+        monkeypatch.setattr(storage, name, str(tmp_path / name.lower()))
+    storage.ensure_upload_dir()
+    return tmp_path
+
+
+def _variants(upload_dirs: Path) -> list:
+    return [p for p in (upload_dirs / "variant_dir").rglob("*") if p.is_file()]
+
+
+def _add_photo(db_session: Session, angler: Angler, upload_dirs: Path, described=True) -> Photo:
+    contents = _jpeg()
+    filename = f"{hashlib.md5(contents).hexdigest()}.jpg"
+    (upload_dirs / "upload_dir" / filename).write_bytes(contents)
+    photo = Photo(angler_id=angler.id, filename=filename)
+    if described:
+        photo.content_hash = hashlib.sha256(contents).hexdigest()
+        photo.width, photo.height = 2000, 1500
+    db_session.add(photo)
+    db_session.commit()
+    return photo
+
+
+class TestVariantEndpoint:
+    def test_first_request_renders_and_caches(
+        self, client: TestClient, db_session: Session, member_user: Angler, upload_dirs: Path
+    ):
+        photo = _add_photo(db_session, member_user, upload_dirs)
+        response = client.get(f"/photos/variants/{photo.content_hash}/800.webp")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert Image.open(io.BytesIO(response.content)).size == (800, 600)
+
+        cached = Path(storage.get_variant_path(photo.content_hash, 800))
+        assert cached.parent.parent.parent == upload_dirs / "variant_dir"
+        assert cached.read_bytes() == response.content
+
+    def test_cached_variant_is_served_from_disk(
+        self,
+        client: TestClient,
+        db_session: Session,
+        member_user: Angler,
+        upload_dirs: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        photo = _add_photo(db_session, member_user, upload_dirs)
+        assert client.get(f"/photos/variants/{photo.content_hash}/400.webp").status_code == 200
+
+        async def no_render(*args):
+            raise AssertionError("rendered again")
+
+        monkeypatch.setattr(variants, "_render", no_render)
+        assert client.get(f"/photos/variants/{photo.content_hash}/400.webp").status_code == 200
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/photos/variants/{hash}/500.webp",  # not a variant width
+            "/photos/variants/{hash}/400.png",  # not a variant format
+            "/photos/variants/{hash}/400.avif",  # AVIF is off
+            "/photos/variants/{missing}/400.webp",  # no such photo
+            "/photos/variants/..%2F..%2Fsecret/400.webp",
+        ],
+    )
+    def test_unknown_variants_are_404(
+        self,
+        path: str,
+        client: TestClient,
+        db_session: Session,
+        member_user: Angler,
+        upload_dirs: Path,
+    ):
+        photo = _add_photo(db_session, member_user, upload_dirs)
+        url = path.format(hash=photo.content_hash, missing="0" * 64)
+        assert client.get(url).status_code == 404
+        assert _variants(upload_dirs) == []
+
+
+class TestGallerySrcset:
+    def test_described_photos_get_a_srcset(
+        self, client: TestClient, db_session: Session, member_user: Angler, upload_dirs: Path
+    ):
+        photo = _add_photo(db_session, member_user, upload_dirs)
+        html = client.get("/photos").text
+        base = f"/photos/variants/{photo.content_hash}"
+        srcset = f"{base}/400.webp 400w, {base}/800.webp 800w, {base}/1600.webp 1600w"
+        assert f'srcset="{srcset}"' in html
+        assert f'data-srcset="{srcset}"' in html
+
+    def test_srcset_stops_at_the_original_width(self):
+        srcset = storage.get_variant_srcset("a" * 64, 1000)
+        assert srcset.endswith("/1600.webp 1000w")
+        assert (
+            storage.get_variant_srcset("a" * 64, 300)
+            == f"/photos/variants/{'a' * 64}/400.webp 300w"
+        )
+
+    def test_photos_without_a_hash_fall_back_to_the_thumbnail(
+        self, client: TestClient, db_session: Session, member_user: Angler, upload_dirs: Path
+    ):
+        _add_photo(db_session, member_user, upload_dirs, described=False)
+        html = client.get("/photos").text
+        assert "srcset" not in html
+
+
+class TestUploadAndDelete:
+    def test_upload_records_hash_and_size(
+        self, member_client: TestClient, db_session: Session, upload_dirs: Path
+    ):
+        contents = _jpeg(size=(1200, 900))
+        post_with_csrf(
+            member_client,
+            "/photos/upload",
+            data={"caption": ""},
+            files={"photo": ("catch.jpg", io.BytesIO(contents), "image/jpeg")},
+        )
+        photo = db_session.query(Photo).one()
+        assert photo.content_hash == hashlib.sha256(contents).hexdigest()
+        assert (photo.width, photo.height) == (1200, 900)
+
+    def test_delete_removes_cached_variants(
+        self,
+        member_client: TestClient,
+        db_session: Session,
+        member_user: Angler,
+        upload_dirs: Path,
+    ):
+        photo = _add_photo(db_session, member_user, upload_dirs)
+        member_client.get(f"/photos/variants/{photo.content_hash}/400.webp")
+        assert len(list((upload_dirs / "variant_dir").iterdir())) == 1
+
+        post_with_csrf(member_client, f"/photos/{photo.id}/delete", data={})
+        assert _variants(upload_dirs) == []
+
+
+class TestBackfill:
+    def test_describes_old_photos_and_renders_every_variant(
+        self, db_session: Session, member_user: Angler, upload_dirs: Path
+    ):
+        photo = _add_photo(db_session, member_user, upload_dirs, described=False)
+        broken = Photo(angler_id=member_user.id, filename="missing.jpg")
+        db_session.add(broken)
+        db_session.commit()
+
+        assert variants.backfill_variants(workers=2) == {
+            "described": 1,
+            "rendered": 3,
+            "failed": 1,
+        }
+        db_session.refresh(photo)
+        assert (photo.width, photo.height) == (2000, 1500)
+        rendered = sorted(p.name for p in _variants(upload_dirs))
+        assert rendered == [f"{photo.content_hash}-{w}.webp" for w in (1600, 400, 800)]
+
+        # Re-running only retries what failed.
+        assert variants.backfill_variants(workers=2) == {
+            "described": 0,
+            "rendered": 0,
+            "failed": 1,
+        }
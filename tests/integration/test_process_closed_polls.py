@@ -0,0 +1,145 @@
+"""Tests for set-based poll finalization (routes/voting/helpers.process_closed_polls)."""
+
+import json
+from datetime import date, time, timedelta
+from typing import List, Optional, Sequence
+
+import pytest
+from sqlalchemy.orm import Session
+
+from core.db_schema import Angler, Event, Poll, PollOption, PollVote, Tournament
+from core.helpers.timezone import now_local
+from routes.voting.helpers import process_closed_polls
+from tests.conftest import count_statements
+
+
+@pytest.fixture
+def voters(db_session: Session) -> List[Angler]:
+    anglers = [Angler(name=f"Voter {i}", email=f"voter{i}@example.com") for i in range(4)]
+    db_session.add_all(anglers)
+    db_session.commit()
+    return anglers
+
+
+def _closed_poll(
+    db_session: Session,
+    voters: Sequence[Angler],
+    votes: Sequence[int],
+    poll_type: str = "tournament_location",
+    option_data: Optional[str] = None,
+) -> Poll:
+    """A poll that closed yesterday; ``votes[i]`` is the vote count for option i."""
+    event = Event(
+        # events.date is unique
+        date=date(2026, 5, 9) + timedelta(days=db_session.query(Event).count()),
+        year=2026,
+        name="May Tournament",
+        event_type="sabc_tournament",
+        start_time=time(6, 30),
+        weigh_in_time=time(14, 30),
+    )
+    db_session.add(event)
+    db_session.flush()
+    now = now_local()
+    poll = Poll(
+        title="Where to fish?",
+        poll_type=poll_type,
+        event_id=event.id,
+        starts_at=now - timedelta(days=8),
+        closes_at=now - timedelta(days=1),
+        closed=False,
+    )
+    db_session.add(poll)
+    db_session.flush()
+    options = [
+        PollOption(
+            poll_id=poll.id,
+            option_text=f"Lake {i} - Ramp {i} (north)",
+            option_data=option_data
+            or json.dumps({"lake_id": None, "start_time": "06:30", "end_time": "14:30"}),
+        )
+        for i in range(len(votes))
+    ]
+    db_session.add_all(options)
+    db_session.flush()
+    voter_iter = iter(voters)
+    for option, count in zip(options, votes):
+        for _ in range(count):
+            db_session.add(
+                PollVote(poll_id=poll.id, option_id=option.id, angler_id=next(voter_iter).id)
+            )
+    db_session.commit()
+    return poll
+
+
+def _tournament_for(db_session: Session, poll: Poll) -> Optional[Tournament]:
+    return db_session.query(Tournament).filter(Tournament.poll_id == poll.id).one_or_none()
+
+
+class TestProcessClosedPolls:
+    def test_most_votes_wins(self, db_session: Session, voters):
+        poll = _closed_poll(db_session, voters, [1, 2, 1])
+        assert process_closed_polls() == 1
+
+        db_session.refresh(poll)
+        winner = db_session.get(PollOption, poll.winning_option_id)
+        assert poll.closed is True
+        assert winner.option_text == "Lake 1 - Ramp 1 (north)"
+        tournament = _tournament_for(db_session, poll)
+        assert tournament is not None
+        assert tournament.event_id == poll.event_id
+        assert (tournament.lake_name, tournament.ramp_name) == ("Lake 1", "Ramp 1")
+        assert (tournament.start_time, tournament.end_time) == (time(6, 30), time(14, 30))
+        assert tournament.name == "May Tournament"
+        assert tournament.fish_limit == 5 and tournament.is_team and not tournament.complete
+
+    @pytest.mark.parametrize("votes", [[2, 2, 0], [0, 0]])
+    def test_ties_go_to_lowest_option_id(self, db_session: Session, voters, votes):
+        poll = _closed_poll(db_session, voters, votes)
+        process_closed_polls()
+
+        db_session.refresh(poll)
+        first = min(o.id for o in db_session.query(PollOption).filter_by(poll_id=poll.id))
+        assert poll.winning_option_id == first
+
+    def test_poll_without_options_is_closed_without_tournament(self, db_session: Session, voters):
+        poll = _closed_poll(db_session, voters, [])
+        assert process_closed_polls() == 1
+
+        db_session.refresh(poll)
+        assert poll.closed is True
+        assert poll.winning_option_id is None
+        assert _tournament_for(db_session, poll) is None
+
+    def test_unparseable_option_data_skips_tournament(self, db_session: Session, voters):
+        poll = _closed_poll(db_session, voters, [1], option_data="{not json")
+        process_closed_polls()
+
+        db_session.refresh(poll)
+        assert poll.closed is True
+        assert poll.winning_option_id is not None
+        assert _tournament_for(db_session, poll) is None
+
+    def test_other_poll_types_are_left_alone(self, db_session: Session, voters):
+        poll = _closed_poll(db_session, voters, [1], poll_type="simple")
+        assert process_closed_polls() == 0
+
+        db_session.refresh(poll)
+        assert poll.closed is False
+
+    def test_processed_polls_are_not_picked_up_again(self, db_session: Session, voters):
+        _closed_poll(db_session, voters, [1])
+        assert process_closed_polls() == 1
+        assert process_closed_polls() == 0
+
+    def test_statement_count_does_not_grow_with_backlog(self, db_session: Session, voters):
+        _closed_poll(db_session, voters, [1, 0])
+        with count_statements() as one_poll:
+            assert process_closed_polls() == 1
+
+        for _ in range(10):
+            _closed_poll(db_session, voters, [0, 1])
+        with count_statements() as many_polls:
+            assert process_closed_polls() == 10
+
+        assert len(many_polls) == len(one_poll)
@@ -0,0 +1,77 @@
+"""Rendering pages must not write: periodic sweeps run on the background scheduler.
+
+A past, incomplete tournament with results and a closed-but-unprocessed poll
+are exactly the state the old GET-time sweeps used to "fix up" on render.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from core.db_schema import Angler, Poll, Result, Tournament
+from core.helpers.timezone import now_local
+from routes.tournaments.helpers import auto_complete_past_tournaments
+from tests.conftest import count_statements
+
+DML = ("INSERT", "UPDATE", "DELETE")
+
+
+def _writes(statements):
+    return [s for s in statements if s.lstrip().upper().startswith(DML)]
+
+
+@pytest.fixture
+def pending_sweeps(
+    db_session: Session, test_tournament: Tournament, test_poll: Poll, member_user: Angler
+) -> Tournament:
+    db_session.add(
+        Result(
+            tournament_id=test_tournament.id,
+            angler_id=member_user.id,
+            num_fish=3,
+            total_weight=Decimal("6.00"),
+        )
+    )
+    test_poll.closes_at = now_local() - timedelta(days=1)
+    db_session.commit()
+    return test_tournament
+
+
+class TestPagesAreReadOnly:
+    @pytest.mark.parametrize("path", ["/", "/calendar", "/roster", "/awards", "/data", "/about"])
+    def test_public_pages(self, client: TestClient, pending_sweeps: Tournament, path: str):
+        with count_statements() as statements:
+            assert client.get(path).status_code == 200
+        assert _writes(statements) == []
+
+    def test_tournament_page(self, client: TestClient, pending_sweeps: Tournament):
+        with count_statements() as statements:
+            assert client.get(f"/tournaments/{pending_sweeps.id}").status_code == 200
+        assert _writes(statements) == []
+
+    @pytest.mark.parametrize("path", ["/polls", "/profile"])
+    def test_member_pages(self, member_client: TestClient, pending_sweeps: Tournament, path: str):
+        with count_statements() as statements:
+            assert member_client.get(path).status_code == 200
+        assert _writes(statements) == []
+
+    def test_enter_results_page(self, admin_client: TestClient, pending_sweeps: Tournament):
+        with count_statements() as statements:
+            response = admin_client.get(f"/admin/tournaments/{pending_sweeps.id}/enter-results")
+        assert response.status_code == 200
+        assert _writes(statements) == []
+
+
+def test_scheduled_sweep_completes_past_tournament(
+    client: TestClient, db_session: Session, pending_sweeps: Tournament
+):
+    client.get(f"/tournaments/{pending_sweeps.id}")
+    db_session.refresh(pending_sweeps)
+    assert not pending_sweeps.complete
+
+    assert auto_complete_past_tournaments() == 1
+    db_session.refresh(pending_sweeps)
+    assert pending_sweeps.complete
@@ -0,0 +1,113 @@
+"""Tests for per-request SQL counts and DB time (core/monitoring/db_queries.py)."""
+
+import contextvars
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from core.correlation_middleware import CorrelationIDMiddleware, correlation_id_var
+from core.db_schema import Tournament, engine
+from core.monitoring import middleware
+from core.monitoring.db_queries import begin_request, end_request
+from core.monitoring.metrics import registry
+from tests.conftest import count_statements
+
+
+def _queries_observed(route: str) -> float:
+    value = registry.get_sample_value(
+        "db_queries_per_request_count", {"method": "GET", "route": route}
+    )
+    return value or 0.0
+
+
+def _app(server_timing: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int) -> dict:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1")).all()
+            conn.execute(text("SELECT 2")).all()
+        return {"id": item_id}
+
+    app.add_middleware(middleware.MetricsMiddleware, server_timing=server_timing)
+    app.add_middleware(CorrelationIDMiddleware)
+    return app
+
+
+class TestServerTiming:
+    def test_header_reports_the_requests_statements(self, client: TestClient):
+        with count_statements() as statements:
+            response = client.get("/roster")
+        assert response.status_code == 200
+        assert f'desc="{len(statements)} queries"' in response.headers["Server-Timing"]
+        assert len(statements) > 0
+
+    def test_counts_statements_from_threadpool_routes(self):
+        response = TestClient(_app(server_timing=True)).get("/items/1")
+        assert 'desc="2 queries"' in response.headers["Server-Timing"]
+
+    def test_off_when_disabled(self):
+        response = TestClient(_app(server_timing=False)).get("/items/1")
+        assert response.status_code == 200
+        assert "Server-Timing" not in response.headers
+
+
+class TestQueryHistograms:
+    def test_observed_per_route_template(self, client: TestClient, test_tournament: Tournament):
+        route = "/tournaments/{tournament_id}"
+        before = _queries_observed(route)
+        client.get(f"/tournaments/{test_tournament.id}")
+        assert _queries_observed(route) == before + 1
+
+    def test_unknown_paths_share_the_catch_all_label(self, client: TestClient):
+        before = _queries_observed("/{page:path}")
+        client.get("/no-such-page-12345")
+        client.get("/another-missing-page")
+        assert _queries_observed("/{page:path}") == before + 2
+
+
+class TestSlowRequestLog:
+    def test_logs_query_count(self, monkeypatch: pytest.MonkeyPatch, caplog):
+        monkeypatch.setattr(middleware, "SLOW_REQUEST_SECONDS", 0.0)
+        with caplog.at_level(logging.WARNING, logger=middleware.logger.name):
+            TestClient(_app(server_timing=False)).get("/items/1")
+        record = next(r for r in caplog.records if r.getMessage().startswith("Slow request"))
+        assert record.route == "/items/{item_id}"
+        assert record.db_queries == 2
+
+
+class TestQueryStats:
+    def test_only_tracked_requests_are_counted(self):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1")).all()
+            stats = begin_request()
+            conn.execute(text("SELECT 1")).all()
+            end_request(stats)
+            conn.execute(text("SELECT 1")).all()
+        assert stats.count == 1
+        assert stats.seconds > 0
+
+    def test_requests_sharing_a_correlation_id_keep_separate_tallies(self):
+        def select() -> None:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1")).all()
+
+        # Two requests with the same client-supplied X-Request-ID, each in its
+        # own context as the server runs them.
+        first, second = contextvars.copy_context(), contextvars.copy_context()
+        for context in (first, second):
+            context.run(correlation_id_var.set, "shared-client-id")
+        first_stats = first.run(begin_request)
+        second_stats = second.run(begin_request)
+
+        first.run(select)
+        second.run(select)
+        second.run(end_request, second_stats)
+        first.run(select)  # still counted after the other request ended
+        first.run(end_request, first_stats)
+
+        assert (first_stats.count, second_stats.count) == (2, 1)
@@ -0,0 +1,285 @@
+"""Tests for frozen season snapshots (core/services/season_snapshots.py)."""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.db_schema import (
+    Angler,
+    Event,
+    Lake,
+    Result,
+    SeasonSnapshotPart,
+    TeamResult,
+    Tournament,
+    engine,
+)
+from core.helpers.snapshot_codec import decode, encode
+from core.query_service import QueryService
+from core.query_service.dashboard_facts import derive_dashboard, load_dashboard_facts
+from core.services.aoy_standings import build_missing_years
+from core.services.big_bass_ledger import build_missing_ledger
+from core.services.result_changes import results_changed
+from core.services.season_snapshots import freeze_season, list_seasons, thaw_season
+from routes.admin.events.update_helpers import update_tournament_record
+from routes.tournaments.data import load_frozen_tournament_page
+from tests.conftest import count_statements
+
+TODAY = date.today()
+SEASON = TODAY.year - 1
+
+
+def _tournament(db_session: Session, lake: Lake, day: date, complete: bool = True) -> Tournament:
+    event = Event(
+        date=day,
+        year=day.year,
+        name=f"Event {day}",
+        event_type="sabc_tournament",
+        start_time=time(6, 0),
+        weigh_in_time=time(15, 0),
+        lake_name=lake.display_name,
+    )
+    db_session.add(event)
+    db_session.flush()
+    tournament = Tournament(
+        event_id=event.id,
+        name=event.name,
+        lake_id=lake.id,
+        lake_name=lake.display_name,
+        fish_limit=5,
+        aoy_points=day.year < 2026,
+        complete=complete,
+    )
+    db_session.add(tournament)
+    db_session.flush()
+    return tournament
+
+
+@pytest.fixture
+def season(db_session: Session) -> Dict[int, List[Tournament]]:
+    """Three tournaments in last season, one earlier and one this year."""
+    lake = Lake(yaml_key="snapshot-lake", display_name="Snapshot Lake")
+    db_session.add(lake)
+    anglers = [
+        Angler(name=f"Angler {i}", email=f"snap{i}@example.com", member=i != 3) for i in range(6)
+    ]
+    db_session.add_all(anglers)
+    db_session.flush()
+
+    days = {
+        SEASON - 1: [date(SEASON - 1, 6, 1)],
+        SEASON: [date(SEASON, 3, 1), date(SEASON, 5, 3), date(SEASON, 9, 6)],
+        TODAY.year: [date(TODAY.year, 1, 10)],
+    }
+    tournaments: Dict[int, List[Tournament]] = {}
+    for year, year_days in days.items():
+        for n, day in enumerate(year_days):
+            tournament = _tournament(db_session, lake, day)
+            tournaments.setdefault(year, []).append(tournament)
+            for i, angler in enumerate(anglers):
+                db_session.add(
+                    Result(
+                        tournament_id=tournament.id,
+                        angler_id=angler.id,
+                        num_fish=min(5, i + n),
+                        total_weight=Decimal(f"{3 + 2.37 * i + n:.2f}"),
+                        big_bass_weight=Decimal(f"{1.5 + 0.91 * i:.2f}"),
+                        was_member=angler.member,
+                        disqualified=i == 4 and n == 1,
+                        buy_in=i == 0 and n == 2,
+                    )
+                )
+    db_session.add(
+        TeamResult(
+            tournament_id=tournaments[SEASON][0].id,
+            angler1_id=anglers[1].id,
+            angler2_id=anglers[2].id,
+            num_fish=5,
+            total_weight=Decimal("11.25"),
+            big_bass_weight=Decimal("3.10"),
+        )
+    )
+    db_session.add(
+        Event(
+            date=date(SEASON, 7, 5),
+            year=SEASON,
+            name="Cancelled",
+            event_type="sabc_tournament",
+            is_cancelled=True,
+        )
+    )
+    db_session.commit()
+    with engine.begin() as conn:
+        build_missing_years(conn)
+        build_missing_ledger(conn)
+    return tournaments
+
+
+def _freeze(year: int = SEASON) -> int:
+    with engine.begin() as conn:
+        return freeze_season(conn, year, TODAY)
+
+
+def _season_paths(tournaments: Dict[int, List[Tournament]]) -> List[str]:
+    return [f"/awards/{SEASON}", "/data"] + [f"/tournaments/{t.id}" for t in tournaments[SEASON]]
+
+
+class TestFreeze:
+    def test_writes_one_part_per_page(self, season):
+        assert _freeze() == 2 + len(season[SEASON])
+        with engine.connect() as conn:
+            (frozen,) = list_seasons(conn)
+        assert (frozen["year"], frozen["parts"]) == (SEASON, 5)
+
+    def test_refuses_the_current_season(self, season):
+        with pytest.raises(ValueError):
+            _freeze(TODAY.year)
+
+    def test_refreezing_replaces_the_snapshot(self, db_session: Session, season):
+        _freeze()
+        _freeze()
+        assert db_session.query(SeasonSnapshotPart).count() == 5
+
+    def test_thaw(self, db_session: Session, season):
+        _freeze()
+        with engine.begin() as conn:
+            assert thaw_season(conn, SEASON) == 5
+        assert db_session.query(SeasonSnapshotPart).count() == 0
+
+
+class TestReadPaths:
+    def test_frozen_pages_render_like_live_ones(self, client: TestClient, season):
+        paths = _season_paths(season)
+        live = {path: client.get(path).text for path in paths}
+        _freeze()
+        for path in paths:
+            assert client.get(path).text == live[path], path
+
+    def test_frozen_pages_use_fewer_statements(self, client: TestClient, season):
+        paths = [f"/awards/{SEASON}", f"/tournaments/{season[SEASON][1].id}"]
+        live = {}
+        for path in paths:
+            with count_statements() as statements:
+                client.get(path)
+            live[path] = len(statements)
+        _freeze()
+        for path in paths:
+            with count_statements() as statements:
+                client.get(path)
+            assert len(statements) == 2, path
+            assert len(statements) < live[path], path
+
+    def test_frozen_tournament_page_is_one_statement(self, season):
+        _freeze()
+        with engine.connect() as conn:
+            with count_statements() as statements:
+                page = load_frozen_tournament_page(QueryService(conn), season[SEASON][1].id, TODAY)
+        assert len(statements) == 1
+        assert page is not None
+        assert page.prev_tournament_id == season[SEASON][0].id
+        assert page.next_tournament_id == season[SEASON][2].id
+
+    def test_navigation_follows_tournaments_added_later(self, db_session: Session, season):
+        _freeze()
+        lake = db_session.query(Lake).one()
+        added = _tournament(db_session, lake, date(SEASON, 12, 1))
+        db_session.commit()
+        with engine.connect() as conn:
+            page = load_frozen_tournament_page(QueryService(conn), season[SEASON][2].id, TODAY)
+        assert page is not None and page.next_tournament_id == added.id
+
+    def test_dashboard_facts_match_live(self, season):
+        with engine.connect() as conn:
+            live = derive_dashboard(load_dashboard_facts(QueryService(conn)))
+        _freeze()
+        with engine.connect() as conn:
+            qs = QueryService(conn)
+            with count_statements("season_snapshots") as statements:
+                frozen = derive_dashboard(load_dashboard_facts(qs))
+        assert frozen == live
+        assert any("payload" in s for s in statements)
+
+    def test_current_year_stays_live(self, client: TestClient, season):
+        _freeze()
+        with count_statements("season_snapshots") as statements:
+            client.get(f"/awards/{TODAY.year}")
+        assert statements == []
+
+    def test_other_format_versions_are_ignored(
+        self, client: TestClient, db_session: Session, season
+    ):
+        tournament = season[SEASON][0]
+        live = client.get(f"/tournaments/{tournament.id}").text
+        _freeze()
+        db_session.execute(text("UPDATE season_snapshots SET payload = '{}', format_version = 0"))
+        db_session.commit()
+        assert client.get(f"/tournaments/{tournament.id}").text == live
+        with engine.connect() as conn:
+            assert load_frozen_tournament_page(QueryService(conn), tournament.id, TODAY) is None
+
+
+class TestInvalidation:
+    def _frozen_years(self) -> List[int]:
+        with engine.connect() as conn:
+            return [season["year"] for season in list_seasons(conn)]
+
+    def test_result_write_drops_the_season_and_later_ones(self, season):
+        _freeze(SEASON - 1)
+        _freeze(SEASON)
+        with engine.begin() as conn:
+            results_changed(conn, [season[SEASON][0].id])
+        assert self._frozen_years() == [SEASON - 1]
+
+        _freeze(SEASON)
+        with engine.begin() as conn:
+            results_changed(conn, [season[SEASON - 1][0].id])
+        assert self._frozen_years() == []
+
+    def test_current_year_write_keeps_frozen_seasons(self, season):
+        _freeze()
+        with engine.begin() as conn:
+            results_changed(conn, [season[TODAY.year][0].id])
+        assert self._frozen_years() == [SEASON]
+
+    def test_tournament_edit_drops_the_season(self, db_session: Session, season):
+        _freeze()
+        tournament = season[SEASON][0]
+        update_tournament_record(
+            db_session,
+            {
+                "event_id": tournament.event_id,
+                "name": "Renamed",
+                "lake_name": tournament.lake_name,
+                "ramp_name": None,
+                "start_time": "06:00",
+                "end_time": "15:00",
+                "fish_limit": 5,
+                "entry_fee": 25.0,
+                "aoy_points": tournament.aoy_points,
+            },
+        )
+        db_session.commit()
+        assert self._frozen_years() == []
+
+
+class TestCodec:
+    def test_round_trips_loader_types(self):
+        value = {
+            "weight": Decimal("12.50"),
+            "day": date(2024, 5, 1),
+            "at": datetime(2024, 5, 1, 6, 30),
+            "start": time(6, 0),
+            "row": ("Angler", Decimal("1.00"), None, True),
+        }
+        decoded = decode(encode(value))
+        assert decoded == {**value, "row": list(value["row"])}
+        assert str(decoded["weight"]) == "12.50"
+        assert type(decoded["at"]) is datetime and type(decoded["day"]) is date
+
+    def test_plain_objects_are_left_alone(self):
+        assert decode(encode({"$other": "x", "n": 1.5})) == {"$other": "x", "n": 1.5}
@@ -0,0 +1,180 @@
+"""Tests for the two-statement tournament results loader (routes/tournaments/data.py)."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from core.db_schema import Angler, Event, Result, TeamResult, Tournament, engine
+from core.query_service import QueryService
+from core.services.big_bass_ledger import build_missing_ledger
+from routes.tournaments.data import load_tournament_page
+from tests.conftest import count_statements
+
+
+def _anglers(db_session: Session, count: int, member: bool = True) -> List[Angler]:
+    start = db_session.query(Angler).count()
+    anglers = [
+        Angler(name=f"Angler {start + i}", email=f"angler{start + i}@example.com", member=member)
+        for i in range(count)
+    ]
+    db_session.add_all(anglers)
+    db_session.flush()
+    return anglers
+
+
+def _tournament(db_session: Session, day: date, aoy_points: bool = True) -> Tournament:
+    event = Event(date=day, year=day.year, name=f"Event {day}", event_type="sabc_tournament")
+    db_session.add(event)
+    db_session.flush()
+    tournament = Tournament(
+        event_id=event.id, name=event.name, fish_limit=5, aoy_points=aoy_points, complete=True
+    )
+    db_session.add(tournament)
+    db_session.flush()
+    return tournament
+
+
+def _result(
+    db_session: Session, tournament: Tournament, angler: Angler, big_bass: str = "2.00", **kw
+) -> None:
+    db_session.add(
+        Result(
+            tournament_id=tournament.id,
+            angler_id=angler.id,
+            num_fish=kw.pop("num_fish", 3),
+            total_weight=Decimal(kw.pop("total_weight", "6.00")),
+            big_bass_weight=Decimal(big_bass),
+            was_member=angler.member,
+            **kw,
+        )
+    )
+
+
+def _load(tournament_id: int):
+    with engine.connect() as conn:
+        return load_tournament_page(QueryService(conn), tournament_id, date.today())
+
+
+class TestStatementCount:
+    def test_loader_uses_two_statements(self, db_session: Session, test_tournament: Tournament):
+        for angler in _anglers(db_session, 3):
+            _result(db_session, test_tournament, angler)
+        db_session.commit()
+        with count_statements() as statements:
+            _load(test_tournament.id)
+        assert len(statements) == 2
+
+    def test_page_does_not_grow_with_results(
+        self, client: TestClient, db_session: Session, test_tournament: Tournament
+    ):
+        _result(db_session, test_tournament, _anglers(db_session, 1)[0])
+        db_session.commit()
+        with count_statements() as one_result:
+            assert client.get(f"/tournaments/{test_tournament.id}").status_code == 200
+
+        for angler in _anglers(db_session, 20):
+            _result(db_session, test_tournament, angler)
+        db_session.commit()
+        with count_statements() as many_results:
+            assert client.get(f"/tournaments/{test_tournament.id}").status_code == 200
+
+        # The season snapshot probe, the loader's two reads and the shared
+        # year-navigation links.
+        assert len(one_result) == len(many_results) == 4
+
+
+class TestLoadTournamentPage:
+    def test_missing_tournament(self, db_session: Session):
+        with pytest.raises(ValueError):
+            _load(999999)
+
+    def test_stats_results_and_disqualified(self, db_session: Session, test_tournament):
+        first, second, dq, buy_in = _anglers(db_session, 4)
+        _result(db_session, test_tournament, first, total_weight="9.00", num_fish=5)
+        _result(db_session, test_tournament, second, total_weight="4.00", big_bass="3.00")
+        _result(db_session, test_tournament, dq, total_weight="12.00", disqualified=True)
+        _result(db_session, test_tournament, buy_in, total_weight="0", num_fish=0, buy_in=True)
+        db_session.commit()
+
+        page = _load(test_tournament.id)
+        assert page.tournament.id == test_tournament.id
+        assert (page.stats.total_anglers, page.stats.total_fish) == (3, 8)
+        assert page.stats.total_weight == Decimal("13.00")
+        assert page.stats.heavy_stringer == Decimal("9.00")
+        assert (page.stats.limits, page.stats.zeros, page.stats.buy_ins) == (1, 0, 1)
+        assert [r[1] for r in page.individual_results] == [first.name, second.name]
+        assert [r[0] for r in page.buy_in_results] == [buy_in.name]
+        assert [r[0] for r in page.disqualified_results] == [dq.name]
+
+    def test_team_results(self, db_session: Session, test_team_format_tournament: Tournament):
+        a1, a2, solo = _anglers(db_session, 3)
+        for angler1, angler2, weight in ((a1, a2, "10.00"), (solo, None, "7.50")):
+            db_session.add(
+                TeamResult(
+                    tournament_id=test_team_format_tournament.id,
+                    angler1_id=angler1.id,
+                    angler2_id=angler2.id if angler2 else None,
+                    num_fish=5,
+                    total_weight=Decimal(weight),
+                    big_bass_weight=Decimal("2.00"),
+                )
+            )
+        db_session.commit()
+
+        page = _load(test_team_format_tournament.id)
+        assert [r[1] for r in page.team_results] == [f"{a1.name} / {a2.name}", solo.name]
+        assert page.stats.total_boats == 2
+        assert page.payouts["first_place"] == Decimal("40.00")
+
+
+class TestBigBass:
+    def test_guest_heaviest_bass_is_flagged(self, db_session: Session, test_tournament):
+        (guest,) = _anglers(db_session, 1, member=False)
+        (member,) = _anglers(db_session, 1)
+        _result(db_session, test_tournament, guest, big_bass="6.50")
+        _result(db_session, test_tournament, member, big_bass="5.50")
+        db_session.commit()
+
+        payouts = _load(test_tournament.id).payouts
+        assert payouts["big_bass_caught_by_guest"] is True
+        assert payouts["big_bass_won"] is True  # the member's 5.50 still qualifies
+
+    def test_carryover_accumulates_since_last_member_win(self, db_session: Session):
+        member, other = _anglers(db_session, 2)
+        won = _tournament(db_session, date(2025, 3, 1))
+        _result(db_session, won, member, big_bass="6.00")
+        rolled = _tournament(db_session, date(2025, 4, 1))
+        for angler in (member, other):
+            _result(db_session, rolled, angler, big_bass="3.00")
+        team = _tournament(db_session, date(2026, 2, 1), aoy_points=False)
+        db_session.add(
+            TeamResult(
+                tournament_id=team.id,
+                angler1_id=member.id,
+                angler2_id=other.id,
+                num_fish=2,
+                total_weight=Decimal("4.00"),
+                big_bass_weight=Decimal("2.00"),
+            )
+        )
+        current = _tournament(db_session, date(2026, 3, 1), aoy_points=False)
+        db_session.commit()
+        with engine.begin() as conn:
+            build_missing_ledger(conn)
+
+        payouts = _load(current.id).payouts
+        # $4/angler x 2 anglers (2025) + $8/boat x 1 boat (2026); the 2025-03 pot was won.
+        assert payouts["big_bass_carryover"] == Decimal("16.00")
+        assert payouts["big_bass_won"] is False
+
+    def test_navigation_ids(self, db_session: Session):
+        days = [date.today() - timedelta(days=30 * n) for n in (3, 2, 1)]
+        earlier, middle, later = (_tournament(db_session, day) for day in days)
+        db_session.commit()
+
+        page = _load(middle.id)
+        assert (page.prev_tournament_id, page.next_tournament_id) == (earlier.id, later.id)
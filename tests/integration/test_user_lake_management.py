@@ -394,6 +394,23 @@ class TestLakesAPI:
         assert test_lake_data["name"] == test_lake.display_name
         assert test_lake_data["key"] == test_lake.yaml_key
 
+    def test_get_all_lakes_via_async_engine(
+        self,
+        client: TestClient,
+        test_lake: Lake,
+        monkeypatch,
+    ):
+        """With ASYNC_DB_ENABLED the route reads through the aiosqlite engine."""
+        from core.db_schema import async_engine
+
+        monkeypatch.setattr(async_engine, "ASYNC_DB_ENABLED", True)
+        response = client.get("/api/lakes")
+
+        assert response.status_code == 200
+        assert {"key": test_lake.yaml_key, "name": test_lake.display_name, "id": test_lake.id} in (
+            response.json()
+        )
+
     def test_get_lakes_returns_empty_on_error(
         self,
         client: TestClient,
@@ -2,6 +2,10 @@
 
 Run with: locust -f tests/load/locustfile.py --host=http://localhost:8000
 Web UI: http://localhost:8089
+
+Single scenario, headless, with CSV stats (compare the p95 column):
+    locust -f tests/load/locustfile.py --host=http://localhost:8000 \
+        --headless -u 50 -r 10 -t 60s --csv=homepage HomepageAndHealth
 """
 
 from locust import HttpUser, between, task
@@ -33,6 +37,36 @@ class BrowsingUser(HttpUser):
         self.client.get("/health")
 
 
+class HomepageAndHealth(HttpUser):
+    """Mixed homepage + /health traffic against a single worker.
+
+    The homepage is the heaviest public page; /health is a one-row query.
+    While homepage queries ran on the event loop every /health request
+    queued behind them, so /health p95 tracked homepage latency. With the
+    homepage's database work in the threadpool, /health p95 should stay
+    flat as homepage load rises. Run against the old and new build with
+    the same -u/-r/-t and compare the /health and / p95 rows of
+    homepage_stats.csv.
+    """
+
+    wait_time = between(0.5, 1.5)
+
+    @task(3)
+    def view_homepage(self):
+        """View homepage."""
+        self.client.get("/")
+
+    @task(1)
+    def view_homepage_page_two(self):
+        """View the second page of completed tournaments."""
+        self.client.get("/?p=2", name="/?p=[page]")
+
+    @task(4)
+    def view_health(self):
+        """Check health endpoint."""
+        self.client.get("/health")
+
+
 class AuthenticatedUser(HttpUser):
     """Simulates authenticated member browsing and voting."""
 
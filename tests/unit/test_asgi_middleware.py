@@ -0,0 +1,195 @@
+"""Tests for the plain-ASGI request middleware: security headers, correlation ID, metrics."""
+
+import asyncio
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from starlette.types import ASGIApp, Message
+
+from core.correlation_middleware import (
+    CORRELATION_ID_HEADER,
+    CorrelationIDMiddleware,
+    get_correlation_id,
+)
+from core.monitoring.metrics import registry
+from core.monitoring.middleware import MetricsMiddleware
+from core.security_middleware import SecurityHeadersMiddleware
+
+
+def _stack(app: ASGIApp, server_timing: bool = True) -> ASGIApp:
+    """The three middlewares in the order app_setup.create_app() nests them."""
+    return SecurityHeadersMiddleware(
+        CorrelationIDMiddleware(MetricsMiddleware(app, server_timing=server_timing))
+    )
+
+
+def _client(routes: List[Route], **kwargs: Any) -> TestClient:
+    return TestClient(_stack(Starlette(routes=routes)), **kwargs)
+
+
+def _sync_ids(request: Request) -> JSONResponse:
+    # Sync endpoints run in the threadpool; the context variable follows them.
+    return JSONResponse({"context": get_correlation_id(), "state": request.state.correlation_id})
+
+
+async def _async_ids(request: Request) -> JSONResponse:
+    return JSONResponse({"context": get_correlation_id()})
+
+
+def _boom(request: Request) -> PlainTextResponse:
+    raise RuntimeError("boom")
+
+
+class TestSecurityHeaders:
+    def test_headers(self):
+        response = _client([Route("/", _async_ids)]).get("/")
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert response.headers["X-XSS-Protection"] == "0"
+        assert response.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
+        assert response.headers["Permissions-Policy"] == "geolocation=(), microphone=(), camera=()"
+        csp = response.headers["Content-Security-Policy"]
+        assert csp.startswith("default-src 'self'; script-src 'self' ")
+        assert "'unsafe-inline'" not in csp.split("; ")[1]
+        assert "upgrade-insecure-requests" not in csp
+        assert "Strict-Transport-Security" not in response.headers
+
+    def test_https_behind_proxy(self):
+        response = _client([Route("/", _async_ids)]).get(
+            "/", headers={"X-Forwarded-Proto": "https"}
+        )
+        assert response.headers["Strict-Transport-Security"] == (
+            "max-age=31536000; includeSubDomains"
+        )
+        assert response.headers["Content-Security-Policy"].endswith("; upgrade-insecure-requests")
+
+    def test_replaces_headers_the_app_set(self):
+        def framed(request: Request) -> PlainTextResponse:
+            return PlainTextResponse("x", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+        response = _client([Route("/", framed)]).get("/")
+        assert response.headers.get_list("X-Frame-Options") == ["DENY"]
+
+
+class TestCorrelationId:
+    @pytest.mark.parametrize("endpoint", [_sync_ids, _async_ids])
+    def test_generated_and_visible_downstream(self, endpoint):
+        response = _client([Route("/", endpoint)]).get("/")
+        correlation_id = response.headers[CORRELATION_ID_HEADER]
+        assert uuid.UUID(correlation_id)
+        assert response.json()["context"] == correlation_id
+        assert get_correlation_id() is None
+
+    def test_client_id_honored(self):
+        response = _client([Route("/", _sync_ids)]).get(
+            "/", headers={CORRELATION_ID_HEADER: "trace-123"}
+        )
+        assert response.headers[CORRELATION_ID_HEADER] == "trace-123"
+        assert response.json() == {"context": "trace-123", "state": "trace-123"}
+
+    def test_unsafe_client_id_replaced(self):
+        response = _client([Route("/", _async_ids)]).get(
+            "/", headers={CORRELATION_ID_HEADER: "bad id\tinjected"}
+        )
+        assert response.headers[CORRELATION_ID_HEADER] != "bad id\tinjected"
+        assert uuid.UUID(response.headers[CORRELATION_ID_HEADER])
+
+
+class TestMetrics:
+    def _requests(self, path: str, status: str) -> float:
+        value = registry.get_sample_value(
+            "http_requests_total", {"method": "GET", "endpoint": path, "status": status}
+        )
+        return value or 0.0
+
+    def test_counts_status(self):
+        client = _client([Route("/ok-metric", _async_ids)])
+        before = self._requests("/ok-metric", "200")
+        response = client.get("/ok-metric")
+        assert self._requests("/ok-metric", "200") == before + 1
+        assert response.headers["Server-Timing"].startswith(
+            'db;dur=0.0;desc="0 queries", total;dur='
+        )
+
+    def test_unhandled_error_counts_as_500(self):
+        client = _client([Route("/boom-metric", _boom)], raise_server_exceptions=False)
+        before = self._requests("/boom-metric", "500")
+        assert client.get("/boom-metric").status_code == 500
+        assert self._requests("/boom-metric", "500") == before + 1
+
+
+def _scope(path: str) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+
+
+class TestStreaming:
+    def test_each_chunk_reaches_the_server_before_the_next_is_produced(self):
+        """Nothing between the app and the server holds chunks back.
+
+        BaseHTTPMiddleware ran the app in a separate task and relayed the
+        body through a memory stream per layer, so the app ran ahead of what
+        the server had been sent.
+        """
+        events: List[str] = []
+        seen_in_stream: List[Optional[str]] = []
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(3):
+                events.append(f"produced {i}")
+                seen_in_stream.append(get_correlation_id())
+                yield f"chunk {i}".encode()
+
+        async def endpoint(request: Request) -> StreamingResponse:
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        async def run() -> List[Message]:
+            app = _stack(Starlette(routes=[Route("/stream", endpoint)]))
+            messages: List[Message] = []
+            requested = False
+
+            async def receive() -> Message:
+                nonlocal requested
+                if not requested:
+                    requested = True
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                # Like a server, block until the client goes away.
+                await asyncio.Event().wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message: Message) -> None:
+                messages.append(message)
+                if message.get("body"):
+                    events.append(f"sent {message['body'].decode()[-1]}")
+
+            await app(_scope("/stream"), receive, send)
+            return messages
+
+        # A private loop, so the main thread's current loop is left alone.
+        loop = asyncio.new_event_loop()
+        try:
+            messages = loop.run_until_complete(run())
+        finally:
+            loop.close()
+        assert events == [f"{step} {i}" for i in range(3) for step in ("produced", "sent")]
+        # The correlation ID stays set while the body streams.
+        request_id = dict(messages[0]["headers"])[b"x-request-id"].decode()
+        assert seen_in_stream == [request_id] * 3
@@ -1,13 +1,14 @@
-"""Lint-style test enforcing ?v={{ asset_v }} on every app-owned static asset.
+"""Lint-style test enforcing asset_url() on every static script and stylesheet.
 
-Without the cache-bust query string, browsers happily serve stale JS/CSS
-after a deploy. We learned this the hard way when a Phase-4 inline-handler
+Without a versioned URL, browsers happily serve stale JS/CSS after a
+deploy. We learned this the hard way when a Phase-4 inline-handler
 migration looked correct in code but the admin-events page kept firing
 the pre-migration JS until a hard refresh — the templates had bare
 `<script src="/static/admin-events.js"></script>` tags.
 
-Vendored assets under /static/vendor/ are excluded because they're
-versioned by the package itself and rarely change.
+asset_url() (core/assets.py) gives each file a URL named by its content
+hash, so a bare /static/ or url_for('static', ...) link is the regression
+to catch. Vendored assets are included: they are fingerprinted the same way.
 """
 
 import re
@@ -39,45 +40,33 @@ def _iter_template_files() -> list[Path]:
     return [p for p in TEMPLATES_ROOT.rglob("*.html") if p.is_file()]
 
 
-def _has_cache_bust(line: str) -> bool:
-    return "asset_v" in line or "?v=" in line
-
-
-def _is_vendor(path: str) -> bool:
-    # Vendored assets are versioned by the upstream package; the SABC
-    # asset_v doesn't apply to them.
-    return path.startswith("vendor/")
+def _offenders(text: str, pattern: re.Pattern) -> list[tuple[int, str, str]]:
+    offenders: list[tuple[int, str, str]] = []
+    for match in pattern.finditer(text):
+        # Locate the line for a useful error message
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line_end = text.find("\n", match.end())
+        if line_end == -1:
+            line_end = len(text)
+        line_no = text.count("\n", 0, match.start()) + 1
+        offenders.append((line_no, match.group(1), text[line_start:line_end].strip()))
+    return offenders
 
 
 @pytest.mark.parametrize(
     "template", _iter_template_files(), ids=lambda p: str(p.relative_to(TEMPLATES_ROOT))
 )
-def test_static_scripts_have_cache_bust(template: Path) -> None:
-    """Every <script src="/static/..."> in a template must carry ?v={{ asset_v }}.
+def test_static_scripts_use_asset_url(template: Path) -> None:
+    """Every static <script> in a template must be linked with asset_url().
 
     Cached browsers were serving pre-migration JS after Phase 4 because
     several admin templates loaded their bundles without cache-bust.
     Locks the convention in so it can't regress silently.
     """
-    text = template.read_text()
-    offenders: list[tuple[int, str, str]] = []
-    for match in _STATIC_SCRIPT_PATTERN.finditer(text):
-        path = match.group(1)
-        if _is_vendor(path):
-            continue
-        # Locate the line for a useful error message
-        line_start = text.rfind("\n", 0, match.start()) + 1
-        line_end = text.find("\n", match.end())
-        if line_end == -1:
-            line_end = len(text)
-        line = text[line_start:line_end]
-        if not _has_cache_bust(line):
-            line_no = text.count("\n", 0, match.start()) + 1
-            offenders.append((line_no, path, line.strip()))
-
+    offenders = _offenders(template.read_text(), _STATIC_SCRIPT_PATTERN)
     assert not offenders, (
-        f"{template.relative_to(TEMPLATES_ROOT)}: static script tag(s) missing "
-        f"`?v={{{{ asset_v }}}}` cache-bust:\n"
+        f"{template.relative_to(TEMPLATES_ROOT)}: static script tag(s) not linked with "
+        f"`{{{{ asset_url('...') }}}}`:\n"
         + "\n".join(f"  L{ln}  /static/{p}\n    {line}" for ln, p, line in offenders)
     )
 
@@ -85,25 +74,25 @@ def test_static_scripts_have_cache_bust(template: Path) -> None:
 @pytest.mark.parametrize(
     "template", _iter_template_files(), ids=lambda p: str(p.relative_to(TEMPLATES_ROOT))
 )
-def test_static_stylesheets_have_cache_bust(template: Path) -> None:
+def test_static_stylesheets_use_asset_url(template: Path) -> None:
     """Same rule as scripts, applied to CSS link tags."""
-    text = template.read_text()
-    offenders: list[tuple[int, str, str]] = []
-    for match in _STATIC_CSS_PATTERN.finditer(text):
-        path = match.group(1)
-        if _is_vendor(path):
-            continue
-        line_start = text.rfind("\n", 0, match.start()) + 1
-        line_end = text.find("\n", match.end())
-        if line_end == -1:
-            line_end = len(text)
-        line = text[line_start:line_end]
-        if not _has_cache_bust(line):
-            line_no = text.count("\n", 0, match.start()) + 1
-            offenders.append((line_no, path, line.strip()))
-
+    offenders = _offenders(template.read_text(), _STATIC_CSS_PATTERN)
     assert not offenders, (
-        f"{template.relative_to(TEMPLATES_ROOT)}: static stylesheet(s) missing "
-        f"`?v={{{{ asset_v }}}}` cache-bust:\n"
+        f"{template.relative_to(TEMPLATES_ROOT)}: static stylesheet(s) not linked with "
+        f"`{{{{ asset_url('...') }}}}`:\n"
         + "\n".join(f"  L{ln}  /static/{p}\n    {line}" for ln, p, line in offenders)
     )
+
+
+@pytest.mark.parametrize(
+    "template", _iter_template_files(), ids=lambda p: str(p.relative_to(TEMPLATES_ROOT))
+)
+def test_asset_url_names_existing_files(template: Path) -> None:
+    """A typo in asset_url('...') would otherwise only show up as a 404 in the browser."""
+    static_root = TEMPLATES_ROOT.parent / "static"
+    missing = [
+        name
+        for name in re.findall(r"asset_url\(['\"]([^'\"]+)['\"]\)", template.read_text())
+        if not (static_root / name).is_file()
+    ]
+    assert not missing, f"{template.relative_to(TEMPLATES_ROOT)}: no such static file(s): {missing}"
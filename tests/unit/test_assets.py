@@ -0,0 +1,154 @@
+"""Tests for the content-hashed static asset build (core/assets.py)."""
+
+import gzip
+import json
+from pathlib import Path
+
+import brotli
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from core import assets
+
+
+@pytest.fixture
+def static_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    static = tmp_path / "static"
+    (static / "vendor" / "fonts").mkdir(parents=True)
+    (static / "app.js").write_text("console.log('hello');\n" * 50)
+    (static / "logo.png").write_bytes(b"\x89PNG not really")
+    (static / "vendor" / "fonts" / "icons.woff2").write_bytes(b"font v1")
+    (static / "vendor" / "icons.css").write_text(
+        '@font-face { src: url("./fonts/icons.woff2?v3.4") format("woff2"); }\n'
+        '.x { background: url("data:image/svg+xml,%3csvg%3e"); }\n' * 20
+    )
+    monkeypatch.setattr(assets, "STATIC_DIR", str(static))
+    return static
+
+
+def _manifest(static_dir: Path) -> dict:
+    return json.loads((static_dir / "dist" / "manifest.json").read_text())
+
+
+class TestBuild:
+    def test_fingerprints_and_precompresses(self, static_dir: Path):
+        counts = assets.build_assets(str(static_dir))
+        manifest = _manifest(static_dir)
+        assert counts["assets"] == len(manifest) == 4
+        dist = static_dir / "dist"
+
+        hashed = manifest["app.js"]
+        assert hashed.startswith("app.") and hashed.endswith(".js") and hashed != "app.js"
+        original = (static_dir / "app.js").read_bytes()
+        assert (dist / hashed).read_bytes() == original
+        assert gzip.decompress((dist / f"{hashed}.gz").read_bytes()) == original
+        assert brotli.decompress((dist / f"{hashed}.br").read_bytes()) == original
+        # Images are already compressed
+        assert not (dist / f"{manifest['logo.png']}.gz").exists()
+
+    def test_unchanged_files_keep_their_urls_across_builds(self, static_dir: Path):
+        assets.build_assets(str(static_dir))
+        before = _manifest(static_dir)
+
+        (static_dir / "app.js").write_text("console.log('changed');\n")
+        counts = assets.build_assets(str(static_dir))
+        after = _manifest(static_dir)
+
+        assert after["app.js"] != before["app.js"]
+        assert {k: v for k, v in after.items() if k != "app.js"} == {
+            k: v for k, v in before.items() if k != "app.js"
+        }
+        assert counts["written"] == 1  # app.js is too small for .gz/.br to help
+        # The old file stays for pages rendered before the deploy
+        assert (static_dir / "dist" / before["app.js"]).exists()
+
+    def test_stylesheet_urls_point_at_hashed_files(self, static_dir: Path):
+        assets.build_assets(str(static_dir))
+        manifest = _manifest(static_dir)
+        css = (static_dir / "dist" / manifest["vendor/icons.css"]).read_text()
+        font = Path(manifest["vendor/fonts/icons.woff2"]).name
+        assert f'url("fonts/{font}")' in css
+        assert 'url("data:image/svg+xml,%3csvg%3e")' in css
+
+        # A new font version gives the stylesheet a new URL too.
+        (static_dir / "vendor" / "fonts" / "icons.woff2").write_bytes(b"font v2")
+        assets.build_assets(str(static_dir))
+        assert _manifest(static_dir)["vendor/icons.css"] != manifest["vendor/icons.css"]
+
+    def test_prune_removes_files_from_earlier_builds(self, static_dir: Path):
+        assets.build_assets(str(static_dir))
+        old = _manifest(static_dir)["app.js"]
+        (static_dir / "app.js").write_text("console.log('changed');\n" * 50)
+
+        counts = assets.build_assets(str(static_dir), prune=True)
+        assert counts["pruned"] == 3  # old app.js and its .gz and .br
+        assert not (static_dir / "dist" / old).exists()
+        assert (static_dir / "dist" / _manifest(static_dir)["app.js"]).exists()
+
+
+class TestAssetUrl:
+    def test_resolves_through_the_manifest(self, static_dir: Path):
+        assets.build_assets(str(static_dir))
+        hashed = _manifest(static_dir)["app.js"]
+        assert assets.asset_url("app.js") == f"/static/dist/{hashed}"
+        assert assets.asset_url("/app.js") == f"/static/dist/{hashed}"
+
+    def test_falls_back_to_a_content_version_without_a_build(self, static_dir: Path):
+        url = assets.asset_url("app.js")
+        assert url.startswith("/static/app.js?v=")
+        assert assets.asset_url("app.js") == url
+
+        (static_dir / "app.js").write_text("console.log('changed');\n")
+        assert assets.asset_url("app.js") != url
+
+    def test_unknown_asset(self, static_dir: Path):
+        assert assets.asset_url("missing.js") == "/static/missing.js"
+
+
+class TestPrecompressedStaticFiles:
+    @pytest.fixture
+    def client(self, static_dir: Path) -> TestClient:
+        assets.build_assets(str(static_dir))
+        app = Starlette(
+            routes=[
+                Mount(
+                    "/static",
+                    assets.PrecompressedStaticFiles(directory=str(static_dir)),
+                    name="static",
+                )
+            ]
+        )
+        return TestClient(app)
+
+    def _get(self, client: TestClient, path: str, accept_encoding: str):
+        # httpx would otherwise advertise (and transparently decode) encodings itself.
+        return client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+    @pytest.mark.parametrize(
+        "accept_encoding, served",
+        [
+            ("gzip, deflate, br", "br"),
+            ("gzip", "gzip"),
+            ("br;q=0, gzip;q=0.5", "gzip"),
+            ("identity", None),
+        ],
+    )
+    def test_serves_the_best_accepted_encoding(
+        self, client: TestClient, static_dir: Path, accept_encoding: str, served
+    ):
+        path = f"/static/dist/{_manifest(static_dir)['app.js']}"
+        response = self._get(client, path, accept_encoding)
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == served
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["cache-control"] == assets.IMMUTABLE
+        assert response.content == (static_dir / "app.js").read_bytes()
+
+    def test_unhashed_files_are_not_immutable(self, client: TestClient):
+        response = self._get(client, "/static/app.js", "gzip")
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers  # no sibling outside dist/
+        assert "cache-control" not in response.headers
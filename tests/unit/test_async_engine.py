@@ -0,0 +1,77 @@
+"""Unit tests for the optional async engine path."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app_setup
+from core.db_schema.async_engine import async_database_url
+from core.query_service.async_base import AsyncQueryServiceBase
+
+
+class TestAsyncDatabaseUrl:
+    def test_postgres_uses_asyncpg(self):
+        assert (
+            async_database_url("postgresql://user:pw@db:5432/sabc")
+            == "postgresql+asyncpg://user:pw@db:5432/sabc"
+        )
+
+    def test_explicit_sync_driver_is_replaced(self):
+        assert async_database_url("postgresql+psycopg2://db/sabc") == (
+            "postgresql+asyncpg://db/sabc"
+        )
+
+    def test_sslmode_becomes_ssl(self):
+        assert async_database_url("postgresql://db/sabc?sslmode=require") == (
+            "postgresql+asyncpg://db/sabc?ssl=require"
+        )
+
+    def test_sqlite_uses_aiosqlite(self):
+        assert async_database_url("sqlite:///test.db") == "sqlite+aiosqlite:///test.db"
+
+    def test_unsupported_backend_is_rejected(self):
+        with pytest.raises(ValueError, match="No async driver"):
+            async_database_url("mysql://db/sabc")
+
+
+class TestLifespan:
+    def test_app_shutdown_disposes_the_async_engine(self, monkeypatch: pytest.MonkeyPatch):
+        disposed = []
+
+        async def dispose() -> None:
+            disposed.append(1)
+
+        monkeypatch.setattr(app_setup, "dispose_async_engine", dispose)
+        with TestClient(app_setup.create_app()):
+            assert disposed == []
+        assert disposed == [1]
+
+
+class TestAsyncQueryServiceBase:
+    def _run(self, coro):
+        # A private loop, so the main thread's current loop is left alone.
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def test_fetch_helpers(self):
+        async def query():
+            engine = create_async_engine("sqlite+aiosqlite://")
+            async with engine.connect() as conn:
+                qs = AsyncQueryServiceBase(conn)
+                rows = await qs.fetch_all("SELECT 1 AS a UNION ALL SELECT 2 ORDER BY a")
+                one = await qs.fetch_one("SELECT :v AS v", {"v": 7})
+                missing = await qs.fetch_one("SELECT 1 WHERE 1 = 0")
+                value = await qs.fetch_value("SELECT 42")
+            await engine.dispose()
+            return rows, one, missing, value
+
+        rows, one, missing, value = self._run(query())
+        assert rows == [{"a": 1}, {"a": 2}]
+        assert one == {"v": 7}
+        assert missing is None
+        assert value == 42
@@ -0,0 +1,259 @@
+"""Unit tests for the single-pass /data dashboard derivations.
+
+Facts are built by hand so each section can be checked against the SQL
+semantics it mirrors (see core/query_service/dashboard_facts.py).
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+import pytest
+from sqlalchemy import create_engine
+
+from core.query_service.dashboard_facts import (
+    DASHBOARD_SECTIONS,
+    DashboardFacts,
+    derive_dashboard,
+)
+from core.query_service.data_queries import DataQueries
+
+
+def _tournament(
+    tid: int, when: date, lake_id: Optional[int] = 1, fish_limit: int = 5
+) -> Dict[str, Any]:
+    return {
+        "id": tid,
+        "fish_limit": fish_limit,
+        "year": when.year,
+        "date": when,
+        "lake_id": lake_id,
+        "lake_name": f"Lake {lake_id}" if lake_id else None,
+    }
+
+
+def _result(tid: int, angler_id: int, fish: int, weight: str, **flags: Any) -> Dict[str, Any]:
+    return {
+        "tournament_id": tid,
+        "angler_id": angler_id,
+        "num_fish": fish,
+        "total_weight": Decimal(weight),
+        "disqualified": flags.get("disqualified", False),
+        "was_member": flags.get("was_member", True),
+    }
+
+
+def _angler_row(
+    tid: int, angler_id: int, fish: int, weight: str, big_bass: str = "0", **flags: Any
+) -> Dict[str, Any]:
+    return {
+        **_result(tid, angler_id, fish, weight, **flags),
+        "angler_name": f"Angler {angler_id}",
+        "big_bass_weight": Decimal(big_bass),
+    }
+
+
+@pytest.fixture
+def facts() -> DashboardFacts:
+    """Two years; 2025 individual format, 2026 one team-format tournament."""
+    return DashboardFacts(
+        tournaments={
+            1: _tournament(1, date(2025, 2, 10)),
+            2: _tournament(2, date(2025, 6, 10), lake_id=2),
+            3: _tournament(3, date(2026, 3, 14)),
+        },
+        results=[
+            _result(1, 10, 5, "12.50"),
+            _result(1, 11, 0, "0", was_member=False),
+            _result(1, 12, 0, "0", disqualified=True),
+            _result(2, 10, 3, "7.00"),
+        ],
+        team_results=[
+            {
+                "tournament_id": 3,
+                "angler1_id": 10,
+                "angler2_id": 11,
+                "num_fish": 5,
+                "total_weight": Decimal("15.00"),
+                "angler1_member": True,
+                "angler2_member": False,
+            },
+        ],
+        angler_rows=[
+            _angler_row(1, 10, 5, "12.50", "4.25"),
+            _angler_row(1, 11, 0, "0", was_member=False),
+            _angler_row(1, 12, 0, "0", disqualified=True),
+            _angler_row(2, 10, 3, "7.00", "3.00"),
+            _angler_row(3, 10, 5, "15.00", "5.50"),
+            _angler_row(3, 11, 0, "0"),
+        ],
+        boat_rows=[
+            {"tournament_id": 1, "total_weight": Decimal("12.50"), "place_finish": None},
+            {"tournament_id": 2, "total_weight": Decimal("7.00"), "place_finish": None},
+            {"tournament_id": 3, "total_weight": Decimal("15.00"), "place_finish": 1},
+        ],
+        cancelled_events=[{"year": 2025, "date": date(2025, 4, 1), "lake_name": "Cancelled"}],
+        current_members=7,
+    )
+
+
+class TestDeriveDashboard:
+    def test_returns_every_section(self, facts):
+        assert tuple(derive_dashboard(facts)) == DASHBOARD_SECTIONS
+
+    def test_decimals_become_floats(self, facts):
+        overview = derive_dashboard(facts)["overview_stats"]
+        assert overview["total_weight"] == 34.5
+        assert isinstance(overview["total_weight"], float)
+
+    def test_overview(self, facts):
+        assert derive_dashboard(facts)["overview_stats"] == {
+            "total_tournaments": 3,
+            "unique_anglers": 3,
+            "total_fish": 13,
+            "total_weight": 34.5,
+            "current_members": 7,
+            "first_year": 2025,
+            "last_year": 2026,
+        }
+
+    def test_ytd_window_is_through_the_latest_month(self, facts):
+        dashboard = derive_dashboard(facts)
+        # 2026's latest tournament is in March, so 2025's June event is excluded.
+        assert [(t["year"], t["total_fish"]) for t in dashboard["ytd_trends"]] == [
+            (2025, 5),
+            (2026, 5),
+        ]
+        comparison = dashboard["year_comparison"]
+        assert comparison["current_year"] == 2026
+        assert comparison["prev_year"] == 2025
+        assert comparison["current_anglers"] == 2
+        assert comparison["prev_avg_weight"] == pytest.approx(12.5 / 3)
+        assert comparison["through_month"] == 3.0
+
+    def test_lake_statistics(self, facts):
+        lakes = derive_dashboard(facts)["lake_statistics"]
+        assert [lake["lake_name"] for lake in lakes] == ["Lake 1", "Lake 2"]
+        lake_1 = lakes[0]
+        assert lake_1["times_fished"] == 2
+        assert lake_1["last_fished"] == date(2026, 3, 14)
+        assert lake_1["total_limits"] == 2
+        # The DQ'd zero is not a zero.
+        assert lake_1["total_zeros"] == 2
+        assert lake_1["biggest_bass"] == 5.5
+
+    def test_limits_zeros_fall_back_to_team_results(self, facts):
+        assert derive_dashboard(facts)["limits_zeros_by_year"] == [
+            {"year": 2025, "total_entries": 4, "limits": 1, "zeros": 1},
+            {"year": 2026, "total_entries": 1, "limits": 1, "zeros": 0},
+        ]
+
+    def test_big_bass_records_skip_zero_and_respect_limit(self, facts):
+        records = derive_dashboard(facts, big_bass_limit=2)["big_bass_records"]
+        assert [(r["angler_name"], r["big_bass_weight"]) for r in records] == [
+            ("Angler 10", 5.5),
+            ("Angler 10", 4.25),
+        ]
+
+    def test_membership_counts_distinct_anglers(self, facts):
+        assert derive_dashboard(facts)["membership_by_year"] == [
+            {"year": 2025, "member_count": 2, "guest_count": 1, "total_anglers": 3},
+            {"year": 2026, "member_count": 2, "guest_count": 0, "total_anglers": 2},
+        ]
+
+    def test_weight_trends(self, facts):
+        trends = derive_dashboard(facts)["weight_trends"]
+        assert trends[0]["avg_individual_weight"] == pytest.approx(19.5 / 4)
+        assert trends[0]["avg_tournament_total_weight"] == pytest.approx(19.5 / 2)
+        assert trends[1]["max_individual_weight"] == 15.0
+
+    def test_winning_weights(self, facts):
+        dashboard = derive_dashboard(facts)
+        by_year = dashboard["winning_weights_by_year"]
+        assert by_year[0] == {"year": 2025, "avg_1st": 9.75, "avg_2nd": None, "avg_3rd": None}
+        by_lake = dashboard["winning_weights_by_lake"]
+        assert [(r["lake_name"], r["tournament_count"]) for r in by_lake] == [
+            ("Lake 1", 2),
+            ("Lake 2", 1),
+        ]
+        by_lake_year = dashboard["winning_weights_by_lake_year"]
+        assert [(r["year"], r["lake_name"]) for r in by_lake_year] == [
+            (2026, "Lake 1"),
+            (2025, "Lake 1"),
+            (2025, "Lake 2"),
+        ]
+
+    def test_place_finish_overrides_weight_rank(self, facts):
+        facts.boat_rows = [
+            {"tournament_id": 1, "total_weight": Decimal("20.00"), "place_finish": 2},
+            {"tournament_id": 1, "total_weight": Decimal("10.00"), "place_finish": 1},
+        ]
+        row = derive_dashboard(facts)["winning_weights_by_year"][0]
+        assert (row["avg_1st"], row["avg_2nd"]) == (10.0, 20.0)
+
+    def test_null_avg_1st_sorts_first_like_postgres(self, facts):
+        facts.boat_rows = [
+            {"tournament_id": 1, "total_weight": Decimal("12.50"), "place_finish": None},
+            {"tournament_id": 2, "total_weight": Decimal("7.00"), "place_finish": 2},
+        ]
+        by_lake = derive_dashboard(facts)["winning_weights_by_lake"]
+        assert [(r["lake_name"], r["avg_1st"]) for r in by_lake] == [
+            ("Lake 2", None),
+            ("Lake 1", 12.5),
+        ]
+
+    def test_participation_includes_team_anglers_and_cancellations(self, facts):
+        assert derive_dashboard(facts)["tournament_participation"] == [
+            {
+                "tournament_id": 1,
+                "year": 2025,
+                "tournament_date": "2025-02-10",
+                "lake_name": "Lake 1",
+                "participants": 3,
+                "members": 2,
+                "guests": 1,
+            },
+            {
+                "tournament_id": None,
+                "year": 2025,
+                "tournament_date": "2025-04-01",
+                "lake_name": "Cancelled",
+                "participants": 0,
+                "members": 0,
+                "guests": 0,
+            },
+            {
+                "tournament_id": 2,
+                "year": 2025,
+                "tournament_date": "2025-06-10",
+                "lake_name": "Lake 2",
+                "participants": 1,
+                "members": 1,
+                "guests": 0,
+            },
+            {
+                "tournament_id": 3,
+                "year": 2026,
+                "tournament_date": "2026-03-14",
+                "lake_name": "Lake 1",
+                "participants": 2,
+                "members": 1,
+                "guests": 1,
+            },
+        ]
+
+    def test_no_completed_tournaments(self):
+        dashboard = derive_dashboard(DashboardFacts())
+        assert dashboard["available_years"] == []
+        assert dashboard["overview_stats"]["total_weight"] == 0
+        # The SQL still returns its one row, all NULL.
+        assert set(dashboard["year_comparison"].values()) == {None}
+        assert dashboard["ytd_trends"] == []
+        assert dashboard["tournament_participation"] == []
+
+
+class TestGetDashboardEngine:
+    def test_unknown_engine_is_rejected(self):
+        with create_engine("sqlite://").connect() as conn:
+            with pytest.raises(ValueError, match="Unknown dashboard engine"):
+                DataQueries(conn).get_dashboard(engine="nope")
@@ -0,0 +1,126 @@
+"""Unit tests for the /data dashboard query cache."""
+
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from core.monitoring.metrics import registry
+from core.query_service import data_cache
+from core.query_service.data_cache import (
+    CachedDataQueries,
+    bump_results_generation,
+    invalidate_on_commit,
+    results_generation,
+)
+
+
+class _FakeQueries:
+    """Counts calls per getter; stands in for a QueryService."""
+
+    def __init__(self) -> None:
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, name: str) -> int:
+        self.calls[name] = self.calls.get(name, 0) + 1
+        return self.calls[name]
+
+    def get_club_overview_stats(self) -> Dict[str, Any]:
+        return {"call": self._count("overview")}
+
+    def get_big_bass_records(self, limit: int = 10) -> List[int]:
+        self._count("big_bass")
+        return list(range(limit))
+
+    def fetch_all(self, query: str, params: Dict[str, Any]) -> List[Any]:
+        self._count("fetch_all")
+        return []
+
+
+def _samples(query: str, result: str) -> float:
+    value = registry.get_sample_value(
+        "data_cache_requests_total", {"query": query, "result": result}
+    )
+    return value or 0.0
+
+
+@pytest.fixture(autouse=True)
+def enabled_cache(monkeypatch):
+    monkeypatch.setattr(data_cache, "DATA_CACHE_ENABLED", True)
+    data_cache._reset_cache_for_test()
+    yield
+    data_cache._reset_cache_for_test()
+
+
+class TestDataCache:
+    def test_second_call_is_a_hit(self):
+        fake = _FakeQueries()
+        cached = CachedDataQueries(fake)  # type: ignore[arg-type]
+        hits_before = _samples("get_club_overview_stats", "hit")
+
+        assert cached.get_club_overview_stats() == {"call": 1}
+        assert cached.get_club_overview_stats() == {"call": 1}
+        assert fake.calls["overview"] == 1
+        assert _samples("get_club_overview_stats", "hit") == hits_before + 1
+
+    def test_arguments_are_part_of_the_key(self):
+        fake = _FakeQueries()
+        cached = CachedDataQueries(fake)  # type: ignore[arg-type]
+        assert cached.get_big_bass_records(limit=3) == [0, 1, 2]
+        assert cached.get_big_bass_records(limit=5) == [0, 1, 2, 3, 4]
+        assert cached.get_big_bass_records(limit=3) == [0, 1, 2]
+        assert fake.calls["big_bass"] == 2
+
+    def test_non_getters_pass_through(self):
+        fake = _FakeQueries()
+        cached = CachedDataQueries(fake)  # type: ignore[arg-type]
+        cached.fetch_all("SELECT 1", {})
+        cached.fetch_all("SELECT 1", {})
+        assert fake.calls["fetch_all"] == 2
+
+    def test_generation_bump_invalidates(self):
+        fake = _FakeQueries()
+        cached = CachedDataQueries(fake)  # type: ignore[arg-type]
+        cached.get_club_overview_stats()
+        generation = results_generation()
+        bump_results_generation()
+        assert results_generation() == generation + 1
+        assert cached.get_club_overview_stats() == {"call": 2}
+
+    def test_ttl_expiry(self, monkeypatch):
+        fake = _FakeQueries()
+        cached = CachedDataQueries(fake)  # type: ignore[arg-type]
+        cached.get_club_overview_stats()
+        monkeypatch.setattr(data_cache, "DATA_CACHE_TTL", 0.0)
+        assert cached.get_club_overview_stats() == {"call": 2}
+
+    def test_value_computed_across_a_bump_is_not_stored(self):
+        fake = _FakeQueries()
+
+        def compute() -> int:
+            bump_results_generation()  # a write lands mid-computation
+            return fake._count("racy")
+
+        assert data_cache.get_or_compute("racy", "racy", compute) == 1
+        assert data_cache.get_or_compute("racy", "racy", compute) == 2
+
+    def test_disabled_cache_always_computes(self, monkeypatch):
+        monkeypatch.setattr(data_cache, "DATA_CACHE_ENABLED", False)
+        fake = _FakeQueries()
+        cached = CachedDataQueries(fake)  # type: ignore[arg-type]
+        cached.get_club_overview_stats()
+        cached.get_club_overview_stats()
+        assert fake.calls["overview"] == 2
+
+    def test_invalidate_on_commit_bumps_again_at_commit(self):
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            generation = results_generation()
+            invalidate_on_commit(conn)
+            assert results_generation() == generation + 1
+            conn.commit()
+            assert results_generation() == generation + 2
+            conn.execute(text("SELECT 1"))
+            conn.commit()  # listener is once-only
+            assert results_generation() == generation + 2
@@ -0,0 +1,272 @@
+"""Tests for the background NWS forecast refresh (core/forecast_prefetcher.py)."""
+
+import asyncio
+import json
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import app_setup
+from core.db_schema import Lake
+from core.forecast_prefetcher import (
+    ForecastPrefetcher,
+    forecast_locations,
+    load_forecast_file,
+    save_forecast_file,
+)
+from core.helpers import poll_day_info
+from core.helpers.poll_day_info import (
+    AUSTIN,
+    AUSTIN_TZ,
+    forecast_fetched_at,
+    get_weather,
+    store_forecast,
+)
+from core.monitoring.metrics import registry
+from tests.fake_nws import FakeNWS
+
+TARGET = date(2026, 5, 10)
+TRAVIS = (30.3916, -97.9079)
+BUCHANAN = (30.7502, -98.4184)
+
+
+def _periods(high: int = 82):
+    return [
+        {
+            "startTime": datetime(2026, 5, 10, 6, tzinfo=AUSTIN_TZ).isoformat(),
+            "isDaytime": True,
+            "temperature": high,
+            "temperatureUnit": "F",
+            "shortForecast": "Sunny",
+        },
+        {
+            "startTime": datetime(2026, 5, 10, 19, tzinfo=AUSTIN_TZ).isoformat(),
+            "isDaytime": False,
+            "temperature": 66,
+            "temperatureUnit": "F",
+            "shortForecast": "Clear",
+        },
+    ]
+
+
+def _refreshes(result: str) -> float:
+    return registry.get_sample_value("nws_forecast_refresh_total", {"result": result}) or 0.0
+
+
+def _run(coro):
+    # A private loop, so the main thread's current loop is left alone.
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    poll_day_info._reset_caches_for_test()
+    yield
+    poll_day_info._reset_caches_for_test()
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> str:
+    return str(tmp_path / "forecast.json")
+
+
+def _refresh(fake_nws: FakeNWS, cache_path: str, times: int = 1, **kw) -> list:
+    kw.setdefault("locations", lambda: [AUSTIN])
+
+    async def run() -> list:
+        prefetcher = ForecastPrefetcher(base_url=fake_nws.base_url, cache_path=cache_path, **kw)
+        try:
+            return [await prefetcher.refresh() for _ in range(times)]
+        finally:
+            await prefetcher.stop()
+
+    return _run(run())
+
+
+class TestRefresh:
+    def test_populates_the_cache_and_the_file(self, fake_nws: FakeNWS, cache_path: str):
+        fake_nws.periods = _periods()
+        ok_before = _refreshes("ok")
+        assert _refresh(fake_nws, cache_path) == [0]
+        assert get_weather(TARGET)["high"] == 82
+        assert _refreshes("ok") == ok_before + 1
+        with open(cache_path) as f:
+            (saved,) = json.load(f)["forecasts"]
+        assert (saved["latitude"], saved["longitude"]) == AUSTIN
+        assert saved["periods"] == fake_nws.periods
+
+    def test_fresh_forecasts_are_not_refetched(self, fake_nws: FakeNWS, cache_path: str):
+        fake_nws.periods = _periods()
+        assert _refresh(fake_nws, cache_path, times=2) == [0, 0]
+        assert len(fake_nws.requests) == 2  # points + forecast, once
+
+    def test_gridpoint_lookup_is_reused(self, fake_nws: FakeNWS, cache_path: str):
+        fake_nws.periods = _periods()
+        assert _refresh(fake_nws, cache_path, times=2, refresh_seconds=0) == [0, 0]
+        assert [path.split("/")[1] for path in fake_nws.requests] == [
+            "points",
+            "gridpoints",
+            "gridpoints",
+        ]
+
+    def test_failure_keeps_serving_the_last_forecast(self, fake_nws: FakeNWS, cache_path: str):
+        fake_nws.periods = _periods()
+        _refresh(fake_nws, cache_path)
+        fetched_at = forecast_fetched_at()
+
+        fake_nws.status = 503
+        errors_before = _refreshes("error")
+        assert _refresh(fake_nws, cache_path, refresh_seconds=0) == [1]
+        assert _refreshes("error") == errors_before + 1
+        assert forecast_fetched_at() == fetched_at
+        assert get_weather(TARGET)["high"] == 82
+
+    def test_timeout_counts_as_a_failure(self, fake_nws: FakeNWS, cache_path: str):
+        fake_nws.periods = _periods()
+        fake_nws.delay = 0.5
+        started = time.perf_counter()
+        assert _refresh(fake_nws, cache_path, timeout=0.1) == [1]
+        assert time.perf_counter() - started < 0.5
+        assert get_weather(TARGET) is None
+
+    def test_request_path_never_fetches(self, fake_nws: FakeNWS):
+        fake_nws.periods = _periods()
+        assert get_weather(TARGET) is None
+        assert fake_nws.requests == []
+
+
+class TestPerLake:
+    def test_each_lake_gets_its_own_forecast(self, fake_nws: FakeNWS, cache_path: str):
+        fake_nws.periods = _periods()
+        fake_nws.forecasts = {TRAVIS: _periods(high=91), BUCHANAN: _periods(high=95)}
+        locations = [AUSTIN, TRAVIS, BUCHANAN]
+        assert _refresh(fake_nws, cache_path, locations=lambda: locations) == [0]
+        assert [get_weather(TARGET, loc)["high"] for loc in locations] == [82, 91, 95]
+
+    def test_lakes_are_fetched_concurrently_within_the_bound(
+        self, fake_nws: FakeNWS, cache_path: str
+    ):
+        fake_nws.periods = _periods()
+        fake_nws.delay = 0.1
+        locations = [AUSTIN] + [(30.0 + i / 10, -98.0) for i in range(5)]
+        started = time.perf_counter()
+        _refresh(fake_nws, cache_path, locations=lambda: locations, max_concurrency=3)
+        elapsed = time.perf_counter() - started
+        # 12 requests at 0.1s each: serially 1.2s, three at a time ~0.4s.
+        assert fake_nws.max_in_flight == 3
+        assert elapsed < 1.0
+        assert all(get_weather(TARGET, loc) for loc in locations)
+
+    def test_one_failing_lake_does_not_block_the_rest(self, fake_nws: FakeNWS, cache_path: str):
+        fake_nws.periods = _periods()
+        new_lake = (30.5, -98.1)
+        fake_nws.forecasts = {TRAVIS: _periods(high=91)}
+        locations = [AUSTIN, TRAVIS]
+        assert _refresh(fake_nws, cache_path, locations=lambda: locations) == [0]
+        assert get_weather(TARGET, TRAVIS)["high"] == 91
+
+        # Only the new lake is due, and its failure leaves the others alone.
+        fake_nws.status = 503
+        assert _refresh(fake_nws, cache_path, locations=lambda: [*locations, new_lake]) == [1]
+        assert get_weather(TARGET, TRAVIS)["high"] == 91
+
+    def test_removed_lakes_are_forgotten(self, fake_nws: FakeNWS, cache_path: str):
+        store_forecast(TRAVIS, _periods(), datetime.now(timezone.utc))
+        fake_nws.periods = _periods()
+        _refresh(fake_nws, cache_path)
+        assert poll_day_info.cached_forecasts().keys() == {AUSTIN}
+
+    def test_locations_come_from_lake_coordinates(self, db_session: Session):
+        db_session.add_all(
+            [
+                Lake(
+                    yaml_key="travis", display_name="Travis", latitude=30.391623, longitude=-97.9079
+                ),
+                Lake(yaml_key="twin", display_name="Twin", latitude=30.3916, longitude=-97.9079),
+                Lake(yaml_key="unknown", display_name="Unknown"),
+            ]
+        )
+        db_session.commit()
+        assert forecast_locations() == sorted([AUSTIN, TRAVIS])
+
+
+class TestPersistence:
+    def test_restart_serves_the_saved_forecasts(self, cache_path: str):
+        now = datetime.now(timezone.utc)
+        store_forecast(AUSTIN, _periods(high=91), now)
+        store_forecast(TRAVIS, _periods(high=93), now)
+        save_forecast_file(cache_path)
+        poll_day_info._reset_caches_for_test()
+
+        assert load_forecast_file(cache_path) == 2
+        assert get_weather(TARGET)["high"] == 91
+        assert get_weather(TARGET, TRAVIS)["high"] == 93
+
+    def test_saved_age_is_kept(self, cache_path: str):
+        fetched_at = datetime.now(timezone.utc) - timedelta(hours=13)
+        store_forecast(AUSTIN, _periods(), fetched_at)
+        save_forecast_file(cache_path)
+        poll_day_info._reset_caches_for_test()
+
+        assert load_forecast_file(cache_path) == 1
+        assert forecast_fetched_at() == fetched_at
+        assert get_weather(TARGET) is None  # older than FORECAST_MAX_AGE
+
+    def test_concurrent_saves_leave_a_whole_file(self, cache_path: str):
+        now = datetime.now(timezone.utc)
+        for offset in range(50):
+            store_forecast((30.0 + offset / 100, -97.0), _periods(), now)
+
+        async def save_from_workers() -> None:
+            await asyncio.gather(
+                *(asyncio.to_thread(save_forecast_file, cache_path) for _ in range(8))
+            )
+
+        asyncio.run(save_from_workers())
+        poll_day_info._reset_caches_for_test()
+
+        assert load_forecast_file(cache_path) == 50
+        assert [p.name for p in Path(cache_path).parent.iterdir() if p.suffix == ".tmp"] == []
+
+    def test_missing_or_corrupt_file(self, cache_path: str):
+        assert load_forecast_file(cache_path) == 0
+        with open(cache_path, "w") as f:
+            f.write("{not json")
+        assert load_forecast_file(cache_path) == 0
+
+
+class TestMetrics:
+    def test_forecast_age_gauge(self, fake_nws: FakeNWS, cache_path: str):
+        assert registry.get_sample_value("nws_forecast_age_seconds") == float("inf")
+        fake_nws.periods = _periods()
+        _refresh(fake_nws, cache_path)
+        assert 0 <= registry.get_sample_value("nws_forecast_age_seconds") < 5
+
+
+class TestLifecycle:
+    def test_app_lifespan_runs_the_prefetcher(
+        self, monkeypatch: pytest.MonkeyPatch, fake_nws: FakeNWS, cache_path: str
+    ):
+        fake_nws.periods = _periods()
+        monkeypatch.setenv("NWS_PREFETCH_ENABLED", "true")
+        monkeypatch.setattr(
+            app_setup,
+            "ForecastPrefetcher",
+            lambda: ForecastPrefetcher(
+                base_url=fake_nws.base_url, cache_path=cache_path, locations=lambda: [AUSTIN]
+            ),
+        )
+        with TestClient(app_setup.create_app()):
+            for _ in range(200):
+                if get_weather(TARGET):
+                    break
+                time.sleep(0.01)
+        assert get_weather(TARGET)["high"] == 82
@@ -0,0 +1,168 @@
+"""Tests for the single-decode upload pipeline (core/photo_processing.py)."""
+
+import asyncio
+import hashlib
+import io
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from core import photo_processing
+from core.photo_processing import (
+    ImageTooLargeError,
+    InvalidImageError,
+    _decode,
+    describe_image,
+    process_photo,
+    render_variant,
+    run_in_photo_pool,
+    shutdown_photo_pool,
+)
+
+PHONE_SIZE = (4032, 3024)  # 12 MP, as shot by most phones
+ORIENTATION = 0x0112
+ROTATE_90_CW = 6
+
+
+def _jpeg(size=PHONE_SIZE, orientation=None) -> bytes:
+    img = Image.new("RGB", size, (40, 90, 160))
+    exif = Image.Exif()
+    if orientation:
+        exif[ORIENTATION] = orientation
+    buf = io.BytesIO()
+    img.save(buf, "JPEG", quality=85, exif=exif)
+    return buf.getvalue()
+
+
+def _png(mode="RGBA", size=(640, 480)) -> bytes:
+    buf = io.BytesIO()
+    Image.new(mode, size).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _open(data: bytes) -> Image.Image:
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    return img
+
+
+def _pid() -> int:
+    return os.getpid()
+
+
+def _run(coro):
+    # A private loop, so the main thread's current loop is left alone.
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestDecode:
+    def test_jpeg_is_decoded_in_draft_mode(self):
+        # libjpeg scales 4032x3024 by 1/4, the most that keeps DRAFT_SIZE.
+        img, size = _decode(_jpeg())
+        assert (img.size, size) == ((1008, 756), PHONE_SIZE)
+
+    def test_exif_orientation_is_applied(self):
+        img, size = _decode(_jpeg(orientation=ROTATE_90_CW))
+        assert (img.size, size) == ((756, 1008), (3024, 4032))
+        assert ORIENTATION not in img.getexif()
+
+    def test_draft_keeps_enough_pixels_for_the_width(self):
+        # 800 wide needs 600 tall: 1/4 scale (1008x756) still covers it.
+        assert _decode(_jpeg(), width=800)[0].size == (1008, 756)
+        # 800 wide upright is 800 tall stored: only 1/2 (2016x1512) does.
+        assert _decode(_jpeg(orientation=ROTATE_90_CW), width=800)[0].size == (1512, 2016)
+
+    def test_non_jpeg_is_decoded_at_full_size_in_rgb(self):
+        img, size = _decode(_png())
+        assert (img.size, img.mode, size) == ((640, 480), "RGB", (640, 480))
+
+
+class TestProcessPhoto:
+    def test_derives_both_variants(self):
+        data = _jpeg(orientation=ROTATE_90_CW)
+        processed = process_photo(data)
+        thumbnail, placeholder = _open(processed.thumbnail), _open(processed.placeholder)
+        assert (thumbnail.format, thumbnail.size) == ("WEBP", (150, 200))
+        assert (placeholder.format, placeholder.size) == ("WEBP", (15, 20))
+        assert (processed.width, processed.height) == (3024, 4032)
+
+    def test_reads_from_a_path(self, tmp_path: Path):
+        path = tmp_path / "upload.jpg"
+        path.write_bytes(_jpeg(orientation=ROTATE_90_CW))
+        assert process_photo(str(path)) == process_photo(path.read_bytes())
+
+    @pytest.mark.parametrize("mode", ["RGBA", "P", "L"])
+    def test_png_modes(self, mode: str):
+        assert _open(process_photo(_png(mode)).thumbnail).size == (200, 150)
+
+    @pytest.mark.parametrize(
+        "data",
+        [b"\x89PNG\r\n\x1a\n" + b"\x00" * 100, b"not an image", _jpeg()[:5000]],
+        ids=["bad-png", "text", "truncated-jpeg"],
+    )
+    def test_invalid_images_are_rejected(self, data: bytes):
+        with pytest.raises(InvalidImageError):
+            process_photo(data)
+
+    def test_decompression_bombs_are_rejected(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100_000)
+        with pytest.raises(ImageTooLargeError):
+            process_photo(_png(size=(500, 500)))
+
+
+class TestVariants:
+    @pytest.fixture
+    def portrait(self, tmp_path: Path) -> str:
+        path = tmp_path / "portrait.jpg"
+        path.write_bytes(_jpeg(orientation=ROTATE_90_CW))
+        return str(path)
+
+    @pytest.mark.parametrize("width", [400, 800, 1600])
+    def test_variants_are_upright_and_width_wide(self, portrait: str, width: int):
+        img = _open(render_variant(portrait, width))
+        assert (img.format, img.size) == ("WEBP", (width, round(width * 4 / 3)))
+
+    def test_variants_are_never_upscaled(self, tmp_path: Path):
+        path = tmp_path / "small.png"
+        path.write_bytes(_png(size=(640, 480)))
+        assert _open(render_variant(str(path), 1600)).size == (640, 480)
+
+    def test_describe_reads_only_the_header(self, portrait: str):
+        content_hash, width, height = describe_image(portrait)
+        assert content_hash == hashlib.sha256(Path(portrait).read_bytes()).hexdigest()
+        assert (width, height) == (3024, 4032)
+
+    def test_unreadable_original(self, tmp_path: Path):
+        path = tmp_path / "bad.jpg"
+        path.write_bytes(b"not an image")
+        with pytest.raises(InvalidImageError):
+            render_variant(str(path), 400)
+        with pytest.raises(InvalidImageError):
+            describe_image(str(path))
+
+
+class TestPool:
+    @pytest.fixture(autouse=True)
+    def pool(self):
+        yield
+        shutdown_photo_pool()
+
+    def test_runs_in_another_process(self):
+        processed = _run(run_in_photo_pool(process_photo, _jpeg()))
+        assert _open(processed.thumbnail).size == (200, 150)
+        assert _run(run_in_photo_pool(_pid)) != os.getpid()
+
+    def test_errors_keep_their_type(self):
+        with pytest.raises(InvalidImageError):
+            _run(run_in_photo_pool(process_photo, b"not an image"))
+
+    def test_shutdown_forgets_the_pool(self):
+        _run(run_in_photo_pool(_pid))
+        shutdown_photo_pool()
+        assert photo_processing._pool is None
@@ -1,20 +1,27 @@
 """Unit tests for core/helpers/poll_day_info.py."""
 
-from datetime import date, datetime, time
-from unittest.mock import MagicMock, patch
+import math
+from datetime import date, datetime, time, timedelta, timezone
 
-import httpx
 import pytest
 
 from core.helpers import poll_day_info
 from core.helpers.poll_day_info import (
+    AUSTIN,
     AUSTIN_TZ,
+    FORECAST_MAX_AGE,
     _summarize_periods_for_date,
+    forecast_age_seconds,
     get_poll_day_info,
     get_sunrise,
     get_weather,
+    lake_location,
+    prune_forecasts,
+    store_forecast,
 )
 
+TRAVIS = (30.3916, -97.9079)
+
 
 @pytest.fixture(autouse=True)
 def reset_caches():
@@ -128,124 +135,81 @@ class TestSummarizePeriodsForDate:
         assert result["high"] == 78
 
 
-def _mock_httpx_client(points_payload, forecast_payload):
-    client = MagicMock()
-    points_resp = MagicMock()
-    points_resp.json.return_value = points_payload
-    points_resp.raise_for_status.return_value = None
-    forecast_resp = MagicMock()
-    forecast_resp.json.return_value = forecast_payload
-    forecast_resp.raise_for_status.return_value = None
-    client.get.side_effect = [points_resp, forecast_resp]
-    cm = MagicMock()
-    cm.__enter__.return_value = client
-    cm.__exit__.return_value = False
-    return cm
+def _periods_for(target: date):
+    return [
+        _make_period(datetime.combine(target, time(6), AUSTIN_TZ), True, temperature=82),
+        _make_period(datetime.combine(target, time(19), AUSTIN_TZ), False, temperature=66),
+    ]
 
 
 class TestGetWeather:
     def test_returns_summary_for_date_in_window(self):
         target = date(2026, 5, 10)
-        points_payload = {
-            "properties": {"forecast": "https://api.weather.gov/gridpoints/EWX/156,90/forecast"}
-        }
-        forecast_payload = {
-            "properties": {
-                "periods": [
-                    _make_period(datetime(2026, 5, 10, 6, tzinfo=AUSTIN_TZ), True, temperature=82),
-                    _make_period(
-                        datetime(2026, 5, 10, 19, tzinfo=AUSTIN_TZ), False, temperature=66
-                    ),
-                ]
-            }
-        }
-        with patch.object(
-            poll_day_info.httpx,
-            "Client",
-            return_value=_mock_httpx_client(points_payload, forecast_payload),
-        ):
-            result = get_weather(target)
+        store_forecast(AUSTIN, _periods_for(target), datetime.now(timezone.utc))
+        result = get_weather(target)
         assert result is not None
         assert result["high"] == 82
         assert result["low"] == 66
 
     def test_returns_none_outside_forecast_window(self):
-        target = date(2030, 1, 1)
-        points_payload = {
-            "properties": {"forecast": "https://api.weather.gov/gridpoints/EWX/156,90/forecast"}
-        }
-        forecast_payload = {
-            "properties": {
-                "periods": [
-                    _make_period(datetime(2026, 5, 10, 6, tzinfo=AUSTIN_TZ), True),
-                ]
-            }
-        }
-        with patch.object(
-            poll_day_info.httpx,
-            "Client",
-            return_value=_mock_httpx_client(points_payload, forecast_payload),
-        ):
-            result = get_weather(target)
-        assert result is None
-
-    def test_returns_none_on_http_error(self):
-        client = MagicMock()
-        client.get.side_effect = httpx.ConnectError("nope")
-        cm = MagicMock()
-        cm.__enter__.return_value = client
-        cm.__exit__.return_value = False
-        with patch.object(poll_day_info.httpx, "Client", return_value=cm):
-            result = get_weather(date(2026, 5, 10))
-        assert result is None
-
-    def test_caches_forecast_response(self):
+        store_forecast(AUSTIN, _periods_for(date(2026, 5, 10)), datetime.now(timezone.utc))
+        assert get_weather(date(2030, 1, 1)) is None
+
+    def test_returns_none_before_first_fetch(self):
+        assert get_weather(date(2026, 5, 10)) is None
+        assert forecast_age_seconds() == math.inf
+
+    def test_stale_forecast_is_served_until_max_age(self):
         target = date(2026, 5, 10)
-        points_payload = {
-            "properties": {"forecast": "https://api.weather.gov/gridpoints/EWX/156,90/forecast"}
-        }
-        forecast_payload = {
-            "properties": {
-                "periods": [
-                    _make_period(datetime(2026, 5, 10, 6, tzinfo=AUSTIN_TZ), True),
-                    _make_period(datetime(2026, 5, 10, 19, tzinfo=AUSTIN_TZ), False),
-                ]
-            }
-        }
-        client_mock = MagicMock()
-        with patch.object(
-            poll_day_info.httpx, "Client", return_value=client_mock
-        ) as client_factory:
-            client_mock.__enter__.return_value = MagicMock(
-                get=MagicMock(
-                    side_effect=[
-                        MagicMock(
-                            json=MagicMock(return_value=points_payload),
-                            raise_for_status=MagicMock(),
-                        ),
-                        MagicMock(
-                            json=MagicMock(return_value=forecast_payload),
-                            raise_for_status=MagicMock(),
-                        ),
-                    ]
-                )
-            )
-            client_mock.__exit__.return_value = False
-            get_weather(target)
-            # Second call should use cache, not re-instantiate the HTTP client.
-            get_weather(target)
-            assert client_factory.call_count == 1
+        fetched_at = datetime.now(timezone.utc) - FORECAST_MAX_AGE + timedelta(minutes=5)
+        store_forecast(AUSTIN, _periods_for(target), fetched_at)
+        assert get_weather(target) is not None
+
+        store_forecast(AUSTIN, _periods_for(target), fetched_at - timedelta(minutes=10))
+        assert get_weather(target) is None
+
+
+class TestLocations:
+    def test_lake_location_rounds_to_nws_precision(self):
+        assert lake_location(30.391623, -97.907911) == TRAVIS
+        assert lake_location(None, -97.9) == AUSTIN
+
+    def test_lake_forecast_is_used_when_cached(self):
+        target = date(2026, 5, 10)
+        now = datetime.now(timezone.utc)
+        store_forecast(AUSTIN, _periods_for(target), now)
+        lake_periods = _periods_for(target)
+        lake_periods[0]["temperature"] = 91
+        store_forecast(TRAVIS, lake_periods, now)
+        assert get_weather(target, TRAVIS)["high"] == 91
+        assert get_weather(target)["high"] == 82
+
+    def test_lake_without_a_forecast_falls_back_to_austin(self):
+        target = date(2026, 5, 10)
+        store_forecast(AUSTIN, _periods_for(target), datetime.now(timezone.utc))
+        assert get_weather(target, TRAVIS)["high"] == 82
+
+    def test_age_is_the_oldest_location(self):
+        now = datetime.now(timezone.utc)
+        store_forecast(AUSTIN, [], now)
+        store_forecast(TRAVIS, [], now - timedelta(hours=1))
+        assert 3599 < forecast_age_seconds() < 3700
+        assert forecast_age_seconds(AUSTIN) < 5
+        prune_forecasts([AUSTIN])
+        assert forecast_age_seconds() < 5
+
+    def test_sunrise_is_per_location_and_memoized(self):
+        get_sunrise.cache_clear()
+        austin = get_sunrise(date(2026, 6, 21))
+        # Lake Travis is west of Austin, so the sun rises there a little later.
+        assert get_sunrise(date(2026, 6, 21), TRAVIS) > austin
+        get_sunrise(date(2026, 6, 21), TRAVIS)
+        assert get_sunrise.cache_info().hits == 1
 
 
 class TestGetPollDayInfo:
     def test_includes_sunrise_and_date_even_when_weather_unavailable(self):
-        client = MagicMock()
-        client.get.side_effect = httpx.ConnectError("nope")
-        cm = MagicMock()
-        cm.__enter__.return_value = client
-        cm.__exit__.return_value = False
-        with patch.object(poll_day_info.httpx, "Client", return_value=cm):
-            result = get_poll_day_info(date(2026, 5, 10))
+        result = get_poll_day_info(date(2026, 5, 10))
         assert result["date"] == date(2026, 5, 10)
         assert isinstance(result["sunrise"], time)
         assert result["weather"] is None
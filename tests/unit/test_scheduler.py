@@ -0,0 +1,146 @@
+"""Tests for the in-process background scheduler (core/scheduler.py)."""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import app_setup
+from core import scheduler
+from core.db_schema import SchedulerLease, utc_now
+from core.monitoring.metrics import registry
+from core.scheduler import Job, Scheduler, release_lease, try_acquire_lease
+
+
+@pytest.fixture(autouse=True)
+def no_lease(db_session: Session):
+    db_session.query(SchedulerLease).delete()
+    db_session.commit()
+    yield
+    db_session.query(SchedulerLease).delete()
+    db_session.commit()
+
+
+def _sample(name: str, job: str) -> float:
+    return registry.get_sample_value(name, {"job": job}) or 0.0
+
+
+class TestLease:
+    def test_first_claim_wins(self):
+        assert try_acquire_lease("a")
+        assert not try_acquire_lease("b")
+
+    def test_holder_renews(self, db_session: Session):
+        assert try_acquire_lease("a")
+        first = db_session.get(SchedulerLease, scheduler.LEASE_NAME).expires_at
+        db_session.expire_all()
+        assert try_acquire_lease("a", now=utc_now() + timedelta(seconds=10))
+        assert db_session.get(SchedulerLease, scheduler.LEASE_NAME).expires_at > first
+
+    def test_expired_lease_is_taken_over(self):
+        assert try_acquire_lease("a")
+        later = utc_now() + timedelta(seconds=scheduler.LEASE_SECONDS + 1)
+        assert try_acquire_lease("b", now=later)
+        assert not try_acquire_lease("a", now=later)
+
+    def test_release_frees_the_lease(self):
+        assert try_acquire_lease("a")
+        release_lease("b")
+        assert not try_acquire_lease("b")
+        release_lease("a")
+        assert try_acquire_lease("b")
+
+
+class TestRunPending:
+    def test_runs_due_jobs_on_their_interval(self):
+        calls: List[str] = []
+        jobs = [
+            Job("fast", lambda: calls.append("fast"), interval=10),
+            Job("slow", lambda: calls.append("slow"), interval=100),
+        ]
+        s = Scheduler(jobs, holder="a")
+        assert s.run_pending(now=1000) == ["fast", "slow"]
+        assert s.run_pending(now=1005) == []
+        assert s.run_pending(now=1010) == ["fast"]
+        assert calls == ["fast", "slow", "fast"]
+
+    def test_follower_runs_nothing(self):
+        assert try_acquire_lease("leader")
+        calls: List[str] = []
+        s = Scheduler([Job("job", lambda: calls.append("job"), interval=1)], holder="follower")
+        assert s.run_pending() == []
+        assert calls == []
+
+    def test_lease_lost_mid_tick_stops_the_remaining_jobs(self):
+        def lose_lease() -> None:
+            release_lease("a")
+            assert try_acquire_lease("b")
+
+        calls: List[str] = []
+        s = Scheduler(
+            [
+                Job("first", lose_lease, interval=1),
+                Job("second", lambda: calls.append("second"), interval=1),
+            ],
+            holder="a",
+        )
+        assert s.run_pending() == ["first"]
+        assert calls == []
+
+    def test_failure_is_counted_and_other_jobs_still_run(self):
+        def boom() -> None:
+            raise RuntimeError("boom")
+
+        calls: List[str] = []
+        failures = _sample("scheduler_job_failures_total", "boom_job")
+        runs = _sample("scheduler_job_duration_seconds_count", "boom_job")
+        s = Scheduler(
+            [Job("boom_job", boom, interval=1), Job("ok", lambda: calls.append("ok"), interval=1)],
+            holder="a",
+        )
+        assert s.run_pending() == ["boom_job", "ok"]
+        assert calls == ["ok"]
+        assert _sample("scheduler_job_failures_total", "boom_job") == failures + 1
+        assert _sample("scheduler_job_duration_seconds_count", "boom_job") == runs + 1
+
+
+class TestLifecycle:
+    def test_start_ticks_and_stop_releases(self, db_session: Session):
+        ran = []
+
+        async def run() -> None:
+            s = Scheduler([Job("job", lambda: ran.append(1), interval=60)], tick_seconds=60)
+            s.start()
+            for _ in range(200):
+                if ran:
+                    break
+                await asyncio.sleep(0.01)
+            await s.stop()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(run())
+        finally:
+            loop.close()
+        assert ran == [1]
+        assert db_session.get(SchedulerLease, scheduler.LEASE_NAME) is None
+
+    def test_app_lifespan_runs_the_scheduler(
+        self, monkeypatch: pytest.MonkeyPatch, db_session: Session
+    ):
+        ran = []
+        monkeypatch.setenv("SCHEDULER_ENABLED", "true")
+        monkeypatch.setattr(
+            app_setup, "_scheduled_jobs", lambda: [Job("job", lambda: ran.append(1), 60)]
+        )
+        with TestClient(app_setup.create_app()):
+            for _ in range(200):
+                if ran:
+                    break
+                time.sleep(0.01)
+        assert ran == [1]
+        assert db_session.get(SchedulerLease, scheduler.LEASE_NAME) is None
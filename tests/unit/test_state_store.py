@@ -0,0 +1,217 @@
+"""Tests for the shared state store (core/state_store.py) and what is built on it."""
+
+import multiprocessing
+import time
+from pathlib import Path
+
+import pytest
+from limits import RateLimitItemPerMinute
+from limits.strategies import FixedWindowRateLimiter
+
+import app_setup
+from core import state_store
+from core.db_schema.engine import requested_workers
+from core.helpers import user_cache
+from core.query_service import data_cache
+from core.state_store import MemoryStateStore, SqlStateStore, StateStore, StateStoreStorage
+from routes.auth import login
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    store: StateStore
+    if request.param == "memory":
+        store = MemoryStateStore()
+    else:
+        store = SqlStateStore.from_url(f"sqlite:///{tmp_path / 'state.db'}")
+    monkeypatch.setattr(state_store, "_store", store)
+    return store
+
+
+class TestCounters:
+    def test_counts_per_key(self, store):
+        assert store.incr("a", 60) == 1
+        assert store.incr("a", 60, amount=2) == 3
+        assert store.incr("b", 60) == 1
+        assert store.get("a") == 3
+        assert store.get("missing") == 0
+
+    def test_expired_counter_starts_over(self, store):
+        store.incr("a", 0)
+        assert store.get("a") == 0
+        assert store.incr("a", 60) == 1
+
+    def test_expiry(self, store):
+        now = time.time()
+        store.incr("fixed", 60)
+        store.incr("fixed", 600)
+        assert now + 59 < store.get_expiry("fixed") < now + 61
+
+        store.incr("elastic", 60, elastic_expiry=True)
+        store.incr("elastic", 600, elastic_expiry=True)
+        assert now + 599 < store.get_expiry("elastic") < now + 601
+
+        assert store.get_expiry("missing") >= now
+
+    def test_clear_and_reset(self, store):
+        store.incr("a", 60)
+        store.incr("b", 60)
+        store.clear("a")
+        assert store.get("a") == 0
+        assert store.get("b") == 1
+        assert store.reset() == 1
+        assert store.get("b") == 0
+
+    def test_memory_store_drops_least_recently_used(self):
+        store = MemoryStateStore(max_keys=2)
+        store.incr("a", 60)
+        store.incr("b", 60)
+        store.incr("a", 60)
+        store.incr("c", 60)
+        assert (store.get("a"), store.get("b"), store.get("c")) == (2, 0, 1)
+
+    def test_backend_missing_a_method_cannot_be_created(self):
+        class Incomplete(StateStore):
+            def incr(self, key, expiry, amount=1, elastic_expiry=False):
+                return 0
+
+        with pytest.raises(TypeError, match="abstract"):
+            Incomplete()  # type: ignore[abstract]
+
+    def test_generations(self, store):
+        assert state_store.read_generation("pages") == 0
+        assert state_store.bump_generation("pages") == 1
+        assert state_store.bump_generation("pages") == 2
+        assert state_store.read_generation("pages") == 2
+        assert state_store.read_generation("results") == 0
+
+    def test_rate_limiter_storage(self, store):
+        limiter = FixedWindowRateLimiter(StateStoreStorage("sabc-state://"))
+        limit = RateLimitItemPerMinute(2)
+        assert limiter.hit(limit, "1.2.3.4")
+        assert limiter.hit(limit, "1.2.3.4")
+        assert not limiter.hit(limit, "1.2.3.4")
+        assert limiter.hit(limit, "5.6.7.8")
+        assert store.get(limit.key_for("1.2.3.4")) == 3
+
+
+class TestLockout:
+    def test_locks_at_threshold_and_clears(self, store):
+        for _ in range(login._MAX_FAILED_ATTEMPTS - 1):
+            login._record_failed_attempt("angler@example.com")
+        assert not login._is_account_locked("angler@example.com")
+        login._record_failed_attempt("angler@example.com")
+        assert login._is_account_locked("angler@example.com")
+        assert not login._is_account_locked("other@example.com")
+
+        login._clear_failed_attempts("angler@example.com")
+        assert not login._is_account_locked("angler@example.com")
+
+
+def _fail_logins(email: str, attempts: int) -> bool:
+    """Fail ``attempts`` logins for ``email`` in a separate process, as a worker would."""
+    from routes.auth import login
+
+    for _ in range(attempts):
+        login._record_failed_attempt(email)
+    return login._is_account_locked(email)
+
+
+def _bump_results() -> int:
+    """Record a result write in a separate process, as a worker would."""
+    from core.query_service import data_cache
+
+    data_cache.bump_results_generation()
+    return data_cache.results_generation()
+
+
+def _count(key: str, times: int) -> None:
+    from core.state_store import get_state_store
+
+    for _ in range(times):
+        get_state_store().incr(key, 60)
+
+
+class TestAcrossProcesses:
+    """Worker processes sharing a SQLite-file store see one set of counters."""
+
+    @pytest.fixture
+    def pool(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        url = f"sqlite:///{tmp_path / 'state.db'}"
+        # Spawned processes build their store from the inherited environment.
+        monkeypatch.setenv("STATE_STORE", url)
+        monkeypatch.setattr(state_store, "_store", SqlStateStore.from_url(url))
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            yield pool
+
+    def test_lockout_threshold_holds_across_workers(self, pool):
+        email = "angler@example.com"
+        # Three workers, three failures each: one short of the threshold.
+        per_worker = (login._MAX_FAILED_ATTEMPTS - 1) // 3
+        assert login._MAX_FAILED_ATTEMPTS - 1 == 3 * per_worker
+        assert pool.starmap(_fail_logins, [(email, per_worker)] * 3) == [False] * 3
+        assert not login._is_account_locked(email)
+
+        # One more failure in any worker locks the account in every one.
+        assert pool.apply(_fail_logins, (email, 1))
+        assert login._is_account_locked(email)
+        assert pool.starmap(_fail_logins, [(email, 0)] * 4) == [True] * 4
+
+    def test_result_write_in_one_worker_invalidates_the_others(self, pool, monkeypatch):
+        monkeypatch.setattr(data_cache, "DATA_CACHE_ENABLED", True)
+        data_cache._reset_cache_for_test()
+        computed = []
+
+        def compute() -> int:
+            computed.append(1)
+            return len(computed)
+
+        assert data_cache.get_or_compute("q", "q", compute) == 1
+        assert data_cache.get_or_compute("q", "q", compute) == 1
+        generation = data_cache.results_generation()
+        assert pool.apply(_bump_results) == generation + 1
+        assert data_cache.get_or_compute("q", "q", compute) == 2
+        data_cache._reset_cache_for_test()
+
+    def test_concurrent_increments_are_not_lost(self, pool):
+        pool.starmap(_count, [("hits", 50)] * 4)
+        assert state_store.get_state_store().get("hits") == 200
+
+
+class TestWorkerGuard:
+    @pytest.fixture(autouse=True)
+    def production(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        monkeypatch.setenv("WEB_CONCURRENCY", "4")
+        monkeypatch.delenv("SABC_ALLOW_MULTIPLE_WORKERS", raising=False)
+
+    def test_requested_workers(self, monkeypatch: pytest.MonkeyPatch):
+        assert requested_workers(["uvicorn", "app:app"]) == 4
+        assert requested_workers(["uvicorn", "app:app", "--workers", "2"]) == 2
+        assert requested_workers(["uvicorn", "app:app", "--workers=3"]) == 3
+        monkeypatch.delenv("WEB_CONCURRENCY")
+        assert requested_workers(["uvicorn", "app:app"]) == 1
+
+    def test_refuses_without_opt_in(self, store):
+        with pytest.raises(RuntimeError, match="SABC_ALLOW_MULTIPLE_WORKERS=1"):
+            app_setup._assert_single_worker()
+
+    def test_honours_opt_in_only_with_a_shared_store(self, store, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("SABC_ALLOW_MULTIPLE_WORKERS", "1")
+        if store.shared:
+            app_setup._assert_single_worker()
+        else:
+            with pytest.raises(RuntimeError, match="shared"):
+                app_setup._assert_single_worker()
+
+    def test_refuses_the_user_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        shared = SqlStateStore.from_url(f"sqlite:///{tmp_path / 'state.db'}")
+        monkeypatch.setattr(state_store, "_store", shared)
+        monkeypatch.setenv("SABC_ALLOW_MULTIPLE_WORKERS", "1")
+        monkeypatch.setattr(user_cache, "USER_CACHE_TTL", 30.0)
+        with pytest.raises(RuntimeError, match="USER_CACHE_TTL_SECONDS"):
+            app_setup._assert_single_worker()
+
+    def test_single_worker_needs_nothing(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("WEB_CONCURRENCY", "1")
+        app_setup._assert_single_worker()
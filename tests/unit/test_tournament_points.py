@@ -1,6 +1,39 @@
 """Unit tests for tournament points calculation."""
 
-from core.helpers.tournament_points import calculate_tournament_points
+import random
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+from core.helpers.tournament_points import (
+    calculate_points_by_tournament,
+    calculate_tournament_points,
+)
+
+
+def _random_field(rng: random.Random, tournament_id: int = 1) -> list:
+    """A random tournament field with deliberate weight/big-bass ties."""
+    # Weights from a small grid so exact ties (and zero-fish rows) are common.
+    weights = [0.0, 5.25, 8.5, 8.5, 10.0, 12.75, 15.5]
+    big_basses = [0.0, 2.5, 3.0, 4.25]
+    field = []
+    for i in range(rng.randint(0, 30)):
+        field.append(
+            {
+                "id": i + 1,
+                "tournament_id": tournament_id,
+                "angler_id": i + 1,
+                "angler_name": f"Angler {i + 1}",
+                "num_fish": rng.randint(0, 5),
+                "total_weight": rng.choice(weights),
+                "big_bass_weight": rng.choice(big_basses),
+                "buy_in": rng.random() < 0.1,
+                "disqualified": rng.random() < 0.05,
+                "was_member": rng.random() < 0.8,
+            }
+        )
+    return field
 
 
 class TestTournamentPoints:
@@ -82,3 +115,55 @@ class TestTournamentPoints:
         assert len(calculated) == 2
         buy_ins = [r for r in calculated if r["buy_in"]]
         assert len(buy_ins) == 1
+
+
+class TestPointsEngines:
+    """The list-based engine must match the pandas reference row for row."""
+
+    def test_python_engine_matches_pandas(self):
+        for seed in range(500):
+            field = _random_field(random.Random(seed))
+            expected = calculate_tournament_points([dict(r) for r in field], engine="pandas")
+            actual = calculate_tournament_points([dict(r) for r in field], engine="python")
+            assert actual == expected, f"engines disagree for seed {seed}"
+
+    def test_missing_flag_columns_get_defaults(self):
+        field = [
+            {"id": 1, "total_weight": 10.0, "big_bass_weight": 3.0},
+            {"id": 2, "total_weight": 0, "big_bass_weight": 0},
+        ]
+        expected = calculate_tournament_points([dict(r) for r in field], engine="pandas")
+        actual = calculate_tournament_points([dict(r) for r in field], engine="python")
+        assert actual == expected
+        assert [r["calculated_points"] for r in actual] == [100, 98]
+
+    def test_input_is_not_mutated(self):
+        field = _random_field(random.Random(1))
+        snapshot = [dict(r) for r in field]
+        calculate_tournament_points(field, engine="python")
+        assert field == snapshot
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError):
+            calculate_tournament_points([], engine="numpy")
+
+    def test_batched_entry_point_scores_each_tournament(self):
+        rng = random.Random(7)
+        rows = _random_field(rng, tournament_id=1) + _random_field(rng, tournament_id=2)
+        batched = calculate_points_by_tournament(rows)
+        for tournament_id, scored in batched.items():
+            field = [r for r in rows if r["tournament_id"] == tournament_id]
+            assert scored == calculate_tournament_points(field)
+
+    def test_default_engine_keeps_pandas_out_of_the_web_process(self):
+        """Scoring on the default engine must not import pandas (startup cost)."""
+        code = (
+            "import sys\n"
+            "from app_setup import create_app\n"
+            "from core.helpers.tournament_points import calculate_tournament_points\n"
+            "create_app()\n"
+            "calculate_tournament_points([{'total_weight': 1, 'big_bass_weight': 1}])\n"
+            "sys.exit('pandas' in sys.modules)\n"
+        )
+        completed = subprocess.run([sys.executable, "-c", code], capture_output=True)  # nosec B603
+        assert completed.returncode == 0, completed.stderr.decode()